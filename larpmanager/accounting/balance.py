@@ -25,26 +25,25 @@ from __future__ import annotations
 import logging
 from datetime import date
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from django.db.models import Q
+from django.conf import settings as conf_settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from larpmanager.cache.accounting import (
+    get_association_accounting_report_cache_key,
+    get_run_accounting_report_cache_key,
+)
 from larpmanager.cache.config import get_association_config
 from larpmanager.cache.feature import get_event_features
 from larpmanager.models.accounting import (
-    AccountingItemCollection,
-    AccountingItemDiscount,
-    AccountingItemDonation,
-    AccountingItemExpense,
-    AccountingItemInflow,
-    AccountingItemMembership,
     AccountingItemOther,
-    AccountingItemOutflow,
-    AccountingItemPayment,
-    AccountingItemTransaction,
+    AccountingLedgerRollup,
     ExpenseChoices,
+    LedgerCategory,
     OtherChoices,
     PaymentChoices,
     RecordAccounting,
@@ -53,12 +52,79 @@ from larpmanager.models.association import Association
 from larpmanager.models.event import DevelopStatus, Run
 from larpmanager.models.member import Membership
 from larpmanager.models.registration import Registration, TicketTier
-from larpmanager.models.utils import get_sum
 from larpmanager.utils.core.common import get_display_choice
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
 logger = logging.getLogger(__name__)
 
 
+def _fold_accounting_rows(rows: Iterable[dict[str, Any]], type_field: str | None) -> dict[str, Any]:
+    """Fold grouped aggregate rows into totals, counts and per-type details.
+
+    Args:
+        rows: Aggregate rows, each with "tot" and "num" keys plus the type_field value
+        type_field: Field the rows are grouped by, or None for no breakdown
+
+    Returns:
+        dict: Raw figures with "tot", "num" and "detail" keys (no display names)
+
+    """
+    figures = {"tot": 0, "num": 0, "detail": {}}
+    for row in rows:
+        # Skip empty aggregates (no rows matched)
+        if not row["num"]:
+            continue
+
+        figures["tot"] += row["tot"]
+        figures["num"] += row["num"]
+
+        if type_field is None:
+            continue
+
+        detail = figures["detail"].setdefault(row[type_field], {"tot": 0, "num": 0})
+        detail["tot"] += row["tot"]
+        detail["num"] += row["num"]
+
+    return figures
+
+
+def _aggregate_accounting(queryset: QuerySet, type_field: str | None) -> dict[str, Any]:
+    """Sum and count accounting items in the database, grouped by type_field if given."""
+    # Clear default ordering, otherwise it ends up in the GROUP BY clause
+    queryset = queryset.order_by()
+    if type_field is None:
+        rows = [queryset.aggregate(tot=Sum("value"), num=Count("id"))]
+    else:
+        rows = queryset.values(type_field).annotate(tot=Sum("value"), num=Count("id"))
+
+    return _fold_accounting_rows(rows, type_field)
+
+
+def _name_accounting_detail(
+    figures: dict[str, Any],
+    name: str,
+    choices: list[tuple[str, str]] | None,
+    description: str | None = None,
+) -> dict[str, Any]:
+    """Attach display names to raw accounting figures, leaving the cached figures untouched."""
+    result = {
+        "tot": figures["tot"],
+        "num": figures["num"],
+        "detail": {
+            item_type: {**detail, "name": get_display_choice(choices, item_type) if choices else ""}
+            for item_type, detail in figures["detail"].items()
+        },
+        "name": name,
+    }
+    if description is not None:
+        result["descr"] = description
+    return result
+
+
 def get_accounting_detail(
     name: str,
     run: Run,
@@ -73,7 +139,8 @@ def get_accounting_detail(
     """Get detailed accounting breakdown for a specific accounting item type.
 
     This function calculates totals, counts, and detailed breakdowns by type
-    for accounting items associated with a specific run or registration.
+    for accounting items associated with a specific run or registration, with
+    a single grouped aggregate query.
 
     Args:
         name: Display name for the accounting category
@@ -95,9 +162,6 @@ def get_accounting_detail(
             - descr: Description
 
     """
-    # Initialize result dictionary with base structure
-    result = {"tot": 0, "num": 0, "detail": {}, "name": name, "descr": description}
-
     # Filter accounting items by run or registration run
     if filter_by_registration:
         queryset = model_class.objects.filter(registration__run=run)
@@ -108,30 +172,7 @@ def get_accounting_detail(
     if filters:
         queryset = queryset.filter(**filters)
 
-    # Process each accounting item
-    for accounting_item in queryset:
-        # Update global counters
-        result["num"] += 1
-        result["tot"] += accounting_item.value
-
-        # Skip detailed breakdown if no type field specified
-        if type_field is None:
-            continue
-
-        # Get type value and create detail entry if needed
-        item_type = getattr(accounting_item, type_field)
-        if item_type not in result["detail"]:
-            result["detail"][item_type] = {
-                "tot": 0,
-                "num": 0,
-                "name": get_display_choice(choices, item_type),
-            }
-
-        # Update type-specific counters
-        result["detail"][item_type]["num"] += 1
-        result["detail"][item_type]["tot"] += accounting_item.value
-
-    return result
+    return _name_accounting_detail(_aggregate_accounting(queryset, type_field), name, choices, description)
 
 
 def get_accounting_registration_type(registration: Registration) -> tuple[str, str]:
@@ -166,6 +207,18 @@ def get_accounting_registration_type(registration: Registration) -> tuple[str, s
     )
 
 
+def _aggregate_registrations(run: Run) -> dict[str, Any]:
+    """Sum the registration fees of the non-cancelled registrations of a run by ticket tier."""
+    rows = (
+        Registration.objects.filter(run=run, cancellation_date__isnull=True)
+        .order_by()
+        .values("ticket__tier")
+        .annotate(tot=Sum("tot_iscr"), num=Count("id"))
+    )
+    # Registrations without a ticket are grouped under the empty tier
+    return _fold_accounting_rows(({**row, "ticket__tier": row["ticket__tier"] or ""} for row in rows), "ticket__tier")
+
+
 def get_accounting_registration_detail(
     nm: str, run: Run, descr: str
 ) -> dict[str, int | str | dict[str, dict[str, int | str]]]:
@@ -188,30 +241,7 @@ def get_accounting_registration_detail(
             - descr: Description passed as parameter
 
     """
-    # Initialize result dictionary with base structure
-    accounting_data = {"tot": 0, "num": 0, "detail": {}, "name": nm, "descr": descr}
-
-    # Query all non-cancelled registrations for the run with ticket data
-    registrations = Registration.objects.filter(run=run).select_related("ticket").filter(cancellation_date__isnull=True)
-
-    # Process each registration to build breakdown by ticket type
-    for registration in registrations:
-        # Get ticket type and description for this registration
-        (ticket_type, ticket_description) = get_accounting_registration_type(registration)
-
-        # Initialize ticket type entry if not exists
-        if ticket_type not in accounting_data["detail"]:
-            accounting_data["detail"][ticket_type] = {"tot": 0, "num": 0, "name": ticket_description}
-
-        # Update ticket type counters
-        accounting_data["detail"][ticket_type]["num"] += 1
-        accounting_data["detail"][ticket_type]["tot"] += registration.tot_iscr
-
-        # Update overall counters
-        accounting_data["num"] += 1
-        accounting_data["tot"] += registration.tot_iscr
-
-    return accounting_data
+    return _name_accounting_detail(_aggregate_registrations(run), nm, TicketTier.choices, descr)
 
 
 def get_token_details(nm: str, run: Run) -> dict[str, int | dict | str]:
@@ -232,21 +262,72 @@ def get_token_details(nm: str, run: Run) -> dict[str, int | dict | str]:
             - name (str): Display name for the category
 
     """
-    # Initialize result dictionary with default values
-    dc = {"tot": 0, "num": 0, "detail": {}, "name": nm}
+    return _name_accounting_detail(_aggregate_accounting(AccountingItemOther.objects.filter(run=run), None), nm, None)
+
+
+def _compute_run_accounting_figures(run: Run) -> dict[str, dict[str, Any]]:
+    """Aggregate the raw figures of every run accounting category.
+
+    Accounting items are read from the daily ledger rollup, registrations from
+    their table. All categories are computed regardless of the enabled features,
+    so the result can be cached once per run and filtered when the report is assembled.
 
-    # Iterate through all accounting items for the given run
-    for a in AccountingItemOther.objects.filter(run=run):
-        # Increment item count
-        dc["num"] += 1
-        # Add item value to total
-        dc["tot"] += a.value
+    Args:
+        run: Run instance to aggregate
+
+    Returns:
+        dict: Raw figures (tot, num, detail) by category code
+
+    """
+    rollup_rows = list(
+        AccountingLedgerRollup.objects.filter(run=run)
+        .order_by()
+        .values("category", "kind")
+        .annotate(tot=Sum("total"), num=Sum("num"))
+    )
+
+    def fold(category: str, *, by_kind: bool = True, kind: str | None = None) -> dict[str, Any]:
+        """Fold the rollup rows of a category, optionally restricted to one kind."""
+        rows = [row for row in rollup_rows if row["category"] == category and kind in (None, row["kind"])]
+        return _fold_accounting_rows(rows, "kind" if by_kind else None)
+
+    return {
+        "exp": fold(LedgerCategory.EXPENSE),
+        "out": fold(LedgerCategory.OUTFLOW),
+        "in": fold(LedgerCategory.INFLOW, by_kind=False),
+        "pay": fold(LedgerCategory.PAYMENT),
+        "trs": fold(LedgerCategory.TRANSACTION, by_kind=False),
+        "dis": fold(LedgerCategory.DISCOUNT, by_kind=False),
+        # Refunds are the cancellation entries, tokens and credits the issued ones
+        "ref": fold(LedgerCategory.REFUND),
+        "tok": fold(LedgerCategory.OTHER, kind=OtherChoices.TOKEN),
+        "cre": fold(LedgerCategory.OTHER, kind=OtherChoices.CREDIT),
+        "registration": _aggregate_registrations(run),
+    }
+
+
+def get_run_accounting_figures(run: Run) -> dict[str, dict[str, Any]]:
+    """Get the cached raw accounting figures of a run, computing them on a miss.
+
+    The cache is invalidated by the accounting item and registration signals.
+
+    Args:
+        run: Run instance to get the figures for
+
+    Returns:
+        dict: Raw figures (tot, num, detail) by category code
 
-    return dc
+    """
+    cache_key = get_run_accounting_report_cache_key(run.id)
+    figures = cache.get(cache_key)
+    if figures is None:
+        figures = _compute_run_accounting_figures(run)
+        cache.set(cache_key, figures, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+    return figures
 
 
 def _process_tokens_credits(
-    run: Run,
+    figures: dict[str, dict[str, Any]],
     features: dict[str, int],
     context: dict,
     details_by_category: dict,
@@ -254,7 +335,7 @@ def _process_tokens_credits(
     """Process tokens and credits accounting details.
 
     Args:
-        run: Run instance to process
+        figures: Raw run accounting figures by category code
         features: Dictionary of enabled features
         context: Context dictionary with token/credit names
         details_by_category: Dictionary to populate with accounting details
@@ -267,29 +348,14 @@ def _process_tokens_credits(
     sum_credits = 0
 
     if "tokens" in features:
-        details_by_category["tok"] = get_accounting_detail(
-            context.get("tokens_name", _("Tokens")),
-            run,
-            _("Total issued"),
-            AccountingItemOther,
-            OtherChoices.choices,
-            "oth",
-            filters={"cancellation__exact": False, "oth__exact": OtherChoices.TOKEN},
+        details_by_category["tok"] = _name_accounting_detail(
+            figures["tok"], context.get("tokens_name", _("Tokens")), OtherChoices.choices, _("Total issued")
         )
         sum_tokens = details_by_category["tok"]["tot"]
 
     if "credits" in features:
-        details_by_category["cre"] = get_accounting_detail(
-            context.get("credits_name", _("Credits")),
-            run,
-            _("Total issued"),
-            AccountingItemOther,
-            OtherChoices.choices,
-            "oth",
-            filters={
-                "cancellation__exact": False,
-                "oth__exact": OtherChoices.CREDIT,
-            },
+        details_by_category["cre"] = _name_accounting_detail(
+            figures["cre"], context.get("credits_name", _("Credits")), OtherChoices.choices, _("Total issued")
         )
         sum_credits = details_by_category["cre"]["tot"]
 
@@ -331,103 +397,70 @@ def get_run_accounting(run: Run, context: dict) -> tuple[dict, dict]:
     # Fetch feature flags to determine which accounting categories are enabled for this event
     features = get_event_features(run.event_id)
 
+    # Raw totals of every category, aggregated in the database and cached per run
+    figures = get_run_accounting_figures(run)
+
     # Process expenses: accumulate all approved expenses submitted by collaborators
     sum_expenses = 0
     if "expense" in features:
-        details["exp"] = get_accounting_detail(
+        details["exp"] = _name_accounting_detail(
+            figures["exp"],
             _("Expenses"),
-            run,
-            _("Total of expenses submitted by collaborators and approved"),
-            AccountingItemExpense,
             ExpenseChoices.choices,
-            "exp",
+            _("Total of expenses submitted by collaborators and approved"),
         )
         sum_expenses = details["exp"]["tot"]
 
     # Process outflows: accumulate all recorded money outflows
     sum_outflows = 0
     if "outflow" in features:
-        details["out"] = get_accounting_detail(
-            _("Outflows"),
-            run,
-            _("Total of recorded money outflows"),
-            AccountingItemOutflow,
-            ExpenseChoices.choices,
-            "exp",
+        details["out"] = _name_accounting_detail(
+            figures["out"], _("Outflows"), ExpenseChoices.choices, _("Total of recorded money outflows")
         )
         sum_outflows = details["out"]["tot"]
 
     # Process inflows: accumulate all recorded money inflows
     sum_inflows = 0
     if "inflow" in features:
-        details["in"] = get_accounting_detail(
-            _("Inflows"),
-            run,
-            _("Total of recorded money inflows"),
-            AccountingItemInflow,
-            None,
-            None,
-        )
+        details["in"] = _name_accounting_detail(figures["in"], _("Inflows"), None, _("Total of recorded money inflows"))
         sum_inflows = details["in"]["tot"]
 
     # Process payments: accumulate all participation fees received from registrations
     sum_payments = 0
     if "payment" in features:
-        details["pay"] = get_accounting_detail(
-            _("Income"),
-            run,
-            _("Total participation fees received"),
-            AccountingItemPayment,
-            PaymentChoices.choices,
-            "pay",
-            filter_by_registration=True,
+        details["pay"] = _name_accounting_detail(
+            figures["pay"], _("Income"), PaymentChoices.choices, _("Total participation fees received")
         )
         sum_payments = details["pay"]["tot"]
 
     # Process transaction fees: accumulate all transfer commissions withheld
-    details["trs"] = get_accounting_detail(
-        _("Transactions"),
-        run,
-        _("Total amount withheld for transfer commissions"),
-        AccountingItemTransaction,
-        None,
-        None,
-        filter_by_registration=True,
+    details["trs"] = _name_accounting_detail(
+        figures["trs"], _("Transactions"), None, _("Total amount withheld for transfer commissions")
     )
     sum_fees = details["trs"]["tot"]
 
     # Process refunds: accumulate all amounts refunded to participants for cancellations
     sum_refund = 0
     if "refund" in features:
-        details["ref"] = get_accounting_detail(
-            _("Refunds"),
-            run,
-            _("Total amount refunded to participants"),
-            AccountingItemOther,
-            OtherChoices.choices,
-            "oth",
-            filters={"cancellation__exact": True},
+        details["ref"] = _name_accounting_detail(
+            figures["ref"], _("Refunds"), OtherChoices.choices, _("Total amount refunded to participants")
         )
         sum_refund = details["ref"]["tot"]
 
     # Process tokens and credits: accumulate all issued tokens and credits
-    sum_tokens, sum_credits = _process_tokens_credits(run, features, context, details)
+    sum_tokens, sum_credits = _process_tokens_credits(figures, features, context, details)
 
     # Process discounts: accumulate all participation fee reductions
     if "discount" in features:
-        details["dis"] = get_accounting_detail(
-            _("Discount"),
-            run,
-            _("Total participation fees reduced through discounts"),
-            AccountingItemDiscount,
-            None,
-            None,
+        details["dis"] = _name_accounting_detail(
+            figures["dis"], _("Discount"), None, _("Total participation fees reduced through discounts")
         )
 
     # Process registrations: get theoretical total based on selected ticket tiers
-    details["registration"] = get_accounting_registration_detail(
+    details["registration"] = _name_accounting_detail(
+        figures["registration"],
         _("Registrations"),
-        run,
+        TicketTier.choices,
         _("Expected total income from participation fees selected by participants"),
     )
 
@@ -496,6 +529,67 @@ def check_run_accounting(run: Run) -> None:
     )
 
 
+def _compute_association_accounting_sums(association_id: int, year: int | None) -> dict[str, Decimal | int]:
+    """Sum the monetary flows of an association for a year (or all time) from the ledger rollup."""
+    # Determine the date range for filtering accounting records
+    if year:
+        start_date = date(year, 1, 1)
+        end_date = date(year, 12, 31)
+    else:
+        # Use a very wide range to capture all records
+        start_date = date(1990, 1, 1)
+        end_date = date(2990, 1, 1)
+
+    sums = AccountingLedgerRollup.objects.filter(
+        association_id=association_id, day__gte=start_date, day__lte=end_date
+    ).aggregate(
+        # Executive-level flows (not associated with any specific run)
+        outflow_exec_sum=Sum("total", filter=Q(category=LedgerCategory.OUTFLOW, run__isnull=True)),
+        inflow_exec_sum=Sum("total", filter=Q(category=LedgerCategory.INFLOW, run__isnull=True)),
+        # Membership fees, donations and collections (gifts/prepaid credits) received
+        membership_sum=Sum("total", filter=Q(category=LedgerCategory.MEMBERSHIP)),
+        donations_sum=Sum("total", filter=Q(category=LedgerCategory.DONATION)),
+        collections_sum=Sum("total", filter=Q(category=LedgerCategory.COLLECTION)),
+        # All inflows and outflows for the association
+        inflow_sum=Sum("total", filter=Q(category=LedgerCategory.INFLOW)),
+        outflow_sum=Sum("total", filter=Q(category=LedgerCategory.OUTFLOW)),
+        # Cash payments received (excluding online/bank transfers)
+        pay_money_sum=Sum("total", filter=Q(category=LedgerCategory.PAYMENT, kind=PaymentChoices.MONEY)),
+        # Transaction fees charged by payment processors, and refunds issued
+        transactions_sum=Sum("total", filter=Q(category=LedgerCategory.TRANSACTION)),
+        refund_sum=Sum(
+            "total",
+            filter=Q(category__in=[LedgerCategory.OTHER, LedgerCategory.REFUND], kind=OtherChoices.REFUND),
+        ),
+    )
+    return {key: value or 0 for key, value in sums.items()}
+
+
+def get_association_accounting_sums(association_id: int, year: int | None = None) -> dict[str, Decimal | int]:
+    """Get the cached accounting sums of an association for a year (or all time).
+
+    All years of an association share one cache entry, invalidated by the
+    accounting item signals.
+
+    Args:
+        association_id: Association to get the sums for
+        year: Optional year to filter data, None for all years
+
+    Returns:
+        dict: Sums by context key (outflow_exec_sum, membership_sum, ...)
+
+    """
+    cache_key = get_association_accounting_report_cache_key(association_id)
+    sums_by_year = cache.get(cache_key) or {}
+
+    year_key = year or 0
+    if year_key not in sums_by_year:
+        sums_by_year[year_key] = _compute_association_accounting_sums(association_id, year)
+        cache.set(cache_key, sums_by_year, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+
+    return sums_by_year[year_key]
+
+
 def association_accounting_data(context: dict, year: int | None = None) -> None:
     """Gather association accounting data for a specific year or all time.
 
@@ -523,102 +617,7 @@ def association_accounting_data(context: dict, year: int | None = None) -> None:
         - out_sum: Total outgoing money
 
     """
-    # Determine the date range for filtering accounting records
-    if year:
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-    else:
-        # Use a very wide range to capture all records
-        start_date = date(1990, 1, 1)
-        end_date = date(2990, 1, 1)
-
-    # Calculate executive-level outflows (not associated with any specific run)
-    context["outflow_exec_sum"] = get_sum(
-        AccountingItemOutflow.objects.filter(
-            run=None,
-            association_id=context["association_id"],
-            payment_date__gte=start_date,
-            payment_date__lte=end_date,
-        ),
-    )
-    # Calculate executive-level inflows (not associated with any specific run)
-    context["inflow_exec_sum"] = get_sum(
-        AccountingItemInflow.objects.filter(
-            run=None,
-            association_id=context["association_id"],
-            payment_date__gte=start_date,
-            payment_date__lte=end_date,
-        ),
-    )
-
-    # Calculate membership fees collected
-    context["membership_sum"] = get_sum(
-        AccountingItemMembership.objects.filter(
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
-    # Calculate donations received
-    context["donations_sum"] = get_sum(
-        AccountingItemDonation.objects.filter(
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
-    # Calculate collections (gifts/prepaid credits) received
-    context["collections_sum"] = get_sum(
-        AccountingItemCollection.objects.filter(
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
-
-    # Calculate all inflows for the association
-    context["inflow_sum"] = get_sum(
-        AccountingItemInflow.objects.filter(
-            association_id=context["association_id"],
-            payment_date__gte=start_date,
-            payment_date__lte=end_date,
-        ),
-    )
-    # Calculate all outflows for the association
-    context["outflow_sum"] = get_sum(
-        AccountingItemOutflow.objects.filter(
-            association_id=context["association_id"],
-            payment_date__gte=start_date,
-            payment_date__lte=end_date,
-        ),
-    )
-
-    # Calculate cash payments received (excluding online/bank transfers)
-    context["pay_money_sum"] = get_sum(
-        AccountingItemPayment.objects.filter(
-            pay=PaymentChoices.MONEY,
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
-    # Calculate transaction fees charged by payment processors
-    context["transactions_sum"] = get_sum(
-        AccountingItemTransaction.objects.filter(
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
-    # Calculate total refunds issued
-    context["refund_sum"] = get_sum(
-        AccountingItemOther.objects.filter(
-            oth=OtherChoices.REFUND,
-            association_id=context["association_id"],
-            created__gte=start_date,
-            created__lte=end_date,
-        ),
-    )
+    context.update(get_association_accounting_sums(context["association_id"], year))
 
     # Calculate net incoming and outgoing sums
     context["in_sum"] = (
@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING
 
 from cryptography.fernet import Fernet, InvalidToken
 
+from larpmanager.accounting.ledger import get_ledger_buckets, get_ledger_source, refresh_ledger_buckets
 from larpmanager.cache.basic import get_run_association_id, get_run_event_id
 from larpmanager.cache.config import get_association_config, get_event_config
 from larpmanager.cache.feature import get_event_features
@@ -162,7 +163,12 @@ def handle_accounting_item_payment_pre_save(instance: AccountingItemPayment) ->
 
         # Update all related transactions if registration changed using bulk update
         if prev.registration_id != instance.registration_id:
-            AccountingItemTransaction.objects.filter(inv_id=instance.inv_id).update(registration=instance.registration)
+            transactions = AccountingItemTransaction.objects.filter(inv_id=instance.inv_id)
+            # The bulk update skips the signals: move the transactions between ledger buckets by hand
+            ledger_source = get_ledger_source(AccountingItemTransaction)
+            ledger_buckets = get_ledger_buckets(ledger_source, transactions)
+            transactions.update(registration=instance.registration)
+            refresh_ledger_buckets(ledger_source, ledger_buckets | get_ledger_buckets(ledger_source, transactions))
     else:
         # Early return if payment should be hidden from notifications
         if instance.hide:
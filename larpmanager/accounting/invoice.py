@@ -26,17 +26,24 @@ import csv
 import logging
 import math
 import re
+from collections import defaultdict
+from dataclasses import dataclass, field
 from decimal import Decimal
 from io import StringIO
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.utils import timezone
 
+from larpmanager.cache.accounting import clear_member_accounting_snapshots
+from larpmanager.cache.widget import clear_widget_cache_association
 from larpmanager.models.accounting import PaymentInvoice, PaymentStatus
 from larpmanager.utils.core.common import clean, detect_delimiter
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.core.files.uploadedfile import InMemoryUploadedFile
 
 logger = logging.getLogger(__name__)
@@ -106,77 +113,123 @@ def _extract_row_payment(row: list[str]) -> tuple[str, float] | None:
     return payment_causal, payment_amount
 
 
-def _invoice_matches(pending_invoice: PaymentInvoice, payment_causal: str) -> bool:
-    """Check whether a CSV payment causal matches a pending invoice.
+# Length of the window used to look up needles in a cleaned statement causal
+_MATCH_PREFIX_LENGTH = 6
+
 
-    All comparisons go through clean(), which lowercases and strips symbols,
-    spaces and accents, so formatting differences in the bank statement
-    (punctuation, casing, extra whitespace) do not prevent a match.
+def _invoice_needles(pending_invoice: PaymentInvoice) -> list[tuple[str, bool]]:
+    """List the cleaned strings identifying a pending invoice in a bank statement causal.
 
     Args:
-        pending_invoice: Pending invoice to match against
-        payment_causal: Causal text from the bank CSV row
+        pending_invoice: Pending invoice, optionally with the registration code in reg_cod
 
     Returns:
-        True if the payment causal matches the invoice by causal text,
-        causal without the special code prefix, invoice code
-        or transaction ID
+        List of (cleaned needle, is_code) pairs: codes (invoice code, transaction ID,
+        registration code) identify a single invoice, causal texts may be shared
 
     """
-    cleaned_payment: str = clean(payment_causal)
-
-    # Try to match causal text directly
-    if clean(pending_invoice.causal) in cleaned_payment:
-        return True
+    needles = [(pending_invoice.causal, False)]
 
     # With the payment_special_code setting the causal is prefixed with
     # "{cod} - "; also try the causal without the code, since payers
     # often omit it in the bank transfer reason
     special_code_prefix: str = f"{pending_invoice.cod} - "
     if pending_invoice.causal.startswith(special_code_prefix):
-        causal_without_code = pending_invoice.causal[len(special_code_prefix) :]
-        if clean(causal_without_code) in cleaned_payment:
-            return True
+        needles.append((pending_invoice.causal[len(special_code_prefix) :], False))
 
-    # Try matching the invoice code, communicated to the payer in the
-    # wire transfer instructions
-    if pending_invoice.cod and clean(pending_invoice.cod) in cleaned_payment:
-        return True
+    # Invoice code communicated in the wire transfer instructions, gateway
+    # transaction ID and registration code
+    needles.extend(
+        (code, True)
+        for code in (pending_invoice.cod, pending_invoice.txn_id, getattr(pending_invoice, "reg_cod", None))
+        if code
+    )
 
-    # Try matching transaction ID if available
-    return bool(pending_invoice.txn_id and clean(pending_invoice.txn_id) in cleaned_payment)
+    # Empty needles would match every row
+    return [(clean(str(needle)), is_code) for needle, is_code in needles if clean(str(needle))]
 
 
-def invoice_verify(context: dict, csv_upload: InMemoryUploadedFile) -> int:
-    """Verify and match payments from CSV upload against pending invoices.
+class InvoiceMatchIndex:
+    """Hash index of the pending invoices, to match bank statement causals.
 
-    Processes a CSV file containing payment data and matches entries against
-    pending payment invoices using causal codes, registration codes, or transaction IDs.
-    Marks matching invoices as verified when payment amounts are sufficient.
+    Every needle of every invoice is indexed by its first characters; a statement
+    causal is cleaned like the needles and each window of that length is looked up,
+    confirming only the needles that start at that position. Matching a row costs
+    one lookup per character instead of a substring check per invoice.
+    """
+
+    def __init__(self, pending_invoices: Iterable[PaymentInvoice]) -> None:
+        """Index the needles of the unverified invoices."""
+        self.invoices: dict[int, PaymentInvoice] = {}
+        self._by_prefix: dict[str, list[tuple[str, int, bool]]] = defaultdict(list)
+        self._short_needles: list[tuple[str, int, bool]] = []
+
+        for pending_invoice in pending_invoices:
+            if pending_invoice.verified:
+                continue
+            self.invoices[pending_invoice.pk] = pending_invoice
+            for needle, is_code in _invoice_needles(pending_invoice):
+                if len(needle) >= _MATCH_PREFIX_LENGTH:
+                    self._by_prefix[needle[:_MATCH_PREFIX_LENGTH]].append((needle, pending_invoice.pk, is_code))
+                else:
+                    self._short_needles.append((needle, pending_invoice.pk, is_code))
+
+    def match(self, payment_causal: str) -> tuple[set[int], set[int]]:
+        """Find the invoices whose needles appear in a statement causal.
+
+        Args:
+            payment_causal: Causal text from the bank CSV row
+
+        Returns:
+            Tuple of (invoice ids matched by a code, invoice ids matched by causal text)
+
+        """
+        cleaned_payment: str = clean(payment_causal)
+        code_matches: set[int] = set()
+        causal_matches: set[int] = set()
+
+        for position in range(len(cleaned_payment) - _MATCH_PREFIX_LENGTH + 1):
+            window = cleaned_payment[position : position + _MATCH_PREFIX_LENGTH]
+            for needle, invoice_id, is_code in self._by_prefix.get(window, ()):
+                if cleaned_payment.startswith(needle, position):
+                    (code_matches if is_code else causal_matches).add(invoice_id)
+
+        for needle, invoice_id, is_code in self._short_needles:
+            if needle in cleaned_payment:
+                (code_matches if is_code else causal_matches).add(invoice_id)
+
+        return code_matches, causal_matches
+
+
+@dataclass
+class ReconciliationResult:
+    """Outcome of matching a bank statement against the pending invoices."""
+
+    verified: list[PaymentInvoice] = field(default_factory=list)
+    ambiguous: list[tuple[str, list[PaymentInvoice]]] = field(default_factory=list)
+
+
+def reconcile_invoices(pending_invoices: Iterable[PaymentInvoice], csv_content: str) -> ReconciliationResult:
+    """Match the rows of a bank statement against pending invoices.
+
+    Invoices matched by a code (invoice code, transaction ID, registration code)
+    take precedence over those matched by causal text. A row is applied only when
+    it identifies exactly one unverified invoice whose amount it covers (rounded up);
+    rows matching several invoices are reported as ambiguous.
 
     Args:
-        context (dict): Context dictionary containing 'todo' key with list of pending invoices
-        csv_upload (InMemoryUploadedFile): Uploaded CSV file containing payment data with
-            format [amount, causal, ...] where amount uses dot for thousands
-            and comma for decimal separator
+        pending_invoices: Invoices to verify
+        csv_content: Bank statement in CSV format, rows as [amount, causal, ...]
 
     Returns:
-        int: Number of successfully verified payments
-
-    Note:
-        CSV format expected: [amount, causal, ...] where amount uses dot for thousands
-        and comma for decimal separator. Only processes unverified invoices where
-        payment amount meets or exceeds invoice amount.
+        ReconciliationResult with the invoices to verify and the ambiguous rows
 
     """
-    # Decode CSV content and detect delimiter
-    csv_content: str = csv_upload.read().decode("utf-8")
-    delimiter: str = detect_delimiter(csv_content)
-    csv_data = csv.reader(StringIO(csv_content), delimiter=delimiter)
-
-    verified_payments_count: int = 0
+    index = InvoiceMatchIndex(pending_invoices)
+    result = ReconciliationResult()
+    verified_ids: set[int] = set()
 
-    # Process each row in the CSV file
+    csv_data = csv.reader(StringIO(csv_content), delimiter=detect_delimiter(csv_content))
     for row in csv_data:
         # Skip malformed rows, missing causal or unparsable amount (e.g. header rows)
         row_payment = _extract_row_payment(row)
@@ -184,33 +237,70 @@ def invoice_verify(context: dict, csv_upload: InMemoryUploadedFile) -> int:
             continue
 
         payment_causal, payment_amount = row_payment
+        code_matches, causal_matches = index.match(payment_causal)
+
+        # Keep the invoices still pending whose amount is covered by the payment
+        # (amount difference > 0 means overpayment, which is fine)
+        candidates = [
+            index.invoices[invoice_id]
+            for invoice_id in sorted((code_matches or causal_matches) - verified_ids)
+            if math.ceil(payment_amount) >= math.ceil(float(index.invoices[invoice_id].mc_gross))
+        ]
+
+        if len(candidates) > 1:
+            result.ambiguous.append((payment_causal, candidates))
+            continue
 
-        # Check payment against all pending invoices
-        for pending_invoice in context["todo"]:
-            # Skip already verified invoices
-            if pending_invoice.verified:
-                continue
+        if candidates:
+            verified_ids.add(candidates[0].pk)
+            result.verified.append(candidates[0])
 
-            # Skip if no match found
-            if not _invoice_matches(pending_invoice, payment_causal):
-                continue
+    return result
 
-            # Verify payment amount is sufficient (rounded up)
-            # amount_difference > 0 means overpayment (ok), < 0 means underpayment (skip)
-            amount_difference: float = math.ceil(payment_amount) - math.ceil(
-                float(pending_invoice.mc_gross),
-            )
-            if amount_difference < 0:
-                # Payment is less than invoice amount - skip this invoice
-                continue
 
-            # Mark invoice as verified and increment counter
-            verified_payments_count += 1
-            with transaction.atomic():
-                pending_invoice.verified = True
-                pending_invoice.save()
+def invoice_verify(context: dict, csv_upload: InMemoryUploadedFile) -> int:
+    """Verify and match payments from CSV upload against pending invoices.
 
-    return verified_payments_count
+    Processes a CSV file containing payment data and matches entries against
+    pending payment invoices using causal codes, registration codes, or transaction IDs.
+    Marks matching invoices as verified when payment amounts are sufficient, with a
+    single bulk update.
+
+    Args:
+        context (dict): Context dictionary containing 'todo' key with list of pending invoices;
+            rows matching more than one invoice are stored in its 'ambiguous' key
+        csv_upload (InMemoryUploadedFile): Uploaded CSV file containing payment data with
+            format [amount, causal, ...] where amount uses dot for thousands
+            and comma for decimal separator
+
+    Returns:
+        int: Number of successfully verified payments
+
+    """
+    # Decode CSV content and match it against the pending invoices
+    csv_content: str = csv_upload.read().decode("utf-8")
+    result = reconcile_invoices(context["todo"], csv_content)
+    context["ambiguous"] = result.ambiguous
+
+    if not result.verified:
+        return 0
+
+    # Apply all verifications with one update, which skips the post_save: the member
+    # accounting snapshots and the widgets it would reset are cleared below
+    PaymentInvoice.objects.filter(pk__in=[invoice.pk for invoice in result.verified]).update(
+        verified=True, updated=timezone.now()
+    )
+    for invoice in result.verified:
+        invoice.verified = True
+
+    members_by_association = defaultdict(set)
+    for invoice in result.verified:
+        members_by_association[invoice.association_id].add(invoice.member_id)
+    for association_id, member_ids in members_by_association.items():
+        clear_member_accounting_snapshots(association_id, member_ids)
+        clear_widget_cache_association(association_id)
+
+    return len(result.verified)
 
 
 def invoice_received_money(
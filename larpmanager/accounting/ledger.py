@@ -0,0 +1,304 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Daily ledger rollup of the accounting items, maintained incrementally."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, CharField, Count, F, IntegerField, Sum, Value, When
+from django.db.models.functions import TruncDate
+
+from larpmanager.models.accounting import (
+    AccountingItem,
+    AccountingItemCollection,
+    AccountingItemDiscount,
+    AccountingItemDonation,
+    AccountingItemExpense,
+    AccountingItemInflow,
+    AccountingItemMembership,
+    AccountingItemOther,
+    AccountingItemOutflow,
+    AccountingItemPayment,
+    AccountingItemTransaction,
+    AccountingLedgerRollup,
+    LedgerCategory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date
+    from decimal import Decimal
+
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+# A bucket is the (association_id, run_id, day) slice of a source rolled up together
+LedgerBucket = tuple[int, int | None, "date | None"]
+
+# Rollup key: (association_id, run_id, day, category, kind)
+LedgerKey = tuple[int, int | None, "date | None", str, str]
+
+
+class LedgerSource(NamedTuple):
+    """How an accounting item model is rolled up into the ledger."""
+
+    model: type[AccountingItem]
+    categories: tuple[str, ...]
+    run_field: str | None
+    type_field: str | None
+    date_field: str
+
+
+LEDGER_SOURCES = [
+    LedgerSource(AccountingItemExpense, (LedgerCategory.EXPENSE,), "run_id", "exp", "created"),
+    LedgerSource(AccountingItemOutflow, (LedgerCategory.OUTFLOW,), "run_id", "exp", "payment_date"),
+    LedgerSource(AccountingItemInflow, (LedgerCategory.INFLOW,), "run_id", None, "payment_date"),
+    LedgerSource(AccountingItemPayment, (LedgerCategory.PAYMENT,), "registration__run_id", "pay", "created"),
+    LedgerSource(AccountingItemTransaction, (LedgerCategory.TRANSACTION,), "registration__run_id", None, "created"),
+    LedgerSource(AccountingItemDiscount, (LedgerCategory.DISCOUNT,), "run_id", None, "created"),
+    # Other items are split between refunds (cancellations) and other entries
+    LedgerSource(AccountingItemOther, (LedgerCategory.OTHER, LedgerCategory.REFUND), "run_id", "oth", "created"),
+    LedgerSource(AccountingItemMembership, (LedgerCategory.MEMBERSHIP,), None, None, "created"),
+    LedgerSource(AccountingItemDonation, (LedgerCategory.DONATION,), None, None, "created"),
+    LedgerSource(AccountingItemCollection, (LedgerCategory.COLLECTION,), None, None, "created"),
+]
+
+_SOURCES_BY_MODEL = {source.model: source for source in LEDGER_SOURCES}
+
+
+def get_ledger_source(model_class: type) -> LedgerSource | None:
+    """Get the ledger source of an accounting item model, None if it is not rolled up."""
+    return _SOURCES_BY_MODEL.get(model_class)
+
+
+def _annotate_bucket(source: LedgerSource, queryset: QuerySet) -> QuerySet:
+    """Annotate a source queryset with its ledger run and day, clearing the default ordering."""
+    return queryset.order_by().annotate(
+        ledger_run=F(source.run_field) if source.run_field else Value(None, output_field=IntegerField()),
+        ledger_day=TruncDate(source.date_field) if source.date_field == "created" else F(source.date_field),
+    )
+
+
+def _ledger_rows(source: LedgerSource, queryset: QuerySet) -> dict[LedgerKey, tuple[Decimal, int]]:
+    """Aggregate a source queryset into rollup rows with a single grouped query.
+
+    Args:
+        source: Ledger source of the queryset model
+        queryset: Accounting items to aggregate
+
+    Returns:
+        dict: (total, num) by rollup key
+
+    """
+    category = (
+        Case(
+            When(cancellation=True, then=Value(LedgerCategory.REFUND)),
+            default=Value(LedgerCategory.OTHER),
+            output_field=CharField(),
+        )
+        if source.model is AccountingItemOther
+        else Value(source.categories[0], output_field=CharField())
+    )
+    rows = (
+        _annotate_bucket(source, queryset)
+        .annotate(
+            ledger_category=category,
+            ledger_kind=F(source.type_field) if source.type_field else Value("", output_field=CharField()),
+        )
+        .values("association_id", "ledger_run", "ledger_day", "ledger_category", "ledger_kind")
+        .annotate(total=Sum("value"), num=Count("id"))
+    )
+    return {
+        (row["association_id"], row["ledger_run"], row["ledger_day"], row["ledger_category"], row["ledger_kind"]): (
+            row["total"],
+            row["num"],
+        )
+        for row in rows
+    }
+
+
+def get_ledger_buckets(source: LedgerSource, queryset: QuerySet) -> set[LedgerBucket]:
+    """Get the rollup buckets the accounting items of a queryset fall into."""
+    return set(_annotate_bucket(source, queryset).values_list("association_id", "ledger_run", "ledger_day").distinct())
+
+
+def _lock_ledger_bucket(source: LedgerSource, bucket: LedgerBucket) -> None:
+    """Serialize the recomputations of a bucket until the end of the transaction.
+
+    Without it two concurrent saves in the same bucket could each write a total
+    missing the item of the other one. The rollup rows may not exist yet, so an
+    advisory lock is taken instead of locking them.
+    """
+    if connection.vendor != "postgresql":
+        return
+
+    association_id, run_id, day = bucket
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            [f"ledger:{source.model.__name__}:{association_id}:{run_id}:{day}"],
+        )
+
+
+def refresh_ledger_buckets(source: LedgerSource, buckets: Iterable[LedgerBucket]) -> None:
+    """Recompute the rollup rows of a source for the given buckets from the raw items.
+
+    Each bucket is a single association, run and day, so the recomputation only
+    reads the handful of items of that day. Buckets are locked in a fixed order
+    before being read, so concurrent refreshes neither lose items nor deadlock.
+
+    Args:
+        source: Ledger source to refresh
+        buckets: (association_id, run_id, day) slices to recompute
+
+    """
+    with transaction.atomic():
+        for bucket in sorted(buckets, key=lambda bucket: (bucket[0], bucket[1] or 0, str(bucket[2]))):
+            _lock_ledger_bucket(source, bucket)
+            association_id, run_id, day = bucket
+            items = source.model.objects.filter(association_id=association_id)
+            if source.run_field:
+                items = items.filter(**{source.run_field: run_id})
+            if source.date_field == "created":
+                items = items.filter(created__date=day)
+            else:
+                items = items.filter(**{source.date_field: day})
+
+            rows = _ledger_rows(source, items)
+
+            # Drop the rows of the bucket left without items, then upsert the others
+            stale_ids = [
+                rollup_id
+                for rollup_id, category, kind in AccountingLedgerRollup.objects.filter(
+                    association_id=association_id, run_id=run_id, day=day, category__in=source.categories
+                ).values_list("id", "category", "kind")
+                if (association_id, run_id, day, category, kind) not in rows
+            ]
+            if stale_ids:
+                AccountingLedgerRollup.objects.filter(pk__in=stale_ids).delete()
+
+            _upsert_rollups(rows)
+
+
+def _upsert_rollups(rows: dict[LedgerKey, tuple[Decimal, int]]) -> None:
+    """Insert rollup rows, overwriting totals and counts of the existing ones."""
+    if not rows:
+        return
+
+    AccountingLedgerRollup.objects.bulk_create(
+        _build_rollups(rows),
+        update_conflicts=True,
+        unique_fields=["association", "run", "day", "category", "kind"],
+        update_fields=["total", "num"],
+    )
+
+
+def _build_rollups(rows: dict[LedgerKey, tuple[Decimal, int]]) -> list[AccountingLedgerRollup]:
+    """Build (unsaved) rollup instances from aggregated rows."""
+    return [
+        AccountingLedgerRollup(
+            association_id=association_id, run_id=run_id, day=day, category=category, kind=kind, total=total, num=num
+        )
+        for (association_id, run_id, day, category, kind), (total, num) in rows.items()
+    ]
+
+
+def capture_ledger_buckets(instance: Any) -> None:
+    """Remember the bucket of an accounting item before it is saved, to refresh it if it moves."""
+    source = get_ledger_source(type(instance))
+    if source is None or not instance.pk:
+        return
+
+    instance._ledger_buckets = get_ledger_buckets(source, source.model.objects.filter(pk=instance.pk))  # noqa: SLF001
+
+
+def update_ledger_rollup(instance: Any) -> None:
+    """Refresh the rollup rows affected by a saved (or soft deleted) accounting item."""
+    source = get_ledger_source(type(instance))
+    if source is None:
+        return
+
+    # Previous bucket (captured before save) plus the current one
+    buckets = set(getattr(instance, "_ledger_buckets", set()))
+    buckets |= get_ledger_buckets(source, source.model.all_objects.filter(pk=instance.pk))
+    refresh_ledger_buckets(source, buckets)
+
+
+def compute_association_ledger(association_id: int) -> dict[LedgerKey, tuple[Decimal, int]]:
+    """Aggregate every accounting item of an association into the expected rollup rows."""
+    rows = {}
+    for source in LEDGER_SOURCES:
+        rows.update(_ledger_rows(source, source.model.objects.filter(association_id=association_id)))
+    return rows
+
+
+def verify_association_ledger(association_id: int) -> list[LedgerKey]:
+    """Compare the stored rollup of an association with its raw accounting items.
+
+    Args:
+        association_id: Association to verify
+
+    Returns:
+        list: Rollup keys whose stored total or count differs from the raw data
+
+    """
+    expected = compute_association_ledger(association_id)
+    stored = {
+        (rollup.association_id, rollup.run_id, rollup.day, rollup.category, rollup.kind): (rollup.total, rollup.num)
+        for rollup in AccountingLedgerRollup.objects.filter(association_id=association_id)
+    }
+    return [key for key in expected.keys() | stored.keys() if expected.get(key) != stored.get(key)]
+
+
+def rebuild_association_ledger(association_id: int) -> int:
+    """Replace the rollup of an association with one computed from the raw accounting items.
+
+    Args:
+        association_id: Association to rebuild
+
+    Returns:
+        int: Number of rollup rows written
+
+    """
+    rollups = _build_rollups(compute_association_ledger(association_id))
+    with transaction.atomic():
+        AccountingLedgerRollup.objects.filter(association_id=association_id).delete()
+        AccountingLedgerRollup.objects.bulk_create(rollups, batch_size=1000)
+
+    # Drop the balance reports built on the previous rollup (local import: cache.accounting imports accounting.base)
+    from larpmanager.cache.accounting import (  # noqa: PLC0415
+        get_association_accounting_report_cache_key,
+        get_run_accounting_report_cache_key,
+    )
+
+    run_ids = {rollup.run_id for rollup in rollups if rollup.run_id}
+    cache.delete_many(
+        [get_association_accounting_report_cache_key(association_id)]
+        + [get_run_accounting_report_cache_key(run_id) for run_id in run_ids]
+    )
+
+    logger.debug("Rebuilt %s ledger rollup rows for association %s", len(rollups), association_id)
+    return len(rollups)
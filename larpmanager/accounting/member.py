@@ -25,8 +25,14 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from dateutil.relativedelta import relativedelta
+from django.conf import settings as conf_settings
 from django.utils import timezone
 
+from larpmanager.cache.accounting import (
+    get_member_accounting_history_cache_key,
+    get_member_accounting_snapshot_cache_key,
+)
+from larpmanager.cache.builder import get_or_build
 from larpmanager.cache.config import get_association_config
 from larpmanager.cache.feature import get_association_features
 from larpmanager.models.accounting import (
@@ -48,12 +54,22 @@ from larpmanager.models.member import Member, MemberConfig, get_user_membership
 from larpmanager.models.registration import Registration
 from larpmanager.utils.core.common import get_now
 
+# Snapshot entries copied into the context, by the feature that shows them
+SNAPSHOT_FEATURE_KEYS = {
+    "membership": ("membership_fee", "year_membership_pending"),
+    "collection": ("collections", "collection_gifts"),
+    "donate": ("donations",),
+}
+
 
 def info_accounting(context: dict) -> None:
     """Gather comprehensive accounting information for a member.
 
     Collects registration history, payment status, membership fees, donations,
     collections, refunds, and token/credit balances for display in member dashboard.
+    The data comes from the member accounting snapshots: registrations of completed
+    runs are read from the history snapshot, which the accounting signals of open
+    runs leave untouched.
 
     Args:
         context: Context dictionary containing member object and association ID (association_id).
@@ -73,80 +89,171 @@ def info_accounting(context: dict) -> None:
 
     """
     member = context["member"]
+    association_id = context["association_id"]
     # Initialize user membership data for the given association
-    get_user_membership(member, context["association_id"])
-    context["registration_list"] = []
+    get_user_membership(member, association_id)
 
-    # Gather membership fee information and status
-    _info_membership(context, member)
+    snapshot = get_member_accounting(member, association_id)
+    history = get_member_accounting_history(member, association_id)
 
-    # Collect donation history and outstanding donations
-    _info_donations(context, member)
+    # Copy the sections of the enabled features
+    for feature, keys in SNAPSHOT_FEATURE_KEYS.items():
+        if feature in context["features"]:
+            for key in keys:
+                context[key] = snapshot[key]
 
-    # Process collection records and payment collections
-    _info_collections(context, member)
+    # Gather membership fee status for the current year
+    _info_membership(context)
 
-    # Initialize registration years tracking dictionary
+    # Initialize registration tracking and payment status lists
+    context["registration_list"] = []
     context["registration_years"] = {}
+    for status in ["payments_todo", "payments_pending"]:
+        context[status] = []
 
-    # Set up pending payments tracking for the member
-    pending_payments = _init_pending(member)
+    # Process each registration to populate payment and status information, newest first
+    # like the Registration ordering, whether its run is open or completed
+    registrations = sorted(
+        snapshot["registrations"] + history["registrations"],
+        key=lambda registration: registration.created,
+        reverse=True,
+    )
+    for registration in registrations:
+        _init_regs(context, snapshot["pending"], registration)
 
-    # Initialize payment choices and options
-    payment_choices = _init_choices(member)
+    # Open refund requests and token/credit history counts
+    context["refunds"] = snapshot["refunds"]
+    context["accounting_tokens"] = snapshot["accounting_tokens"]
+    context["accounting_credits"] = snapshot["accounting_credits"]
 
-    # Initialize payment status lists for todo and pending items
-    for status in ["payments_todo", "payments_pending"]:
-        context[status] = []
 
-    # Query all registrations for this member in the current association
-    # Exclude cancelled events from the development status
-    registration_query = Registration.objects.filter(
-        member=member,
-        run__event__association_id=context["association_id"],
+def get_member_accounting(member: Member, association_id: int) -> dict:
+    """Get the accounting snapshot of a member, built on cache miss.
+
+    Args:
+        member: Member to get the snapshot for
+        association_id: Association the accounting refers to
+
+    Returns:
+        dict: Snapshot with the registrations of the open runs, pending invoices,
+            membership fees, donations, collections, refunds and token/credit counts
+
+    """
+    return get_or_build(
+        get_member_accounting_snapshot_cache_key(association_id, member.id),
+        lambda: build_member_accounting(member, association_id),
+        name="member_accounting",
+    )
+
+
+def get_member_accounting_history(member: Member, association_id: int) -> dict:
+    """Get the registrations of a member in completed runs, built on cache miss.
+
+    Completed runs no longer change, so the history is kept for a week and only
+    dropped when one of its registrations or runs is saved.
+
+    Args:
+        member: Member to get the history for
+        association_id: Association the accounting refers to
+
+    Returns:
+        dict: History with the registrations of the completed runs
+
+    """
+    return get_or_build(
+        get_member_accounting_history_cache_key(association_id, member.id),
+        lambda: {"registrations": _get_member_registrations(member, association_id, history=True)},
+        timeout=conf_settings.CACHE_TIMEOUT_1_DAY * 7,
+        name="member_accounting_history",
     )
-    registration_query = registration_query.exclude(run__development__in=[DevelopStatus.CANC])
 
-    # Process each registration to populate payment and status information
-    for registration in registration_query.select_related("run", "run__event", "ticket"):
-        _init_regs(payment_choices, context, pending_payments, registration)
+
+def build_member_accounting(member: Member, association_id: int) -> dict:
+    """Build the accounting snapshot of a member.
+
+    All the sections are computed regardless of the enabled features, so the
+    snapshot stays valid when features are toggled.
+
+    Args:
+        member: Member to build the snapshot for
+        association_id: Association the accounting refers to
+
+    Returns:
+        dict: Accounting snapshot, see get_member_accounting
+
+    """
+    snapshot = {
+        "association_id": association_id,
+        "registrations": _get_member_registrations(member, association_id, history=False),
+        "pending": set(_init_pending(member)),
+    }
+
+    _info_membership_fees(snapshot, member)
+    _info_donations(snapshot, member)
+    _info_collections(snapshot, member)
 
     # Retrieve open refund requests for this member and association
-    context["refunds"] = context["member"].refund_requests.filter(
-        status=RefundStatus.REQUEST,
-        association_id=context["association_id"],
+    snapshot["refunds"] = list(
+        member.refund_requests.filter(status=RefundStatus.REQUEST, association_id=association_id),
     )
 
-    # Calculate and add token/credit balance information
-    _info_token_credit(context, member)
+    # Calculate token/credit history counts
+    _info_token_credit(snapshot, member)
+
+    return snapshot
+
+
+def _get_member_registrations(member: Member, association_id: int, *, history: bool) -> list[Registration]:
+    """Get the registrations of a member, with their selected options.
+
+    Args:
+        member: Member to get the registrations for
+        association_id: Association to filter the runs by
+        history: Whether to get the registrations of completed runs, or of the open ones
+
+    Returns:
+        list: Registrations with run, event and ticket loaded, and the opts attribute set
+
+    """
+    registration_query = Registration.objects.filter(member=member, run__event__association_id=association_id)
+
+    # Cancelled runs are never shown
+    if history:
+        registration_query = registration_query.filter(run__development=DevelopStatus.DONE)
+    else:
+        registration_query = registration_query.exclude(run__development__in=[DevelopStatus.CANC, DevelopStatus.DONE])
+
+    registrations = list(registration_query.select_related("run", "run__event", "ticket"))
+
+    # Attach the selected options of each registration
+    registration_choices = _init_choices(member, [registration.id for registration in registrations])
+    for registration in registrations:
+        registration.opts = registration_choices.get(registration.id, {})
+
+    return registrations
 
 
 def _init_regs(
-    registration_choices: dict[int, dict],
     context: dict,
-    pending_invoices: dict,
+    pending_registration_ids: set[int],
     registration: Registration,
 ) -> None:
-    """Initialize registration options and payment status tracking.
+    """Track the payment status of a registration.
 
     Args:
-        registration_choices: Dictionary mapping registration IDs to their selected options
         context: Context dictionary to update with payment status
-        pending_invoices: Dictionary of pending payment invoices
+        pending_registration_ids: Ids of the registrations with pending payment invoices
         registration: Registration instance to process
 
     Side effects:
-        Updates context with payments_pending and payments_todo lists
-        Sets registration.opts and registration.pending attributes
+        Updates context with registration_list, payments_pending and payments_todo lists
+        Sets registration.currently_pending attribute
 
     """
-    if registration.id not in registration_choices:
-        registration_choices[registration.id] = {}
-    registration.opts = registration_choices[registration.id]
     context["registration_list"].append(registration)
 
     # check if there is a pending payment
-    if registration.id in pending_invoices:
+    if registration.id in pending_registration_ids:
         registration.currently_pending = True
         context["payments_pending"].append(registration)
     elif registration.quota > 0:
@@ -180,11 +287,15 @@ def _init_pending(member: Member) -> dict[int, list[PaymentInvoice]]:
     return pending_payments_by_registration
 
 
-def _init_choices(member: Member) -> dict[int, dict[int, dict[str, RegistrationQuestion | list[RegistrationOption]]]]:
+def _init_choices(
+    member: Member,
+    registration_ids: list[int] | None = None,
+) -> dict[int, dict[int, dict[str, RegistrationQuestion | list[RegistrationOption]]]]:
     """Initialize registration choice tracking for a member.
 
     Args:
         member: Member instance to get registration choices for
+        registration_ids: Optional registrations to restrict the choices to
 
     Returns:
         dict: Nested mapping of registration and question IDs to selected options
@@ -194,6 +305,8 @@ def _init_choices(member: Member) -> dict[int, dict[int, dict[str, RegistrationQ
     choice_queryset = RegistrationChoice.objects.filter(
         registration__member_id=member.id, question__typ__in=[BaseQuestionType.SINGLE, BaseQuestionType.MULTIPLE]
     )
+    if registration_ids is not None:
+        choice_queryset = choice_queryset.filter(registration_id__in=registration_ids)
     choice_queryset = choice_queryset.select_related("option", "question").order_by("question__order")
     for registration_choice in choice_queryset:
         if registration_choice.registration_id not in choices:
@@ -242,47 +355,70 @@ def _info_token_credit(context: dict, member: Member) -> None:
     context["accounting_credits"] = expense_queryset.count() + credit_queryset.count()
 
 
-def _info_collections(context: dict, member: Member) -> None:
-    """Get collection information if collections feature is enabled."""
-    if "collection" not in context["features"]:
-        return
-
-    context["collections"] = Collection.objects.filter(organizer=member, association_id=context["association_id"])
-    context["collection_gifts"] = AccountingItemCollection.objects.filter(
-        member=member,
-        collection__association_id=context["association_id"],
+def _info_collections(snapshot: dict, member: Member) -> None:
+    """Get the collections organized by the member and the ones it contributed to."""
+    snapshot["collections"] = list(
+        Collection.objects.filter(organizer=member, association_id=snapshot["association_id"]),
+    )
+    snapshot["collection_gifts"] = list(
+        AccountingItemCollection.objects.filter(
+            member=member,
+            collection__association_id=snapshot["association_id"],
+        ).select_related("collection__member"),
     )
 
 
-def _info_donations(context: dict, member: Member) -> None:
-    """Get donation history if donations feature is enabled."""
-    if "donate" not in context["features"]:
-        return
+def _info_donations(snapshot: dict, member: Member) -> None:
+    """Get the donation history of the member."""
+    donation_queryset = AccountingItemDonation.objects.filter(member=member, association_id=snapshot["association_id"])
+    snapshot["donations"] = list(donation_queryset.order_by("-created"))
+
+
+def _info_membership_fees(snapshot: dict, member: Member) -> None:
+    """Get the membership fee history of the member.
+
+    Args:
+        snapshot: Snapshot dictionary containing association ID, updated with
+            membership_fee (years with a membership fee) and year_membership_pending
+            (whether a membership payment is awaiting approval)
+        member: Member instance to retrieve membership information for
+
+    """
+    # Retrieve all membership fee years for this member and association
+    snapshot["membership_fee"] = list(
+        AccountingItemMembership.objects.filter(
+            member=member,
+            association_id=snapshot["association_id"],
+        )
+        .order_by("year")
+        .values_list("year", flat=True),
+    )
 
-    donation_queryset = AccountingItemDonation.objects.filter(member=member, association_id=context["association_id"])
-    context["donations"] = donation_queryset.order_by("-created")
+    # Check for pending membership payment invoices
+    snapshot["year_membership_pending"] = PaymentInvoice.objects.filter(
+        member=member,
+        status=PaymentStatus.SUBMITTED,
+        typ=PaymentType.MEMBERSHIP,
+    ).exists()
 
 
-def _info_membership(context: dict, member: Member) -> None:
-    """Get membership fee information if membership feature is enabled.
+def _info_membership(context: dict) -> None:
+    """Get membership fee status for the current year if membership feature is enabled.
 
-    Retrieves and adds membership-related information to the context dictionary,
-    including fee history, current year status, pending payments, and grace period
-    calculations. Only processes if the membership feature is enabled for the association.
+    Adds the current year status and grace period calculations to the context,
+    from the membership fee history already copied from the member snapshot.
+    Only processes if the membership feature is enabled for the association.
 
     Args:
-        context: Context dictionary containing association ID, will be updated with
-             membership information including fee history and status flags
-        member: Member instance to retrieve membership information for
+        context: Context dictionary containing association ID and membership_fee,
+             will be updated with the current year status flags
 
     Returns:
         None: Function modifies context dictionary in-place
 
     Side Effects:
         Updates context with the following keys if membership feature is enabled:
-        - membership_fee: List of years with membership fees
         - year_membership_fee: Boolean indicating if current year fee exists
-        - year_membership_pending: Boolean indicating pending membership payments
         - year: Current year
         - grazing: Boolean indicating if within grace period
 
@@ -294,26 +430,9 @@ def _info_membership(context: dict, member: Member) -> None:
     # Get current year for membership calculations
     current_year = timezone.now().year
 
-    # Retrieve all membership fee years for this member and association
-    context["membership_fee"] = []
-    for membership_item in AccountingItemMembership.objects.filter(
-        member=member,
-        association_id=context["association_id"],
-    ).order_by("year"):
-        context["membership_fee"].append(membership_item.year)
-
     # Check if current year membership fee exists
     context["year_membership_fee"] = current_year in context["membership_fee"]
 
-    # Check for pending membership payment invoices
-    pending_invoices_query = PaymentInvoice.objects.filter(
-        member=member,
-        status=PaymentStatus.SUBMITTED,
-        typ=PaymentType.MEMBERSHIP,
-    )
-    if pending_invoices_query.count() > 0:
-        context["year_membership_pending"] = True
-
     # Store current year in context
     context["year"] = current_year
 
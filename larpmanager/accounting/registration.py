@@ -24,6 +24,8 @@ from __future__ import annotations
 
 import logging
 import math
+from collections import defaultdict
+from datetime import datetime, time
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
@@ -34,12 +36,16 @@ from django.db import models, transaction
 from django.utils import timezone
 
 from larpmanager.accounting.base import is_registration_provisional, round_to_nearest_cent
+from larpmanager.accounting.ledger import get_ledger_buckets, get_ledger_source, refresh_ledger_buckets
 from larpmanager.accounting.token_credit import handle_tokes_credits
+from larpmanager.cache.accounting import clear_member_accounting_snapshots, clear_registration_accounting_cache
 from larpmanager.cache.basic import get_run_association_id, get_run_basic_cache, get_run_event_id
+from larpmanager.cache.character import bump_event_cache_generation
 from larpmanager.cache.config import get_event_config
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.links import reset_event_links
-from larpmanager.cache.run import get_event_runs
+from larpmanager.cache.registration import clear_registration_counts_cache
+from larpmanager.cache.run import clear_calendar_runs_cache, get_event_runs
 from larpmanager.mail.registration import update_registration_status_bkg
 from larpmanager.models.accounting import (
     AccountingItemDiscount,
@@ -52,7 +58,7 @@ from larpmanager.models.accounting import (
 from larpmanager.models.casting import AssignmentTrait
 from larpmanager.models.event import DevelopStatus, Event, Run
 from larpmanager.models.form import BaseQuestionType, RegistrationChoice, RegistrationOption
-from larpmanager.models.member import Member, MembershipStatus, get_user_membership
+from larpmanager.models.member import Member, Membership, MembershipStatus, get_user_membership
 from larpmanager.models.registration import (
     Registration,
     RegistrationCharacterRel,
@@ -62,6 +68,7 @@ from larpmanager.models.registration import (
     TicketTier,
 )
 from larpmanager.utils.core.common import get_time_diff, get_time_diff_today
+from larpmanager.utils.core.nav import invalidate_user_nav_entries
 from larpmanager.utils.larpmanager.tasks import background_auto
 
 if TYPE_CHECKING:
@@ -87,6 +94,28 @@ def get_registration_iscr(registration: Registration) -> int:
     Returns:
         int: Total signup fee after applying discounts and surcharges, minimum 0
     """
+    # Sum the prices of the registration choice options (extras, meals, etc.)
+    choices_total = 0
+    for choice in RegistrationChoice.objects.filter(
+        registration=registration, question__typ__in=[BaseQuestionType.SINGLE, BaseQuestionType.MULTIPLE]
+    ).select_related("option"):
+        choices_total += choice.option.price
+
+    # Sum the discounts of the member on the run
+    discounts_total = 0
+    if not registration.redeem_code:
+        discount_items = AccountingItemDiscount.objects.filter(
+            member_id=registration.member_id,
+            run_id=registration.run_id,
+        )
+        for discount_item in discount_items.select_related("disc"):
+            discounts_total += discount_item.disc.value
+
+    return _compute_registration_iscr(registration, choices_total, discounts_total)
+
+
+def _compute_registration_iscr(registration: Registration, choices_total: int, discounts_total: int) -> int:
+    """Compute the registration signup fee from the already summed option prices and discounts."""
     # Initialize total registration fee
     total_registration_fee = 0
 
@@ -102,19 +131,11 @@ def get_registration_iscr(registration: Registration) -> int:
         total_registration_fee += registration.pay_what
 
     # Add registration choice options (extras, meals, etc.)
-    for choice in RegistrationChoice.objects.filter(
-        registration=registration, question__typ__in=[BaseQuestionType.SINGLE, BaseQuestionType.MULTIPLE]
-    ).select_related("option"):
-        total_registration_fee += choice.option.price
+    total_registration_fee += choices_total
 
     # Apply discounts only for non-gifted registrations
     if not registration.redeem_code:
-        discount_items = AccountingItemDiscount.objects.filter(
-            member_id=registration.member_id,
-            run_id=registration.run_id,
-        )
-        for discount_item in discount_items.select_related("disc"):
-            total_registration_fee -= discount_item.disc.value
+        total_registration_fee -= discounts_total
 
     # Add any surcharges
     total_registration_fee += registration.surcharge
@@ -360,7 +381,18 @@ def _set_installment_fallback(
         registration.deadline = overdue_deadline if overdue_deadline is not None else 0
 
 
-def installment_check(registration: Registration, alert: int, association_id: int) -> None:
+def get_event_installments(event_id: int) -> list[RegistrationInstallment]:
+    """Return the installments of an event in order, annotated with the ids of their tickets."""
+    installments_query = RegistrationInstallment.objects.filter(event_id=event_id)
+    return list(installments_query.annotate(tickets_map=ArrayAgg("tickets__id")).order_by("order"))
+
+
+def installment_check(
+    registration: Registration,
+    alert: int,
+    association_id: int,
+    installments: list[RegistrationInstallment] | None = None,
+) -> None:
     """Check installment payment schedule for a registration.
 
     Processes configured installments for the event and determines
@@ -370,6 +402,8 @@ def installment_check(registration: Registration, alert: int, association_id: in
         registration: Registration instance to check installments for
         alert: Alert threshold in days for deadline filtering
         association_id: Association ID used for payment deadline calculation
+        installments: Installments of the event, as returned by get_event_installments;
+            queried if None
 
     Side Effects:
         Sets registration.quota and registration.deadline
@@ -381,11 +415,12 @@ def installment_check(registration: Registration, alert: int, association_id: in
     cumulative_amount = 0
     has_distant_installments = False
     most_overdue_deadline = None
-    installments_query = RegistrationInstallment.objects.filter(event_id=get_run_event_id(registration.run_id))
-    installments_query = installments_query.annotate(tickets_map=ArrayAgg("tickets__id")).order_by("order")
+    installments = (
+        installments if installments is not None else get_event_installments(get_run_event_id(registration.run_id))
+    )
     is_first_deadline = True
 
-    for installment in installments_query:
+    for installment in installments:
         if not _is_installment_applicable(installment.tickets_map, registration.ticket_id):
             continue
 
@@ -526,6 +561,7 @@ def cancel_run(instance: Run) -> None:
         refund_credits = [
             AccountingItemOther(
                 member_id=payment["member_id"],
+                association_id=instance.event.association_id,
                 oth=OtherChoices.CREDIT,
                 descr=f"Refund per {instance}",
                 run=instance,
@@ -537,10 +573,23 @@ def cancel_run(instance: Run) -> None:
 
         if refund_credits:
             AccountingItemOther.objects.bulk_create(refund_credits)
+            # The bulk create skips the signals: roll up the new credits by hand
+            ledger_source = get_ledger_source(AccountingItemOther)
+            refresh_ledger_buckets(
+                ledger_source,
+                get_ledger_buckets(
+                    ledger_source, AccountingItemOther.objects.filter(pk__in=[credit.pk for credit in refund_credits])
+                ),
+            )
 
         # Mark all registrations as refunded
         non_refunded_regs.update(refunded=True)
 
+        # The bulk writes skip the signals: drop the accounting snapshots of the refunded members
+        clear_member_accounting_snapshots(
+            instance.event.association_id, member_ids, history=instance.development == DevelopStatus.DONE
+        )
+
 
 def cancel_reg(registration: Registration) -> None:
     """Cancel a specific registration and clean up related data.
@@ -591,10 +640,8 @@ def get_date_surcharge(registration: Registration | None, event: Event) -> int:
         int: Total surcharge amount based on registration date
 
     """
-    if registration and registration.ticket:
-        ticket_tier = registration.ticket.tier
-        if ticket_tier in (TicketTier.WAITING, TicketTier.STAFF, TicketTier.NPC):
-            return 0
+    if _is_surcharge_exempt(registration):
+        return 0
 
     reference_date = timezone.now().date()
     if registration and registration.created:
@@ -611,6 +658,28 @@ def get_date_surcharge(registration: Registration | None, event: Event) -> int:
     return total_surcharge
 
 
+def _is_surcharge_exempt(registration: Registration | None) -> bool:
+    """Check if the ticket tier of the registration is exempt from date surcharges."""
+    if registration and registration.ticket:
+        return registration.ticket.tier in (TicketTier.WAITING, TicketTier.STAFF, TicketTier.NPC)
+    return False
+
+
+def _compute_date_surcharge(registration: Registration, surcharges: list[tuple[date, int]]) -> int:
+    """Compute in memory the date surcharge of a registration from the (date, amount) surcharges of the event.
+
+    Matches get_date_surcharge, where the surcharge dates are compared in the
+    database with the creation timestamp (a date being its midnight).
+    """
+    if _is_surcharge_exempt(registration):
+        return 0
+    return sum(
+        amount
+        for surcharge_date, amount in surcharges
+        if datetime.combine(surcharge_date, time.min) < registration.created
+    )
+
+
 def handle_registration_accounting_updates(registration: Registration) -> None:
     """Handle post-save accounting updates for registrations.
 
@@ -675,6 +744,9 @@ def handle_registration_accounting_updates(registration: Registration) -> None:
         if was_provisional_before_update and not is_registration_provisional(registration):
             update_registration_status_bkg(registration.id)
 
+    # The update skips the signals: drop the member accounting snapshot here
+    clear_member_accounting_snapshots(get_run_association_id(registration.run_id), [registration.member_id])
+
 
 def process_accounting_discount_post_save(discount_item: AccountingItemDiscount) -> None:
     """Process accounting discount item after save.
@@ -706,13 +778,201 @@ def process_registration_option_post_save(option: RegistrationOption) -> None:
 
 
 def check_registration_events(event: Event) -> None:
-    """Trigger background accounting updates for all registrations in an event."""
-    registration_ids = [
-        str(registration_id)
-        for run in get_event_runs(event.id)
-        for registration_id in run.registrations.values_list("id", flat=True)
-    ]
-    check_registration_background(",".join(registration_ids))
+    """Trigger background accounting updates for all registrations in an event, one task per run."""
+    for run in get_event_runs(event.id):
+        check_run_accounting_background(run.id)
+
+
+@background_auto(queue="acc")
+def check_run_accounting_background(run_id: int) -> None:
+    """Recompute the accounting of all the registrations of a run (background task)."""
+    try:
+        run = Run.objects.select_related("event").get(pk=run_id)
+    except ObjectDoesNotExist:
+        return
+    recompute_run_accounting(run)
+
+
+def get_run_accounting_data(run: Run, registrations: list[Registration]) -> dict:
+    """Load the accounting data of the registrations of a run with a few grouped queries.
+
+    Args:
+        run: Run of the registrations
+        registrations: Registrations to load the data for
+
+    Returns:
+        Dictionary with option prices ('choices') and transaction fees
+        ('transactions') summed by registration id, payment items
+        ('payments') listed by registration id, discounts ('discounts')
+        summed by member id, the event 'installments' and the 'alert' threshold.
+        With tokens or credits enabled, also the members with a balance to spend
+        ('token_credit_members') and the registrations holding token or credit
+        payments ('token_credit_registrations')
+
+    """
+    registration_ids = [registration.id for registration in registrations]
+    event_id = get_run_event_id(run.id)
+
+    choices = defaultdict(int)
+    for registration_id, price in RegistrationChoice.objects.filter(
+        registration_id__in=registration_ids,
+        question__typ__in=[BaseQuestionType.SINGLE, BaseQuestionType.MULTIPLE],
+    ).values_list("registration_id", "option__price"):
+        choices[registration_id] += price
+
+    discounts = defaultdict(int)
+    for member_id, value in AccountingItemDiscount.objects.filter(run_id=run.id).values_list(
+        "member_id", "disc__value"
+    ):
+        discounts[member_id] += value
+
+    payments = defaultdict(list)
+    for payment in AccountingItemPayment.objects.filter(registration_id__in=registration_ids).exclude(hide=True):
+        payments[payment.registration_id].append(payment)
+
+    transactions = defaultdict(int)
+    for registration_id, value in AccountingItemTransaction.objects.filter(
+        registration_id__in=registration_ids, user_burden=True
+    ).values_list("registration_id", "value"):
+        transactions[registration_id] += value
+
+    # Only these registrations can spend or give back tokens and credits
+    token_credit_members = set()
+    token_credit_registrations = set()
+    features = get_event_features(event_id)
+    if "tokens" in features or "credits" in features:
+        token_credit_members = set(
+            Membership.objects.filter(
+                association_id=get_run_association_id(run.id),
+                member_id__in=[registration.member_id for registration in registrations],
+            )
+            .filter(models.Q(tokens__gt=0) | models.Q(credit__gt=0))
+            .values_list("member_id", flat=True)
+        )
+        token_credit_registrations = set(
+            AccountingItemPayment.objects.filter(
+                registration_id__in=registration_ids, pay__in=[PaymentChoices.TOKEN, PaymentChoices.CREDIT]
+            ).values_list("registration_id", flat=True)
+        )
+
+    return {
+        "choices": choices,
+        "discounts": discounts,
+        "payments": payments,
+        "transactions": transactions,
+        "installments": get_event_installments(event_id),
+        "alert": int(get_event_config(event_id, "payment_alert", bypass_cache=True)),
+        "token_credit_members": token_credit_members,
+        "token_credit_registrations": token_credit_registrations,
+    }
+
+
+def _transfer_cancelled_payments(run: Run, registrations: list[Registration]) -> None:
+    """Move the payments of cancelled registrations to the active registration of the same member."""
+    active_by_member = {
+        registration.member_id: registration
+        for registration in registrations
+        if not registration.cancellation_date and registration.member_id
+    }
+    cancelled_by_member = defaultdict(list)
+    for registration_id, member_id in Registration.objects.filter(
+        run_id=run.id, member_id__in=active_by_member, cancellation_date__isnull=False
+    ).values_list("id", "member_id"):
+        cancelled_by_member[member_id].append(registration_id)
+
+    for member_id, cancelled_ids in cancelled_by_member.items():
+        for accounting_item_type in [AccountingItemPayment, AccountingItemTransaction]:
+            accounting_item_type.objects.filter(registration_id__in=cancelled_ids).update(
+                registration=active_by_member[member_id]
+            )
+
+
+def recompute_run_accounting(run: Run) -> int:
+    """Recompute the accounting fields of all the registrations of a run.
+
+    Set-based equivalent of saving every registration: the payments,
+    transactions, options, discounts and installments of the run are loaded
+    with a few grouped queries, the accounting of each registration is
+    computed in memory and written back with a single bulk_update, without
+    firing the registration signals.
+
+    Tokens and credits are still applied one registration at a time, since
+    they lock the membership and create or cut payment items: only the
+    registrations that actually spend or give back a balance pay for it,
+    the others are skipped using the preloaded balances.
+
+    Args:
+        run: Run to recompute
+
+    Returns:
+        Number of registrations updated
+
+    """
+    if run.development in [DevelopStatus.CANC, DevelopStatus.DONE]:
+        return 0
+
+    registrations = list(
+        Registration.objects.filter(run=run, pending=False)
+        .exclude(member__isnull=True)
+        .select_related("run", "ticket", "member")
+    )
+    if not registrations:
+        return 0
+
+    event_id = get_run_event_id(run.id)
+    features = get_event_features(event_id)
+    association_id = get_run_association_id(run.id)
+
+    with transaction.atomic():
+        # Lock the registrations to prevent concurrent accounting updates
+        list(
+            Registration.objects.select_for_update().filter(pk__in=[registration.id for registration in registrations])
+        )
+        _transfer_cancelled_payments(run, registrations)
+
+        run_data = get_run_accounting_data(run, registrations)
+        surcharges = list(RegistrationSurcharge.objects.filter(event_id=run.event_id).values_list("date", "amount"))
+
+        # Preload the memberships used for deadlines and membership requirements
+        memberships = {
+            membership.member_id: membership
+            for membership in Membership.objects.filter(
+                association_id=association_id, member_id__in=[registration.member_id for registration in registrations]
+            )
+        }
+
+        confirmed_ids = []
+        for registration in registrations:
+            if registration.member_id in memberships:
+                registration.membership = memberships[registration.member_id]
+            registration.surcharge = _compute_date_surcharge(registration, surcharges)
+
+            was_provisional = is_registration_provisional(registration, event_id=event_id, features=features)
+            update_registration_accounting(registration, run_data)
+            if was_provisional and not is_registration_provisional(registration, event_id=event_id, features=features):
+                confirmed_ids.append(registration.id)
+
+        Registration.objects.bulk_update(
+            registrations,
+            ["surcharge", "tot_payed", "tot_iscr", "quota", "alert", "deadline", "payment_date"],
+            batch_size=500,
+        )
+
+    # Notify the registrations moved from provisional to confirmed
+    for registration_id in confirmed_ids:
+        update_registration_status_bkg(registration_id)
+
+    # The bulk update skips the registration signals: clear the caches they would clear
+    member_ids = {registration.member_id for registration in registrations}
+    clear_registration_accounting_cache(run.id)
+    clear_member_accounting_snapshots(association_id, member_ids)
+    clear_registration_counts_cache(run.id)
+    clear_calendar_runs_cache(association_id)
+    bump_event_cache_generation(run.id)
+    for member_id in member_ids:
+        reset_event_links(member_id, association_id)
+        invalidate_user_nav_entries(member_id)
+    return len(registrations)
 
 
 @background_auto(queue="acc")
@@ -785,7 +1045,18 @@ def _check_membership_requirements(registration: Registration, event_features: d
     return True
 
 
-def update_registration_accounting(registration: Registration) -> None:
+def _has_tokens_credits_to_apply(registration: Registration, remaining_balance: Decimal, run_data: dict) -> bool:
+    """Return whether tokens or credits may be spent on, or given back from, a registration.
+
+    A member has a single active registration in the run, so the balances and
+    payments preloaded for the recompute are the ones this registration sees.
+    """
+    if remaining_balance > 0:
+        return registration.member_id in run_data["token_credit_members"]
+    return registration.id in run_data["token_credit_registrations"]
+
+
+def update_registration_accounting(registration: Registration, run_data: dict | None = None) -> None:
     """Update comprehensive accounting information for a registration.
 
     Calculates total signup fee, payments received, outstanding balance,
@@ -793,6 +1064,8 @@ def update_registration_accounting(registration: Registration) -> None:
 
     Args:
         registration (Registration): Registration instance to update accounting for
+        run_data: Accounting data of the whole run, as returned by get_run_accounting_data;
+            if None the data of the registration is queried
 
     Returns:
         None
@@ -818,9 +1091,18 @@ def update_registration_accounting(registration: Registration) -> None:
     association_id = run_cache["association_id"]
 
     # Calculate total inscription fee and payments
-    registration.tot_iscr = get_registration_iscr(registration)
-    total_transactions = get_registration_transactions(registration)
-    registration.tot_payed = get_registration_payments(registration)
+    if run_data is None:
+        registration.tot_iscr = get_registration_iscr(registration)
+        total_transactions = get_registration_transactions(registration)
+        registration.tot_payed = get_registration_payments(registration)
+    else:
+        registration.tot_iscr = _compute_registration_iscr(
+            registration,
+            run_data["choices"].get(registration.id, 0),
+            run_data["discounts"].get(registration.member_id, 0),
+        )
+        total_transactions = run_data["transactions"].get(registration.id, 0)
+        registration.tot_payed = get_registration_payments(registration, run_data["payments"].get(registration.id, []))
 
     # Adjust for transactions and round to nearest cent
     registration.tot_payed -= total_transactions
@@ -844,15 +1126,20 @@ def update_registration_accounting(registration: Registration) -> None:
     if not _check_membership_requirements(registration, event_features, association_id):
         return
 
-    # Process tokens and credits
-    handle_tokes_credits(association_id, event_features, registration, remaining_balance)
+    # Process tokens and credits, skipping the registrations of a run recompute with nothing to apply
+    if run_data is None or _has_tokens_credits_to_apply(registration, remaining_balance, run_data):
+        handle_tokes_credits(association_id, event_features, registration, remaining_balance)
 
     # Get payment alert threshold from event configuration
-    alert_days_threshold = int(get_event_config(run_cache["event_id"], "payment_alert", bypass_cache=True))
+    if run_data is None:
+        alert_days_threshold = int(get_event_config(run_cache["event_id"], "payment_alert", bypass_cache=True))
+    else:
+        alert_days_threshold = run_data["alert"]
 
     # Calculate payment schedule based on feature flags
     if "reg_installments" in event_features:
-        installment_check(registration, alert_days_threshold, association_id)
+        installments = None if run_data is None else run_data["installments"]
+        installment_check(registration, alert_days_threshold, association_id, installments)
     else:
         quota_check(registration, event_start_date, alert_days_threshold, association_id)
 
@@ -37,6 +37,7 @@ from larpmanager.models.miscellanea import (
     EmailContent,
     EmailRecipient,
     EmailSuppression,
+    ExportJob,
     HelpQuestion,
     OneTimeAccessToken,
     OneTimeContent,
@@ -510,3 +511,13 @@ class NotificationQueueAdmin(DefModelAdmin):
         "sent_at",
     )
     list_filter: ClassVar[tuple] = ("notification_type", "sent", RunFilter)
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(DefModelAdmin):
+    """Admin interface for ExportJob model."""
+
+    list_display: ClassVar[tuple] = ("id", "run", "member", "typ", "status", "progress", "created", "expires", "uuid")
+    search_fields: ClassVar[tuple] = ("id", "uuid")
+    autocomplete_fields: ClassVar[list] = ["run", "member"]
+    list_filter: ClassVar[tuple] = ("typ", "status", RunFilter)
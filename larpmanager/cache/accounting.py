@@ -19,24 +19,28 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
+from larpmanager.cache.builder import get_or_build
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.registration import get_active_registrations, get_registration_tickets
 from larpmanager.models.accounting import (
+    AccountingItem,
     AccountingItemPayment,
     PaymentChoices,
 )
 from larpmanager.models.registration import Registration, RegistrationTicket
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from decimal import Decimal
 
+    from django.db.models import QuerySet
+
     from larpmanager.models.event import Run
 
 
@@ -81,9 +85,85 @@ def get_registration_accounting_cache_key(run_id: int) -> str:
 
 
 def clear_registration_accounting_cache(run_id: int) -> None:
-    """Reset registration accounting cache for a run."""
-    cache_key = get_registration_accounting_cache_key(run_id)
-    cache.delete(cache_key)
+    """Reset registration accounting cache for a run, along with its balance report."""
+    cache.delete_many([get_registration_accounting_cache_key(run_id), get_run_accounting_report_cache_key(run_id)])
+
+
+def get_run_accounting_report_cache_key(run_id: int) -> str:
+    """Generate cache key for the aggregated run balance report."""
+    return f"run_accounting_report_{run_id}"
+
+
+def get_association_accounting_report_cache_key(association_id: int) -> str:
+    """Generate cache key for the aggregated association accounting sums."""
+    return f"association_accounting_report_{association_id}"
+
+
+def clear_accounting_reports_cache(instance: AccountingItem) -> None:
+    """Reset the aggregated balance reports affected by an accounting item.
+
+    Drops the association sums of the item's association and, when the item is
+    linked to a run directly or through a registration, the run balance report.
+
+    Args:
+        instance: Accounting item that was saved or soft deleted
+
+    """
+    cache_keys = [get_association_accounting_report_cache_key(instance.association_id)]
+
+    # Payments and transactions reach the run through their registration
+    run_id = getattr(instance, "run_id", None)
+    if run_id is None and getattr(instance, "registration_id", None):
+        run_id = instance.registration.run_id
+
+    if run_id:
+        cache_keys.append(get_run_accounting_report_cache_key(run_id))
+
+    cache.delete_many(cache_keys)
+
+
+def get_member_accounting_snapshot_cache_key(association_id: int, member_id: int) -> str:
+    """Generate cache key for a member accounting snapshot."""
+    return f"member_accounting_{association_id}_{member_id}"
+
+
+def get_member_accounting_history_cache_key(association_id: int, member_id: int) -> str:
+    """Generate cache key for the registrations of a member in completed runs."""
+    return f"member_accounting_history_{association_id}_{member_id}"
+
+
+def clear_member_accounting_snapshots(association_id: int, member_ids: Iterable[int], *, history: bool = False) -> None:
+    """Reset the accounting snapshots of some members.
+
+    Args:
+        association_id: Association the snapshots refer to
+        member_ids: Members whose snapshots are dropped
+        history: Whether to also drop the registrations of completed runs
+
+    """
+    cache_keys = []
+    for member_id in member_ids:
+        cache_keys.append(get_member_accounting_snapshot_cache_key(association_id, member_id))
+        if history:
+            cache_keys.append(get_member_accounting_history_cache_key(association_id, member_id))
+    if cache_keys:
+        cache.delete_many(cache_keys)
+
+
+def clear_runs_accounting_snapshots(association_id: int, run_ids: Iterable[int]) -> None:
+    """Reset the accounting snapshots, history included, of the members registered to some runs."""
+    _clear_registrants_accounting_snapshots(association_id, Registration.objects.filter(run_id__in=run_ids))
+
+
+def clear_event_accounting_snapshots(association_id: int, event_id: int) -> None:
+    """Reset the accounting snapshots, history included, of the members registered to an event."""
+    _clear_registrants_accounting_snapshots(association_id, Registration.objects.filter(run__event_id=event_id))
+
+
+def _clear_registrants_accounting_snapshots(association_id: int, registrations: QuerySet[Registration]) -> None:
+    """Reset the accounting snapshots of the members of some registrations, which show their run and options."""
+    member_ids = registrations.order_by().values_list("member_id", flat=True).distinct()
+    clear_member_accounting_snapshots(association_id, member_ids, history=True)
 
 
 def _get_accounting_context(run: Run, member_filter: int | None = None) -> tuple[dict, dict, dict]:
@@ -275,9 +355,10 @@ def get_registration_accounting_cache(run: Run) -> dict:
     """Get or create registration accounting cache for a run.
 
     Retrieves cached registration accounting data for the given run. If the cache
-    is empty or expired, regenerates the data and stores it in cache with a 1-day timeout.
-    Uses a lock-based pattern to prevent cache stampede when multiple requests try to
-    regenerate the cache simultaneously.
+    is empty, regenerates the data and stores it in cache with a 1-day timeout; once
+    expired, the data is still served for an hour while a single request refreshes it.
+    The rebuild is single-flight, to prevent cache stampede when multiple requests try
+    to regenerate the cache simultaneously.
 
     Args:
         run (Run): The Run instance to get accounting data for.
@@ -287,44 +368,13 @@ def get_registration_accounting_cache(run: Run) -> dict:
               registration statistics, and financial information.
 
     """
-    # Generate the cache key for this specific run
-    cache_key = get_registration_accounting_cache_key(run.id)
-    lock_key = f"{cache_key}_lock"
-
-    # Attempt to retrieve cached data
-    cached_data = cache.get(cache_key)
-
-    # If cache miss, regenerate with lock to prevent stampede
-    if cached_data is None:
-        # Try to acquire lock with 30-second timeout
-        lock_acquired = cache.add(lock_key, "locked", timeout=30)
-
-        if lock_acquired:
-            # This process acquired the lock - regenerate the cache
-            try:
-                cached_data = update_registration_accounting_cache(run)
-                cache.set(cache_key, cached_data, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
-            finally:
-                # Always release the lock
-                cache.delete(lock_key)
-        else:
-            # Another process is regenerating - retry multiple times
-            max_retries = 10
-            for _attempt in range(max_retries):
-                # Wait briefly for regeneration to complete
-                time.sleep(0.1)
-
-                # Check if cache is now available
-                cached_data = cache.get(cache_key)
-                if cached_data is not None:
-                    break
-
-            # If still no data after retries, regenerate without lock as fallback
-            if cached_data is None:
-                cached_data = update_registration_accounting_cache(run)
-                cache.set(cache_key, cached_data, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
-
-    return cached_data
+    return get_or_build(
+        get_registration_accounting_cache_key(run.id),
+        lambda: update_registration_accounting_cache(run),
+        timeout=conf_settings.CACHE_TIMEOUT_1_DAY,
+        stale_timeout=60 * 60,
+        name="registration_accounting",
+    )
 
 
 def update_registration_accounting_cache(run: Run) -> dict[int, dict[str, str]]:
@@ -0,0 +1,293 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+"""Shared primitives to build cached values without stampedes.
+
+Cache getters adopt ``get_or_build`` to rebuild a missing or expired value in a
+single worker (single-flight), while concurrent requests either wait for it
+or keep serving the previous value (stale-while-revalidate). Getters whose
+value spans several keys use ``build_once`` for the single-flight part only.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings as conf_settings
+from django.core.cache import cache
+
+from larpmanager.utils.profiler.signals import cache_rebuild_signal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Relative spread applied to the timeouts, so keys written together do not expire together
+TIMEOUT_JITTER = 0.1
+
+# Seconds a rebuild lock is held at most, in case the worker holding it dies
+LOCK_TIMEOUT = 30
+
+# Seconds a worker waits for the lock holder to store the value before building it itself
+WAIT_TIMEOUT = 1.0
+WAIT_INTERVAL = 0.1
+
+# Rebuilds slower than this (in seconds) are logged as info instead of debug
+SLOW_REBUILD = 1.0
+
+
+def _lock_key(key: str) -> str:
+    """Generate cache key for the rebuild lock of a cached value."""
+    return f"{key}:lock"
+
+
+def _soft_expiry_key(key: str) -> str:
+    """Generate cache key for the time after which a cached value is stale."""
+    return f"{key}:soft"
+
+
+def jittered_timeout(timeout: int, jitter: float = TIMEOUT_JITTER) -> int:
+    """Return the timeout randomly spread by the given relative jitter.
+
+    Args:
+        timeout: Nominal timeout in seconds
+        jitter: Relative spread, 0.1 means +/- 10%
+
+    Returns:
+        The jittered timeout, at least one second
+
+    """
+    spread = int(timeout * jitter)
+    return max(1, timeout + random.randint(-spread, spread))  # noqa: S311
+
+
+def _timed_build(key: str, builder: Callable[[], Any], name: str | None, *, stale: bool = False) -> Any:
+    """Run the builder, reporting how long the rebuild took.
+
+    Args:
+        key: Cache key being rebuilt
+        builder: Callable computing the value
+        name: Name of the cache reported in the metrics, the key if None
+        stale: Whether a stale value was being served during the rebuild
+
+    Returns:
+        The built value
+
+    """
+    start = time.perf_counter()
+    value = builder()
+    duration = time.perf_counter() - start
+
+    level = logging.INFO if duration > SLOW_REBUILD else logging.DEBUG
+    logger.log(level, "Rebuilt cache %s in %.3fs (stale: %s)", key, duration, stale)
+    cache_rebuild_signal.send(sender=None, name=name or key, key=key, duration=duration, stale=stale)
+    return value
+
+
+def _store(key: str, value: Any, timeout: int, stale_timeout: int) -> None:
+    """Store the value, keeping it available for the stale window after its soft expiry."""
+    fresh_timeout = jittered_timeout(timeout)
+    hard_timeout = fresh_timeout + stale_timeout
+    cache.set(key, value, timeout=hard_timeout)
+    if stale_timeout:
+        cache.set(_soft_expiry_key(key), time.time() + fresh_timeout, timeout=hard_timeout)
+
+
+def _is_stale(key: str) -> bool:
+    """Check whether the cached value passed its soft expiry.
+
+    Values written directly with ``cache.set`` have no soft expiry and are
+    considered fresh until they expire.
+    """
+    soft_expiry = cache.get(_soft_expiry_key(key))
+    return soft_expiry is not None and time.time() > soft_expiry
+
+
+def build_once(
+    key: str,
+    builder: Callable[[], Any],
+    loader: Callable[[], Any],
+    *,
+    name: str | None = None,
+) -> Any:
+    """Build a cached value in a single worker, letting the concurrent ones wait for it.
+
+    The builder is expected to store the value itself, so that the loader can
+    read it back: this fits the caches spread over several keys.
+
+    Args:
+        key: Cache key identifying the value, used for the lock
+        builder: Callable computing and storing the value
+        loader: Callable reading the stored value, returning None if missing
+        name: Name of the cache reported in the metrics
+
+    Returns:
+        The built or loaded value
+
+    """
+    lock_key = _lock_key(key)
+    if cache.add(lock_key, "locked", timeout=LOCK_TIMEOUT):
+        try:
+            return _timed_build(key, builder, name)
+        finally:
+            cache.delete(lock_key)
+
+    # Another worker is building: wait briefly for it to store the value
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        value = loader()
+        if value is not None:
+            return value
+
+    # The other worker is too slow (or died): build without the lock
+    return _timed_build(key, builder, name)
+
+
+def peek(key: str) -> tuple[Any, bool]:
+    """Read a cached value without building it.
+
+    Args:
+        key: Cache key of the value
+
+    Returns:
+        The cached value (None if missing) and whether it passed its soft expiry
+
+    """
+    cached = cache.get_many([key, _soft_expiry_key(key)])
+    value = cached.get(key)
+    soft_expiry = cached.get(_soft_expiry_key(key))
+    return value, value is not None and soft_expiry is not None and time.time() > soft_expiry
+
+
+def rebuild(
+    key: str,
+    builder: Callable[[], Any],
+    timeout: int = conf_settings.CACHE_TIMEOUT_1_DAY,
+    *,
+    stale_timeout: int = 0,
+    name: str | None = None,
+) -> Any:
+    """Rebuild and store a cached value, unless another worker is already rebuilding it.
+
+    Args:
+        key: Cache key of the value
+        builder: Callable computing the value, which must not be None
+        timeout: Seconds the value is fresh
+        stale_timeout: Seconds a stale value is still served while rebuilding
+        name: Name of the cache reported in the metrics, the key if None
+
+    Returns:
+        The rebuilt value, or None if another worker holds the rebuild lock
+
+    """
+    lock_key = _lock_key(key)
+    if not cache.add(lock_key, "locked", timeout=LOCK_TIMEOUT):
+        return None
+    try:
+        value = _timed_build(key, builder, name, stale=True)
+        _store(key, value, timeout, stale_timeout)
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+def get_or_build(
+    key: str,
+    builder: Callable[[], Any],
+    timeout: int = conf_settings.CACHE_TIMEOUT_1_DAY,
+    *,
+    stale_timeout: int = 0,
+    name: str | None = None,
+) -> Any:
+    """Get a cached value, building it with single-flight and stale-while-revalidate.
+
+    On a miss a single worker builds the value, while the others wait for it.
+    Once the (jittered) timeout has passed the value becomes stale: for
+    ``stale_timeout`` more seconds it is still served, while one worker
+    rebuilds it.
+
+    Args:
+        key: Cache key of the value
+        builder: Callable computing the value, which must not be None
+        timeout: Seconds the value is fresh
+        stale_timeout: Seconds a stale value is still served while rebuilding
+        name: Name of the cache reported in the metrics, the key if None
+
+    Returns:
+        The cached or freshly built value
+
+    """
+    value = cache.get(key)
+
+    if value is not None:
+        # Refresh a stale value in the worker winning the lock, the others keep serving it
+        if stale_timeout and _is_stale(key):
+            refreshed = rebuild(key, builder, timeout, stale_timeout=stale_timeout, name=name)
+            if refreshed is not None:
+                value = refreshed
+        return value
+
+    def build_and_store() -> Any:
+        built = builder()
+        _store(key, built, timeout, stale_timeout)
+        return built
+
+    return build_once(key, build_and_store, lambda: cache.get(key), name=name)
+
+
+def get_many_or_build(
+    builders: dict[str, Callable[[], Any]],
+    timeout: int = conf_settings.CACHE_TIMEOUT_1_DAY,
+    *,
+    stale_timeout: int = 0,
+    name: str | None = None,
+) -> dict[str, Any]:
+    """Get several cached values with a single round trip, building the missing ones.
+
+    Values that are missing, or stale, go through ``get_or_build`` one by one,
+    so they keep its single-flight and stale-while-revalidate behaviour.
+
+    Args:
+        builders: Callable computing the value, by cache key
+        timeout: Seconds the values are fresh
+        stale_timeout: Seconds a stale value is still served while rebuilding
+        name: Name of the cache reported in the metrics, the key if None
+
+    Returns:
+        The values by cache key
+
+    """
+    keys = list(builders)
+    if stale_timeout:
+        keys += [_soft_expiry_key(key) for key in builders]
+    cached = cache.get_many(keys) if keys else {}
+
+    values = {}
+    for key, builder in builders.items():
+        value = cached.get(key)
+        soft_expiry = cached.get(_soft_expiry_key(key))
+        if value is None or (soft_expiry is not None and time.time() > soft_expiry):
+            value = get_or_build(key, builder, timeout, stale_timeout=stale_timeout, name=name)
+        values[key] = value
+    return values
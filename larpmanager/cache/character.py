@@ -19,15 +19,22 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import shutil
+import unicodedata
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.utils.html import strip_tags
+from django.utils.translation import get_language
 
+from larpmanager.cache.builder import build_once, get_or_build
 from larpmanager.cache.config import get_event_config
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.fields import get_event_fields_cache, visible_writing_fields
@@ -77,10 +84,147 @@ def delete_all_in_path(path: str) -> None:
 
 
 def get_event_cache_all_key(event_run: Run) -> str:
-    """Generate cache key for event data."""
+    """Generate cache key for the index of the event data."""
     return f"event_factions_characters_{event_run.id}"
 
 
+def get_event_cache_char_key(event_run: Run, number: int) -> str:
+    """Generate cache key for the fragment of a character in the event data."""
+    return f"event_factions_characters_{event_run.id}_char_{number}"
+
+
+def get_event_cache_faction_key(event_run: Run, number: int) -> str:
+    """Generate cache key for the fragment of a faction in the event data."""
+    return f"event_factions_characters_{event_run.id}_fac_{number}"
+
+
+def get_event_cache_generation_key(run_id: int) -> str:
+    """Generate cache key for the generation token of the event data."""
+    return f"event_factions_characters_gen_{run_id}"
+
+
+def get_event_cache_generation(run_id: int) -> str:
+    """Return the generation token of the event data, changing each time the data is reset or updated.
+
+    Rendered pages built from the event data embed the token in their cache
+    key, so they are invalidated together with it.
+    """
+    cache_key = get_event_cache_generation_key(run_id)
+    generation = cache.get(cache_key)
+    if generation is None:
+        # Use add so that concurrent requests agree on the same token
+        cache.add(cache_key, uuid4().hex, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+        generation = cache.get(cache_key) or ""
+    return generation
+
+
+def bump_event_cache_generation(run_id: int) -> None:
+    """Start a new generation of the event data, invalidating the pages rendered from it."""
+    cache.set(get_event_cache_generation_key(run_id), uuid4().hex, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+
+
+# Seconds the gallery content rendered for anonymous visitors is kept, within the same generation
+GALLERY_HTML_TIMEOUT = 60 * 15
+
+
+def get_gallery_html_key(run_id: int, language: str) -> str:
+    """Generate cache key for the gallery content rendered for anonymous visitors."""
+    return f"gallery_html_{run_id}_{get_event_cache_generation(run_id)}_{language}"
+
+
+def get_event_cache_fragment_key(context: dict, run: Run, text: str, *, include_tooltip: bool) -> str | None:
+    """Generate cache key for a text rendered with the character references of the event data.
+
+    The key embeds the digest of the text, so a saved writing gets a new key,
+    and the generation of the event data, so changes of characters or factions
+    discard every fragment rendered from them.
+
+    Args:
+        context: Context dictionary the text is rendered with
+        run: Run the references link to
+        text: Text to render
+        include_tooltip: Whether the references include tooltips
+
+    Returns:
+        The cache key, or None if the context does not hold the complete event data of the run
+
+    """
+    # Only the complete event data loaded by get_event_cache_all is known to match the generation
+    source = context.get("event_cache_source")
+    if not source or source["run_id"] != run.id or source["chars"] is not context.get("chars"):
+        return None
+
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    return (
+        f"event_fragment_{run.id}_{source['generation']}_{get_language()}_"
+        f"{context.get('association_slug')}_{int(bool(include_tooltip))}_{digest}"
+    )
+
+
+def _store_event_cache_all(
+    run: Run,
+    result: dict,
+    char_numbers: list[int] | None = None,
+    faction_numbers: list[int] | None = None,
+) -> None:
+    """Store the event data split into an index plus per-character and per-faction fragments.
+
+    Args:
+        run: Run of the event data
+        result: Complete event data, as built by init_event_cache_all
+        char_numbers: Characters whose fragment is written, all if None
+        faction_numbers: Factions whose fragment is written, all if None
+
+    """
+    index = {key: value for key, value in result.items() if key not in ("chars", "factions")}
+    index["char_numbers"] = list(result["chars"])
+    index["faction_numbers"] = list(result["factions"])
+
+    fragments = {get_event_cache_all_key(run): index}
+    for number in result["chars"] if char_numbers is None else char_numbers:
+        if number in result["chars"]:
+            fragments[get_event_cache_char_key(run, number)] = result["chars"][number]
+    for number in result["factions"] if faction_numbers is None else faction_numbers:
+        if number in result["factions"]:
+            fragments[get_event_cache_faction_key(run, number)] = result["factions"][number]
+    cache.set_many(fragments, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+
+
+def _load_event_cache_fragments(
+    run: Run, char_numbers: list[int], faction_numbers: list[int]
+) -> tuple[dict, dict] | None:
+    """Fetch character and faction fragments with a single get_many.
+
+    Returns:
+        Characters and factions by number, or None if any fragment is missing
+
+    """
+    char_keys = {number: get_event_cache_char_key(run, number) for number in char_numbers}
+    faction_keys = {number: get_event_cache_faction_key(run, number) for number in faction_numbers}
+    cached = cache.get_many([*char_keys.values(), *faction_keys.values()])
+    if len(cached) != len(char_keys) + len(faction_keys):
+        return None
+    return (
+        {number: cached[key] for number, key in char_keys.items()},
+        {number: cached[key] for number, key in faction_keys.items()},
+    )
+
+
+def _load_event_cache_all(run: Run) -> dict | None:
+    """Assemble the complete event data from the cached fragments, None if not (fully) cached."""
+    index = cache.get(get_event_cache_all_key(run))
+    if index is None:
+        return None
+
+    fragments = _load_event_cache_fragments(run, index["char_numbers"], index["faction_numbers"])
+    if fragments is None:
+        return None
+
+    result = {key: value for key, value in index.items() if key not in ("char_numbers", "faction_numbers")}
+    result["chars"], result["factions"] = fragments
+    return result
+
+
 def init_event_cache_all(context: dict) -> dict:
     """Initialize complete event cache with characters, factions, and traits.
 
@@ -497,18 +641,137 @@ def get_event_cache_all(context: dict) -> None:
         context: Context dictionary containing run information.
 
     """
-    # Get cache key for the current run
-    cache_key = get_event_cache_all_key(context["run"])
+    run = context["run"]
+    # Read the generation before the data, so that fragments are never keyed to a newer one
+    generation = get_event_cache_generation(run.id)
+
+    def build() -> dict:
+        result = init_event_cache_all(context)
+        _store_event_cache_all(run, result)
+        return result
 
-    # Try to retrieve cached result
-    cached_result = cache.get(cache_key)
+    # Assemble the cached fragments of the current run
+    cached_result = _load_event_cache_all(run)
     if cached_result is None:
-        # Initialize cache if not found
-        cached_result = init_event_cache_all(context)
-        cache.set(cache_key, cached_result, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+        # Initialize cache if not found, in a single worker
+        cached_result = build_once(
+            get_event_cache_all_key(run), build, lambda: _load_event_cache_all(run), name="event_cache_all"
+        )
 
     # Update context with cached data
     context.update(cached_result)
+    context["event_cache_source"] = {"run_id": run.id, "generation": generation, "chars": context["chars"]}
+
+
+# Character data fields matched by the search, along with the faction names
+SEARCH_INDEX_FIELDS = ("name", "title", "pronoun", "player", "player_full")
+
+
+def get_search_index_key(run_id: int, *, show_teaser: bool) -> str:
+    """Generate cache key for the search index of the characters of a run."""
+    return f"search_index_{run_id}_{get_event_cache_generation(run_id)}_{int(show_teaser)}"
+
+
+def normalize_search_text(text: str) -> str:
+    """Normalize a text for matching: strip markup and accents, casefold and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", strip_tags(text.replace("<br />", " ")))
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).casefold().split())
+
+
+def init_search_index(context: dict, *, show_teaser: bool) -> dict[int, dict]:
+    """Build the search index of the characters in the event data.
+
+    Args:
+        context: Context dictionary holding the event data, as loaded by get_event_cache_all
+        show_teaser: Whether the teasers are shown, and so can be searched
+
+    Returns:
+        Dict mapping each visible character number to its normalized text and sorted words
+
+    """
+    fields = (*SEARCH_INDEX_FIELDS, "teaser") if show_teaser else SEARCH_INDEX_FIELDS
+    factions = context.get("factions", {})
+
+    index = {}
+    for number, character in context["chars"].items():
+        if character.get("hide"):
+            continue
+
+        texts = [str(character[field]) for field in fields if character.get(field)]
+        texts.extend(
+            factions[faction_number]["name"]
+            for faction_number in character.get("factions", [])
+            if faction_number in factions and factions[faction_number].get("number")
+        )
+        text = normalize_search_text(" ".join(texts))
+        index[number] = {"text": text, "words": sorted(set(text.split()))}
+
+    return index
+
+
+def get_search_index(context: dict, *, show_teaser: bool) -> tuple[dict[int, dict], str]:
+    """Get the search index of the characters of the run, built alongside the event data.
+
+    The index is cached per generation of the event data, so it follows every change of
+    the characters, factions or assignments.
+
+    Args:
+        context: Context dictionary containing run information
+        show_teaser: Whether the teasers are shown, and so can be searched
+
+    Returns:
+        Tuple of the search index and its ETag
+
+    """
+    run = context["run"]
+
+    def build() -> dict:
+        get_event_cache_all(context)
+        index = init_search_index(context, show_teaser=show_teaser)
+        etag = hashlib.sha256(json.dumps(index, sort_keys=True).encode()).hexdigest()
+        return {"index": index, "etag": etag}
+
+    cached = get_or_build(get_search_index_key(run.id, show_teaser=show_teaser), build, name="search_index")
+    return cached["index"], cached["etag"]
+
+
+def get_event_cache_faction(context: dict, faction_uuid: str) -> dict | None:
+    """Load into context the event data needed to show a single faction.
+
+    Only the index, the factions and the characters of the requested faction
+    are fetched; the complete data is built if not cached.
+
+    Args:
+        context: Context dictionary containing run information
+        faction_uuid: UUID of the faction to show
+
+    Returns:
+        The faction data, or None if no faction has the given UUID
+
+    """
+    run = context["run"]
+    index = cache.get(get_event_cache_all_key(run))
+    fragments = None
+    if index is not None:
+        fragments = _load_event_cache_fragments(run, [], index["faction_numbers"])
+
+    faction = None
+    if fragments is not None:
+        factions = fragments[1]
+        faction = next((data for data in factions.values() if data.get("uuid") == faction_uuid), None)
+        if faction is not None:
+            # Fetch only the characters listed in the faction
+            char_fragments = _load_event_cache_fragments(run, faction["characters"], [])
+            fragments = None if char_fragments is None else (char_fragments[0], factions)
+
+    if fragments is None:
+        # Some fragments are missing: fall back to the complete data
+        get_event_cache_all(context)
+        return next((data for data in context["factions"].values() if data.get("uuid") == faction_uuid), None)
+
+    context.update({key: value for key, value in index.items() if key not in ("char_numbers", "faction_numbers")})
+    context["chars"], context["factions"] = fragments
+    return faction
 
 
 def clear_run_cache_and_media(run: Run) -> None:
@@ -519,9 +782,12 @@ def clear_run_cache_and_media(run: Run) -> None:
 
 
 def reset_event_cache_all(run: Run) -> None:
-    """Delete the event cache for the given run."""
-    cache_key = get_event_cache_all_key(run)
-    cache.delete(cache_key)
+    """Delete the event cache for the given run.
+
+    Dropping the index is enough, since fragments are only reached through it.
+    """
+    cache.delete(get_event_cache_all_key(run))
+    bump_event_cache_generation(run.id)
 
 
 def update_character_fields(character: Character, character_data: dict) -> None:
@@ -551,29 +817,37 @@ def update_event_cache_all(run: Run, instance: BaseModel) -> None:
         None
 
     """
-    # Get the cache key for the event and retrieve cached data
-    cache_key = get_event_cache_all_key(run)
-    cached_result = cache.get(cache_key)
+    # Assemble the cached fragments of the event data
+    cached_result = _load_event_cache_all(run)
 
     # Exit early if no cached data exists
     if cached_result is None:
         return
 
+    # Only the fragments touched by the update are written back, together with the index
+    char_numbers = []
+    faction_numbers = []
+
     # Update cache based on instance type - Faction updates
     if isinstance(instance, Faction):
         update_event_cache_all_faction(instance, cached_result, run)
+        faction_numbers = None
 
     # Character updates include both character data and faction refresh
     if isinstance(instance, Character):
         update_event_cache_all_character(instance, cached_result, run)
         get_event_cache_factions({"event": run.event}, cached_result)
+        char_numbers = [instance.number]
+        faction_numbers = None
 
     # Registration-character relationship updates
     if isinstance(instance, RegistrationCharacterRel):
         update_event_cache_all_character_reg(instance, cached_result, run)
+        char_numbers = [instance.character.number]
 
-    # Save the updated cache data with 1-day timeout
-    cache.set(cache_key, cached_result, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+    # Save the updated fragments with 1-day timeout
+    _store_event_cache_all(run, cached_result, char_numbers=char_numbers, faction_numbers=faction_numbers)
+    bump_event_cache_generation(run.id)
 
 
 def update_event_cache_all_character_reg(
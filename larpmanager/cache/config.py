@@ -24,17 +24,34 @@ from typing import TYPE_CHECKING, Any
 from django.apps import apps
 from django.conf import settings as conf_settings
 from django.core.cache import cache
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from larpmanager.models.base import Config
 from larpmanager.utils.larpmanager.versions import LATEST_AVAILABLE_VERSION
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
     from larpmanager.models.base import BaseModel
 
 # Configs that must always read from the child event, never from the campaign parent (matched as prefixes)
 EVENT_CONFIGS_OWN_CHILD: frozenset[str] = frozenset({"payment_custom_reason", "theme", "pub_"})
 
+# Config model and foreign key field of each element type
+CONFIG_MODELS: dict[str, tuple[str, str]] = {
+    "event": ("EventConfig", "event_id"),
+    "association": ("AssociationConfig", "association_id"),
+    "run": ("RunConfig", "run_id"),
+    "member": ("MemberConfig", "member_id"),
+    "character": ("CharacterConfig", "character_id"),
+}
+
+# Attribute holding the configs attached to an element by prefetch_configs
+PREFETCHED_CONFIGS_ATTR = "prefetched_configs"
+
 # Centralized config defaults, used when a caller does not pass an explicit default_value.
 # Exact-name match first, then prefix, then suffix; falls back to False if nowhere matched.
 CONFIG_DEFAULTS: dict[str, Any] = {
@@ -237,31 +254,66 @@ def update_configs(element_id: int, model_name: str) -> dict[str, str]:
         {"max_participants": "50", "registration_deadline": "2024-01-15"}
 
     """
-    # Define mapping between model names and their corresponding config models
-    model_map = {
-        "event": ("EventConfig", "event_id"),
-        "association": ("AssociationConfig", "association_id"),
-        "run": ("RunConfig", "run_id"),
-        "member": ("MemberConfig", "member_id"),
-        "character": ("CharacterConfig", "character_id"),
-    }
+    return _query_configs([element_id], model_name).get(element_id, {})
 
+
+def _query_configs(element_ids: Iterable[int], model_name: str) -> dict[int, dict[str, str]]:
+    """Query the configs of many elements of the same model, grouped by element id."""
     # Validate that the provided model name exists in our mapping
-    # noinspection PyProtectedMember
-    if model_name not in model_map:
+    if model_name not in CONFIG_MODELS:
         return {}
 
-    # Extract the config model class name and foreign key field name
-    config_model_name, foreign_key_field = model_map[model_name]
-
     # Get the actual Django model class using apps registry
+    config_model_name, foreign_key_field = CONFIG_MODELS[model_name]
     config_model_class = apps.get_model("larpmanager", config_model_name)
 
-    # Query for all config entries matching the element ID
-    config_queryset = config_model_class.objects.filter(**{foreign_key_field: element_id})
+    # Query all config entries of the elements at once
+    element_configs: dict[int, dict[str, str]] = {element_id: {} for element_id in element_ids}
+    for element_id, name, value in config_model_class.objects.filter(
+        **{f"{foreign_key_field}__in": list(element_configs)}
+    ).values_list(foreign_key_field, "name", "value"):
+        element_configs[element_id][name] = value
+
+    return element_configs
+
+
+def get_many_element_configs(
+    element_ids: Iterable[int], model_name: str, *, bypass_cache: bool = False
+) -> dict[int, dict[str, str]]:
+    """Get the configs of many elements of the same model in one round trip.
+
+    Cached configs are read with a single multi-get, and the missing ones are loaded
+    with a single query and cached.
+
+    Args:
+        element_ids: IDs of the elements
+        model_name: The type of model ("event", "association", "run", "member", "character")
+        bypass_cache: Whether to read directly from the database, for background processes
+
+    Returns:
+        Dictionary mapping each element id to its config names and values
+
+    """
+    element_ids = set(element_ids)
+    if not element_ids:
+        return {}
+    if bypass_cache:
+        return _query_configs(element_ids, model_name)
+
+    # Read all the cached configs at once
+    cache_keys = {cache_configs_key(element_id, model_name): element_id for element_id in element_ids}
+    element_configs = {cache_keys[key]: configs for key, configs in cache.get_many(list(cache_keys)).items()}
+
+    # Load the missing configs with a single query and cache them
+    missing_configs = _query_configs(element_ids - element_configs.keys(), model_name)
+    if missing_configs:
+        cache.set_many(
+            {cache_configs_key(element_id, model_name): configs for element_id, configs in missing_configs.items()},
+            timeout=conf_settings.CACHE_TIMEOUT_1_DAY,
+        )
+        element_configs.update(missing_configs)
 
-    # Build and return dictionary of config name-value pairs
-    return {config.name: config.value for config in config_queryset}
+    return element_configs
 
 
 def save_all_element_configs(obj: BaseModel, dct: dict[str, str]) -> None:
@@ -372,8 +424,9 @@ def get_element_config(element: Any, config_name: str, *, bypass_cache: bool = F
         if the configuration parameter is not found.
 
     Note:
-        If element lacks aux_configs attribute, it will be populated either from
-        cache (default) or directly from database (if bypass_cache=True).
+        If element lacks aux_configs attribute, it will be populated from the configs
+        attached by prefetch_configs, if any, otherwise either from cache (default) or
+        directly from database (if bypass_cache=True).
 
     """
     # If element is an Event with a parent, use parent's config directly (except own-child configs)
@@ -386,7 +439,11 @@ def get_element_config(element: Any, config_name: str, *, bypass_cache: bool = F
 
     # Check if element already has cached configurations
     if not hasattr(element, "aux_configs"):
-        if bypass_cache:
+        prefetched_configs = getattr(element, PREFETCHED_CONFIGS_ATTR, None)
+        if prefetched_configs is not None:
+            # Use the configs attached by prefetch_configs with the queryset
+            element.aux_configs = {config.name: config.value for config in prefetched_configs}
+        elif bypass_cache:
             # Fetch directly from database for background processes to avoid stale cache
             element.aux_configs = update_configs(element.id, element._meta.model_name.lower())  # noqa: SLF001  # Django model metadata
         else:
@@ -398,15 +455,33 @@ def get_element_config(element: Any, config_name: str, *, bypass_cache: bool = F
     return evaluate_config(element.aux_configs, config_name, default_value)
 
 
-def _get_cached_config(
-    element_id: int,
+def prefetch_configs(lookup: str = "configs") -> Prefetch:
+    """Prefetch all the configs of the elements reached by lookup, read by get_element_config."""
+    return Prefetch(lookup, to_attr=PREFETCHED_CONFIGS_ATTR)
+
+
+def with_configs(queryset: QuerySet, *lookups: str) -> QuerySet:
+    """Prefetch the configs of the queryset elements, or of the related elements reached by lookups.
+
+    Args:
+        queryset: Queryset of elements having configs, or related to them
+        *lookups: Config lookups to prefetch, such as "event__configs" for runs
+
+    Returns:
+        Queryset whose elements answer get_element_config without further queries
+
+    """
+    return queryset.prefetch_related(*[prefetch_configs(lookup) for lookup in lookups or ("configs",)])
+
+
+def _get_context_configs(
+    element_ids: Iterable[int],
     element_type: str,
-    config_name: str,
     *,
     context: dict | None = None,
     bypass_cache: bool = False,
-) -> any:
-    """Get cached configuration for any element type."""
+) -> dict[int, dict[str, str]]:
+    """Get the configs of many elements, memoized in the context for the rest of the request."""
     cache_key = f"{element_type}_configs"
 
     if context is None:
@@ -414,17 +489,61 @@ def _get_cached_config(
     if cache_key not in context:
         context[cache_key] = {}
 
-    element_configs = context[cache_key].get(element_id, None)
-    if element_configs is None:
-        if bypass_cache:
-            # do not trust cache for background processes
-            element_configs = update_configs(element_id, element_type)
-        else:
-            element_configs = get_element_configs(element_id, element_type)
-        context[cache_key][element_id] = element_configs
+    # Load the configs not yet in the context with a single round trip
+    missing_ids = [element_id for element_id in element_ids if element_id not in context[cache_key]]
+    if missing_ids:
+        context[cache_key].update(get_many_element_configs(missing_ids, element_type, bypass_cache=bypass_cache))
+
+    return context[cache_key]
+
+
+def _get_cached_config(
+    element_id: int,
+    element_type: str,
+    config_name: str,
+    *,
+    context: dict | None = None,
+    bypass_cache: bool = False,
+) -> any:
+    """Get cached configuration for any element type."""
+    element_configs = _get_context_configs([element_id], element_type, context=context, bypass_cache=bypass_cache)
 
     default_value = get_config_default(config_name)
-    return evaluate_config(element_configs, config_name, default_value)
+    return evaluate_config(element_configs[element_id], config_name, default_value)
+
+
+def get_many_configs(
+    element_ids: Iterable[int],
+    element_type: str,
+    config_names: Iterable[str],
+    *,
+    context: dict | None = None,
+    bypass_cache: bool = False,
+) -> dict[int, dict[str, Any]]:
+    """Get many configuration values for many elements of the same type in one round trip.
+
+    Args:
+        element_ids: IDs of the elements
+        element_type: The type of the elements ("event", "association", "run", "member", "character")
+        config_names: Configuration names to retrieve
+        context: Request context memoizing the configs already loaded
+        bypass_cache: Whether to read directly from the database, for background processes
+
+    Returns:
+        Dictionary mapping each element id to its configuration values, with defaults applied
+
+    """
+    element_ids = list(element_ids)
+    element_configs = _get_context_configs(element_ids, element_type, context=context, bypass_cache=bypass_cache)
+
+    defaults = {config_name: get_config_default(config_name) for config_name in config_names}
+    return {
+        element_id: {
+            config_name: evaluate_config(element_configs[element_id], config_name, default_value)
+            for config_name, default_value in defaults.items()
+        }
+        for element_id in element_ids
+    }
 
 
 def get_association_config(
@@ -493,6 +612,28 @@ def get_event_config(
     return _get_cached_config(lookup_id, "event", config_name, context=context, bypass_cache=bypass_cache)
 
 
+def get_event_configs(
+    event_id: int,
+    config_names: Iterable[str],
+    *,
+    context: dict | None = None,
+    bypass_cache: bool = False,
+) -> dict[str, Any]:
+    """Get many event configuration values at once, resolving the campaign parent like get_event_config."""
+    if context is None:
+        context = {}
+
+    # Load the configs of both the event and its campaign parent in one round trip
+    parent_id = _get_event_parent_id(event_id, context)
+    lookup_ids = [event_id, parent_id] if parent_id else [event_id]
+    _get_context_configs(lookup_ids, "event", context=context, bypass_cache=bypass_cache)
+
+    return {
+        config_name: get_event_config(event_id, config_name, context=context, bypass_cache=bypass_cache)
+        for config_name in config_names
+    }
+
+
 def get_member_config(
     member_id: int,
     config_name: str,
@@ -513,22 +654,9 @@ def _is_config_set_cached(
     bypass_cache: bool = False,
 ) -> bool:
     """Check whether a config has been explicitly set, without applying evaluate_config type coercion."""
-    cache_key = f"{element_type}_configs"
-
-    if context is None:
-        context = {}
-    if cache_key not in context:
-        context[cache_key] = {}
-
-    element_configs = context[cache_key].get(element_id, None)
-    if element_configs is None:
-        if bypass_cache:
-            element_configs = update_configs(element_id, element_type)
-        else:
-            element_configs = get_element_configs(element_id, element_type)
-        context[cache_key][element_id] = element_configs
+    element_configs = _get_context_configs([element_id], element_type, context=context, bypass_cache=bypass_cache)
 
-    raw_value = element_configs.get(config_name)
+    raw_value = element_configs[element_id].get(config_name)
     return bool(raw_value) and raw_value != "None"
 
 
@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING, Any
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 
+from larpmanager.cache.builder import build_once
 from larpmanager.cache.dirty import get_has_dirty_key, mark_dirty, refresh_if_dirty, resolve_dirty_section
 from larpmanager.models.event import Event
 from larpmanager.models.experience import AbilityExp, CriterionExp, DeliveryExp, ModifierExp, RuleExp, SystemExp
@@ -366,7 +367,9 @@ def get_event_exp_cache(event: Event) -> dict[str, Any]:
     # Initialize cache if no data found
     if cached_relationships is None:
         logger.debug("EXP cache miss for event %s (effective %s), initializing", event.id, effective_event.id)
-        return init_event_exp_all(effective_event)
+        return build_once(
+            cache_key, lambda: init_event_exp_all(effective_event), lambda: cache.get(cache_key), name="event_exp"
+        )
 
     # Resolve any items still marked as dirty (not yet cleaned by background job)
     any_resolved = False
@@ -31,6 +31,12 @@ from django.http import HttpRequest
 from django.utils import timezone
 
 from larpmanager.cache.basic import get_run_association_id
+from larpmanager.cache.role import (
+    get_association_permission_index,
+    get_event_permission_index,
+    remove_association_role_cache,
+    remove_event_role_cache,
+)
 from larpmanager.models.access import AssociationRole, EventRole
 from larpmanager.models.event import DevelopStatus, Event, Run
 from larpmanager.models.registration import Registration
@@ -105,6 +111,14 @@ def _build_navigation_context(request: HttpRequest, context: dict) -> dict:
     navigation_context["association_role"] = _get_association_roles(member, association_id, request)
     navigation_context["event_role"] = _get_event_roles(member, association_id)
 
+    # Merge the permissions of the roles, so each permission check is a set lookup
+    # (LarpManager admins are granted every permission without looking at the roles)
+    if not is_lm_admin(request):
+        navigation_context["association_permission_index"] = get_association_permission_index(
+            navigation_context["association_role"]
+        )
+    navigation_context["event_permission_index"] = get_event_permission_index(navigation_context["event_role"])
+
     # Build accessible runs
     navigation_context.update(
         _get_accessible_runs(association_id, navigation_context["association_role"], navigation_context["event_role"]),
@@ -239,8 +253,10 @@ def clear_run_event_links_cache(event: Event) -> None:
     # Clear visible_runs cache for this association (public run list may have changed)
     cache.delete(f"visible_runs:{event.association_id}")
 
-    # Clear cache for all members with roles in this specific event
+    # Clear cache for all members with roles in this specific event, and the roles
+    # themselves as their permissions depend on the event features
     for event_role in EventRole.objects.filter(event=event).prefetch_related("members"):
+        remove_event_role_cache(event_role.id)
         for member in event_role.members.all():
             reset_event_links(member.id, event.association_id)
 
@@ -262,6 +278,30 @@ def clear_run_event_links_cache(event: Event) -> None:
         reset_event_links(superuser.member.id, event.association_id)
 
 
+def clear_association_event_links_cache(association_id: int) -> None:
+    """Reset the roles and the event links of all the association staff.
+
+    Role permissions are filtered by the features of the association, inherited
+    by its events, so they must be rebuilt when the association is saved.
+
+    Args:
+        association_id: ID of the association
+
+    """
+    member_ids = set()
+    for association_role in AssociationRole.objects.filter(association_id=association_id).prefetch_related("members"):
+        remove_association_role_cache(association_role.id)
+        member_ids.update(member.id for member in association_role.members.all())
+
+    for event_role in EventRole.objects.filter(event__association_id=association_id).prefetch_related("members"):
+        remove_event_role_cache(event_role.id)
+        member_ids.update(member.id for member in event_role.members.all())
+
+    member_ids.update(User.objects.filter(is_superuser=True, member__isnull=False).values_list("member__id", flat=True))
+    for member_id in member_ids:
+        reset_event_links(member_id, association_id)
+
+
 def on_registration_post_save_reset_event_links(instance: Registration) -> None:
     """Handle registration post-save event link reset."""
     # Early return if no member is associated with the registration
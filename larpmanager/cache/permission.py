@@ -17,234 +17,213 @@
 # commercial@larpmanager.com
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+"""Permission lookups served from a table compiled once per process.
+
+Permissions, their features and modules only change with the fixtures, so
+they are compiled in an immutable in-process table instead of being read
+from the shared cache at each lookup. The table is stamped with a version
+stored in the shared cache: saving a permission, feature or module bumps
+it, and every process recompiles its table once it notices the change.
+"""
+
 from __future__ import annotations
 
 import logging
+import time
+import uuid
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-from django.conf import settings as conf_settings
 from django.core.cache import cache
-from django.core.exceptions import ObjectDoesNotExist
 
 from larpmanager.models.access import AssociationPermission, EventPermission
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from larpmanager.models.base import BaseModel
+
 logger = logging.getLogger(__name__)
 
+# Cache key holding the version of the permission table shared by all processes
+PERMISSION_TABLE_VERSION_KEY = "permission_table_version"
 
-def association_permission_feature_key(permission_slug: str) -> str:
-    """Generate cache key for association permission features."""
-    return f"association_permission_feature_{permission_slug}"
+# Seconds a process trusts its table before checking the shared version again
+PERMISSION_TABLE_CHECK_INTERVAL = 30
 
+# Fields of the permissions listed in the sidebar index
+INDEX_PERMISSION_FIELDS = (
+    "name",
+    "descr",
+    "slug",
+    "hidden",
+    "config",
+    "active_if",
+    "icon",
+    "feature__placeholder",
+    "feature__slug",
+    "module__name",
+    "module__icon",
+)
 
-def update_association_permission_feature(slug: str) -> tuple[str, str, str]:
-    """Update cached association permission feature data.
+PERMISSION_MODELS: dict[str, type[BaseModel]] = {"event": EventPermission, "association": AssociationPermission}
 
-    Retrieves association permission data by slug, processes the feature information,
-    and updates the cache with the processed data.
 
-    Args:
-        slug: Permission slug to look up
+@dataclass(frozen=True)
+class PermissionTable:
+    """Immutable lookup table of the permissions, compiled once per process."""
 
-    Returns:
-        A tuple containing (feature_slug, tutorial, config) where:
-            - feature_slug: The feature slug or 'def' if placeholder
-            - tutorial: Feature tutorial text or empty string
-            - config: Permission config text or empty string
+    version: str
+    checked: float
+    # Feature slug ("def" for placeholders), tutorial and config, by permission type and slug
+    features: Mapping[str, Mapping[str, tuple[str, str, str]]]
+    # Permissions ordered by module and number, by permission type
+    index: Mapping[str, tuple[dict, ...]]
+
+
+_permission_table: PermissionTable | None = None
 
-    """
-    # Fetch permission with related feature data to minimize queries
-    perm = AssociationPermission.objects.select_related("feature").get(slug=slug)
-    feature = perm.feature
-
-    # Use default slug for placeholder features, otherwise use actual feature slug
-    slug = "def" if feature.placeholder else feature.slug
-
-    # Extract tutorial and config data with fallback to empty strings
-    tutorial = feature.tutorial or ""
-    config = perm.config or ""
-
-    # Cache the processed data for future requests
-    cache.set(
-        association_permission_feature_key(slug),
-        (slug, tutorial, config),
-        timeout=conf_settings.CACHE_TIMEOUT_1_DAY,
-    )
-    return slug, tutorial, config
 
+def _get_permission_table_version() -> str:
+    """Return the shared version of the permission table, creating it if missing."""
+    version = cache.get(PERMISSION_TABLE_VERSION_KEY)
+    if version is None:
+        cache.add(PERMISSION_TABLE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(PERMISSION_TABLE_VERSION_KEY)
+    return version
 
-def get_association_permission_feature(slug: str | list[str]) -> tuple[str, str | None, dict | None]:
-    """Get cached association permission feature data.
 
-    Retrieves feature data for an association permission from cache first,
-    falling back to database if not cached.
+def _compile_permission_table(version: str) -> PermissionTable:
+    """Compile the lookup table of all the permissions.
 
     Args:
-        slug: Permission slug(s) identifier
+        version: Shared version the table is compiled for
 
     Returns:
-        A tuple containing:
-            - feature_slug (str): The feature slug, defaults to "def" if slug is empty
-            - tutorial (str | None): Tutorial content if available
-            - config (dict | None): Configuration data if available
+        The compiled table
 
     """
-    # Return default values if no slug provided
-    if not slug:
-        return "def", None, None
-
-    permission = slug[0] if isinstance(slug, list) else slug
+    features = {}
+    index = {}
+    for permission_type, model in PERMISSION_MODELS.items():
+        permissions = list(
+            model.objects.order_by("module__order", "number").values(*INDEX_PERMISSION_FIELDS, "feature__tutorial")
+        )
+        features[permission_type] = MappingProxyType(
+            {
+                permission["slug"]: (
+                    "def" if permission["feature__placeholder"] else permission["feature__slug"],
+                    permission.pop("feature__tutorial") or "",
+                    permission["config"] or "",
+                )
+                for permission in permissions
+            }
+        )
+        index[permission_type] = tuple(permissions)
+
+    logger.debug("Compiled permission table %s", version)
+    return PermissionTable(
+        version=version,
+        checked=time.monotonic(),
+        features=MappingProxyType(features),
+        index=MappingProxyType(index),
+    )
 
-    # Attempt to retrieve from cache first
-    cached_feature_data = cache.get(association_permission_feature_key(permission))
 
-    # If cache miss, update cache and return fresh data
-    if cached_feature_data is None:
-        cached_feature_data = update_association_permission_feature(permission)
+def get_permission_table() -> PermissionTable:
+    """Return the permission table of this process, recompiling it if the shared version changed."""
+    global _permission_table  # noqa: PLW0603
 
-    return cached_feature_data
+    table = _permission_table
+    now = time.monotonic()
+    if table is None or now - table.checked > PERMISSION_TABLE_CHECK_INTERVAL:
+        version = _get_permission_table_version()
+        table = (
+            _compile_permission_table(version)
+            if table is None or table.version != version
+            else replace(table, checked=now)
+        )
+        _permission_table = table
 
+    return table
 
-def clear_association_permission_cache(association: AssociationPermission) -> None:
-    """Clear the association permission cache for the given association."""
-    cache.delete(association_permission_feature_key(association.slug))
 
+def reload_permission_table() -> None:
+    """Bump the shared version, so that every process recompiles its permission table."""
+    global _permission_table  # noqa: PLW0603
 
-def event_permission_feature_key(permission_slug: str) -> str:
-    """Generate cache key for event permission features."""
-    return f"event_permission_feature_{permission_slug}"
+    cache.set(PERMISSION_TABLE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    _permission_table = None
 
 
-def update_event_permission_feature(permission_slug: str) -> tuple[str, str, str]:
-    """Update event permission feature cache with slug, tutorial, and config data.
+def get_association_permission_feature(slug: str | list[str]) -> tuple[str, str | None, str | None]:
+    """Get the feature data of an association permission.
 
     Args:
-        permission_slug: The permission slug to look up
+        slug: Permission slug(s) identifier, the first one is used for lists
 
     Returns:
-        A tuple containing (feature_slug, tutorial, config):
-            - feature_slug: The feature slug or "def" if placeholder
-            - tutorial: The feature tutorial text or empty string
-            - config: The permission config or empty string
+        A tuple containing:
+            - feature_slug (str): The feature slug, "def" for placeholders or if slug is empty
+            - tutorial (str | None): Tutorial content if available
+            - config (str | None): Configuration section if available
 
-    """
-    try:
-        # Fetch permission with related feature to avoid additional queries
-        event_permission = EventPermission.objects.select_related("feature").get(slug=permission_slug)
-    except ObjectDoesNotExist:
-        logger.warning("Permission slug does not exist: %s", permission_slug)
-        return "", "", ""
+    Raises:
+        AssociationPermission.DoesNotExist: If no permission has the slug
 
-    # Extract feature from permission
-    permission_feature = event_permission.feature
+    """
+    # Return default values if no slug provided
+    if not slug:
+        return "def", None, None
 
-    # Determine the appropriate slug based on feature type
-    feature_slug = "def" if permission_feature.placeholder else permission_feature.slug
+    permission = slug[0] if isinstance(slug, list) else slug
 
-    # Extract tutorial and config with fallback to empty strings
-    feature_tutorial = permission_feature.tutorial or ""
-    permission_config = event_permission.config or ""
+    try:
+        return get_permission_table().features["association"][permission]
+    except KeyError as err:
+        msg = f"Association permission {permission} does not exist"
+        raise AssociationPermission.DoesNotExist(msg) from err
 
-    # Cache the result for 1 day to improve performance
-    cache.set(
-        event_permission_feature_key(permission_slug),
-        (feature_slug, feature_tutorial, permission_config),
-        timeout=conf_settings.CACHE_TIMEOUT_1_DAY,
-    )
 
-    return feature_slug, feature_tutorial, permission_config
+def clear_association_permission_cache(association: AssociationPermission) -> None:  # noqa: ARG001
+    """Reload the permission table after an association permission changed."""
+    reload_permission_table()
 
 
-def get_event_permission_feature(slug: str | None) -> tuple[str, None, None]:
-    """Get event permission feature from cache or update if not cached.
+def get_event_permission_feature(slug: str | None) -> tuple[str, str | None, str | None]:
+    """Get the feature data of an event permission.
 
     Args:
-        slug: Event slug identifier
+        slug: Permission slug identifier
 
     Returns:
-        Tuple containing permission feature data
+        Tuple of feature slug ("def" for placeholders), tutorial and config section;
+        empty strings if the permission does not exist
 
     """
     # Return default values if no slug provided
     if not slug:
         return "def", None, None
 
-    # Attempt to retrieve from cache first
-    cached_feature = cache.get(event_permission_feature_key(slug))
-
-    # Update cache if no cached result found
+    cached_feature = get_permission_table().features["event"].get(slug)
     if cached_feature is None:
-        cached_feature = update_event_permission_feature(slug)
+        logger.warning("Permission slug does not exist: %s", slug)
+        return "", "", ""
 
     return cached_feature
 
 
-def clear_event_permission_cache(event_permission: EventPermission) -> None:
-    """Clear cache for an event permission."""
-    cache.delete(event_permission_feature_key(event_permission.slug))
-
-
-def index_permission_key(permission_type: str) -> str:
-    """Build cache key for index permission lookup."""
-    return f"index_permission_key_{permission_type}"
-
-
-def update_index_permission(permission_type: str) -> list[dict]:
-    """Update and cache permission index for given type.
-
-    Retrieves permissions from database, orders them by module and number,
-    then caches the result for efficient access.
-
-    Args:
-        permission_type: Permission type, either 'event' or 'association'
-
-    Returns:
-        List of permission dictionaries with feature and module information
-
-    Raises:
-        KeyError: If permission_type is not 'event' or 'association'
-
-    """
-    # Map permission type to corresponding model class
-    type_to_model_mapping = {"event": EventPermission, "association": AssociationPermission}
-
-    # Get queryset with related feature and module data
-    permission_queryset = type_to_model_mapping[permission_type].objects.select_related("feature", "module")
-
-    # Order by module priority and permission number
-    permission_queryset = permission_queryset.order_by("module__order", "number")
-
-    # Extract required fields for caching
-    permission_data = permission_queryset.values(
-        "name",
-        "descr",
-        "slug",
-        "hidden",
-        "config",
-        "active_if",
-        "icon",
-        "feature__placeholder",
-        "feature__slug",
-        "module__name",
-        "module__icon",
-    )
-
-    # Cache result with 1-day timeout
-    cache.set(index_permission_key(permission_type), permission_data, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
-
-    return permission_data
-
-
-def get_cache_index_permission(permission_type: str) -> list:
-    """Get or update cached permission index for a given type."""
-    # Attempt to retrieve from cache
-    cached_result = cache.get(index_permission_key(permission_type))
+def clear_event_permission_cache(event_permission: EventPermission) -> None:  # noqa: ARG001
+    """Reload the permission table after an event permission changed."""
+    reload_permission_table()
 
-    # Update cache if not found
-    if cached_result is None:
-        cached_result = update_index_permission(permission_type)
 
-    return cached_result
+def get_cache_index_permission(permission_type: str) -> tuple[dict, ...]:
+    """Get the permissions of the given type ('event' or 'association'), ordered by module and number."""
+    return get_permission_table().index[permission_type]
 
 
-def clear_index_permission_cache(permission_type: str) -> None:
-    """Clear the cached permission index for the specified permission type."""
-    cache.delete(index_permission_key(permission_type))
+def clear_index_permission_cache(permission_type: str) -> None:  # noqa: ARG001
+    """Reload the permission table after permissions, features or modules changed."""
+    reload_permission_table()
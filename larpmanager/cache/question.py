@@ -91,7 +91,7 @@ def _skip_question_allowed(
     if "reg_que_allowed" not in features or not registration or not registration.pk or not is_organizer or not params:
         return False
 
-    allowed_map = [a for a in question.get("allowed_map", []) if a is not None]
+    allowed_map = question.get("allowed_map")
     if not allowed_map:
         return False
 
@@ -106,7 +106,7 @@ def _skip_question_tickets(features: dict, registration: Registration, question:
     if "reg_que_tickets" not in features or not registration or not registration.pk:
         return False
 
-    allowed_ticket_uuids = [ticket_uuid for ticket_uuid in question.get("tickets_map", []) if ticket_uuid is not None]
+    allowed_ticket_uuids = question.get("tickets_map")
     if allowed_ticket_uuids:
         if not registration.ticket:
             return True
@@ -122,20 +122,30 @@ def _skip_question_factions(features: dict, registration: Registration, question
     if "reg_que_faction" not in features:
         return False
 
-    allowed_faction_ids = [faction_id for faction_id in question.get("factions_map", []) if faction_id is not None]
+    allowed_faction_ids = question.get("factions_map")
     if allowed_faction_ids:
-        registration_faction_ids = []
-        if registration and registration.pk:
-            for character_relation in RegistrationCharacterRel.objects.filter(registration=registration):
-                character_factions = character_relation.character.factions_list.values_list("id", flat=True)
-                registration_faction_ids.extend(character_factions)
-
-        if not set(allowed_faction_ids).intersection(set(registration_faction_ids)):
-            return True
+        return _get_registration_faction_ids(registration).isdisjoint(allowed_faction_ids)
 
     return False
 
 
+def _get_registration_faction_ids(registration: Registration | None) -> frozenset[int]:
+    """Get the factions of the characters assigned to the registration, loaded once per instance."""
+    if not registration or not registration.pk:
+        return frozenset()
+
+    if not hasattr(registration, "aux_faction_ids"):
+        registration.aux_faction_ids = frozenset(
+            faction_id
+            for faction_id in RegistrationCharacterRel.objects.filter(
+                registration=registration, character__factions_list__deleted__isnull=True
+            ).values_list("character__factions_list__id", flat=True)
+            if faction_id is not None
+        )
+
+    return registration.aux_faction_ids
+
+
 def get_event_questions_cache_key(event_id: int, question_type: str) -> str:
     """Generate cache key for event questions."""
     return f"event_questions_{question_type}_{event_id}"
@@ -168,10 +178,11 @@ def init_writing_questions_cache(event: Event) -> dict:
     return questions_by_applicable
 
 
-def init_registration_questions_cache(event: Event) -> list:
+def init_registration_questions_cache(event: Event) -> dict[str, list]:
     """Initialize cache for registration questions.
 
-    Returns a list of question dicts with serialized options and annotation maps.
+    Returns the form plan of the event: the question dicts with serialized options and
+    annotation maps, grouped by applicable and already in form order.
 
     Note: We always compute all annotations regardless of enabled features to ensure
     cache consistency across different feature configurations.
@@ -194,8 +205,16 @@ def init_registration_questions_cache(event: Event) -> list:
         Prefetch("options", queryset=RegistrationOption.objects.order_by("order"))
     )
 
-    # Serialize questions to dicts
-    return [question.as_dict() for question in questions]
+    # Serialize questions to dicts, grouped by applicable
+    questions_by_applicable = {}
+    for question in questions:
+        questions_by_applicable.setdefault(question.applicable, []).append(question.as_dict())
+
+    # Sort each group once here, so readers get them already in form order
+    for applicable_questions in questions_by_applicable.values():
+        applicable_questions.sort(key=lambda q: (q.get("section_order") or -1, q["order"]))
+
+    return questions_by_applicable
 
 
 def get_cached_writing_questions(event: Event, applicable: str) -> list:
@@ -243,7 +262,7 @@ def get_cached_registration_questions(
               Each dict contains question fields, annotation maps, and 'options' list.
 
     """
-    cache_key = get_event_questions_cache_key(event.id, "registration")
+    cache_key = get_event_questions_cache_key(event.id, "registration_form")
 
     # Try to get from cache
     cached_data = cache.get(cache_key)
@@ -253,9 +272,7 @@ def get_cached_registration_questions(
         cached_data = init_registration_questions_cache(event)
         cache.set(cache_key, cached_data, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
 
-    # Explicitly sort to ensure order is preserved after cache deserialization
-    questions = [q for q in cached_data if q["applicable"] == applicable]
-    return sorted(questions, key=lambda q: (q.get("section_order") or -1, q["order"]))
+    return cached_data.get(applicable, [])
 
 
 def get_writing_field_names(event: Event, applicable: str) -> dict:
@@ -346,5 +363,5 @@ def clear_writing_questions_cache(event_id: int) -> None:
 
 def clear_registration_questions_cache(event_id: int) -> None:
     """Clear registration questions cache for an event."""
-    cache_key = get_event_questions_cache_key(event_id, "registration")
+    cache_key = get_event_questions_cache_key(event_id, "registration_form")
     cache.delete(cache_key)
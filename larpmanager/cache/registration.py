@@ -17,6 +17,7 @@
 # commercial@larpmanager.com
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+from functools import partial
 from typing import Any
 
 from django.core.cache import cache
@@ -24,6 +25,7 @@ from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from larpmanager.accounting.base import is_registration_provisional
+from larpmanager.cache.builder import get_many_or_build, get_or_build
 from larpmanager.cache.config import get_event_config
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.run import get_event_run_ids
@@ -107,6 +109,11 @@ def get_ticket_form_text(ticket: dict, currency_symbol: str = "") -> str:
     return formatted_text
 
 
+# Seconds the registration counts are fresh, and then served stale while refreshed
+REGISTRATION_COUNTS_TIMEOUT = 60 * 5
+REGISTRATION_COUNTS_STALE_TIMEOUT = 60
+
+
 def clear_registration_counts_cache(run_id: int) -> None:
     """Clear cached registration counts for a run."""
     cache.delete(cache_registration_counts_key(run_id))
@@ -132,14 +139,37 @@ def get_registration_counts(run: Run, *, reset_cache: bool = False) -> dict:
     cache_key = cache_registration_counts_key(run.id)
 
     # Check if we should bypass cache
-    cached_counts = None if reset_cache else cache.get(cache_key)
+    if reset_cache:
+        cache.delete(cache_key)
+
+    # Counts are served stale for a while after expiring, while a single worker refreshes them
+    return get_or_build(
+        cache_key,
+        lambda: update_registration_counts(run),
+        timeout=REGISTRATION_COUNTS_TIMEOUT,
+        stale_timeout=REGISTRATION_COUNTS_STALE_TIMEOUT,
+        name="registration_counts",
+    )
+
+
+def get_registration_counts_many(runs: list[Run]) -> dict[int, dict]:
+    """Get registration counts for several runs, fetching the cached ones together.
 
-    # Update and cache if not found
-    if cached_counts is None:
-        cached_counts = update_registration_counts(run)
-        cache.set(cache_key, cached_counts, timeout=60 * 5)
+    Args:
+        runs: The run instances to get counts for
+
+    Returns:
+        Registration count data by run id
 
-    return cached_counts
+    """
+    runs_by_key = {cache_registration_counts_key(run.id): run for run in runs}
+    counts = get_many_or_build(
+        {key: partial(update_registration_counts, run) for key, run in runs_by_key.items()},
+        timeout=REGISTRATION_COUNTS_TIMEOUT,
+        stale_timeout=REGISTRATION_COUNTS_STALE_TIMEOUT,
+        name="registration_counts",
+    )
+    return {run.id: counts[key] for key, run in runs_by_key.items()}
 
 
 def add_count(counter_dict: dict, parameter_name: str, increment_value: int = 1) -> None:
@@ -20,12 +20,14 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 
+from larpmanager.cache.builder import build_once, get_or_build
 from larpmanager.cache.character import update_event_cache_all
 from larpmanager.cache.config import get_event_config
 from larpmanager.cache.dirty import get_has_dirty_key, mark_dirty, refresh_if_dirty, resolve_dirty_section
@@ -33,7 +35,15 @@ from larpmanager.cache.feature import get_event_features
 from larpmanager.models.casting import Quest, QuestType, Trait
 from larpmanager.models.event import Event, Run
 from larpmanager.models.utils import strip_tags
-from larpmanager.models.writing import Character, Faction, Plot, Prologue, Relationship, SpeedLarp
+from larpmanager.models.writing import (
+    Character,
+    Faction,
+    Plot,
+    PlotCharacterRel,
+    Prologue,
+    Relationship,
+    SpeedLarp,
+)
 from larpmanager.utils.core.clone_guard import is_clone_active
 from larpmanager.utils.core.common import _validate_and_fetch_objects
 from larpmanager.utils.larpmanager.tasks import background_auto
@@ -58,14 +68,12 @@ def get_event_rels_key(event_id: int) -> str:
 def clear_event_relationships_cache(event_id: int) -> None:
     """Reset event relationships cache for given event ID."""
     # Clear cache for the main event
-    cache_key = get_event_rels_key(event_id)
-    cache.delete(cache_key)
+    cache.delete_many([get_event_rels_key(event_id), get_event_rels_graph_key(event_id)])
     logger.debug("Reset cache for event %s", event_id)
 
     # Invalidate cache for all child events to maintain consistency
     for child_event_id in Event.objects.filter(parent_id=event_id).values_list("pk", flat=True):
-        cache_key = get_event_rels_key(child_event_id)
-        cache.delete(cache_key)
+        cache.delete_many([get_event_rels_key(child_event_id), get_event_rels_graph_key(child_event_id)])
 
 
 def build_relationship_dict(relationship_items: list) -> dict[str, Any]:
@@ -127,6 +135,115 @@ def remove_item_from_cache_section(event_id: int, section_name: str, section_id:
         clear_event_relationships_cache(event_id)
 
 
+# Relationship graph index: for the characters of an event, the edges towards other characters
+# (relationships) and towards the elements they belong to (plots, factions, speedlarps, prologues),
+# stored as lists of integer ids in both directions. The signals drop it when an edge changes, and it
+# is rebuilt under the builder lock on the next lookup, answering inbound/outbound lookups without querying.
+
+_GRAPH_SECTIONS = ("relationships", "plots", "factions", "speedlarps", "prologues")
+
+
+def get_event_rels_graph_key(event_id: int) -> str:
+    """Generate cache key for the relationship graph of the characters of an event."""
+    return f"event__rels_graph__{event_id}"
+
+
+def _add_graph_edges(section_graph: dict[str, dict[int, list[int]]], edges: Any) -> None:
+    """Add (outbound id, inbound id) edges to a graph section, skipping the ones already present."""
+    for outbound_id, inbound_id in edges:
+        outbound = section_graph["out"].setdefault(outbound_id, [])
+        if inbound_id not in outbound:
+            outbound.append(inbound_id)
+            section_graph["in"].setdefault(inbound_id, []).append(outbound_id)
+
+
+def _build_event_rels_graph(event_id: int) -> dict[str, dict[str, dict[int, list[int]]]]:
+    """Build the relationship graph of the characters of an event, with one query per section.
+
+    Returns:
+        Dictionary by section with 'out' (character id -> linked ids) and 'in'
+        (linked id -> character ids) adjacency lists; for relationships the
+        outbound side is the source character.
+
+    """
+    section_edges = {
+        "relationships": Relationship.objects.filter(deleted=None, source__event_id=event_id).values_list(
+            "source_id", "target_id"
+        ),
+        "plots": PlotCharacterRel.objects.filter(character__event_id=event_id).values_list("character_id", "plot_id"),
+    }
+    for section, model_class in (("factions", Faction), ("speedlarps", SpeedLarp), ("prologues", Prologue)):
+        element_field = model_class.__name__.lower()
+        section_edges[section] = model_class.characters.through.objects.filter(
+            character__event_id=event_id, **{f"{element_field}__deleted": None}
+        ).values_list("character_id", f"{element_field}_id")
+
+    graph = {section: {"out": {}, "in": {}} for section in _GRAPH_SECTIONS}
+    for section, edges in section_edges.items():
+        _add_graph_edges(graph[section], edges)
+    return graph
+
+
+def get_event_rels_graph(event_id: int) -> dict[str, dict[str, dict[int, list[int]]]]:
+    """Get the relationship graph of the characters of an event from cache, building it if missing."""
+    return get_or_build(
+        get_event_rels_graph_key(event_id), partial(_build_event_rels_graph, event_id), name="event_rels_graph"
+    )
+
+
+def get_character_graph_ids(character: Character, section: str, *, inbound: bool = False) -> list[int]:
+    """Return the ids linked to a character in a graph section.
+
+    Args:
+        character: The character to look up
+        section: Graph section ('relationships', 'plots', 'factions', 'speedlarps', 'prologues')
+        inbound: For relationships, return the source characters having the character as target,
+            instead of the targets of its relationships
+
+    Returns:
+        List of linked ids
+
+    """
+    graph = get_event_rels_graph(character.event_id)
+    return list(graph[section]["in" if inbound else "out"].get(character.id, []))
+
+
+def clear_event_rels_graph(event_id: int) -> None:
+    """Drop the cached relationship graph of an event after one of its edges changed.
+
+    The graph is not patched in place: concurrent read-modify-write cycles on the
+    shared cache entry would lose edges. The next lookup rebuilds it from the
+    database, with a single builder.
+    """
+    cache.delete(get_event_rels_graph_key(event_id))
+
+
+def update_relationship_graph(relationship: Relationship) -> None:
+    """Update the relationship graph after a relationship is saved or soft deleted."""
+    clear_event_rels_graph(relationship.source.event_id)
+
+
+def update_plot_character_graph(plot_character_rel: PlotCharacterRel) -> None:
+    """Update the relationship graph after a plot-character relation is saved or soft deleted."""
+    clear_event_rels_graph(plot_character_rel.character.event_id)
+
+
+def _update_m2m_graph(
+    instance: Plot | Faction | SpeedLarp | Prologue, character_ids: list[int], action: str, section: str
+) -> list[int]:
+    """Apply an M2M change to the relationship graph, returning the affected characters.
+
+    On post_clear the removed characters are not reported by Django: they are
+    taken from the graph before dropping it.
+    """
+    characters_event_id = instance.event.get_class_parent(Character).id
+    if action == "post_clear" and not character_ids:
+        character_ids = list(get_event_rels_graph(characters_event_id)[section]["in"].get(instance.id, []))
+    if character_ids:
+        clear_event_rels_graph(characters_event_id)
+    return character_ids
+
+
 def _make_char_rels_func(event: Event) -> Callable:
     """Return a closure that computes character rels within a specific event.
 
@@ -174,25 +291,17 @@ def refresh_character_related_caches(character: Character) -> None:
         None
 
     """
-    # Schedule background task to update all plots that this character is part of
-    plot_ids = list(character.get_plot_characters().values_list("plot_id", flat=True))
-    if plot_ids:
-        refresh_event_plot_relationships_background(plot_ids)
-
-    # Schedule background task to update all factions that this character is part of
-    faction_ids = list(get_character_faction_ids_cached(character))
-    if faction_ids:
-        refresh_event_faction_relationships_background(faction_ids)
-
-    # Schedule background task to update all speedlarps that this character is part of
-    speedlarp_ids = list(character.speedlarps_list.values_list("id", flat=True))
-    if speedlarp_ids:
-        refresh_event_speedlarp_relationships_background(speedlarp_ids)
-
-    # Schedule background task to update all prologues that this character is part of
-    prologue_ids = list(character.prologues_list.values_list("id", flat=True))
-    if prologue_ids:
-        refresh_event_prologue_relationships_background(prologue_ids)
+    # The linked elements are looked up in the relationship graph of the event
+    for section, refresh_background in (
+        ("plots", refresh_event_plot_relationships_background),
+        ("factions", refresh_event_faction_relationships_background),
+        ("speedlarps", refresh_event_speedlarp_relationships_background),
+        ("prologues", refresh_event_prologue_relationships_background),
+    ):
+        # Schedule background task to update all the elements of the section this character is part of
+        element_ids = get_character_graph_ids(character, section)
+        if element_ids:
+            refresh_background(element_ids)
 
 
 def mark_plot_character_rel_dirty(plot_id: int, character_id: int | None = None) -> None:
@@ -224,16 +333,8 @@ def update_m2m_related_characters(
 
     """
     if action in ("post_add", "post_remove", "post_clear"):
-        # Collect all affected character IDs
-        affected_character_ids = []
-        if character_ids:
-            affected_character_ids = list(character_ids)
-        elif action == "post_clear":
-            # For post_clear, get all characters that were related
-            if hasattr(instance, "characters"):
-                affected_character_ids = list(instance.characters.values_list("id", flat=True))
-            elif hasattr(instance, "get_plot_characters"):
-                affected_character_ids = [rel.character_id for rel in instance.get_plot_characters()]
+        # Drop the graph, which also reports the characters removed by a clear
+        affected_character_ids = _update_m2m_graph(instance, list(character_ids or []), action, section)
 
         # Get all run IDs to update (event and child events)
         event = instance.event
@@ -281,7 +382,9 @@ def get_event_rels_cache(event: Event) -> dict[str, Any]:
     # Initialize cache if no data found
     if cached_relationships is None:
         logger.debug("Cache miss for event %s, initializing", event.id)
-        return init_event_rels_all(event)
+        return build_once(
+            cache_key, lambda: init_event_rels_all(event), lambda: cache.get(cache_key), name="event_rels"
+        )
 
     # Resolve any items marked still dirty by M2M signal
     any_resolved = False
@@ -340,9 +443,10 @@ def init_event_rels_all(event: Event) -> dict[str, dict[int, dict[str, Any]]]:
         features = get_event_features(event.id)
 
         # Configuration mapping for each relationship type with their corresponding
-        # feature name, cache key, model class, relationship function, and feature flag
+        # feature name, cache key, model class, relationship function, and whether the
+        # function builds all the elements at once with the event features
         relationship_configs = [
-            ("character", "characters", Character, get_event_char_rels, True),
+            ("character", "characters", Character, get_event_chars_rels, True),
             ("faction", "factions", Faction, get_event_faction_rels, False),
             ("plot", "plots", Plot, get_event_plot_rels, False),
             ("speedlarp", "speedlarps", SpeedLarp, get_event_speedlarp_rels, False),
@@ -368,15 +472,12 @@ def init_event_rels_all(event: Event) -> dict[str, dict[int, dict[str, Any]]]:
             # Get all elements of this type associated with the event
             elements = event.get_elements(model_class)
 
-            # Build relationships for each element, passing features if required
-            for element in elements:
-                if should_pass_features:
-                    relationship_cache[cache_key_plural][element.id] = get_relationships_function(
-                        element,
-                        features,
-                        event,
-                    )
-                else:
+            # Build relationships of all the elements at once when the function supports it (characters),
+            # otherwise for each element
+            if should_pass_features:
+                relationship_cache[cache_key_plural] = get_relationships_function(list(elements), features, event)
+            else:
+                for element in elements:
                     relationship_cache[cache_key_plural][element.id] = get_relationships_function(element)
 
             logger.debug("Initialized %s %s relationships for event %s", len(elements), feature_name, event.id)
@@ -454,81 +555,209 @@ def _count_unimportant(rels: Any, event_id: int) -> int:
     return sum(1 for rel in rels if strip_tags(rel.text).lstrip().startswith("$unimportant"))
 
 
-def _build_plot_relations(char: Character, event: Event) -> dict[str, Any]:
-    """Build plot relationships for a character.
+def _build_plot_relations(characters: list[Character], event: Event) -> dict[int, dict[str, Any]]:
+    """Build plot relationships for the characters, with a single query.
 
     Args:
-        char: Character to build plot relationships for
+        characters: Characters to build plot relationships for
         event: Event for which the cache is built, used to scope plots
 
     Returns:
-        Dictionary with plot relationship data including important count
+        Dictionary by character id with plot relationship data including important count
     """
-    related_plots = char.get_plot_characters(event)
-    plot_list = [(plot_rel.plot.uuid, plot_rel.plot.name) for plot_rel in related_plots]
-    plot_rels = build_relationship_dict(plot_list)
-    plot_rels["important"] = plot_rels["count"] - _count_unimportant(related_plots, char.event_id)
-    return plot_rels
+    rels_by_character = defaultdict(list)
+    plot_rels_queryset = (
+        PlotCharacterRel.objects.filter(
+            character_id__in=[char.id for char in characters], plot__event=event.get_class_parent("plot")
+        )
+        .select_related("plot")
+        .order_by("order")
+    )
+    for plot_rel in plot_rels_queryset:
+        rels_by_character[plot_rel.character_id].append(plot_rel)
+
+    relations = {}
+    for char in characters:
+        related_plots = rels_by_character[char.id]
+        plot_rels = build_relationship_dict([(plot_rel.plot.uuid, plot_rel.plot.name) for plot_rel in related_plots])
+        plot_rels["important"] = plot_rels["count"] - _count_unimportant(related_plots, char.event_id)
+        relations[char.id] = plot_rels
+    return relations
 
 
-def _build_faction_relations(char: Character, event: Event) -> dict[str, Any]:
-    """Build faction relationships for a character.
+def _build_faction_relations(characters: list[Character], event: Event) -> dict[int, dict[str, Any]]:
+    """Build faction relationships for the characters, with a query for memberships and one for factions.
 
     Args:
-        char: Character to build faction relationships for
+        characters: Characters to build faction relationships for
         event: Event for faction independence configuration
 
     Returns:
-        Dictionary with faction relationship data
+        Dictionary by character id with faction relationship data
     """
-    cache_event_id = event.id if event else char.event_id
-    if get_event_config(cache_event_id, "campaign_faction_indep"):
-        # Use the cache event for independent faction lookup
-        faction_event_id = cache_event_id
-    else:
-        # Use the parent event for inherited faction lookup
-        faction_event_id = char.event.get_class_parent("faction").id
-
-    # Build faction list based on determined event
-    if faction_event_id:
-        character_factions = char.factions_list.filter(event_id=faction_event_id)
-        faction_list = [(faction.uuid, faction.name) for faction in character_factions]
-    else:
-        faction_list = []
+    # Resolve the event of the factions once per character event
+    faction_event_ids = {}
+    for char in characters:
+        if char.event_id in faction_event_ids:
+            continue
+        if get_event_config(event.id, "campaign_faction_indep"):
+            # Use the cache event for independent faction lookup
+            faction_event_ids[char.event_id] = event.id
+        else:
+            # Use the parent event for inherited faction lookup
+            faction_event_ids[char.event_id] = char.event.get_class_parent("faction").id
+
+    faction_ids_by_character = defaultdict(set)
+    memberships = Faction.characters.through.objects.filter(character_id__in=[char.id for char in characters])
+    for character_id, faction_id in memberships.values_list("character_id", "faction_id"):
+        faction_ids_by_character[character_id].add(faction_id)
+
+    # Factions in their default ordering, as the character factions_list returns them
+    factions = list(
+        Faction.objects.filter(
+            id__in=set().union(*faction_ids_by_character.values()),
+            event_id__in=set(faction_event_ids.values()),
+        )
+    )
 
-    return build_relationship_dict(faction_list)
+    relations = {}
+    for char in characters:
+        faction_event_id = faction_event_ids[char.event_id]
+        character_faction_ids = faction_ids_by_character[char.id]
+        faction_list = [
+            (faction.uuid, faction.name)
+            for faction in factions
+            if faction.event_id == faction_event_id and faction.id in character_faction_ids
+        ]
+        relations[char.id] = build_relationship_dict(faction_list)
+    return relations
 
 
-def _build_character_relations(char: Character) -> dict[str, Any]:
-    """Build character-to-character relationships.
+def _build_character_relations(characters: list[Character]) -> dict[int, dict[str, Any]]:
+    """Build character-to-character relationships, with a single query.
 
     Args:
-        char: Character to build relationships for
+        characters: Characters to build relationships for
 
     Returns:
-        Dictionary with character relationship data including important count
+        Dictionary by character id with character relationship data including important count
     """
-    character_relationships = Relationship.objects.filter(deleted=None, source=char)
-    relationship_list = [
-        (relationship.target.uuid, relationship.target.name) for relationship in character_relationships
-    ]
-    relationships_rels = build_relationship_dict(relationship_list)
-    relationships_rels["important"] = relationships_rels["count"] - _count_unimportant(
-        character_relationships, char.event_id
-    )
-    return relationships_rels
+    relationships_by_source = defaultdict(list)
+    character_relationships = Relationship.objects.filter(
+        deleted=None, source_id__in=[char.id for char in characters]
+    ).select_related("target")
+    for relationship in character_relationships:
+        relationships_by_source[relationship.source_id].append(relationship)
 
+    relations = {}
+    for char in characters:
+        source_relationships = relationships_by_source[char.id]
+        relationship_list = [
+            (relationship.target.uuid, relationship.target.name) for relationship in source_relationships
+        ]
+        relationships_rels = build_relationship_dict(relationship_list)
+        relationships_rels["important"] = relationships_rels["count"] - _count_unimportant(
+            source_relationships, char.event_id
+        )
+        relations[char.id] = relationships_rels
+    return relations
 
-def _build_relationship_tag_counts(char: Character) -> dict[str, int]:
-    """Count, per relationship tag, how many of this character's direct relationships carry it."""
-    character_relationships = Relationship.objects.filter(deleted=None, source=char).prefetch_related("tags")
-    counts: dict[str, int] = {}
-    for relationship in character_relationships:
-        for tag in relationship.tags.all():
-            counts[tag.uuid] = counts.get(tag.uuid, 0) + 1
+
+def _build_relationship_tag_counts(characters: list[Character]) -> dict[int, dict[str, int]]:
+    """Count, per relationship tag, how many of each character's direct relationships carry it."""
+    counts: dict[int, dict[str, int]] = {char.id: {} for char in characters}
+    tagged = Relationship.tags.through.objects.filter(
+        relationship__deleted=None,
+        relationship__source_id__in=list(counts),
+        relationshiptag__deleted=None,
+    ).values_list("relationship__source_id", "relationshiptag__uuid")
+    for source_id, tag_uuid in tagged:
+        counts[source_id][tag_uuid] = counts[source_id].get(tag_uuid, 0) + 1
     return counts
 
 
+def _build_m2m_relations(characters: list[Character], model_class: type[SpeedLarp | Prologue]) -> dict[int, dict]:
+    """Build the relationships with the elements of a many-to-many on characters (speedlarps, prologues).
+
+    Args:
+        characters: Characters to build the relationships for
+        model_class: Model with the characters many-to-many field
+
+    Returns:
+        Dictionary by character id with relationship data
+    """
+    element_field = f"{model_class.__name__.lower()}_id"
+    element_ids_by_character = defaultdict(set)
+    through_rows = model_class.characters.through.objects.filter(character_id__in=[char.id for char in characters])
+    for character_id, element_id in through_rows.values_list("character_id", element_field):
+        element_ids_by_character[character_id].add(element_id)
+
+    # Elements in their default ordering, as the character related manager returns them
+    elements = list(model_class.objects.filter(id__in=set().union(*element_ids_by_character.values())))
+
+    return {
+        char.id: build_relationship_dict(
+            [(element.uuid, element.name) for element in elements if element.id in element_ids_by_character[char.id]]
+        )
+        for char in characters
+    }
+
+
+def _build_event_chars_rels(characters: list[Character], features: dict[str, Any], event: Event) -> dict[int, dict]:
+    """Build the relationships of several characters with a fixed number of queries.
+
+    Every section is loaded with one query for all the characters, then split
+    per character in memory; see get_event_char_rels for the structure.
+    """
+    sections: dict[str, dict[int, Any]] = {}
+
+    # Handle plot relationships if plot feature is enabled
+    if "plot" in features:
+        sections["plot_rels"] = _build_plot_relations(characters, event)
+
+    # Handle faction relationships if faction feature is enabled
+    if "faction" in features:
+        sections["faction_rels"] = _build_faction_relations(characters, event)
+
+    # Handle character-to-character relationships if relationships feature is enabled
+    if "relationships" in features:
+        sections["relationships_rels"] = _build_character_relations(characters)
+
+        if get_event_config(event.id, "writing_relationship_tags"):
+            sections["relationship_tag_counts"] = _build_relationship_tag_counts(characters)
+
+    # Handle speedlarp relationships if speedlarp feature is enabled
+    if "speedlarp" in features:
+        sections["speedlarp_rels"] = _build_m2m_relations(characters, SpeedLarp)
+
+    # Handle prologue relationships if prologue feature is enabled
+    if "prologue" in features:
+        sections["prologue_rels"] = _build_m2m_relations(characters, Prologue)
+
+    return {char.id: {name: section[char.id] for name, section in sections.items()} for char in characters}
+
+
+def get_event_chars_rels(characters: list[Character], features: dict[str, Any], event: Event) -> dict[int, dict]:
+    """Get the relationships of several characters, with a fixed number of queries.
+
+    Args:
+        characters: The Character instances to get relationships for.
+        features: Dictionary of enabled features for the event.
+        event: Event instance for which we are building the cache.
+
+    Returns:
+        Dictionary by character id with the relationship data of get_event_char_rels;
+        every character gets an empty dict if relationship building fails.
+
+    """
+    try:
+        return _build_event_chars_rels(characters, features, event)
+    except Exception:
+        # Log the error with full traceback and return empty dicts as fallback
+        logger.exception("Error getting relationships for characters of event %s", event.id)
+        return {char.id: {} for char in characters}
+
+
 def get_event_char_rels(char: Character, features: dict[str, Any], event: Event) -> dict[str, Any]:
     """Get character relationships for a specific character.
 
@@ -559,42 +788,7 @@ def get_event_char_rels(char: Character, features: dict[str, Any], event: Event)
         Exception: Logs error and returns empty dict if relationship building fails.
 
     """
-    relations: dict[str, Any] = {}
-
-    try:
-        # Handle plot relationships if plot feature is enabled
-        if "plot" in features:
-            relations["plot_rels"] = _build_plot_relations(char, event)
-
-        # Handle faction relationships if faction feature is enabled
-        if "faction" in features:
-            relations["faction_rels"] = _build_faction_relations(char, event)
-
-        # Handle character-to-character relationships if relationships feature is enabled
-        if "relationships" in features:
-            relations["relationships_rels"] = _build_character_relations(char)
-
-            if get_event_config(event.id, "writing_relationship_tags"):
-                relations["relationship_tag_counts"] = _build_relationship_tag_counts(char)
-
-        # Handle speedlarp relationships if speedlarp feature is enabled
-        if "speedlarp" in features:
-            character_speedlarps = char.speedlarps_list.all()
-            speedlarp_list = [(speedlarp.uuid, speedlarp.name) for speedlarp in character_speedlarps]
-            relations["speedlarp_rels"] = build_relationship_dict(speedlarp_list)
-
-        # Handle prologue relationships if prologue feature is enabled
-        if "prologue" in features:
-            character_prologues = char.prologues_list.all()
-            prologue_list = [(prologue.uuid, prologue.name) for prologue in character_prologues]
-            relations["prologue_rels"] = build_relationship_dict(prologue_list)
-
-    except Exception:
-        # Log the error with full traceback and return empty dict as fallback
-        logger.exception("Error getting relationships for character %s", char.id)
-        relations = {}
-
-    return relations
+    return get_event_chars_rels([char], features, event)[char.id]
 
 
 def get_event_faction_rels(faction: Faction) -> dict[str, Any]:
@@ -18,6 +18,10 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 
@@ -25,6 +29,12 @@ from larpmanager.cache.feature import get_association_features, get_event_featur
 from larpmanager.models.access import AssociationRole, EventRole
 from larpmanager.utils.core.exceptions import UserPermissionError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Admin (or organizer) flag, granted permission slugs and role names of a member
+PermissionIndex = tuple[bool, frozenset[str], list[str]]
+
 
 def cache_association_role_key(association_role_id: int) -> str:
     """Generate cache key for association role."""
@@ -175,3 +185,42 @@ def remove_event_role_cache(assignment_role_id: int) -> None:
     """Remove cached event role data for the given assignment role ID."""
     key = cache_event_role_key(assignment_role_id)
     cache.delete(key)
+
+
+def _merge_roles(roles: dict[int, int], get_role: Callable[[int], tuple[str, list[str]]]) -> PermissionIndex:
+    """Merge the cached roles of a member in a single permission index entry."""
+    role_names = []
+    permission_slugs = set()
+    for role_id in roles.values():
+        role_name, role_permission_slugs = get_role(role_id)
+        role_names.append(role_name)
+        permission_slugs.update(role_permission_slugs)
+
+    # Role number 1 is the association admin, or the event organizer
+    return 1 in roles, frozenset(permission_slugs), role_names
+
+
+def get_association_permission_index(association_roles: dict[int, int]) -> PermissionIndex:
+    """Merge the association roles of a member, so permission checks become set lookups.
+
+    Args:
+        association_roles: Role id by role number of the member in the association
+
+    Returns:
+        Tuple of admin flag, granted permission slugs and role names
+
+    """
+    return _merge_roles(association_roles, get_cache_association_role)
+
+
+def get_event_permission_index(event_roles: dict[str, dict[int, int]]) -> dict[str, PermissionIndex]:
+    """Merge the event roles of a member for each event, so permission checks become set lookups.
+
+    Args:
+        event_roles: Role id by role number of the member, by event slug
+
+    Returns:
+        Tuple of organizer flag, granted permission slugs and role names, by event slug
+
+    """
+    return {event_slug: _merge_roles(roles, get_cache_event_role) for event_slug, roles in event_roles.items()}
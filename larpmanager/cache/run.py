@@ -68,6 +68,32 @@ def get_event_runs(event_id: int) -> QuerySet[Run]:
     return Run.objects.filter(id__in=get_event_run_ids(event_id))
 
 
+def calendar_runs_cache_key(association_id: int, language: str) -> str:
+    """Generate cache key for the upcoming runs, with status, shown to anonymous visitors."""
+    return f"calendar_runs_{association_id}_{language}"
+
+
+def calendar_api_cache_key(association_id: int) -> str:
+    """Generate cache key for the upcoming events listed by the JSON api."""
+    return f"calendar_api_{association_id}"
+
+
+def clear_calendar_runs_cache(association_id: int) -> None:
+    """Invalidate the cached calendar of an association, in every language.
+
+    The calendar of the main site (association 0) lists the runs of every
+    association, so it is invalidated too.
+    """
+    keys = []
+    for calendar_association_id in {association_id, 0}:
+        keys.append(calendar_api_cache_key(calendar_association_id))
+        keys.extend(
+            calendar_runs_cache_key(calendar_association_id, language_code)
+            for language_code, _label in conf_settings.LANGUAGES
+        )
+    cache.delete_many(keys)
+
+
 def reset_cache_run(association: Association, slug: str) -> None:
     """Invalidate the cached run data for a specific event."""
     key = cache_run_key(association, slug)
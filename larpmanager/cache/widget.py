@@ -35,10 +35,12 @@ from larpmanager.accounting.balance import (
     get_run_accounting,
 )
 from larpmanager.cache.basic import get_event_basic_cache, get_run_association_id
+from larpmanager.cache.builder import get_or_build, peek, rebuild
 from larpmanager.cache.config import get_association_config
 from larpmanager.cache.registration import get_registration_counts
 from larpmanager.cache.run import get_event_run_ids
 from larpmanager.models.accounting import (
+    AccountingItem,
     AccountingItemExpense,
     PaymentInvoice,
     PaymentStatus,
@@ -46,9 +48,9 @@ from larpmanager.models.accounting import (
     RefundRequest,
     RefundStatus,
 )
-from larpmanager.models.casting import Casting, Quest, QuestType
+from larpmanager.models.casting import Casting, Quest, QuestType, Trait
 from larpmanager.models.event import DevelopStatus, Event, ProgressStep, RegistrationStatus, Run
-from larpmanager.models.experience import AbilityTypeExp, DeliveryExp
+from larpmanager.models.experience import AbilityExp, AbilityTypeExp, DeliveryExp
 from larpmanager.models.form import (
     BaseQuestionType,
     RegistrationQuestion,
@@ -66,6 +68,7 @@ from larpmanager.models.registration import (
 )
 from larpmanager.models.writing import Character, CharacterStatus
 from larpmanager.utils.core.common import format_datetime, get_coming_runs, get_event_features
+from larpmanager.utils.larpmanager.tasks import background_auto
 from larpmanager.utils.publication.ildb import (
     ILDB_CONFIG_KEY,
     ILDB_EXPIRE_CONFIG,
@@ -626,6 +629,13 @@ def _init_milestones_widget_cache(run: Run) -> dict:
     return {"milestones": result} if result else {}
 
 
+# Seconds a widget is fresh: afterwards it is still served, while a background task refreshes it
+WIDGET_TIMEOUT = 60 * 60
+WIDGET_STALE_TIMEOUT = conf_settings.CACHE_TIMEOUT_1_DAY
+
+# Seconds an invalidated widget waits before the recompute, so that close saves are coalesced
+WIDGET_RECOMPUTE_DELAY = 10
+
 # Widget list for run-level widgets
 orga_widget_list = {
     "actions": _init_orga_actions_cache,
@@ -647,6 +657,58 @@ exe_widget_list = {
 }
 
 
+# Models each run-level widget is computed from: saving one of them invalidates only these widgets
+orga_widget_dependencies = {
+    "actions": (
+        AbilityExp,
+        AccountingItem,
+        Character,
+        DeliveryExp,
+        HelpQuestion,
+        PaymentInvoice,
+        Quest,
+        QuestType,
+        Registration,
+        RegistrationInstallment,
+        RegistrationQuestion,
+        RegistrationQuota,
+        RegistrationTicket,
+        Trait,
+        WritingQuestion,
+    ),
+    "deadlines": (
+        AccountingItem,
+        Casting,
+        Membership,
+        PaymentInvoice,
+        Registration,
+        RegistrationInstallment,
+        RegistrationQuota,
+        RegistrationTicket,
+    ),
+    "user_character": (Character,),
+    "progress": (Character, ProgressStep),
+    "casting": (Casting, Character, Registration),
+    "accounting": (AccountingItem, PaymentInvoice, Registration, Run),
+    "logs": (Log,),
+    "milestones": (Milestone,),
+}
+
+# Models each association-level widget is computed from
+exe_widget_dependencies = {
+    "actions": (AccountingItem, HelpQuestion, Membership, PaymentInvoice, RefundRequest, Registration, Run),
+    "accounting": (AccountingItem, Membership, PaymentInvoice, RefundRequest, Run),
+    "deadlines": orga_widget_dependencies["deadlines"],
+    "logs": (Log,),
+}
+
+# Models whose saves invalidate at least one widget
+WIDGET_DEPENDENCY_TYPES = tuple(
+    {model for dependencies in orga_widget_dependencies.values() for model in dependencies}
+    | {model for dependencies in exe_widget_dependencies.values() for model in dependencies}
+)
+
+
 def get_widget_cache_key(entity_type: str, entity_id: int, widget_name: str) -> str:
     """Generate cache key for widget data."""
     return f"widget_cache_{entity_type}_{entity_id}_{widget_name}"
@@ -675,18 +737,61 @@ def get_widget_cache(
         msg = f"widget {widget_name} not found in widget list"
         raise Http404(msg)
 
-    cache_key = get_widget_cache_key(entity_type, entity_id, widget_name)
-    cached_data = cache.get(cache_key)
+    cached_data = peek_widget_cache(entity_type, entity_id, widget_name)
+    if cached_data is not None:
+        return cached_data
+
+    # If not in cache, compute fresh data in a single worker and cache it
+    return get_or_build(
+        get_widget_cache_key(entity_type, entity_id, widget_name),
+        lambda: cached_data_function(entity),
+        timeout=WIDGET_TIMEOUT,
+        stale_timeout=WIDGET_STALE_TIMEOUT,
+        name=f"widget_{widget_name}",
+    )
+
+
+def peek_widget_cache(entity_type: str, entity_id: int, widget_name: str) -> dict | None:
+    """Get widget data only if already cached, scheduling a background refresh once stale.
 
-    # If not in cache, update and get fresh data
-    if cached_data is None:
-        cached_data = cached_data_function(entity)
-        # Cache the result with 1-day timeout
-        cache.set(cache_key, cached_data, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+    Args:
+        entity_type: Type of entity ('run' or 'association')
+        entity_id: ID of the entity
+        widget_name: Name of the widget to retrieve
 
+    Returns:
+        dict | None: Widget data, None if not cached
+    """
+    cached_data, is_stale = peek(get_widget_cache_key(entity_type, entity_id, widget_name))
+    if is_stale:
+        refresh_widget_cache(entity_type, entity_id, widget_name)
     return cached_data
 
 
+def _get_widget_entity(entity_type: str, entity_id: int) -> tuple[Run | int | None, dict]:
+    """Return the object the widgets are computed on (None if deleted) and its widget list."""
+    if entity_type == "run":
+        return Run.objects.select_related("event").filter(pk=entity_id).first(), orga_widget_list
+    return entity_id, exe_widget_list
+
+
+@background_auto(queue="cache-widget", skip_duplicates=True)
+def refresh_widget_cache(entity_type: str, entity_id: int, widget_name: str) -> None:
+    """Recompute a stale widget, while the dashboards keep serving the previous data."""
+    entity, widget_list = _get_widget_entity(entity_type, entity_id)
+    cached_data_function = widget_list.get(widget_name)
+    if entity is None or not cached_data_function:
+        return
+
+    rebuild(
+        get_widget_cache_key(entity_type, entity_id, widget_name),
+        lambda: cached_data_function(entity),
+        timeout=WIDGET_TIMEOUT,
+        stale_timeout=WIDGET_STALE_TIMEOUT,
+        name=f"widget_{widget_name}",
+    )
+
+
 def get_orga_widget_cache(run: Run, widget_name: str) -> dict:
     """Get deadline widget data from cache or compute if not cached."""
     return get_widget_cache(run, "run", run.id, orga_widget_list, widget_name)
@@ -699,6 +804,18 @@ def get_exe_widget_cache(association_id: int, widget_name: str) -> dict:
     return get_widget_cache(association_id, "association", association_id, exe_widget_list, widget_name)
 
 
+def peek_orga_widget_cache(run_id: int, widget_name: str) -> dict | None:
+    """Get run-level widget data only if already cached."""
+    return peek_widget_cache("run", run_id, widget_name)
+
+
+def peek_exe_widget_cache(association_id: int, widget_name: str) -> dict | None:
+    """Get association-level widget data only if already cached."""
+    if _is_ildb_token_expired(association_id):
+        cache.delete(get_widget_cache_key("association", association_id, widget_name))
+    return peek_widget_cache("association", association_id, widget_name)
+
+
 def clear_widget_cache(run_id: int) -> None:
     """Clear cached widget data for a run."""
     for widget_name in orga_widget_list:
@@ -735,18 +852,81 @@ def clear_widget_cache_for_association(association_id: int) -> None:
     clear_widget_cache_association(association_id)
 
 
+def _get_widget_dirty_key(entity_type: str, entity_id: int, widget_name: str) -> str:
+    """Generate cache key flagging a widget invalidated and waiting for its recompute."""
+    return f"widget_dirty_{entity_type}_{entity_id}_{widget_name}"
+
+
+def invalidate_widgets(entity_type: str, entity_id: int, widget_names: list[str]) -> None:
+    """Drop the given widgets from cache, scheduling their recompute in background.
+
+    Only the widgets actually cached are recomputed: the others are built when
+    a dashboard first needs them.
+
+    Args:
+        entity_type: Type of entity ('run' or 'association')
+        entity_id: ID of the entity
+        widget_names: Names of the widgets to invalidate
+    """
+    if not widget_names:
+        return
+
+    widget_keys = {get_widget_cache_key(entity_type, entity_id, name): name for name in widget_names}
+    cached_keys = list(cache.get_many(list(widget_keys)))
+    if not cached_keys:
+        return
+
+    cache.delete_many(cached_keys)
+    cache.set_many(
+        {_get_widget_dirty_key(entity_type, entity_id, widget_keys[key]): True for key in cached_keys},
+        timeout=conf_settings.CACHE_TIMEOUT_1_DAY,
+    )
+    recompute_widgets(entity_type, entity_id)
+
+
+@background_auto(schedule=WIDGET_RECOMPUTE_DELAY, queue="cache-widget", skip_duplicates=True)
+def recompute_widgets(entity_type: str, entity_id: int) -> None:
+    """Recompute the invalidated widgets of a run or association.
+
+    The task is delayed and not duplicated while pending, so the saves made in
+    the meantime are coalesced in a single recompute. Widgets already rebuilt by
+    a dashboard view are left untouched.
+    """
+    entity, widget_list = _get_widget_entity(entity_type, entity_id)
+    dirty_keys = {_get_widget_dirty_key(entity_type, entity_id, name): name for name in widget_list}
+    dirty_found = list(cache.get_many(list(dirty_keys)))
+    if not dirty_found:
+        return
+
+    cache.delete_many(dirty_found)
+    if entity is None:
+        return
+
+    for dirty_key in dirty_found:
+        get_widget_cache(entity, entity_type, entity_id, widget_list, dirty_keys[dirty_key])
+
+
+def _get_dependent_widgets(instance: Any, widget_dependencies: dict) -> list[str]:
+    """Return the widgets computed from the model of the given instance."""
+    return [name for name, models in widget_dependencies.items() if isinstance(instance, models)]
+
+
 def reset_widgets(instance: Any) -> None:
-    """Reset widget cache data for related elements."""
+    """Invalidate the widgets computed from the given element, in its run, event and association."""
+    orga_widgets = _get_dependent_widgets(instance, orga_widget_dependencies)
+    exe_widgets = _get_dependent_widgets(instance, exe_widget_dependencies)
+
     run_id = getattr(instance, "run_id", None)
     if run_id:
-        clear_widget_cache(run_id)
-        clear_widget_cache_association(get_run_association_id(run_id))
+        invalidate_widgets("run", run_id, orga_widgets)
+        invalidate_widgets("association", get_run_association_id(run_id), exe_widgets)
 
     event_id = getattr(instance, "event_id", None)
     if event_id:
-        clear_widget_cache_for_event(event_id)
-        clear_widget_cache_association(get_event_basic_cache(event_id)["association_id"])
+        for event_run_id in get_event_run_ids(event_id):
+            invalidate_widgets("run", event_run_id, orga_widgets)
+        invalidate_widgets("association", get_event_basic_cache(event_id)["association_id"], exe_widgets)
 
     association_id = getattr(instance, "association_id", None)
     if association_id:
-        clear_widget_cache_association(association_id)
+        invalidate_widgets("association", association_id, exe_widgets)
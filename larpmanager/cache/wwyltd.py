@@ -50,6 +50,16 @@ def get_tutorials_cache_key() -> str:
     return "tutorials_cache"
 
 
+def get_chat_index_cache_key() -> str:
+    """Get the cache key for the chat retrieval index over guides and tutorials."""
+    return "chat_index_cache"
+
+
+def get_chat_index_version_key() -> str:
+    """Get the cache key for the version of the chat retrieval index."""
+    return "chat_index_version"
+
+
 def get_features_cache_key() -> str:
     """Get the cache key for features data."""
     return "features_cache"
@@ -145,15 +155,22 @@ def get_exe_configs_cache(association_id: int, features: set) -> list[dict]:
 
 
 def reset_guides_cache() -> None:
-    """Reset the guides cache."""
+    """Reset the guides cache, and the chat index built on guides."""
     guides_cache_key = get_guides_cache_key()
     cache.delete(guides_cache_key)
+    reset_chat_index_cache()
 
 
 def reset_tutorials_cache() -> None:
-    """Reset the tutorials cache."""
+    """Reset the tutorials cache, and the chat index built on tutorials."""
     tutorials_cache_key = get_tutorials_cache_key()
     cache.delete(tutorials_cache_key)
+    reset_chat_index_cache()
+
+
+def reset_chat_index_cache() -> None:
+    """Reset the chat index: processes reload it once they notice the missing version."""
+    cache.delete_many([get_chat_index_cache_key(), get_chat_index_version_key()])
 
 
 def reset_features_cache() -> None:
@@ -198,6 +198,11 @@ class UploadElementsForm(BaseForm):
 
     first = forms.FileField(validators=[validator], required=False)
     second = forms.FileField(validators=[validator], required=False)
+    dry_run = forms.BooleanField(
+        required=False,
+        label=_("Dry run"),
+        help_text=_("Check the file and show the resulting logs, without saving anything"),
+    )
 
     def __init__(self, *args: Any, only_one: bool = False, **kwargs: Any) -> None:
         """Initialize form, optionally removing the 'second' field."""
@@ -53,6 +53,8 @@ from larpmanager.utils.larpmanager.tasks import my_send_mail
 from larpmanager.utils.users.member import queue_executive_notification, queue_organizer_notification
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from larpmanager.models.event import Run
 
 logger = logging.getLogger(__name__)
@@ -207,49 +209,129 @@ def my_send_digest_email_exe(
         my_send_mail(subject, body, association.main_mail, instance)
 
 
+# Model holding the object of each notification type
+DIGEST_MODELS = {
+    NotificationType.REGISTRATION_NEW: Registration,
+    NotificationType.REGISTRATION_UPDATE: Registration,
+    NotificationType.REGISTRATION_CANCEL: Registration,
+    NotificationType.REGISTRATION_REQUEST_NEW: Registration,
+    NotificationType.PAYMENT_MONEY: AccountingItemPayment,
+    NotificationType.PAYMENT_CREDIT: AccountingItemPayment,
+    NotificationType.PAYMENT_TOKEN: AccountingItemPayment,
+    NotificationType.INVOICE_APPROVAL: PaymentInvoice,
+    NotificationType.INVOICE_APPROVAL_EXE: PaymentInvoice,
+    NotificationType.HELP_QUESTION: HelpQuestion,
+    NotificationType.REFUND_REQUEST: RefundRequest,
+    NotificationType.PASSWORD_REMINDER: Membership,
+}
+
+# Relations of each model shown in the digest, loaded together with the objects
+DIGEST_RELATED = {
+    Registration: ("member__user", "ticket"),
+    AccountingItemPayment: ("member__user", "inv"),
+    PaymentInvoice: ("member__user",),
+    HelpQuestion: ("member__user",),
+    RefundRequest: ("member__user",),
+    Membership: ("member__user", "association__skin"),
+}
+
+
+def load_digest_objects(notifications: list[NotificationQueue]) -> dict[tuple[type, int], Any]:
+    """Load the objects of the notifications, with a single query for each model.
+
+    Args:
+        notifications: Notifications whose objects are loaded
+
+    Returns:
+        Dict mapping (model, object id) to the object with its digest relations
+
+    """
+    object_ids: dict[type, set[int]] = {}
+    for notification in notifications:
+        model = DIGEST_MODELS.get(notification.notification_type)
+        if model:
+            object_ids.setdefault(model, set()).add(notification.object_id)
+
+    return {
+        (model, instance.pk): instance
+        for model, ids in object_ids.items()
+        for instance in model.objects.filter(pk__in=ids).select_related(*DIGEST_RELATED[model])
+    }
+
+
+def _digest_objects(
+    notifications: list[NotificationQueue],
+    objects: dict[tuple[type, int], Any] | None,
+    condition: Callable[[Any], bool],
+) -> list:
+    """Resolve the distinct objects of the notifications satisfying the condition.
+
+    Args:
+        notifications: Notifications of the same model
+        objects: Objects loaded by load_digest_objects, loaded here if None
+        condition: Check an object must pass to be listed
+
+    Returns:
+        Objects in the order of their first notification
+
+    """
+    if objects is None:
+        objects = load_digest_objects(notifications)
+
+    resolved = {}
+    for notification in notifications:
+        instance = objects.get((DIGEST_MODELS.get(notification.notification_type), notification.object_id))
+        if instance is not None and instance.pk not in resolved and condition(instance):
+            resolved[instance.pk] = instance
+    return list(resolved.values())
+
+
 def send_daily_organizer_summaries() -> None:
     """Send daily summary emails to organizers and executives with queued notifications.
 
-    For each member with unsent notifications, collects all their notifications,
-    groups them by event (for event organizers) or association (for executives),
-    generates summary emails, and marks notifications as sent.
+    All unsent notifications are loaded with their recipients, runs and objects
+    in a few queries, and grouped in memory by recipient and run (for event
+    organizers) or association (for executives). Each summary email is then
+    generated without further lookups, and its notifications are marked as sent
+    as soon as it is delivered.
 
     Handles both event-level notifications (sent to event organizers) and
     association-level notifications (sent to association executives or main_mail).
     """
     # Get all unsent notifications
-    notifications = NotificationQueue.objects.filter(sent=False).select_related("run__event", "association")
+    notifications = list(
+        NotificationQueue.objects.filter(sent=False).select_related(
+            "member__user", "run__event__association__skin", "association__skin"
+        )
+    )
+    objects = load_digest_objects(notifications)
 
     member_notifications = {}
     association_notifications = {}
     for notification in notifications:
         if notification.member_id:
-            if notification.member_id not in member_notifications:
-                member_notifications[notification.member_id] = []
-            member_notifications[notification.member_id].append(notification)
+            member_notifications.setdefault(notification.member_id, []).append(notification)
         else:
-            if notification.association_id not in association_notifications:
-                association_notifications[notification.association_id] = []
-            association_notifications[notification.association_id].append(notification)
+            association_notifications.setdefault(notification.association_id, []).append(notification)
 
-    for member_id, notifications in member_notifications.items():
-        _daily_member_summaries(member_id, notifications)
+    for member_notifications_list in member_notifications.values():
+        _daily_member_summaries(member_notifications_list, objects)
 
     # Handle association notifications (member is None, sent to association.main_mail)
-    for association_id, notifications in association_notifications.items():
-        association = Association.objects.get(pk=association_id)
+    for association_notifications_list in association_notifications.values():
+        association = association_notifications_list[0].association
 
         logger.info(
             "Sending daily summary to %s main_mail with %d notifications",
             association.name,
-            len(notifications),
+            len(association_notifications_list),
         )
 
         # Activate association's executive language
         activate(get_exec_language(association))
 
         # Generate summary email content for this association
-        email_content = generate_association_summary_email(association, notifications)
+        email_content = generate_association_summary_email(association, association_notifications_list, objects)
 
         # Build email subject
         email_subject = f"[{association.name}] " + _("Daily Summary")
@@ -262,8 +344,8 @@ def send_daily_organizer_summaries() -> None:
             association,
         )
 
-        # Mark all notifications for this association's main_mail as sent
-        _mark_notifications_sent(notifications)
+        # Marked right away, so a later failing summary does not send this one twice
+        _mark_notifications_sent(association_notifications_list)
         logger.info("Daily summary sent to %s main_mail", association.name)
 
 
@@ -272,9 +354,9 @@ def _mark_notifications_sent(notifications: list) -> None:
     NotificationQueue.objects.filter(id__in=[n.id for n in notifications]).update(sent=True, sent_at=timezone.now())
 
 
-def _daily_member_summaries(member_id: int, all_notifications: list) -> None:
+def _daily_member_summaries(all_notifications: list, objects: dict[tuple[type, int], Any]) -> None:
     """Send a summary of all unsent notifications for a member."""
-    member = Member.objects.get(pk=member_id)
+    member = all_notifications[0].member
 
     # Separate run-level and association-level notifications
     runs_notifications = {}
@@ -282,17 +364,11 @@ def _daily_member_summaries(member_id: int, all_notifications: list) -> None:
     for notification in all_notifications:
         if notification.run:
             # Run-level notification
-            run = notification.run
-            if run not in runs_notifications:
-                runs_notifications[run] = []
-            runs_notifications[run].append(notification)
+            runs_notifications.setdefault(notification.run, []).append(notification)
 
         elif notification.association:
             # Association-level notification
-            association = notification.association
-            if association not in associations_notifications:
-                associations_notifications[association] = []
-            associations_notifications[association].append(notification)
+            associations_notifications.setdefault(notification.association, []).append(notification)
 
     logger.info(
         "Sending daily summary to %s for %d runs and %d associations with %d total notifications",
@@ -308,7 +384,7 @@ def _daily_member_summaries(member_id: int, all_notifications: list) -> None:
         activate(member.language)
 
         # Generate summary email content for this run
-        email_content = generate_summary_email(run, notifications)
+        email_content = generate_summary_email(run, notifications, objects)
 
         # Build email subject
         email_subject = hdr(run.event) + _("Daily Summary") + f" - {run}"
@@ -321,13 +397,16 @@ def _daily_member_summaries(member_id: int, all_notifications: list) -> None:
             run.event,
         )
 
+        # Marked right away, so a later failing summary does not send this one twice
+        _mark_notifications_sent(notifications)
+
     # Send a summary email for each association this member has notifications for
     for association, notifications in associations_notifications.items():
         # Activate member's preferred language
         activate(member.language)
 
         # Generate summary email content for this association
-        email_content = generate_association_summary_email(association, notifications)
+        email_content = generate_association_summary_email(association, notifications, objects)
 
         # Build email subject
         email_subject = f"[{association.name}] " + _("Daily Summary")
@@ -340,21 +419,25 @@ def _daily_member_summaries(member_id: int, all_notifications: list) -> None:
             association,
         )
 
-    # Mark all notifications for this member as sent
-    _mark_notifications_sent(all_notifications)
+        _mark_notifications_sent(notifications)
+
     logger.info("Daily summary sent to %s", str(member))
 
 
-def generate_summary_email(run: Run, notifications: list) -> str:
+def generate_summary_email(run: Run, notifications: list, objects: dict[tuple[type, int], Any] | None = None) -> str:
     """Generate HTML email content for daily organizer summary.
 
     Args:
         run: Run instance
         notifications: List of notifications to include
+        objects: Objects of the notifications from load_digest_objects, loaded here if None
 
     Returns:
         str: HTML formatted email body
     """
+    if objects is None:
+        objects = load_digest_objects(notifications)
+
     # Group notifications by type
     grouped_notifications = _digest_organize_notifications(notifications)
 
@@ -374,7 +457,7 @@ def generate_summary_email(run: Run, notifications: list) -> str:
     # Process each notification group using its handler
     for group_key, handler_func in notification_handlers:
         if group_key in grouped_notifications:
-            email_body = handler_func(run, email_body, grouped_notifications[group_key], currency_symbol)
+            email_body = handler_func(run, email_body, grouped_notifications[group_key], currency_symbol, objects)
 
     # Footer
     email_body += "<br/><hr/>"
@@ -411,12 +494,14 @@ def _digest_organize_notifications(notifications: list) -> dict:
     return process
 
 
-def _digest_invoices(run: Run, email_body: str, invoice_approvals: list, currency_symbol: str) -> str:
+def _digest_invoices(
+    run: Run, email_body: str, invoice_approvals: list, currency_symbol: str, objects: dict[tuple[type, int], Any]
+) -> str:
     """Generate email content for digest invoice to approve."""
     email_body += "<h4>" + _("Payments Awaiting Approval") + f": {len(invoice_approvals)}" + "</h4>"
     email_body += "<ul>"
-    invoice_ids = [notification.object_id for notification in invoice_approvals]
-    for invoice in PaymentInvoice.objects.filter(pk__in=invoice_ids, association_id=run.event.association_id):
+    association_id = run.event.association_id
+    for invoice in _digest_objects(invoice_approvals, objects, lambda obj: obj.association_id == association_id):
         email_body += f"<li><b>{invoice.member}</b> - {invoice.causal} - {invoice.mc_gross:.2f} {currency_symbol}"
         approve_url = get_url(
             reverse("orga_invoices_confirm", kwargs={"event_slug": run.get_slug(), "invoice_uuid": invoice.uuid}),
@@ -428,13 +513,15 @@ def _digest_invoices(run: Run, email_body: str, invoice_approvals: list, currenc
     return email_body
 
 
-def _digest_payments(run: Run, email_body: str, all_payments: list, currency_symbol: str) -> str:
+def _digest_payments(
+    run: Run, email_body: str, all_payments: list, currency_symbol: str, objects: dict[tuple[type, int], Any]
+) -> str:
     """Generate email content for digest payments received."""
     email_body += "<h4>" + _("Payments Received") + f": {len(all_payments)}" + "</h4>"
     email_body += "<ul>"
 
-    payment_ids = [notification.object_id for notification in all_payments]
-    for payment in AccountingItemPayment.objects.filter(pk__in=payment_ids, association_id=run.event.association_id):
+    association_id = run.event.association_id
+    for payment in _digest_objects(all_payments, objects, lambda obj: obj.association_id == association_id):
         # Calculate net value (without transaction fees)
         net_value = payment.value
         if payment.inv and payment.inv.mc_fee:
@@ -453,12 +540,14 @@ def _digest_cancelled_registrations(
     email_body: str,
     cancelled_registrations: list,
     currency_symbol: str,  # noqa: ARG001
+    objects: dict[tuple[type, int], Any],
 ) -> str:
     """Generate email content for digest cancelled registrations."""
     email_body += "<h4>" + _("Cancelled Registrations") + f": {len(cancelled_registrations)}" + "</h4>"
     email_body += "<ul>"
-    registration_ids = [notification.object_id for notification in cancelled_registrations]
-    for registration in Registration.objects.filter(pk__in=registration_ids, run=run, pending=False):
+    for registration in _digest_objects(
+        cancelled_registrations, objects, lambda obj: obj.run_id == run.id and not obj.pending
+    ):
         ticket_name = registration.ticket.name if registration.ticket else _("No ticket")
         email_body += f"<li><b>{registration.member}</b> - {ticket_name}</li>"
     email_body += "</ul>"
@@ -466,12 +555,15 @@ def _digest_cancelled_registrations(
     return email_body
 
 
-def _digest_updated_registrations(run: Run, email_body: str, updated_registrations: list, currency_symbol: str) -> str:
+def _digest_updated_registrations(
+    run: Run, email_body: str, updated_registrations: list, currency_symbol: str, objects: dict[tuple[type, int], Any]
+) -> str:
     """Generate email content for digest updated registrations."""
     email_body += "<h4>" + _("Updated Registrations") + f": {len(updated_registrations)}" + "</h4>"
     email_body += "<ul>"
-    registration_ids = [notification.object_id for notification in updated_registrations]
-    for registration in Registration.objects.filter(pk__in=registration_ids, run=run, pending=False):
+    for registration in _digest_objects(
+        updated_registrations, objects, lambda obj: obj.run_id == run.id and not obj.pending
+    ):
         ticket_name = registration.ticket.name if registration.ticket else _("No ticket")
         email_body += (
             f"<li><b>{registration.member}</b> - {ticket_name} - {registration.tot_iscr:.2f} {currency_symbol}"
@@ -489,12 +581,15 @@ def _digest_updated_registrations(run: Run, email_body: str, updated_registratio
     return email_body
 
 
-def _digest_new_registrations(run: Run, email_body: str, new_registrations: list, currency_symbol: str) -> str:
+def _digest_new_registrations(
+    run: Run, email_body: str, new_registrations: list, currency_symbol: str, objects: dict[tuple[type, int], Any]
+) -> str:
     """Generate email content for digest updated registrations."""
     email_body += "<h4>" + _("New Registrations") + f": {len(new_registrations)}" + "</h4>"
     email_body += "<ul>"
-    registration_ids = [notification.object_id for notification in new_registrations]
-    for registration in Registration.objects.filter(pk__in=registration_ids, run=run, pending=False):
+    for registration in _digest_objects(
+        new_registrations, objects, lambda obj: obj.run_id == run.id and not obj.pending
+    ):
         ticket_name = registration.ticket.name if registration.ticket else _("No ticket")
         email_body += (
             f"<li><b>{registration.member}</b> - {ticket_name} - {registration.tot_iscr:.2f} {currency_symbol}"
@@ -517,12 +612,14 @@ def _digest_request_registrations(
     email_body: str,
     request_registrations: list,
     currency_symbol: str,  # noqa: ARG001
+    objects: dict[tuple[type, int], Any],
 ) -> str:
     """Generate email content for digest new signup requests."""
     email_body += "<h4>" + _("Signup Requests") + f": {len(request_registrations)}" + "</h4>"
     email_body += "<ul>"
-    registration_ids = [notification.object_id for notification in request_registrations]
-    for registration in Registration.objects.filter(pk__in=registration_ids, run=run, pending=True):
+    for registration in _digest_objects(
+        request_registrations, objects, lambda obj: obj.run_id == run.id and obj.pending
+    ):
         email_body += f"<li><b>{registration.member}</b>"
         requests_url = get_url(
             reverse("orga_registration_requests", kwargs={"event_slug": run.get_slug()}),
@@ -534,16 +631,22 @@ def _digest_request_registrations(
     return email_body
 
 
-def generate_association_summary_email(association: Association, notifications: list) -> str:
+def generate_association_summary_email(
+    association: Association, notifications: list, objects: dict[tuple[type, int], Any] | None = None
+) -> str:
     """Generate HTML email content for daily association executive summary.
 
     Args:
         association: Association instance
         notifications: List of notifications to include
+        objects: Objects of the notifications from load_digest_objects, loaded here if None
 
     Returns:
         str: HTML formatted email body
     """
+    if objects is None:
+        objects = load_digest_objects(notifications)
+
     email_body = ""
 
     # Map notification types to their handler functions
@@ -566,7 +669,7 @@ def generate_association_summary_email(association: Association, notifications:
     # Process each notification type using its handler
     for notification_type, handler_func in notification_handlers.items():
         if notification_type in grouped_notifications:
-            email_body += handler_func(association, grouped_notifications[notification_type])
+            email_body += handler_func(association, grouped_notifications[notification_type], objects)
 
     # Footer
     email_body += "<br/><hr/>"
@@ -576,12 +679,15 @@ def generate_association_summary_email(association: Association, notifications:
     return email_body
 
 
-def digest_password_reminders(association: Association, password_reminders: list[NotificationQueue]) -> str:
+def digest_password_reminders(
+    association: Association,
+    password_reminders: list[NotificationQueue],
+    objects: dict[tuple[type, int], Any] | None = None,
+) -> str:
     """Handles password reminders digest summary emails."""
     content = "<h4>" + _("Password Reset Requests") + f": ({len(password_reminders)})" + "</h4>"
     content += "<ul>"
-    membership_ids = [notification.object_id for notification in password_reminders]
-    for membership in Membership.objects.filter(pk__in=membership_ids, association=association):
+    for membership in _digest_objects(password_reminders, objects, lambda obj: obj.association_id == association.id):
         content += (
             "<li>"
             + _("Password reset request url for")
@@ -594,12 +700,15 @@ def digest_password_reminders(association: Association, password_reminders: list
     return content
 
 
-def digest_refund_request(association: Association, refund_requests: list[NotificationQueue]) -> str:
+def digest_refund_request(
+    association: Association,
+    refund_requests: list[NotificationQueue],
+    objects: dict[tuple[type, int], Any] | None = None,
+) -> str:
     """Handles refund request digest summary emails."""
     content = "<h4>" + _("Refund Requests") + f": ({len(refund_requests)})" + "</h4>"
     content += "<ul>"
-    request_ids = [notification.object_id for notification in refund_requests]
-    for refund in RefundRequest.objects.filter(pk__in=request_ids, association=association):
+    for refund in _digest_objects(refund_requests, objects, lambda obj: obj.association_id == association.id):
         content += f"<li><b>{refund.member}</b> - {refund.details} - {refund.value:.2f}"
         content += " - " + _("Refund requested")
         view_url = get_url(reverse("exe_refunds"), association)
@@ -608,12 +717,15 @@ def digest_refund_request(association: Association, refund_requests: list[Notifi
     return content
 
 
-def digest_invoice_approvals(association: Association, invoice_approvals: list[NotificationQueue]) -> str:
+def digest_invoice_approvals(
+    association: Association,
+    invoice_approvals: list[NotificationQueue],
+    objects: dict[tuple[type, int], Any] | None = None,
+) -> str:
     """Handles invoice approvals digest summary emails."""
     content = "<h4>" + _("Payments Awaiting Approval") + f": ({len(invoice_approvals)})" + "</h4>"
     content += "<ul>"
-    invoice_ids = [notification.object_id for notification in invoice_approvals]
-    for invoice in PaymentInvoice.objects.filter(pk__in=invoice_ids, association=association):
+    for invoice in _digest_objects(invoice_approvals, objects, lambda obj: obj.association_id == association.id):
         content += f"<li><b>{invoice.member}</b> - {invoice.causal} - {invoice.mc_gross:.2f}"
         content += " - " + _("Awaiting approval")
         approve_url = get_url(reverse("exe_invoices_confirm", kwargs={"invoice_uuid": invoice.uuid}), association)
@@ -622,12 +734,15 @@ def digest_invoice_approvals(association: Association, invoice_approvals: list[N
     return content
 
 
-def digest_help_questions(association: Association, help_questions: list[NotificationQueue]) -> str:
+def digest_help_questions(
+    association: Association,
+    help_questions: list[NotificationQueue],
+    objects: dict[tuple[type, int], Any] | None = None,
+) -> str:
     """Handles help questions digest summary emails."""
     content = "<h4>" + _("Help Questions") + f": ({len(help_questions)})" + "</h4>"
     content += "<ul>"
-    question_ids = [notification.object_id for notification in help_questions]
-    for question in HelpQuestion.objects.filter(pk__in=question_ids, association=association):
+    for question in _digest_objects(help_questions, objects, lambda obj: obj.association_id == association.id):
         content += f"<li><b>{question.member}</b>: {question.text[:100]}..."
         help_url = get_url(reverse("exe_questions"), association)
         content += f' - <a href="{help_url}">' + _("View") + "</a></li>"
@@ -5,7 +5,7 @@ import logging
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 
-from larpmanager.cache.config import get_event_config
+from larpmanager.cache.config import get_event_configs
 from larpmanager.mail.backends import DefaultEmailBackend, EmailBackend, SESEmailBackend, SMTPEmailBackend
 from larpmanager.models.association import Association
 from larpmanager.models.event import Run
@@ -56,46 +56,32 @@ def _get_event_smtp_config(run_id: int) -> dict | None:
         run = Run.objects.get(pk=run_id)
         event = run.event
 
-        cache_context = {}
-
-        # Check if event has custom SMTP host user configured
-        host_user = get_event_config(
+        # Read all the SMTP configs of the event in one round trip
+        smtp_configs = get_event_configs(
             event.id,
-            "mail_server_host_user",
-            context=cache_context,
+            [
+                "mail_server_host_user",
+                "mail_server_host",
+                "mail_server_port",
+                "mail_server_host_password",
+                "mail_server_use_tls",
+            ],
             bypass_cache=True,
         )
 
+        # Check if event has custom SMTP host user configured
+        host_user = smtp_configs["mail_server_host_user"]
+
         if not host_user:
             return None
 
         # Return SMTP configuration
         return {
-            "host": get_event_config(
-                event.id,
-                "mail_server_host",
-                context=cache_context,
-                bypass_cache=True,
-            ),
-            "port": get_event_config(
-                event.id,
-                "mail_server_port",
-                context=cache_context,
-                bypass_cache=True,
-            ),
+            "host": smtp_configs["mail_server_host"],
+            "port": smtp_configs["mail_server_port"],
             "username": host_user,
-            "password": get_event_config(
-                event.id,
-                "mail_server_host_password",
-                context=cache_context,
-                bypass_cache=True,
-            ),
-            "use_tls": get_event_config(
-                event.id,
-                "mail_server_use_tls",
-                context=cache_context,
-                bypass_cache=True,
-            ),
+            "password": smtp_configs["mail_server_host_password"],
+            "use_tls": smtp_configs["mail_server_use_tls"],
         }
 
     except ObjectDoesNotExist:
@@ -0,0 +1,261 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Reminder schedule: the next day each periodic reminder is due.
+
+Registration reminders are sent every ``remind_days`` days counted from the
+registration date, deadline reminders every ``deadline_days`` days counted from
+the run start. Instead of evaluating the modulo on every registration each
+night, the next due day is stored in ReminderSchedule and the nightly
+automation only reads the rows due today, then moves them forward. Cancelled
+registrations and completed or cancelled runs have no schedule.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+from django.utils import timezone
+
+from larpmanager.cache.basic import get_run_association_id
+from larpmanager.cache.config import get_association_config
+from larpmanager.models.event import DevelopStatus, Run
+from larpmanager.models.registration import Registration, ReminderKind, ReminderSchedule
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+# Association config holding the interval of each reminder kind
+REMINDER_CONFIGS = {
+    ReminderKind.REGISTRATION: "remind_days",
+    ReminderKind.DEADLINE: "deadline_days",
+}
+
+# Runs that no longer receive reminders
+CLOSED_RUN_STATUSES = [DevelopStatus.DONE, DevelopStatus.CANC]
+
+
+def get_reminder_interval(association_id: int, kind: str) -> int:
+    """Return the days between two reminders of the given kind, 0 if disabled."""
+    try:
+        return int(get_association_config(association_id, REMINDER_CONFIGS[kind]) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def next_reminder_day(anchor: date | None, interval: int, from_day: date) -> date | None:
+    """Return the first day from from_day on when a reminder is due.
+
+    A reminder is due on the days whose distance from the anchor, modulo the
+    interval, is 1. With an interval of 1 or less no day qualifies.
+
+    Args:
+        anchor: Registration date or run start the reminders are counted from
+        interval: Days between two reminders
+        from_day: First day that can be returned
+
+    Returns:
+        The due day, or None if the reminder never fires
+
+    """
+    if not anchor or interval <= 1:
+        return None
+
+    offset = ((anchor - from_day).days - 1) % interval
+    return from_day + timedelta(days=offset)
+
+
+def schedule_registration_reminder(registration: Registration, *, created: bool) -> None:
+    """Create, move or drop the reminder schedule of a registration.
+
+    Args:
+        registration: Registration just saved
+        created: Whether the registration was just created
+
+    """
+    schedules = ReminderSchedule.objects.filter(registration_id=registration.id)
+    if registration.cancellation_date or registration.run.development in CLOSED_RUN_STATUSES:
+        if not created:
+            schedules.delete()
+        return
+
+    if not created:
+        # Existing schedules stay valid unless the registration switched run
+        schedules.exclude(run_id=registration.run_id).delete()
+        if schedules.exists():
+            return
+
+    interval = get_reminder_interval(get_run_association_id(registration.run_id), ReminderKind.REGISTRATION)
+    due = next_reminder_day(registration.created.date(), interval, timezone.now().date())
+    if due:
+        ReminderSchedule.objects.create(
+            run_id=registration.run_id,
+            registration=registration,
+            kind=ReminderKind.REGISTRATION,
+            due=due,
+            interval=interval,
+        )
+
+
+def track_run_reopening(run: Run) -> None:
+    """Flag a run about to be saved that leaves the completed or cancelled status."""
+    run._reopened = False  # noqa: SLF001
+    if not run.pk or run.development in CLOSED_RUN_STATUSES:
+        return
+    previous = Run.objects.filter(pk=run.pk).values_list("development", flat=True).first()
+    run._reopened = previous in CLOSED_RUN_STATUSES  # noqa: SLF001
+
+
+def _registration_schedules(
+    registrations: QuerySet[Registration], interval: int, today: date
+) -> list[ReminderSchedule]:
+    """Build the unsaved registration reminder schedules of some registrations."""
+    return [
+        ReminderSchedule(
+            run_id=run_id,
+            registration_id=registration_id,
+            kind=ReminderKind.REGISTRATION,
+            due=next_reminder_day(created.date(), interval, today),
+            interval=interval,
+        )
+        for registration_id, run_id, created in registrations.values_list("id", "run_id", "created")
+    ]
+
+
+def schedule_run_reminder(run: Run) -> None:
+    """Create, move or drop the deadline reminder schedule of a run.
+
+    Completed and cancelled runs lose all their schedules, registration ones included,
+    so a run reopened after track_run_reopening flagged it gets them back.
+    """
+    if run.development in CLOSED_RUN_STATUSES:
+        ReminderSchedule.objects.filter(run_id=run.id).delete()
+        return
+
+    if getattr(run, "_reopened", False):
+        run._reopened = False  # noqa: SLF001
+        interval = get_reminder_interval(get_run_association_id(run.id), ReminderKind.REGISTRATION)
+        if interval > 1:
+            registrations = Registration.objects.filter(run_id=run.id, cancellation_date__isnull=True).exclude(
+                reminder_schedules__kind=ReminderKind.REGISTRATION
+            )
+            ReminderSchedule.objects.bulk_create(
+                _registration_schedules(registrations, interval, timezone.now().date())
+            )
+
+    interval = get_reminder_interval(get_run_association_id(run.id), ReminderKind.DEADLINE)
+    due = next_reminder_day(run.start, interval, timezone.now().date())
+    if not due:
+        ReminderSchedule.objects.filter(run_id=run.id, kind=ReminderKind.DEADLINE).delete()
+        return
+
+    ReminderSchedule.objects.update_or_create(
+        run_id=run.id,
+        registration=None,
+        kind=ReminderKind.DEADLINE,
+        defaults={"due": due, "interval": interval},
+    )
+
+
+def rebuild_association_reminders(association_id: int) -> int:
+    """Rebuild all the reminder schedules of an association.
+
+    Used when the reminder intervals change, and after bulk operations that
+    bypass the signals.
+
+    Args:
+        association_id: Association whose schedules are rebuilt
+
+    Returns:
+        Number of schedules created
+
+    """
+    today = timezone.now().date()
+    ReminderSchedule.objects.filter(run__event__association_id=association_id).delete()
+
+    schedules = []
+    interval = get_reminder_interval(association_id, ReminderKind.REGISTRATION)
+    if interval > 1:
+        registrations = Registration.objects.filter(
+            run__event__association_id=association_id, cancellation_date__isnull=True
+        ).exclude(run__development__in=CLOSED_RUN_STATUSES)
+        schedules.extend(_registration_schedules(registrations, interval, today))
+
+    interval = get_reminder_interval(association_id, ReminderKind.DEADLINE)
+    if interval > 1:
+        runs = Run.objects.filter(event__association_id=association_id, start__isnull=False).exclude(
+            development__in=CLOSED_RUN_STATUSES
+        )
+        schedules.extend(
+            ReminderSchedule(
+                run_id=run_id,
+                kind=ReminderKind.DEADLINE,
+                due=next_reminder_day(start, interval, today),
+                interval=interval,
+            )
+            for run_id, start in runs.values_list("id", "start")
+        )
+
+    ReminderSchedule.objects.bulk_create(schedules, batch_size=1000)
+    return len(schedules)
+
+
+def get_due_reminders(kind: str, today: date) -> QuerySet[ReminderSchedule]:
+    """Return the reminder schedules of the given kind due today."""
+    return ReminderSchedule.objects.filter(kind=kind, due=today)
+
+
+def prune_reminder_schedules() -> int:
+    """Delete the schedules of cancelled registrations and of completed or cancelled runs.
+
+    The signals already drop them, this catches the bulk updates that bypass them.
+
+    Returns:
+        Number of schedules deleted
+
+    """
+    deleted, _deleted_by_model = ReminderSchedule.objects.filter(
+        Q(run__development__in=CLOSED_RUN_STATUSES) | Q(registration__cancellation_date__isnull=False)
+    ).delete()
+    return deleted
+
+
+def advance_reminder_schedules(today: date) -> int:
+    """Move every schedule due today, or missed on a previous day, to its next due day.
+
+    The stale schedules are pruned first, so they are not moved forward.
+
+    Args:
+        today: Day the reminders have just been processed for
+
+    Returns:
+        Number of schedules moved
+
+    """
+    prune_reminder_schedules()
+    schedules = list(ReminderSchedule.objects.filter(due__lte=today).only("id", "due", "interval"))
+    for schedule in schedules:
+        periods = (today - schedule.due).days // schedule.interval + 1
+        schedule.due += timedelta(days=periods * schedule.interval)
+
+    ReminderSchedule.objects.bulk_update(schedules, ["due"], batch_size=1000)
+    return len(schedules)
@@ -25,6 +25,7 @@ import base64
 import json
 import logging
 import re
+import time
 import urllib.request
 from typing import Any
 from urllib.parse import urlparse
@@ -36,8 +37,9 @@ from cryptography.x509 import load_pem_x509_certificate
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 
-from larpmanager.mail.suppression import clear_soft_bounces, suppress_email
-from larpmanager.models.miscellanea import SuppressionReason
+from larpmanager.mail.suppression import apply_feedback_batch
+from larpmanager.models.miscellanea import EmailFeedbackEvent, EmailFeedbackKind, SuppressionReason
+from larpmanager.utils.larpmanager.tasks import background_auto
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,12 @@ CERT_FETCH_TIMEOUT = 10
 # Notifications already processed are ignored for this long
 DEDUP_TIMEOUT = 86400
 
+# Seconds the queued feedback events wait, so that a burst is applied in a few batches
+FEEDBACK_BATCH_DELAY = 30
+
+# Signing certificate parsed by this process, by url, with the monotonic time it expires at
+_loaded_certificate: dict[str, tuple[Any, float]] = {}
+
 
 def _is_aws_url(url: str) -> bool:
     """Check that a url points to an https endpoint owned by the SNS service.
@@ -113,19 +121,30 @@ def _canonical_string(payload: dict[str, Any]) -> bytes:
 def _fetch_certificate(url: str) -> Any:
     """Download and cache the SNS signing certificate.
 
-    The url reaches here before the signature is checked, so a single cache
-    entry is kept: the certificate name rotates, but an attacker knowing the
-    topic arn cannot turn distinct urls into unbounded cache entries.
+    The url reaches here before the signature is checked, so a single entry is
+    kept, both in process and in the shared cache: the certificate name rotates,
+    but an attacker knowing the topic arn cannot turn distinct urls into
+    unbounded cache entries. The parsed certificate expires like the shared
+    entry, so a long running process picks up a certificate reissued by AWS
+    under the same url.
     """
+    loaded = _loaded_certificate.get(url)
+    if loaded is not None and time.monotonic() < loaded[1]:
+        return loaded[0]
+
     key = "sns_cert_current"
     cached = cache.get(key)
     if cached and cached.get("url") == url:
-        return load_pem_x509_certificate(cached["pem"])
+        pem = cached["pem"]
+    else:
+        with urllib.request.urlopen(url, timeout=CERT_FETCH_TIMEOUT) as response:  # noqa: S310
+            pem = response.read()
+        cache.set(key, {"url": url, "pem": pem}, CERT_CACHE_TIMEOUT)
 
-    with urllib.request.urlopen(url, timeout=CERT_FETCH_TIMEOUT) as response:  # noqa: S310
-        pem = response.read()
-    cache.set(key, {"url": url, "pem": pem}, CERT_CACHE_TIMEOUT)
-    return load_pem_x509_certificate(pem)
+    certificate = load_pem_x509_certificate(pem)
+    _loaded_certificate.clear()
+    _loaded_certificate[url] = (certificate, time.monotonic() + CERT_CACHE_TIMEOUT)
+    return certificate
 
 
 def verify_sns_signature(payload: dict[str, Any]) -> bool:
@@ -186,31 +205,55 @@ def _bounce_reason(bounce: dict[str, Any]) -> str:
     return SuppressionReason.BOUNCE_TRANSIENT
 
 
+def _feedback_event(email: str, kind: str, reason: str = "", raw: dict[str, Any] | None = None) -> EmailFeedbackEvent:
+    """Build the queued feedback event of a recipient, with the address normalised."""
+    return EmailFeedbackEvent(email=(email or "").strip().lower(), kind=kind, reason=reason, raw=raw)
+
+
 def _handle_ses_message(message: dict[str, Any]) -> None:
-    """Record suppressions for the recipients of a bounce or complaint event."""
+    """Queue the feedback events for the recipients of a bounce, complaint or delivery."""
     notification_type = message.get("notificationType") or message.get("eventType")
+    events = []
 
     if notification_type == "Bounce":
         bounce = message.get("bounce", {})
         reason = _bounce_reason(bounce)
-        for recipient in bounce.get("bouncedRecipients", []):
-            suppress_email(recipient.get("emailAddress", ""), reason, raw=recipient)
-        return
+        events = [
+            _feedback_event(recipient.get("emailAddress", ""), EmailFeedbackKind.BOUNCE, reason, raw=recipient)
+            for recipient in bounce.get("bouncedRecipients", [])
+        ]
 
-    if notification_type == "Complaint":
+    elif notification_type == "Complaint":
         complaint = message.get("complaint", {})
-        for recipient in complaint.get("complainedRecipients", []):
-            suppress_email(recipient.get("emailAddress", ""), SuppressionReason.COMPLAINT, raw=complaint)
-        return
-
-    if notification_type == "Delivery":
+        events = [
+            _feedback_event(
+                recipient.get("emailAddress", ""), EmailFeedbackKind.COMPLAINT, SuppressionReason.COMPLAINT, complaint
+            )
+            for recipient in complaint.get("complainedRecipients", [])
+        ]
+
+    elif notification_type == "Delivery":
         # Acceptance by SES proves nothing: only a delivery clears past transient failures,
         # since the bounce notification of a message always arrives after it was sent
-        for recipient in message.get("delivery", {}).get("recipients", []):
-            clear_soft_bounces(recipient)
-        return
+        events = [
+            _feedback_event(recipient, EmailFeedbackKind.DELIVERY)
+            for recipient in message.get("delivery", {}).get("recipients", [])
+        ]
+
+    else:
+        logger.debug("SES notification ignored: %s", notification_type)
+
+    events = [event for event in events if "@" in event.email]
+    if events:
+        EmailFeedbackEvent.objects.bulk_create(events)
+        process_email_feedback()
+
 
-    logger.debug("SES notification ignored: %s", notification_type)
+@background_auto(schedule=FEEDBACK_BATCH_DELAY, queue="mail", skip_duplicates=True)
+def process_email_feedback() -> None:
+    """Apply all the queued feedback events, in batches."""
+    while apply_feedback_batch():
+        pass
 
 
 def _release_dedup(dedup_key: str) -> None:
@@ -223,7 +266,8 @@ def handle_sns_payload(payload: dict[str, Any]) -> bool:
     """Process a verified SNS payload, returning whether it was handled.
 
     Notifications are deduplicated on their SNS message id, so retries from
-    Amazon do not inflate bounce counters.
+    Amazon do not inflate bounce counters. Their events are only queued, and
+    applied to the suppression list by process_email_feedback.
     """
     message_type = payload.get("Type")
 
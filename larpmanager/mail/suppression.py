@@ -22,6 +22,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 from typing import Any
 
@@ -30,8 +31,16 @@ from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings as conf_settings
 from django.core.cache import cache
 from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
 
-from larpmanager.models.miscellanea import EmailSuppression, SuppressionReason
+from larpmanager.models.miscellanea import (
+    EmailFeedbackEvent,
+    EmailFeedbackKind,
+    EmailReputationCounter,
+    EmailSuppression,
+    SuppressionReason,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +61,12 @@ REASON_SEVERITY = {
 
 SUPPRESSION_CACHE_TIMEOUT = 3600
 
+# Maximum number of queued feedback events applied in a single transaction
+FEEDBACK_BATCH_SIZE = 500
+
+# Hours of feedback the reputation rates are computed on; older counters are deleted
+REPUTATION_LOOKBACK_HOURS = 24
+
 
 def _cache_key(email: str) -> str:
     """Return the cache key holding the suppression flag of an address."""
@@ -135,6 +150,26 @@ def reset_suppression_cache(email: str) -> None:
     cache.delete(_cache_key(email))
 
 
+def _apply_suppression_event(obj: EmailSuppression, reason: str, raw: dict[str, Any] | None) -> None:
+    """Count a bounce or complaint on a suppression, activating it when warranted."""
+    # Soft deleted rows still hold the unique email and are revived here
+    if obj.deleted:
+        obj.deleted = None
+        obj.deleted_by_cascade = False
+
+    obj.bounce_count += 1
+    # A reason is never downgraded while the address is blocked, but a stricter one
+    # replaces it; a released address starts over from the new event
+    if not obj.active or REASON_SEVERITY.get(reason, 0) > REASON_SEVERITY.get(obj.reason, 0):
+        obj.reason = reason
+    # A manual entry carries no payload: it must not erase the diagnostic of the
+    # bounce that is the only record of why the address is dead
+    if raw is not None:
+        obj.raw = raw
+    # Suppression is only ever raised here: releasing an address is up to unsuppress_email
+    obj.active = obj.active or reason in HARD_REASONS or obj.bounce_count >= SOFT_BOUNCE_LIMIT
+
+
 def suppress_email(email: str, reason: str, raw: dict[str, Any] | None = None) -> EmailSuppression | None:
     """Record a bounce or complaint, activating suppression when warranted.
 
@@ -153,21 +188,7 @@ def suppress_email(email: str, reason: str, raw: dict[str, Any] | None = None) -
             defaults={"reason": reason, "bounce_count": 0, "active": False},
         )
         obj = EmailSuppression.all_objects.select_for_update().get(pk=obj.pk)
-        if obj.deleted:
-            obj.deleted = None
-            obj.deleted_by_cascade = False
-
-        obj.bounce_count += 1
-        # A reason is never downgraded while the address is blocked, but a stricter one
-        # replaces it; a released address starts over from the new event
-        if not obj.active or REASON_SEVERITY.get(reason, 0) > REASON_SEVERITY.get(obj.reason, 0):
-            obj.reason = reason
-        # A manual entry carries no payload: it must not erase the diagnostic of the
-        # bounce that is the only record of why the address is dead
-        if raw is not None:
-            obj.raw = raw
-        # Suppression is only ever raised here: releasing an address is up to unsuppress_email
-        obj.active = obj.active or reason in HARD_REASONS or obj.bounce_count >= SOFT_BOUNCE_LIMIT
+        _apply_suppression_event(obj, reason, raw)
         obj.save()
 
     reset_suppression_cache(email)
@@ -175,6 +196,160 @@ def suppress_email(email: str, reason: str, raw: dict[str, Any] | None = None) -
     return obj
 
 
+def apply_feedback_batch(batch_size: int = FEEDBACK_BATCH_SIZE) -> int:
+    """Apply the oldest queued SES feedback events to the suppression list.
+
+    Bounces and complaints are applied like suppress_email, and deliveries
+    clear the transient bounces like clear_soft_bounces, but the whole batch
+    creates the missing rows with one bulk insert, locks the involved rows once,
+    writes them back with one bulk update, and drops their cached flags in a
+    single call. The batch is also added to the reputation counter.
+
+    Args:
+        batch_size: Maximum number of events applied
+
+    Returns:
+        Number of events consumed from the queue, 0 when it is empty
+
+    """
+    totals = {"deliveries": 0, "bounces": 0, "complaints": 0}
+    changed: set[str] = set()
+
+    with transaction.atomic():
+        # Events locked by a concurrent batch are left to it
+        events = list(EmailFeedbackEvent.objects.select_for_update(skip_locked=True).order_by("pk")[:batch_size])
+        if not events:
+            return 0
+
+        # Like suppress_email, every address to suppress gets its row before the lock: one
+        # created concurrently is then waited for, locked and merged instead of overwritten
+        reasons = {event.email: event.reason for event in events if event.kind != EmailFeedbackKind.DELIVERY}
+        EmailSuppression.all_objects.bulk_create(
+            [
+                EmailSuppression(email=email, reason=reason, bounce_count=0, active=False)
+                for email, reason in reasons.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+        emails = {event.email for event in events}
+        existing = {
+            obj.email: obj
+            for obj in EmailSuppression.all_objects.select_for_update().filter(email__in=emails).order_by("pk")
+        }
+
+        for event in events:
+            obj = existing.get(event.email)
+            if event.kind == EmailFeedbackKind.DELIVERY:
+                totals["deliveries"] += 1
+                # Only an address tracking transient failures, and not blocked, is reset
+                if obj and not obj.deleted and not obj.active and obj.bounce_count:
+                    obj.bounce_count = 0
+                    changed.add(event.email)
+                continue
+
+            totals["complaints" if event.kind == EmailFeedbackKind.COMPLAINT else "bounces"] += 1
+            _apply_suppression_event(obj, event.reason, event.raw)
+            changed.add(event.email)
+
+        now = timezone.now()
+        updated = [obj for email, obj in existing.items() if email in changed]
+        for obj in updated:
+            obj.updated = now
+            obj.last_event = now
+        EmailSuppression.all_objects.bulk_update(
+            updated,
+            ["reason", "bounce_count", "active", "raw", "deleted", "deleted_by_cascade", "updated", "last_event"],
+        )
+
+        record_email_reputation(totals)
+        EmailFeedbackEvent.objects.filter(pk__in=[event.pk for event in events]).delete()
+
+    cache.delete_many([_cache_key(email) for email in changed])
+    logger.info("Feedback batch applied: %s events, %s addresses changed", len(events), len(changed))
+    return len(events)
+
+
+def record_email_reputation(totals: dict[str, int]) -> None:
+    """Add the deliveries, bounces and complaints of a batch to the counter of the current hour."""
+    if not any(totals.values()):
+        return
+    hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+    EmailReputationCounter.objects.get_or_create(hour=hour)
+    EmailReputationCounter.objects.filter(hour=hour).update(
+        **{field: F(field) + value for field, value in totals.items() if value}
+    )
+
+
+def _reputation_since(hours: int) -> datetime:
+    """Return the first counter hour included in the last hours."""
+    return timezone.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=hours - 1)
+
+
+def get_email_reputation(hours: int = REPUTATION_LOOKBACK_HOURS) -> dict[str, int]:
+    """Return the deliveries, bounces and complaints counted in the last hours."""
+    since = _reputation_since(hours)
+    totals = EmailReputationCounter.objects.filter(hour__gte=since).aggregate(
+        deliveries=Sum("deliveries"), bounces=Sum("bounces"), complaints=Sum("complaints")
+    )
+    return {field: value or 0 for field, value in totals.items()}
+
+
+def get_ses_send_statistics(hours: int = REPUTATION_LOOKBACK_HOURS) -> dict[str, int] | None:
+    """Return the delivery attempts, bounces and complaints reported by SES in the last hours.
+
+    SES counts every message sent by the account, whether or not its notifications
+    reach the SNS endpoint, so it is the reliable denominator of the rates.
+
+    Returns:
+        The aggregated counts, or None when the SES credentials are not configured
+
+    Raises:
+        ClientError: If SES rejects the request
+        BotoCoreError: If SES cannot be reached
+
+    """
+    if not all(
+        [
+            getattr(conf_settings, "AWS_SES_ACCESS_KEY_ID", None),
+            getattr(conf_settings, "AWS_SES_SECRET_ACCESS_KEY", None),
+            getattr(conf_settings, "AWS_SES_REGION_NAME", None),
+        ]
+    ):
+        return None
+
+    client = boto3.client(
+        "ses",
+        aws_access_key_id=conf_settings.AWS_SES_ACCESS_KEY_ID,
+        aws_secret_access_key=conf_settings.AWS_SES_SECRET_ACCESS_KEY,
+        region_name=conf_settings.AWS_SES_REGION_NAME,
+    )
+    data_points = client.get_send_statistics().get("SendDataPoints", [])
+
+    # Aggregate the data points of the window, which SES reports in 15 minute buckets
+    limit = datetime.now(UTC) - timedelta(hours=hours)
+    statistics = {"attempts": 0, "bounces": 0, "complaints": 0}
+    for point in data_points:
+        timestamp = point.get("Timestamp")
+        # A point without a timestamp cannot be placed in the window: SES reports up to
+        # two weeks of data, so counting it would inflate the rate of the window
+        if not timestamp:
+            continue
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        if timestamp < limit:
+            continue
+        statistics["attempts"] += point.get("DeliveryAttempts", 0)
+        statistics["bounces"] += point.get("Bounces", 0)
+        statistics["complaints"] += point.get("Complaints", 0)
+    return statistics
+
+
+def clean_email_reputation() -> None:
+    """Delete the reputation counters older than the lookback window."""
+    EmailReputationCounter.objects.filter(hour__lt=_reputation_since(REPUTATION_LOOKBACK_HOURS)).delete()
+
+
 def unsuppress_email(email: str) -> None:
     """Remove an address from the local suppression list and from the SES one."""
     email = (email or "").strip().lower()
@@ -19,10 +19,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings as conf_settings
 from django.core.cache import cache
@@ -32,9 +31,9 @@ from django.db import connection
 from django.utils import dateparse, timezone
 
 from larpmanager.accounting.balance import check_accounting, check_run_accounting
+from larpmanager.accounting.ledger import rebuild_association_ledger, verify_association_ledger
 from larpmanager.accounting.token_credit import get_regs, get_regs_paying_incomplete
 from larpmanager.cache.basic import get_run_association_id, get_run_event_id
-from larpmanager.cache.config import get_association_config
 from larpmanager.cache.feature import get_association_features, get_event_features
 from larpmanager.cache.registration import get_active_registrations
 from larpmanager.mail.accounting import notify_invoice_check
@@ -48,6 +47,9 @@ from larpmanager.mail.remind import (
     remember_pay,
     remember_profile,
 )
+from larpmanager.mail.schedule import advance_reminder_schedules, get_due_reminders
+from larpmanager.mail.sns import process_email_feedback
+from larpmanager.mail.suppression import clean_email_reputation, get_email_reputation, get_ses_send_statistics
 from larpmanager.models.access import AssociationRole, EventRole, get_association_executives
 from larpmanager.models.accounting import (
     AccountingItemDiscount,
@@ -63,8 +65,8 @@ from larpmanager.models.event import DevelopStatus, Event, Run
 from larpmanager.models.larpmanager import LarpManagerChatLog
 from larpmanager.models.member import Badge, Member, Membership, MembershipStatus, get_user_membership
 from larpmanager.models.miscellanea import Log
-from larpmanager.models.registration import Registration, TicketTier
-from larpmanager.utils.core.common import get_time_diff_today
+from larpmanager.models.registration import Registration, ReminderKind, TicketTier
+from larpmanager.utils.io.export import clean_export_jobs
 from larpmanager.utils.io.pdf import print_run_bkg
 from larpmanager.utils.larpmanager.tasks import my_send_mail, notify_admins
 from larpmanager.utils.publication.base import publish_event_all
@@ -126,6 +128,12 @@ class Command(BaseCommand):
         # Clean up database records and perform initial maintenance
         self.clean_db()
 
+        # Remove expired export artifacts from the media storage
+        clean_export_jobs()
+
+        # Remove the email reputation counters older than the lookback window
+        clean_email_reputation()
+
         # Clean up stale test and inactive associations
         self.clean_associations()
 
@@ -158,13 +166,17 @@ class Command(BaseCommand):
         # Warn admins when SES bounce or complaint rates approach AWS thresholds
         self.check_email_reputation()
 
+        # Runs whose deadline reminder is scheduled for today
+        today = timezone.now().date()
+        deadline_run_ids = set(get_due_reminders(ReminderKind.DEADLINE, today).values_list("run_id", flat=True))
+
         # Process automation tasks for active runs only
         # Skip completed or cancelled runs to avoid unnecessary processing
         for run in Run.objects.exclude(development__in=[DevelopStatus.DONE, DevelopStatus.CANC]):
             event_features = get_event_features(run.event_id)
 
             # Check and process deadline notifications
-            if "deadlines" in event_features:
+            if "deadlines" in event_features and run.id in deadline_run_ids:
                 self.check_deadline(run)
 
             # Update run-specific accounting records
@@ -175,6 +187,9 @@ class Command(BaseCommand):
             if "print_pdf" in event_features:
                 print_run_bkg(run.event.association.slug, run.get_slug())
 
+        # Move the reminders processed today (or skipped by holidays and disabled features) to their next day
+        advance_reminder_schedules(today)
+
     def check_association(self, association: Association) -> None:
         """Run all feature-specific automation checks for a single association."""
         enabled_features = get_association_features(association.id)
@@ -195,6 +210,19 @@ class Command(BaseCommand):
         if "publisher" in enabled_features:
             self.publish_runs(association)
 
+        # Repair the ledger rollup if it drifted from the raw accounting items
+        self.check_ledger(association)
+
+    @staticmethod
+    def check_ledger(association: Association) -> None:
+        """Verify the ledger rollup of an association, rebuilding it on mismatch."""
+        mismatches = verify_association_ledger(association.id)
+        if not mismatches:
+            return
+
+        notify_admins("Ledger rebuilt", f"{association.slug}: {len(mismatches)} rollup rows differed from the raw data")
+        rebuild_association_ledger(association.id)
+
     @staticmethod
     def publish_runs(association: Association) -> None:
         """Trigger publication sync for all visible runs."""
@@ -419,47 +447,33 @@ class Command(BaseCommand):
         """Notify admins when SES bounce or complaint rates get close to the AWS limits.
 
         AWS places an account under review above 5% bounces or 0.1% complaints,
-        so the alert fires well before sending is suspended.
+        so the alert fires well before sending is suspended. Rates are read from
+        the hourly counter of the SNS feedback events, after applying the ones
+        still queued, and from the SES send statistics: these count every message
+        sent even when the Delivery topic is not subscribed, so they are used as the
+        denominator whenever available.
         """
-        if not all(
-            [
-                getattr(conf_settings, "AWS_SES_ACCESS_KEY_ID", None),
-                getattr(conf_settings, "AWS_SES_SECRET_ACCESS_KEY", None),
-                getattr(conf_settings, "AWS_SES_REGION_NAME", None),
-            ]
-        ):
-            return
+        process_email_feedback.task_function()
+
+        # Every attempt ends in a delivery or a bounce, while complaints follow a delivery
+        reputation = get_email_reputation()
+        bounces = reputation["bounces"]
+        complaints = reputation["complaints"]
+        sent = reputation["deliveries"] + bounces
 
         try:
-            client = boto3.client(
-                "ses",
-                aws_access_key_id=conf_settings.AWS_SES_ACCESS_KEY_ID,
-                aws_secret_access_key=conf_settings.AWS_SES_SECRET_ACCESS_KEY,
-                region_name=conf_settings.AWS_SES_REGION_NAME,
-            )
-            data_points = client.get_send_statistics().get("SendDataPoints", [])
+            statistics = get_ses_send_statistics()
         except (ClientError, BotoCoreError) as exc:
             # A misconfiguration fails on every daily run: warn once a week, not every day
             if cache.add("ses_statistics_unavailable", 1, SES_ERROR_ALERT_TIMEOUT):
                 notify_admins("SES statistics unavailable", str(exc))
-            return
+            statistics = None
 
-        # Aggregate the last day of data points, which SES reports in 15 minute buckets
-        limit = datetime.now(UTC) - timedelta(days=1)
-        sent = bounces = complaints = 0
-        for point in data_points:
-            timestamp = point.get("Timestamp")
-            # A point without a timestamp cannot be placed in the window: SES reports up to
-            # two weeks of data, so counting it would inflate a rate advertised as daily
-            if not timestamp:
-                continue
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=UTC)
-            if timestamp < limit:
-                continue
-            sent += point.get("DeliveryAttempts", 0)
-            bounces += point.get("Bounces", 0)
-            complaints += point.get("Complaints", 0)
+        if statistics:
+            # SES reports with a delay while the SNS counters are live: keep the larger of each
+            sent = max(sent, statistics["attempts"])
+            bounces = max(bounces, statistics["bounces"])
+            complaints = max(complaints, statistics["complaints"])
 
         if sent < MIN_REPUTATION_SAMPLE:
             return
@@ -846,9 +860,9 @@ class Command(BaseCommand):
     def check_remind(self, association: Association) -> None:
         """Check and send reminder emails for association registrations.
 
-        This function processes reminders for upcoming event registrations based on
-        association configuration. It respects holiday settings and reminder day
-        preferences while filtering for future events.
+        This function processes reminders for upcoming event registrations whose
+        reminder schedule is due today. It respects holiday settings while
+        filtering for future events.
 
         Args:
             association (Association): Association instance to process reminders for.
@@ -869,11 +883,11 @@ class Command(BaseCommand):
         if not send_reminders_during_holidays and check_holiday():
             return
 
-        # Get the number of days before event to send reminders
-        reminder_days_before_event = int(association.get_config("remind_days"))
-
-        # Get all registrations for this association
-        registrations_queryset = get_regs(association)
+        # Get the registrations of this association whose reminder is due today
+        registrations_queryset = get_regs(association).filter(
+            reminder_schedules__kind=ReminderKind.REGISTRATION,
+            reminder_schedules__due=timezone.now().date(),
+        )
 
         # Calculate reference date (3 days from now) to filter out immediate events
         minimum_start_date = timezone.now() + timedelta(days=3)
@@ -885,9 +899,9 @@ class Command(BaseCommand):
 
         # Process each qualifying registration for reminder emails
         for registration in registrations_queryset.select_related("run", "ticket"):
-            self.remind_reg(registration, association, reminder_days_before_event)
+            self.remind_reg(registration, association)
 
-    def remind_reg(self, registration: Registration, association: Association, remind_days: int) -> None:
+    def remind_reg(self, registration: Registration, association: Association) -> None:
         """Process reminder logic for a specific registration.
 
         Handles various reminder scenarios based on registration status, membership state,
@@ -897,7 +911,6 @@ class Command(BaseCommand):
         Args:
             registration: Registration instance to check reminders for
             association: Association instance containing the registration
-            remind_days: Interval in days for sending reminders
 
         Returns:
             None
@@ -907,11 +920,6 @@ class Command(BaseCommand):
         event_features = get_event_features(get_run_event_id(registration.run_id))
         get_user_membership(registration.member, association.id)
 
-        # Check if today is the scheduled day to send reminder emails
-        # Only send reminders on specific intervals based on registration creation date
-        if get_time_diff_today(registration.created) % remind_days != 1:
-            return
-
         # Process reminders only for non-waiting registrations
         if registration.ticket and registration.ticket.tier != TicketTier.WAITING:
             membership = registration.member.membership
@@ -1026,9 +1034,8 @@ class Command(BaseCommand):
     def check_deadline(run: Run) -> None:
         """Check and send deadline notifications for run.
 
-        This function performs deadline checking for a specific run, considering holidays,
-        run timing constraints, and configured deadline intervals. It will send notifications
-        when appropriate based on the deadline_days configuration.
+        This function is called for runs whose deadline reminder is scheduled for today,
+        and sends the notifications considering holidays and run timing constraints.
 
         Args:
             run: Run instance to check deadlines for. Must have start date and associated event.
@@ -1046,16 +1053,6 @@ class Command(BaseCommand):
         if not run.start or run.start < reference_date.date():
             return
 
-        # Get deadline interval configuration for the association
-        deadline_interval_days = int(get_association_config(run.event.association_id, "deadline_days"))
-        if not deadline_interval_days:
-            return
-
-        # Check if today matches the deadline notification schedule
-        # Only notify when days until run start modulo deadline_days equals 1
-        if get_time_diff_today(run.start) % deadline_interval_days != 1:
-            return
-
         # Send deadline notifications for this run
         notify_deadlines(run)
 
@@ -24,7 +24,9 @@ from typing import Any
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from larpmanager.accounting.ledger import rebuild_association_ledger
 from larpmanager.fixtures.demos import DEMO_BUILDERS
+from larpmanager.mail.schedule import rebuild_association_reminders
 from larpmanager.management.commands.utils import check_virtualenv
 
 
@@ -40,4 +42,8 @@ class Command(BaseCommand):
         for builder in DEMO_BUILDERS:
             with transaction.atomic():
                 demo_type = builder()
+                # Builders backdate accounting items with bulk updates, which skip the ledger signals
+                rebuild_association_ledger(demo_type.template_association_id)
+                # Registrations are backdated the same way, moving their reminder days
+                rebuild_association_reminders(demo_type.template_association_id)
             self.stdout.write(self.style.SUCCESS(f"Demo type ready: {demo_type.slug}"))
@@ -0,0 +1,67 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from larpmanager.accounting.ledger import rebuild_association_ledger, verify_association_ledger
+from larpmanager.management.commands.utils import check_virtualenv
+from larpmanager.models.association import Association
+
+
+class Command(BaseCommand):
+    """Django management command to verify and rebuild the accounting ledger rollup."""
+
+    help = "Verify the daily ledger rollup against the raw accounting items, rebuilding the associations that differ"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--association",
+            nargs="+",
+            help="Slugs of the associations to process (default: all)",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report the differences, without rebuilding",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002
+        """Compare each association rollup with its raw data and rebuild it on mismatch."""
+        check_virtualenv()
+
+        associations = Association.objects.order_by("id")
+        if options.get("association"):
+            associations = associations.filter(slug__in=options["association"])
+
+        for association_id, slug in associations.values_list("id", "slug"):
+            mismatches = verify_association_ledger(association_id)
+            if not mismatches:
+                continue
+
+            self.stdout.write(self.style.WARNING(f"{slug}: {len(mismatches)} ledger rows differ from the raw data"))
+            if options.get("check"):
+                continue
+
+            rows = rebuild_association_ledger(association_id)
+            self.stdout.write(self.style.SUCCESS(f"{slug}: rebuilt {rows} ledger rows"))
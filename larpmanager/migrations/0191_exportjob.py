@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:21
+
+import django.db.models.deletion
+import django.utils.timezone
+import model_clone.mixin
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('larpmanager', '0190_writingoption_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('deleted', models.DateTimeField(db_index=True, editable=False, null=True)),
+                ('deleted_by_cascade', models.BooleanField(default=False, editable=False)),
+                ('uuid', models.CharField(db_index=True, editable=False, max_length=12, unique=True)),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('typ', models.CharField(choices=[('backup', 'Backup'), ('registration_form', 'Registration form'), ('character_form', 'Character form')], max_length=20, verbose_name='Type')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='Parameters')),
+                ('status', models.CharField(choices=[('p', 'Pending'), ('r', 'Running'), ('d', 'Done'), ('f', 'Failed')], default='p', max_length=1, verbose_name='Status')),
+                ('progress', models.PositiveSmallIntegerField(default=0, verbose_name='Progress')),
+                ('fingerprint', models.CharField(blank=True, max_length=64, verbose_name='Fingerprint')),
+                ('artifact', models.CharField(blank=True, max_length=500, verbose_name='Artifact')),
+                ('expires', models.DateTimeField(blank=True, null=True, verbose_name='Expires')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('member', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='export_jobs', to='larpmanager.member')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to='larpmanager.run')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('deleted__isnull', True)), fields=['run', 'typ', 'status'], name='exportjob_run_typ_act'), models.Index(condition=models.Q(('deleted__isnull', True)), fields=['expires'], name='exportjob_expires_act')],
+            },
+            bases=(model_clone.mixin.CloneMixin, models.Model),
+        ),
+    ]
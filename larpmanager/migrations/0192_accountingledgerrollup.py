@@ -0,0 +1,83 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, CharField, Count, F, IntegerField, Sum, Value, When
+from django.db.models.functions import TruncDate
+
+# (model, category, run field, type field, date field) of each accounting item source
+LEDGER_SOURCES = (
+    ("AccountingItemExpense", "exp", "run_id", "exp", "created"),
+    ("AccountingItemOutflow", "out", "run_id", "exp", "payment_date"),
+    ("AccountingItemInflow", "in", "run_id", None, "payment_date"),
+    ("AccountingItemPayment", "pay", "registration__run_id", "pay", "created"),
+    ("AccountingItemTransaction", "trs", "registration__run_id", None, "created"),
+    ("AccountingItemDiscount", "dis", "run_id", None, "created"),
+    ("AccountingItemOther", "oth", "run_id", "oth", "created"),
+    ("AccountingItemMembership", "mem", None, None, "created"),
+    ("AccountingItemDonation", "don", None, None, "created"),
+    ("AccountingItemCollection", "col", None, None, "created"),
+)
+
+
+def populate_ledger(apps, schema_editor):
+    """Build the initial ledger rollup from the existing accounting items."""
+    rollup_model = apps.get_model("larpmanager", "AccountingLedgerRollup")
+    for model_name, category, run_field, type_field, date_field in LEDGER_SOURCES:
+        # historical models use a plain manager: skip soft deleted items by hand
+        items = apps.get_model("larpmanager", model_name).objects.filter(deleted__isnull=True).order_by()
+        if category == "oth":
+            category_expr = Case(When(cancellation=True, then=Value("ref")), default=Value("oth"), output_field=CharField())
+        else:
+            category_expr = Value(category, output_field=CharField())
+        rows = (
+            items.annotate(
+                ledger_run=F(run_field) if run_field else Value(None, output_field=IntegerField()),
+                ledger_day=TruncDate(date_field) if date_field == "created" else F(date_field),
+                ledger_category=category_expr,
+                ledger_kind=F(type_field) if type_field else Value("", output_field=CharField()),
+            )
+            .values("association_id", "ledger_run", "ledger_day", "ledger_category", "ledger_kind")
+            .annotate(total=Sum("value"), num=Count("id"))
+        )
+        rollup_model.objects.bulk_create(
+            [
+                rollup_model(
+                    association_id=row["association_id"],
+                    run_id=row["ledger_run"],
+                    day=row["ledger_day"],
+                    category=row["ledger_category"],
+                    kind=row["ledger_kind"],
+                    total=row["total"],
+                    num=row["num"],
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('larpmanager', '0191_exportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountingLedgerRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(blank=True, null=True)),
+                ('category', models.CharField(choices=[('exp', 'Expenses'), ('out', 'Outflows'), ('in', 'Inflows'), ('pay', 'Payments'), ('trs', 'Transactions'), ('dis', 'Discounts'), ('oth', 'Other'), ('ref', 'Refunds'), ('mem', 'Memberships'), ('don', 'Donations'), ('col', 'Collections')], max_length=3)),
+                ('kind', models.CharField(blank=True, default='', max_length=1)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('num', models.PositiveIntegerField(default=0)),
+                ('association', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ledger_rollups', to='larpmanager.association')),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ledger_rollups', to='larpmanager.run')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['association', 'category', 'day'], name='larpmanager_associa_53d95a_idx')],
+                'constraints': [models.UniqueConstraint(fields=('association', 'run', 'day', 'category', 'kind'), name='unique_ledger_rollup', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunPython(populate_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('larpmanager', '0192_accountingledgerrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailFeedbackEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.CharField(max_length=254)),
+                ('kind', models.CharField(choices=[('b', 'Bounce'), ('c', 'Complaint'), ('d', 'Delivery')], max_length=1)),
+                ('reason', models.CharField(blank=True, choices=[('b', 'Permanent bounce'), ('t', 'Transient bounce'), ('c', 'Complaint'), ('m', 'Manual')], default='', max_length=1)),
+                ('raw', models.JSONField(blank=True, null=True)),
+                ('created', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EmailReputationCounter',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(unique=True)),
+                ('deliveries', models.PositiveIntegerField(default=0)),
+                ('bounces', models.PositiveIntegerField(default=0)),
+                ('complaints', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:18
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+# (kind, association config, default) of each periodic reminder
+REMINDER_CONFIGS = (
+    ("r", "remind_days", 5),
+    ("d", "deadline_days", 0),
+)
+
+
+def _next_day(anchor, interval, today):
+    """Return the first day from today on whose distance from anchor, modulo interval, is 1."""
+    return today + timedelta(days=((anchor - today).days - 1) % interval)
+
+
+def populate_reminders(apps, schema_editor):
+    """Schedule the next reminder of the existing registrations and runs."""
+    schedule_model = apps.get_model("larpmanager", "ReminderSchedule")
+    config_model = apps.get_model("larpmanager", "AssociationConfig")
+    registration_model = apps.get_model("larpmanager", "Registration")
+    run_model = apps.get_model("larpmanager", "Run")
+    today = timezone.now().date()
+
+    for kind, config_name, default in REMINDER_CONFIGS:
+        intervals = {}
+        # historical models use a plain manager: skip soft deleted rows by hand
+        for association_id, value in config_model.objects.filter(name=config_name, deleted__isnull=True).values_list(
+            "association_id", "value"
+        ):
+            try:
+                intervals[association_id] = int(value or 0)
+            except ValueError:
+                intervals[association_id] = 0
+
+        if kind == "r":
+            rows = registration_model.objects.filter(deleted__isnull=True).values_list(
+                "id", "run_id", "run__event__association_id", "created"
+            )
+            anchors = (
+                (registration_id, run_id, association_id, created.date())
+                for registration_id, run_id, association_id, created in rows
+            )
+        else:
+            rows = run_model.objects.filter(deleted__isnull=True, start__isnull=False).values_list(
+                "id", "event__association_id", "start"
+            )
+            anchors = ((None, run_id, association_id, start) for run_id, association_id, start in rows)
+
+        schedules = []
+        for registration_id, run_id, association_id, anchor in anchors:
+            interval = intervals.get(association_id, default)
+            if interval <= 1:
+                continue
+            schedules.append(
+                schedule_model(
+                    run_id=run_id,
+                    registration_id=registration_id,
+                    kind=kind,
+                    due=_next_day(anchor, interval, today),
+                    interval=interval,
+                )
+            )
+        schedule_model.objects.bulk_create(schedules, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('larpmanager', '0193_emailfeedbackevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderSchedule',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('r', 'Registration'), ('d', 'Deadlines')], max_length=1)),
+                ('due', models.DateField()),
+                ('interval', models.PositiveIntegerField()),
+                ('registration', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reminder_schedules', to='larpmanager.registration')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_schedules', to='larpmanager.run')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['due', 'kind'], name='larpmanager_due_6f8ef9_idx')],
+                'constraints': [models.UniqueConstraint(fields=('run', 'registration', 'kind'), name='unique_reminder_schedule', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunPython(populate_reminders, migrations.RunPython.noop),
+    ]
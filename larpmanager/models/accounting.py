@@ -843,3 +843,57 @@ class RecordAccounting(BaseModel):
     global_sum = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name=_("Global balance"))
 
     bank_sum = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name=_("Overall balance"))
+
+
+class LedgerCategory(models.TextChoices):
+    """Choices for the accounting item categories of the ledger rollup."""
+
+    EXPENSE = "exp", _("Expenses")
+    OUTFLOW = "out", _("Outflows")
+    INFLOW = "in", _("Inflows")
+    PAYMENT = "pay", _("Payments")
+    TRANSACTION = "trs", _("Transactions")
+    DISCOUNT = "dis", _("Discounts")
+    OTHER = "oth", _("Other")
+    REFUND = "ref", _("Refunds")
+    MEMBERSHIP = "mem", _("Memberships")
+    DONATION = "don", _("Donations")
+    COLLECTION = "col", _("Collections")
+
+
+class AccountingLedgerRollup(models.Model):
+    """Daily totals of the accounting items, by association, run, category and type.
+
+    Maintained incrementally by the accounting item signals; the rebuild_ledger
+    command verifies and rebuilds it from the raw accounting items.
+    """
+
+    association = models.ForeignKey(Association, on_delete=models.CASCADE, related_name="ledger_rollups")
+
+    run = models.ForeignKey(Run, on_delete=models.CASCADE, related_name="ledger_rollups", null=True, blank=True)
+
+    day = models.DateField(null=True, blank=True)
+
+    category = models.CharField(max_length=3, choices=LedgerCategory.choices)
+
+    kind = models.CharField(max_length=1, blank=True, default="")
+
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    num = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints: ClassVar[list] = [
+            UniqueConstraint(
+                fields=["association", "run", "day", "category", "kind"],
+                name="unique_ledger_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes: ClassVar[list] = [
+            models.Index(fields=["association", "category", "day"]),
+        ]
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.day} {self.get_category_display()} {self.kind} ({self.total})"
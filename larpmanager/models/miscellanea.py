@@ -936,6 +936,52 @@ class EmailSuppression(BaseModel):
         return f"{self.email} ({self.get_reason_display()})"
 
 
+class EmailFeedbackKind(models.TextChoices):
+    """Kinds of SES feedback events about a recipient."""
+
+    BOUNCE = "b", _("Bounce")
+    COMPLAINT = "c", _("Complaint")
+    DELIVERY = "d", _("Delivery")
+
+
+class EmailFeedbackEvent(models.Model):
+    """SES feedback event about a recipient, waiting to be applied to the suppression list.
+
+    The SNS endpoint only queues the events; they are applied in batches by
+    process_email_feedback.
+    """
+
+    email = models.CharField(max_length=254)
+
+    kind = models.CharField(max_length=1, choices=EmailFeedbackKind.choices)
+
+    reason = models.CharField(max_length=1, choices=SuppressionReason.choices, blank=True, default="")
+
+    raw = models.JSONField(blank=True, null=True)
+
+    created = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.email} ({self.get_kind_display()})"
+
+
+class EmailReputationCounter(models.Model):
+    """Hourly count of the SES feedback events, incremented by each applied batch."""
+
+    hour = models.DateTimeField(unique=True)
+
+    deliveries = models.PositiveIntegerField(default=0)
+
+    bounces = models.PositiveIntegerField(default=0)
+
+    complaints = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.hour} ({self.deliveries}/{self.bounces}/{self.complaints})"
+
+
 class OneTimeContent(UuidMixin, BaseModel):
     """Model to store multimedia content for one-time access via tokens.
 
@@ -1240,3 +1286,74 @@ class Milestone(UuidMixin, BaseConceptModel):
 
     class Meta:
         indexes: ClassVar[list] = [models.Index(fields=["event", "deadline"])]
+
+
+class ExportJobType(models.TextChoices):
+    """Kinds of export that run as background jobs."""
+
+    BACKUP = "backup", _("Backup")
+    REGISTRATION_FORM = "registration_form", _("Registration form")
+    CHARACTER_FORM = "character_form", _("Character form")
+
+
+class ExportJobStatus(models.TextChoices):
+    """Lifecycle of an export job."""
+
+    PENDING = "p", _("Pending")
+    RUNNING = "r", _("Running")
+    DONE = "d", _("Done")
+    FAILED = "f", _("Failed")
+
+
+class ExportJob(UuidMixin, BaseModel):
+    """Export generated in the background, with its progress and the downloadable artifact.
+
+    The fingerprint captures the state of the event data when the export started:
+    a later request with the same fingerprint reuses the artifact instead of
+    building it again.
+    """
+
+    run = models.ForeignKey(Run, on_delete=models.CASCADE, related_name="export_jobs")
+
+    member = models.ForeignKey(Member, on_delete=models.SET_NULL, blank=True, null=True, related_name="export_jobs")
+
+    typ = models.CharField(max_length=20, choices=ExportJobType.choices, verbose_name=_("Type"))
+
+    params = models.JSONField(default=dict, blank=True, verbose_name=_("Parameters"))
+
+    status = models.CharField(
+        max_length=1,
+        choices=ExportJobStatus.choices,
+        default=ExportJobStatus.PENDING,
+        verbose_name=_("Status"),
+    )
+
+    progress = models.PositiveSmallIntegerField(default=0, verbose_name=_("Progress"))
+
+    fingerprint = models.CharField(max_length=64, blank=True, verbose_name=_("Fingerprint"))
+
+    artifact = models.CharField(max_length=500, blank=True, verbose_name=_("Artifact"))
+
+    expires = models.DateTimeField(blank=True, null=True, verbose_name=_("Expires"))
+
+    error = models.TextField(blank=True, verbose_name=_("Error"))
+
+    class Meta:
+        indexes: ClassVar[list] = [
+            models.Index(
+                fields=["run", "typ", "status"], condition=Q(deleted__isnull=True), name="exportjob_run_typ_act"
+            ),
+            models.Index(fields=["expires"], condition=Q(deleted__isnull=True), name="exportjob_expires_act"),
+        ]
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.get_typ_display()} - {self.run} ({self.get_status_display()})"
+
+    def is_ready(self) -> bool:
+        """Return whether the artifact is available for download."""
+        if self.status != ExportJobStatus.DONE or not self.artifact:
+            return False
+        if self.expires and self.expires < timezone.now():
+            return False
+        return Path(self.artifact).exists()
@@ -526,3 +526,52 @@ class RegistrationCharacterRel(BaseModel):
         format="JPEG",
         options={"quality": 90},
     )
+
+
+class ReminderKind(models.TextChoices):
+    """Choices for the reminders scheduled by the nightly automation."""
+
+    REGISTRATION = "r", _("Registration")
+    DEADLINE = "d", _("Deadlines")
+
+
+class ReminderSchedule(models.Model):
+    """Next day a periodic reminder is due.
+
+    Registration reminders have one row per registration, deadline reminders one
+    row per run. Rows are kept in sync by the registration, run and association
+    config signals, so the nightly automation only reads the rows due today.
+    """
+
+    run = models.ForeignKey(Run, on_delete=models.CASCADE, related_name="reminder_schedules")
+
+    registration = models.ForeignKey(
+        Registration,
+        on_delete=models.CASCADE,
+        related_name="reminder_schedules",
+        null=True,
+        blank=True,
+    )
+
+    kind = models.CharField(max_length=1, choices=ReminderKind.choices)
+
+    due = models.DateField()
+
+    # Days between two reminders, from the association config at scheduling time
+    interval = models.PositiveIntegerField()
+
+    class Meta:
+        constraints: ClassVar[list] = [
+            UniqueConstraint(
+                fields=["run", "registration", "kind"],
+                name="unique_reminder_schedule",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes: ClassVar[list] = [
+            models.Index(fields=["due", "kind"]),
+        ]
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.get_kind_display()} {self.due} ({self.interval})"
@@ -35,6 +35,7 @@ from larpmanager.accounting.base import (
     handle_collection_pre_save,
 )
 from larpmanager.accounting.gateway.paypal import handle_invalid_paypal_ipn, handle_valid_paypal_ipn
+from larpmanager.accounting.ledger import capture_ledger_buckets, update_ledger_rollup
 from larpmanager.accounting.payment import (
     cleanup_membership_fee_reservation,
     process_collection_status_change,
@@ -54,13 +55,22 @@ from larpmanager.accounting.token_credit import (
     update_token_credit_on_payment_save,
 )
 from larpmanager.accounting.vat import calculate_payment_vat
-from larpmanager.cache.accounting import clear_registration_accounting_cache, refresh_member_accounting_cache
+from larpmanager.cache.accounting import (
+    clear_accounting_reports_cache,
+    clear_event_accounting_snapshots,
+    clear_member_accounting_snapshots,
+    clear_registration_accounting_cache,
+    clear_runs_accounting_snapshots,
+    refresh_member_accounting_cache,
+)
 from larpmanager.cache.association import clear_association_cache
 from larpmanager.cache.association_text import (
     update_association_text_cache_on_save,
 )
 from larpmanager.cache.association_translation import clear_association_translation_cache
 from larpmanager.cache.basic import (
+    get_event_basic_cache,
+    get_run_association_id,
     get_run_basic_cache,
     reset_association_basic_cache,
     reset_event_basic_cache,
@@ -69,6 +79,7 @@ from larpmanager.cache.basic import (
 from larpmanager.cache.bulk import on_bulk_model_changed, on_event_role_deleted, on_event_role_members_changed
 from larpmanager.cache.button import clear_event_button_cache
 from larpmanager.cache.character import (
+    bump_event_cache_generation,
     clear_event_cache_all_runs,
     clear_run_cache_and_media,
     on_character_factions_m2m_changed,
@@ -124,6 +135,7 @@ from larpmanager.cache.larpmanager import (
     clear_larpmanager_texts_cache,
 )
 from larpmanager.cache.links import (
+    clear_association_event_links_cache,
     clear_run_event_links_cache,
     on_registration_post_save_reset_event_links,
     reset_event_links,
@@ -142,6 +154,7 @@ from larpmanager.cache.registration import (
 from larpmanager.cache.rels import (
     clear_event_relationships_cache,
     collect_relationship_tag_characters,
+    get_character_graph_ids,
     mark_plot_character_rel_dirty,
     on_faction_characters_m2m_changed,
     on_plot_characters_m2m_changed,
@@ -159,9 +172,12 @@ from larpmanager.cache.rels import (
     refresh_event_questtype_relationships_background,
     refresh_event_speedlarp_relationships_background,
     remove_item_from_cache_section,
+    update_plot_character_graph,
+    update_relationship_graph,
 )
 from larpmanager.cache.role import remove_association_role_cache, remove_event_role_cache
 from larpmanager.cache.run import (
+    clear_calendar_runs_cache,
     get_event_run_ids,
     on_event_post_save_reset_config_cache,
     on_event_pre_save_invalidate_cache,
@@ -175,7 +191,7 @@ from larpmanager.cache.run import (
 from larpmanager.cache.skin import clear_skin_cache
 from larpmanager.cache.text_fields import update_text_fields_cache
 from larpmanager.cache.warehouse import on_warehouse_item_assignment_changed, on_warehouse_item_tags_m2m_changed
-from larpmanager.cache.widget import reset_widgets
+from larpmanager.cache.widget import WIDGET_DEPENDENCY_TYPES, reset_widgets
 from larpmanager.cache.writing import clear_relationship_tags_cache
 from larpmanager.cache.wwyltd import reset_features_cache, reset_guides_cache, reset_tutorials_cache
 from larpmanager.mail.accounting import (
@@ -207,6 +223,13 @@ from larpmanager.mail.registration import (
     send_registration_deletion_email,
     send_registration_request_rejected_email,
 )
+from larpmanager.mail.schedule import (
+    REMINDER_CONFIGS,
+    rebuild_association_reminders,
+    schedule_registration_reminder,
+    schedule_run_reminder,
+    track_run_reopening,
+)
 from larpmanager.mail.suppression import reset_suppression_cache
 from larpmanager.models.access import AssociationPermission, AssociationRole, EventPermission, EventRole
 from larpmanager.models.accounting import (
@@ -238,8 +261,9 @@ from larpmanager.models.base import (
     debug_set_uuid,
     update_model_search_field,
 )
-from larpmanager.models.casting import AssignmentTrait, Casting, Quest, QuestType, Trait, refresh_all_instance_traits
+from larpmanager.models.casting import AssignmentTrait, Quest, QuestType, Trait, refresh_all_instance_traits
 from larpmanager.models.event import (
+    DevelopStatus,
     Event,
     EventButton,
     EventConfig,
@@ -259,6 +283,7 @@ from larpmanager.models.experience import (
     SystemExp,
 )
 from larpmanager.models.form import (
+    RegistrationChoice,
     RegistrationOption,
     RegistrationQuestion,
     WritingAnswer,
@@ -287,7 +312,6 @@ from larpmanager.models.miscellanea import (
     ChatMessage,
     EmailSuppression,
     HelpQuestion,
-    Log,
     PlayerRelationship,
     WarehouseItem,
     WarehouseItemAssignment,
@@ -295,8 +319,6 @@ from larpmanager.models.miscellanea import (
 from larpmanager.models.registration import (
     Registration,
     RegistrationCharacterRel,
-    RegistrationInstallment,
-    RegistrationQuota,
     RegistrationSection,
     RegistrationTicket,
 )
@@ -371,27 +393,6 @@ log = logging.getLogger(__name__)
 # ruff: noqa: FBT001 (Do not check "Boolean-typed positional argument in function definition", as with created there are too many)
 # ruff: noqa: ARG001 Unused function argument
 
-RESET_WIDGETS_TYPES = (
-    AccountingItem,
-    AbilityExp,
-    Casting,
-    Character,
-    DeliveryExp,
-    Log,
-    Membership,
-    PaymentInvoice,
-    Quest,
-    QuestType,
-    RefundRequest,
-    Registration,
-    RegistrationInstallment,
-    RegistrationQuestion,
-    RegistrationQuota,
-    RegistrationTicket,
-    Trait,
-    WritingQuestion,
-)
-
 
 # Generic signal handlers (no specific sender)
 @receiver(pre_save)
@@ -411,7 +412,11 @@ def pre_save_callback(sender: type, instance: object, *args: Any, **kwargs: Any)
     # Assign media_token for models that has it
     auto_set_media_token(instance)
 
-    if isinstance(instance, RESET_WIDGETS_TYPES):
+    # Remember the ledger bucket of accounting items, in case the save moves them
+    if isinstance(instance, AccountingItem) and not is_clone_active():
+        capture_ledger_buckets(instance)
+
+    if isinstance(instance, WIDGET_DEPENDENCY_TYPES):
         reset_widgets(instance)
 
 
@@ -426,7 +431,7 @@ def post_save_callback(sender: type, instance: object, created: bool, **kwargs:
     # Update cache for accounting items
     reset_accountingitem_cache(instance)
 
-    if isinstance(instance, RESET_WIDGETS_TYPES):
+    if isinstance(instance, WIDGET_DEPENDENCY_TYPES):
         reset_widgets(instance)
 
 
@@ -435,6 +440,17 @@ def reset_accountingitem_cache(instance: Any) -> None:
     if not isinstance(instance, AccountingItem):
         return
 
+    # Keep the daily ledger rollup in sync (clones rebuild it in bulk afterwards)
+    if not is_clone_active():
+        update_ledger_rollup(instance)
+
+    # Drop the aggregated balance reports that include this item
+    clear_accounting_reports_cache(instance)
+
+    # Drop the accounting snapshot of the member
+    if instance.member_id:
+        clear_member_accounting_snapshots(instance.association_id, [instance.member_id])
+
     if hasattr(instance, "run") and instance.run and instance.member_id:
         refresh_member_accounting_cache(instance.run, instance.member_id)
 
@@ -667,6 +683,9 @@ def post_save_association_reset_lm_home(sender: type, instance: object, **kwargs
     # Reset features cache for this association
     on_association_post_save_reset_features_cache(instance)
 
+    # Reset the staff roles and links, as their permissions depend on the features
+    clear_association_event_links_cache(instance.id)
+
     # Add main_mail to newsletter if set
     if instance.main_mail:
         LarpManagerNewsletter.objects.get_or_create(
@@ -680,6 +699,10 @@ def post_save_reset_association_config(sender: type, instance: object, **kwargs:
     """Clear association config cache after save."""
     reset_association_configs(instance.association_id)
 
+    # Reminder schedules store the interval they were computed with
+    if instance.name in REMINDER_CONFIGS.values() and not is_clone_active():
+        rebuild_association_reminders(instance.association_id)
+
 
 @receiver(post_save, sender=AssociationSkin)
 def post_save_association_skin_reset_cache(sender: type, instance: Association, **kwargs: Any) -> None:
@@ -744,8 +767,9 @@ def post_save_character(sender: type, instance: Character, created: bool, **kwar
     refresh_character_relationships_background(instance.id)
 
     # Update relationship caches for all characters that have this character as a target
-    for rel in Relationship.objects.filter(target=instance):
-        refresh_character_relationships_background(rel.source_id)
+    source_ids = get_character_graph_ids(instance, "relationships", inbound=True)
+    if source_ids:
+        refresh_character_relationships_background(source_ids)
 
     # Update all other character-related caches (experience, abilities, etc.)
     refresh_character_related_caches(instance)
@@ -810,6 +834,9 @@ def post_save_collection_activation_email(
     if created:
         send_collection_activation_email(instance)
 
+    # The organizer accounting snapshot lists its collections
+    clear_member_accounting_snapshots(instance.association_id, [instance.organizer_id])
+
 
 @receiver(post_save, sender=DeliveryExp)
 def post_save_delivery_exp(
@@ -875,6 +902,9 @@ def post_save_event_update(sender: type, instance: Event, **kwargs: Any) -> None
         clear_registration_counts_cache(run_id)
         reset_run_basic_cache(run_id)
 
+    # The calendar shows the event in its runs
+    clear_calendar_runs_cache(instance.association_id)
+
     # Reset configuration cache and create default setup
     on_event_post_save_reset_config_cache(instance)
 
@@ -923,6 +953,13 @@ def post_save_reset_event_config(sender: type, instance: Any, **kwargs: Any) ->
     clear_event_features_cache(instance.event_id)
     reset_cache_config_run_ids(get_event_run_ids(instance.event_id))
 
+    # Gallery configs change the rendered pages of the runs
+    for run_id in get_event_run_ids(instance.event_id):
+        bump_event_cache_generation(run_id)
+
+    # The calendar shows the runs with their configs and registration status
+    clear_calendar_runs_cache(get_event_basic_cache(instance.event_id)["association_id"])
+
     # child events inherit the parent configs, so their caches must be reset too
     for child in Event.objects.filter(parent_id=instance.event_id):
         reset_event_configs(child.id)
@@ -1178,6 +1215,14 @@ def pre_save_payment_invoice(sender: type[PaymentInvoice], instance: PaymentInvo
     process_payment_invoice_status_change(instance)
 
 
+@receiver(post_save, sender=PaymentInvoice)
+def post_save_payment_invoice_accounting_snapshot(
+    sender: type[PaymentInvoice], instance: PaymentInvoice, **kwargs: Any
+) -> None:
+    """Drop the member accounting snapshot, which lists the pending payments."""
+    clear_member_accounting_snapshots(instance.association_id, [instance.member_id])
+
+
 @receiver(pre_softdelete, sender=PaymentInvoice)
 def pre_softdelete_payment_invoice_membership_config(
     sender: type[PaymentInvoice], instance: PaymentInvoice, **kwargs: Any
@@ -1225,6 +1270,7 @@ def post_save_plot_character_rel_refs(sender: type, instance: PlotCharacterRel,
     """Recompute auto relationships when a plot-character relation changes."""
     if is_clone_active():
         return
+    update_plot_character_graph(instance)
     if instance.plot_id:
         refresh_event_plot_relationships_background(instance.plot_id)
         mark_plot_character_rel_dirty(instance.plot_id, instance.character_id)
@@ -1328,6 +1374,12 @@ def pre_save_refund_request(sender: type, instance: Any, **kwargs: Any) -> None:
     process_refund_request_status_change(instance)
 
 
+@receiver(post_save, sender=RefundRequest)
+def post_save_refund_request_accounting_snapshot(sender: type, instance: RefundRequest, **kwargs: Any) -> None:
+    """Drop the member accounting snapshot, which lists the open refund requests."""
+    clear_member_accounting_snapshots(instance.association_id, [instance.member_id])
+
+
 @receiver(pre_save, sender=Registration)
 def pre_save_registration_switch_event(sender: type, instance: Registration, **kwargs: Any) -> None:
     """Handle registration updates when switching events."""
@@ -1365,6 +1417,16 @@ def post_save_registration_cache(sender: type, instance: Registration, created:
     if is_clone_active():
         return
 
+    # Keep the nightly reminder schedule in sync
+    schedule_registration_reminder(instance, created=created)
+
+    # Drop the member accounting snapshot (registrations of completed runs are kept apart)
+    clear_member_accounting_snapshots(
+        get_run_association_id(instance.run_id),
+        [instance.member_id],
+        history=instance.run.development == DevelopStatus.DONE,
+    )
+
     # Signup requests awaiting approval have no ticket/characters yet: skip
     if instance.pending:
         return
@@ -1390,8 +1452,12 @@ def post_save_registration_cache(sender: type, instance: Registration, created:
     if instance.member_id:
         invalidate_user_nav_entries(instance.member_id)
 
-    # Update registration count caches for this run
+    # Update registration count caches for this run, and the calendar status computed from them
     clear_registration_counts_cache(instance.run_id)
+    clear_calendar_runs_cache(get_run_association_id(instance.run_id))
+
+    # The gallery lists the registrants, so its rendered pages must be invalidated
+    bump_event_cache_generation(instance.run_id)
 
     # Sync published data on this registration (soft deletes are handled by post_softdelete, which knows the run)
     if not instance.deleted:
@@ -1447,6 +1513,16 @@ def post_save_registration_character_rel_savereg(
     publish_registration(instance.registration_id)
 
 
+@receiver(post_save, sender=RegistrationChoice)
+def post_save_registration_choice(sender: type, instance: RegistrationChoice, **kwargs: Any) -> None:
+    """Drop the member accounting snapshot, which shows the selected options."""
+    if is_clone_active():
+        return
+
+    registration = instance.registration
+    clear_member_accounting_snapshots(get_run_association_id(registration.run_id), [registration.member_id])
+
+
 @receiver(post_save, sender=RegistrationSection)
 def post_save_registration_section(sender: type, instance: RegistrationSection, **kwargs: dict) -> None:
     """Process registration section post-save signal."""
@@ -1457,6 +1533,7 @@ def post_save_registration_section(sender: type, instance: RegistrationSection,
 def post_save_registration_question(sender: type, instance: RegistrationQuestion, **kwargs: dict) -> None:
     """Process registration question post-save signal."""
     clear_registration_questions_cache(instance.event_id)
+    clear_event_accounting_snapshots(get_event_basic_cache(instance.event_id)["association_id"], instance.event_id)
 
 
 @receiver(post_save, sender=RegistrationOption)
@@ -1466,7 +1543,9 @@ def post_save_registration_option(sender: type, instance: RegistrationOption, **
         return
 
     process_registration_option_post_save(instance)
-    clear_registration_questions_cache(instance.question.event_id)
+    event_id = instance.question.event_id
+    clear_registration_questions_cache(event_id)
+    clear_event_accounting_snapshots(get_event_basic_cache(event_id)["association_id"], event_id)
 
 
 @receiver(post_save, sender=RegistrationTicket)
@@ -1483,6 +1562,7 @@ def post_save_ticket_accounting_cache(
     log_registration_ticket_saved(instance)
     reset_registration_ticket(instance)
     clear_registration_tickets_cache(instance.event_id)
+    clear_event_accounting_snapshots(get_event_basic_cache(instance.event_id)["association_id"], instance.event_id)
 
 
 @receiver(pre_save, sender=Relationship)
@@ -1499,6 +1579,7 @@ def post_save_relationship_reset_rels(sender: type, instance: Any, **kwargs: Any
     if is_clone_active():
         return
 
+    update_relationship_graph(instance)
     refresh_character_relationships(instance.source)
     delete_character_pdf_files(instance.source)
 
@@ -1541,6 +1622,8 @@ def pre_save_run(sender: type, instance: Any, **kwargs: Any) -> None:
     if is_clone_active():
         return
     on_run_pre_save_invalidate_cache(instance)
+    # A reopened run gets back the registration reminders dropped when it was closed
+    track_run_reopening(instance)
 
 
 @receiver(post_save, sender=Run)
@@ -1566,6 +1649,13 @@ def post_save_run_links(sender: type, instance: Run, **kwargs: Any) -> None:
 
     # Clear registration-related caches for this run
     clear_registration_counts_cache(instance.id)
+    clear_calendar_runs_cache(get_run_association_id(instance.id))
+
+    # Deadline reminders are counted from the run start
+    schedule_run_reminder(instance)
+
+    # Accounting snapshots show the run, and keep apart the registrations of completed runs
+    clear_runs_accounting_snapshots(get_run_association_id(instance.id), [instance.id])
 
     # Reset configuration cache when run changes
     on_run_post_save_reset_config_cache(instance)
@@ -1590,6 +1680,7 @@ def post_save_reset_run_config(sender: type, instance: Any, **kwargs: Any) -> No
     """Reset run config cache when related instance is saved."""
     reset_run_configs(instance.run_id)
     reset_cache_config_run(instance.run)
+    clear_calendar_runs_cache(get_run_association_id(instance.run_id))
 
 
 @receiver(pre_save, sender=SpeedLarp)
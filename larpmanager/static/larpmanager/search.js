@@ -84,6 +84,12 @@ var options = window['options'];
 // Custom searchable fields (question_id -> [option_ids])
 var searchable = window['searchable'];
 
+// URL of the character search index served by the backend
+var search_index_url = window['search_index_url'];
+
+// Character search index (number -> {text, words}), null until loaded
+var search_index = null;
+
 // ============================================================================
 // FILTER BUILDING AND MANAGEMENT
 // ============================================================================
@@ -349,6 +355,53 @@ function uniform(s) {
     return s.toString().toLowerCase().trim();
 }
 
+/**
+ * Normalizes text like the search index (lowercase, no accents, single spaces)
+ * @param {*} s - Text to normalize
+ * @returns {string} Normalized text
+ */
+function normalize_search(s) {
+    return uniform(s).normalize('NFKD').replace(/[\u0300-\u036f]/g, '').replace(/\s+/g, ' ');
+}
+
+/**
+ * Checks if two words differ by at most one inserted, removed or replaced letter
+ * @param {string} a - First word
+ * @param {string} b - Second word
+ * @returns {boolean} True if the words are at most one edit apart
+ */
+function within_one_edit(a, b) {
+    if (Math.abs(a.length - b.length) > 1) return false;
+    var i = 0, j = 0, edits = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) { i++; j++; continue; }
+        if (++edits > 1) return false;
+        if (a.length > b.length) i++;
+        else if (a.length < b.length) j++;
+        else { i++; j++; }
+    }
+    return edits + (a.length - i) + (b.length - j) <= 1;
+}
+
+/**
+ * Checks if every search token is found in the indexed character text
+ * Tokens match as substrings (so also as prefixes), or fuzzily against a word
+ * or a word prefix one edit away, when they are long enough to avoid noise
+ *
+ * @param {Array} tokens - Normalized search tokens
+ * @param {Object} entry - Search index entry of the character
+ * @returns {boolean} True if all tokens match
+ */
+function found_index(tokens, entry) {
+    for (const token of tokens) {
+        if (entry['text'].includes(token)) continue;
+        if (token.length < 4) return false;
+        if (!entry['words'].some(word => within_one_edit(token, word.substring(0, token.length)) || within_one_edit(token, word))) return false;
+    }
+
+    return true;
+}
+
 /**
  * Escapes HTML to prevent XSS attacks
  * @param {string} text - Text to escape
@@ -392,12 +445,18 @@ function search(key) {
 
     if (!show_char) return;  // Exit if character display is disabled
 
+    // Split the search text into the tokens matched against the search index
+    var tokens = normalize_search(key).split(' ').filter(token => token.length > 0);
+
     // Filter all characters by search text and active filters
     var res = [];
     for (const [num, el] of Object.entries(all)) {
         if ("hide" in el && el.hide === true) continue;  // Skip hidden characters
+        // Match the text on the search index once loaded, scanning the character data otherwise
+        var entry = search_index ? search_index[num] : undefined;
+        var match = entry ? found_index(tokens, entry) : found(key, el);
         // Check all filter conditions
-        if (found(key, el) && in_faction(el) && in_spec(el) && in_fields(el) && in_custom_fields(el)) res.push(el);
+        if (match && in_faction(el) && in_spec(el) && in_fields(el) && in_custom_fields(el)) res.push(el);
     }
 
     if (res.length > 0) {
@@ -615,8 +674,22 @@ $(document).ready(function(){
     // Perform initial search (empty = show all)
     search('');
 
-    // Attach input handler to search box
-    $('#search').on('input', function() { search($(this).val()); });
+    // Attach input handler to search box, searching once the typing pauses
+    var search_timeout = null;
+    $('#search').on('input', function() {
+        var key = $(this).val();
+        clearTimeout(search_timeout);
+        search_timeout = setTimeout(function() { search(key); }, 100);
+    });
+
+    // Load the search index, revalidated by the browser through its ETag
+    if (show_char && search_index_url) {
+        $.getJSON(search_index_url, function(data) {
+            search_index = data['index'];
+            // A key typed while the index was loading found nothing: run it again
+            search($('#search').val());
+        });
+    }
 });
 
 // ============================================================================
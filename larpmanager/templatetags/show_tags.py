@@ -28,7 +28,9 @@ from typing import TYPE_CHECKING, Any
 
 from allauth.utils import get_request_param
 from django import template
+from django.conf import settings as conf_settings
 from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.core.cache import cache
 from django.db.models import Max
 from django.templatetags.static import static
 from django.urls import reverse
@@ -37,6 +39,7 @@ from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
 from larpmanager.accounting.base import _format_decimal
+from larpmanager.cache.character import get_event_cache_fragment_key
 from larpmanager.models.association import get_url
 from larpmanager.models.casting import Trait
 from larpmanager.models.utils import get_option_form_text
@@ -49,6 +52,8 @@ from larpmanager.utils.services.association import get_hint_for_slug
 _VERSION_BODY_CLASS_START = min(v["number"] for v in VERSIONS)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from django.forms import BoundField, Form
 
     from larpmanager.models.event import Run
@@ -170,6 +175,67 @@ def tooltip_factions(character: dict[str, Any], context: dict, tooltip: str) ->
     return tooltip
 
 
+# References to characters (or traits) in texts: #XX creates relationships,
+# @XX counts as character in faction/plot, ^XX is a simple reference
+_REFERENCE_PATTERN = re.compile(r"([#@^])(\d+)")
+
+
+def _replace_references(text: str, max_number: int, resolve: Callable[[str, int], str | None]) -> str:
+    """Replace all the references in the text with a single scan.
+
+    Each reference is resolved on the longest leading part of its digits that is
+    defined, keeping the remaining digits as text: with only character 1 defined,
+    "#12" becomes the reference to 1 followed by "2". This matches replacing each
+    number in descending order, without scanning the text once per number.
+
+    Args:
+        text: Text containing the references
+        max_number: Highest number that can be referenced
+        resolve: Returns the replacement for a prefix and a number, None if not defined
+
+    Returns:
+        The text with the references replaced
+
+    """
+
+    def replace(match: re.Match) -> str:
+        prefix, digits = match.groups()
+        # Numbers are never written with leading zeros
+        if digits[0] != "0":
+            for length in range(len(digits), 0, -1):
+                number = int(digits[:length])
+                if number > max_number:
+                    continue
+                replacement = resolve(prefix, number)
+                if replacement is not None:
+                    return replacement + digits[length:]
+        return match.group(0)
+
+    return _REFERENCE_PATTERN.sub(replace, text)
+
+
+def _get_references(context: dict, name: str) -> dict:
+    """Return the references resolved so far while rendering the context.
+
+    The resolved references are kept as long as the context holds the same
+    characters, so that every text of a page shares them.
+
+    Args:
+        context: Template context
+        name: Name of the lookup table
+
+    Returns:
+        The lookup table, from key to replacement
+
+    """
+    chars = context.get("chars")
+    lookup = context.get(name)
+    if lookup is None or lookup["chars"] is not chars:
+        lookup = {"chars": chars, "references": {}}
+        context[name] = lookup
+    return lookup["references"]
+
+
 @register.simple_tag(takes_context=True)
 def replace_chars(context: dict, text: str, limit: int = 200) -> str:
     """Template tag to replace character number references with names.
@@ -185,83 +251,80 @@ def replace_chars(context: dict, text: str, limit: int = 200) -> str:
         str: Text with character references replaced by names
 
     """
-    text = html_clean(text)
-    for character_number in range(context["max_ch_number"], 0, -1):
-        if character_number not in context["chars"]:
-            continue
+    chars = context["chars"]
+
+    def resolve(prefix: str, character_number: int) -> str | None:
+        if character_number not in chars:
+            return None
         # Escape character name to prevent XSS when used in HTML contexts
-        character_name = escape(context["chars"][character_number]["name"])
-        text = text.replace(f"#{character_number}", character_name)
-        text = text.replace(f"@{character_number}", character_name)
+        character_name = escape(chars[character_number]["name"])
+        if prefix != "^":
+            return character_name
 
         first_name_parts = character_name.split()
-        if first_name_parts:
-            first_name = first_name_parts[0]
-            text = text.replace(f"^{character_number}", first_name)
+        return first_name_parts[0] if first_name_parts else None
+
+    text = _replace_references(html_clean(text), context["max_ch_number"], resolve)
     return text[:limit]
 
 
 def go_character(
     context: dict,
-    search_pattern: str,
     character_number: int,
-    text: str,
     run: Run,
     *,
     include_tooltip: bool,
     simple: bool = False,
-) -> str:
-    """Replace character reference with formatted link or name.
+) -> str | None:
+    """Build the replacement of a character reference, as formatted link or name.
 
-    Processes text containing character references (like '#1', '@1', '^1') and replaces
-    them with either formatted HTML links or simple bold names, depending on the simple
-    parameter. Optionally includes tooltips for character information.
+    Builds either a formatted HTML link or a simple bold name, depending on the
+    simple parameter. Optionally includes tooltips for character information.
+    Replacements are kept in the context, so that each one is built once per page.
 
     Args:
         context: Template context dictionary containing character data under 'chars' key.
-        search_pattern: Pattern to search for in the text (e.g., '#1', '@1', '^1').
         character_number: Character number/ID to look up in the context chars dictionary.
-        text: Input text that may contain the search pattern to be replaced.
         run: Run instance used for generating character URLs via get_slug() method.
         include_tooltip: If True, includes hover tooltip with character information.
         simple: If True, returns character name in bold; if False, returns clickable link.
 
     Returns:
-        The input text with character references replaced by formatted HTML, or
-        unchanged text if search pattern not found or character data unavailable.
+        The formatted HTML of the reference, or None if character data unavailable.
 
     Example:
-        >>> go_character(context, '#1', 1, 'See character #1', run_obj, True, False)
-        'See character <a class="link_show_char" href="/run/char/1">John Doe</a>'
+        >>> go_character(context, 1, run_obj, include_tooltip=False)
+        '<a class="link_show_char" href="/run/char/1">John Doe</a>'
 
     """
     # Check if character data exists in context
     if "chars" not in context:
-        return text
+        return None
 
     # Verify specific character number exists
     if character_number not in context["chars"]:
-        return text
+        return None
 
-    # Early return if search pattern not in text
-    if search_pattern not in text:
-        return text
+    references = _get_references(context, "character_references")
+    reference_key = (run.id, character_number, bool(include_tooltip), simple)
+    if reference_key in references:
+        return references[reference_key]
 
     # Get character data from context
     character_data = context["chars"][character_number]
 
-    # Generate character URL using run slug and character uuid
-    character_url = get_url(
-        reverse("character", args=[run.get_slug(), character_data["uuid"]]),
-        context["association_slug"],
-    ).replace('"', "")
-
     # Create either simple bold name or full link based on simple flag
     if simple:
         name_parts = character_data["name"].split()
         first_name = name_parts[0] if name_parts else ""
         formatted_link = f"<b>{escape(first_name)}</b>"
     else:
+        # Generate character URL using run slug and character uuid
+        character_url = get_url(
+            reverse("character", args=[run.get_slug(), character_data["uuid"]]),
+            context["association_slug"],
+        ).replace('"', "")
+
         formatted_link = (
             f"<a class='link_show_char' href='{escape(character_url)}'>{escape(character_data['name'])}</a>"
         )
@@ -275,8 +338,8 @@ def go_character(
                 + f"</span><span class='hide show_char'>{tooltip_content}</span>"
             )
 
-    # Replace search pattern with generated link/name
-    return text.replace(search_pattern, formatted_link)
+    references[reference_key] = formatted_link
+    return formatted_link
 
 
 def _remove_unimportant_prefix(text: str) -> str:
@@ -340,7 +403,8 @@ def show_char(context: dict, element: dict | str | None, run: Run, include_toolt
 
     This function processes text content and converts character references (prefixed with
     #, @, or ^) into clickable links. It also handles character tooltips and removes
-    unimportant tags from the processed text.
+    unimportant tags from the processed text. The rendered text is cached when the
+    context holds the complete event data, until the text or the event data change.
 
     Args:
         context: Template context dictionary containing rendering state
@@ -353,13 +417,23 @@ def show_char(context: dict, element: dict | str | None, run: Run, include_toolt
         tags removed
 
     """
-    # Extract text content from various input types and sanitize to prevent XSS
+    # Extract text content from various input types
     if isinstance(element, dict) and "text" in element:
-        text = _sanitize_html(element["text"]) + " "
+        source = element["text"]
     elif element is not None:
-        text = _sanitize_html(str(element)) + " "
+        source = str(element)
     else:
-        text = ""
+        return format_html("{}", "")
+
+    # Serve the text already rendered with the current event data
+    fragment_key = get_event_cache_fragment_key(context, run, str(source), include_tooltip=include_tooltip)
+    if fragment_key:
+        text = cache.get(fragment_key)
+        if text is not None:
+            return format_html("{}", mark_safe(text))  # noqa: S308
+
+    # Sanitize to prevent XSS
+    text = _sanitize_html(source) + " "
 
     # Cache the maximum character number for this run's event to avoid repeated queries
     if "max_ch_number" not in context:
@@ -369,75 +443,73 @@ def show_char(context: dict, element: dict | str | None, run: Run, include_toolt
     if not context["max_ch_number"]:
         context["max_ch_number"] = 0
 
-    # Process character references in descending order to avoid partial matches
+    # Process all character references in a single pass
     # #XX creates relationships, @XX counts as character in faction/plot, ^XX is simple reference
-    for character_number in range(context["max_ch_number"], 0, -1):
-        text = go_character(
-            context, f"#{character_number}", character_number, text, run, include_tooltip=include_tooltip
-        )
-        text = go_character(
-            context, f"@{character_number}", character_number, text, run, include_tooltip=include_tooltip
-        )
-        text = go_character(
-            context, f"^{character_number}", character_number, text, run, include_tooltip=include_tooltip, simple=True
-        )
+    text = _replace_references(
+        text,
+        context["max_ch_number"],
+        lambda prefix, character_number: go_character(
+            context, character_number, run, include_tooltip=include_tooltip, simple=prefix == "^"
+        ),
+    )
 
     # Clean up unimportant tags by removing $unimportant prefix and empty tags
     text = _remove_unimportant_prefix(text)
 
+    if fragment_key:
+        cache.set(fragment_key, text, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+
     # Text is already HTML-safe from character link processing, so we can mark it as such
     return format_html("{}", mark_safe(text))  # noqa: S308
 
 
 def go_trait(
     context: dict,
-    search: str,
     trait_number: int,
-    text: str,
     run: Run,
     *,
     include_tooltip: bool,
     simple: bool = False,
-) -> str:
-    """Replace trait reference with character link.
+) -> str | None:
+    """Build the replacement of a trait reference, as character link or name.
 
-    Searches for a pattern in text and replaces it with either a character name
-    or a clickable link to the character page, depending on the simple flag.
+    Builds either the character name or a clickable link to the character page,
+    depending on the simple flag. Replacements are kept in the context, so that
+    each one is built once per page.
 
     Args:
         context: Template context dictionary containing trait and character data
-        search: Pattern string to search for in the text
         trait_number: Trait number identifier to look up the associated character
-        text: Input text containing the search pattern to be replaced
         run: Run instance used for character lookup operations
         include_tooltip: Whether to include hover tooltip in the generated link
         simple: If True, returns bold character name; if False, returns full HTML link
 
     Returns:
-        Modified text string with trait reference replaced by character link or name,
-        or original text if pattern not found or character data unavailable
+        The formatted HTML of the reference, or None if character data unavailable
 
     """
-    # Early return if search pattern not found in text
-    if search not in text:
-        return text
-
     # Initialize traits cache if not present in context
     if "traits" not in context:
         context["traits"] = {}
 
+    references = _get_references(context, "trait_references")
+    reference_key = (run.id, trait_number, bool(include_tooltip), simple)
+    if reference_key in references:
+        return references[reference_key]
+
     # Get character number from cached traits or fetch from database
+    character_number = None
     if trait_number in context["traits"]:
         character_number = context["traits"][trait_number]["char"]
     else:
         character = get_trait_character(run, trait_number)
-        if not character:
-            return text
-        character_number = character.number
+        if character:
+            character_number = character.number
 
     # Verify character exists in context data
-    if character_number not in context["chars"]:
-        return text
+    if character_number is None or character_number not in context["chars"]:
+        references[reference_key] = None
+        return None
 
     # Get character data from context
     character_data = context["chars"][character_number]
@@ -466,8 +538,8 @@ def go_trait(
             f"<span class='hide show_char'>{tooltip}</span>"
         )
 
-    # Replace search pattern with generated link/name
-    return text.replace(search, link)
+    references[reference_key] = link
+    return link
 
 
 @register.simple_tag(takes_context=True)
@@ -493,12 +565,14 @@ def show_trait(context: dict, text: str, run: Run, include_tooltip: bool) -> str
     if not context["max_trait"]:
         context["max_trait"] = 0
 
-    for trait_number in range(context["max_trait"], 0, -1):
-        text = go_trait(context, f"#{trait_number}", trait_number, text, run, include_tooltip=include_tooltip)
-        text = go_trait(context, f"@{trait_number}", trait_number, text, run, include_tooltip=include_tooltip)
-        text = go_trait(
-            context, f"^{trait_number}", trait_number, text, run, include_tooltip=include_tooltip, simple=True
-        )
+    # Process all trait references in a single pass
+    text = _replace_references(
+        text,
+        context["max_trait"],
+        lambda prefix, trait_number: go_trait(
+            context, trait_number, run, include_tooltip=include_tooltip, simple=prefix == "^"
+        ),
+    )
 
     # Text is already HTML-safe from trait link processing, so we can mark it as such
     return format_html("{}", mark_safe(text))  # noqa: S308
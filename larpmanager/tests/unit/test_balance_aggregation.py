@@ -0,0 +1,193 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the database-side aggregation and caching of balance reports"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from larpmanager.accounting.balance import (
+    association_accounting_data,
+    get_association_accounting_sums,
+    get_run_accounting,
+    get_run_accounting_figures,
+)
+from larpmanager.cache.accounting import (
+    get_association_accounting_report_cache_key,
+    get_run_accounting_report_cache_key,
+)
+from larpmanager.models.accounting import (
+    AccountingItemDonation,
+    AccountingItemInflow,
+    AccountingItemOther,
+    AccountingItemOutflow,
+    AccountingItemPayment,
+    ExpenseChoices,
+    OtherChoices,
+    PaymentChoices,
+)
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestRunAccountingFigures(BaseTestCase):
+    """Test the aggregated and cached run accounting figures"""
+
+    def test_figures_group_by_type(self) -> None:
+        """Payments and other items are summed and counted per type"""
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+        registration = self.create_registration(member=member, run=run)
+
+        for pay, value in (
+            (PaymentChoices.MONEY, "100.00"),
+            (PaymentChoices.MONEY, "20.00"),
+            (PaymentChoices.TOKEN, "5.00"),
+        ):
+            AccountingItemPayment.objects.create(
+                member=member, association=association, registration=registration, pay=pay, value=Decimal(value)
+            )
+        for oth, cancellation, value in (
+            (OtherChoices.TOKEN, False, "7.00"),
+            (OtherChoices.CREDIT, False, "3.00"),
+            (OtherChoices.REFUND, True, "10.00"),
+        ):
+            AccountingItemOther.objects.create(
+                member=member,
+                association=association,
+                run=run,
+                oth=oth,
+                cancellation=cancellation,
+                value=Decimal(value),
+            )
+
+        figures = get_run_accounting_figures(run)
+
+        self.assertEqual(figures["pay"]["tot"], Decimal("125.00"))
+        self.assertEqual(figures["pay"]["num"], 3)
+        self.assertEqual(figures["pay"]["detail"][PaymentChoices.MONEY], {"tot": Decimal("120.00"), "num": 2})
+        self.assertEqual(figures["tok"]["tot"], Decimal("7.00"))
+        self.assertEqual(figures["cre"]["tot"], Decimal("3.00"))
+        self.assertEqual(figures["ref"]["tot"], Decimal("10.00"))
+        self.assertEqual(figures["exp"], {"tot": 0, "num": 0, "detail": {}})
+        self.assertEqual(figures["registration"]["num"], 1)
+        # Registrations without a ticket fall under the empty tier
+        self.assertIn("", figures["registration"]["detail"])
+
+    def test_figures_are_cached(self) -> None:
+        """A second request reads the figures from the cache without queries"""
+        run = self.get_run()
+
+        get_run_accounting_figures(run)
+        self.assertIsNotNone(cache.get(get_run_accounting_report_cache_key(run.id)))
+
+        with self.assertNumQueries(0):
+            get_run_accounting_figures(run)
+
+    @patch("larpmanager.accounting.balance.get_event_features")
+    def test_payment_save_invalidates_report(self, mock_features: Any) -> None:
+        """Saving a payment refreshes the cached run report"""
+        mock_features.return_value = {"payment": True}
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+        registration = self.create_registration(member=member, run=run)
+
+        _summary, details = get_run_accounting(run, {})
+        self.assertEqual(details["pay"]["tot"], 0)
+
+        payment = AccountingItemPayment.objects.create(
+            member=member,
+            association=association,
+            registration=registration,
+            pay=PaymentChoices.MONEY,
+            value=Decimal("80.00"),
+        )
+        _summary, details = get_run_accounting(run, {})
+        self.assertEqual(details["pay"]["tot"], Decimal("80.00"))
+        self.assertEqual(details["pay"]["detail"][PaymentChoices.MONEY]["name"], PaymentChoices.MONEY.label)
+
+        # Soft deleting the payment also invalidates the report
+        payment.delete()
+        _summary, details = get_run_accounting(run, {})
+        self.assertEqual(details["pay"]["tot"], 0)
+
+
+class TestAssociationAccountingSums(BaseTestCase):
+    """Test the aggregated and cached association accounting sums"""
+
+    def test_sums_match_items(self) -> None:
+        """Each sum covers only the matching items of the requested year"""
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+
+        AccountingItemOutflow.objects.create(
+            association=association,
+            value=Decimal("40.00"),
+            exp=ExpenseChoices.LOCAT,
+            descr="Rent",
+            payment_date=date(2024, 3, 1),
+        )
+        AccountingItemOutflow.objects.create(
+            association=association,
+            run=run,
+            value=Decimal("15.00"),
+            exp=ExpenseChoices.LOCAT,
+            descr="Venue",
+            payment_date=date(2024, 4, 1),
+        )
+        AccountingItemInflow.objects.create(
+            association=association, value=Decimal("25.00"), descr="Sponsor", payment_date=date(2023, 5, 1)
+        )
+        AccountingItemDonation.objects.create(
+            member=member, association=association, value=Decimal("12.00"), descr="Gift"
+        )
+
+        sums = get_association_accounting_sums(association.id, 2024)
+        self.assertEqual(sums["outflow_exec_sum"], Decimal("40.00"))
+        self.assertEqual(sums["outflow_sum"], Decimal("55.00"))
+        self.assertEqual(sums["inflow_sum"], 0)
+
+        context = {"association_id": association.id}
+        association_accounting_data(context)
+        self.assertEqual(context["inflow_exec_sum"], Decimal("25.00"))
+        self.assertEqual(context["donations_sum"], Decimal("12.00"))
+        self.assertEqual(context["in_sum"], Decimal("37.00"))
+        self.assertEqual(context["out_sum"], Decimal("55.00"))
+
+    def test_sums_use_single_query_and_cache(self) -> None:
+        """All sums come from one query, then from the cache until an item is saved"""
+        association = self.get_association()
+
+        with self.assertNumQueries(1):
+            get_association_accounting_sums(association.id, 2024)
+        with self.assertNumQueries(0):
+            get_association_accounting_sums(association.id, 2024)
+
+        AccountingItemInflow.objects.create(
+            association=association, value=Decimal("9.00"), descr="Sponsor", payment_date=date(2024, 6, 1)
+        )
+        self.assertIsNone(cache.get(get_association_accounting_report_cache_key(association.id)))
+        self.assertEqual(get_association_accounting_sums(association.id, 2024)["inflow_sum"], Decimal("9.00"))
@@ -0,0 +1,94 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the bulk config access API"""
+
+from django.core.cache import cache
+
+from larpmanager.cache.config import (
+    get_element_config,
+    get_event_configs,
+    get_many_configs,
+    get_many_element_configs,
+    save_single_config,
+    with_configs,
+)
+from larpmanager.models.event import Event, EventConfig, Run
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestBulkConfigs(BaseTestCase):
+    """Test reading many configs of many elements in one round trip"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.first = self.create_event(slug="first")
+        self.second = self.create_event(slug="second")
+        save_single_config(self.first, "payment_alert", "10")
+        save_single_config(self.first, "pub_country", "IT")
+        save_single_config(self.second, "payment_alert", "20")
+
+    def test_many_element_configs_single_query(self) -> None:
+        """Configs of many elements are loaded with one query and then served from cache"""
+        with self.assertNumQueries(1):
+            configs = get_many_element_configs([self.first.id, self.second.id], "event")
+        self.assertEqual(configs[self.first.id], {"payment_alert": "10", "pub_country": "IT"})
+        self.assertEqual(configs[self.second.id], {"payment_alert": "20"})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_many_element_configs([self.first.id, self.second.id], "event"), configs)
+
+    def test_many_configs_apply_defaults(self) -> None:
+        """Values are evaluated with the centralized defaults"""
+        configs = get_many_configs([self.first.id, self.second.id], "event", ["payment_alert", "pub_country"])
+        self.assertEqual(configs[self.first.id], {"payment_alert": "10", "pub_country": "IT"})
+        self.assertEqual(configs[self.second.id], {"payment_alert": "20", "pub_country": ""})
+
+    def test_context_memo(self) -> None:
+        """Configs loaded in the context are not read again"""
+        context = {}
+        get_many_configs([self.first.id], "event", ["payment_alert"], context=context)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_event_configs(self.first.id, ["payment_alert"], context=context)["payment_alert"], "10"
+            )
+
+    def test_bypass_cache_reads_database(self) -> None:
+        """Bypassing the cache sees values changed behind it"""
+        get_many_element_configs([self.first.id], "event")
+        EventConfig.objects.filter(event=self.first, name="payment_alert").update(value="15")
+        configs = get_event_configs(self.first.id, ["payment_alert", "pub_country"], bypass_cache=True)
+        self.assertEqual(configs, {"payment_alert": "15", "pub_country": "IT"})
+
+    def test_event_configs_use_campaign_parent(self) -> None:
+        """Event configs come from the campaign parent, except the ones owned by the child"""
+        child = self.create_event(slug="child", parent=self.first)
+        save_single_config(child, "pub_country", "FR")
+        configs = get_event_configs(child.id, ["payment_alert", "pub_country"])
+        self.assertEqual(configs, {"payment_alert": "10", "pub_country": "FR"})
+
+    def test_prefetched_configs(self) -> None:
+        """Prefetched configs answer get_element_config without further queries"""
+        events = list(with_configs(Event.objects.filter(id__in=[self.first.id, self.second.id])))
+        runs = list(with_configs(Run.objects.filter(event=self.first).select_related("event"), "event__configs"))
+        with self.assertNumQueries(0):
+            self.assertEqual({get_element_config(event, "payment_alert") for event in events}, {"10", "20"})
+            self.assertEqual(get_element_config(runs[0].event, "pub_country"), "IT")
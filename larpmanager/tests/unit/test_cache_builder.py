@@ -0,0 +1,146 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the single-flight and stale-while-revalidate cache builder"""
+
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from larpmanager.cache import builder
+from larpmanager.cache.builder import build_once, get_many_or_build, get_or_build, jittered_timeout
+from larpmanager.models.larpmanager import LarpManagerProfiler
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.profiler.signals import cache_rebuild_signal
+
+
+class TestCacheBuilder(BaseTestCase):
+    """Test the shared cache builder primitives"""
+
+    def test_jittered_timeout_stays_in_range(self) -> None:
+        """Jittered timeouts spread around the nominal value"""
+        timeouts = {jittered_timeout(1000) for _ in range(200)}
+        self.assertTrue(all(900 <= timeout <= 1100 for timeout in timeouts))
+        self.assertGreater(len(timeouts), 1)
+        self.assertEqual(jittered_timeout(0), 1)
+
+    def test_miss_builds_and_caches(self) -> None:
+        """A miss builds the value once, later calls are served from the cache"""
+        calls = []
+
+        def build() -> dict:
+            calls.append(1)
+            return {"value": len(calls)}
+
+        self.assertEqual(get_or_build("builder_test", build, 60), {"value": 1})
+        self.assertEqual(get_or_build("builder_test", build, 60), {"value": 1})
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(cache.get("builder_test:lock"))
+
+    def test_stale_value_is_refreshed_by_lock_holder_only(self) -> None:
+        """A stale value is rebuilt by the worker winning the lock, the others serve it"""
+        get_or_build("builder_stale", lambda: "old", 60, stale_timeout=60)
+        cache.set("builder_stale:soft", time.time() - 1)
+
+        # Another worker holds the lock: the stale value is served without rebuilding
+        cache.add("builder_stale:lock", "locked")
+        self.assertEqual(get_or_build("builder_stale", lambda: "new", 60, stale_timeout=60), "old")
+
+        # Once the lock is free the value is rebuilt
+        cache.delete("builder_stale:lock")
+        self.assertEqual(get_or_build("builder_stale", lambda: "new", 60, stale_timeout=60), "new")
+        self.assertGreater(cache.get("builder_stale:soft"), time.time())
+
+    def test_value_without_soft_expiry_is_fresh(self) -> None:
+        """Values stored directly with cache.set are not considered stale"""
+        cache.set("builder_legacy", "legacy")
+        self.assertEqual(get_or_build("builder_legacy", lambda: "new", 60, stale_timeout=60), "legacy")
+
+    def test_many_builds_missing_and_stale(self) -> None:
+        """Fresh values are read together, the missing and stale ones are rebuilt"""
+        get_or_build("builder_many_fresh", lambda: "fresh", 60, stale_timeout=60)
+        get_or_build("builder_many_stale", lambda: "old", 60, stale_timeout=60)
+        cache.set("builder_many_stale:soft", time.time() - 1)
+
+        values = get_many_or_build(
+            {
+                "builder_many_fresh": lambda: "rebuilt",
+                "builder_many_stale": lambda: "new",
+                "builder_many_missing": lambda: "built",
+            },
+            60,
+            stale_timeout=60,
+        )
+
+        self.assertEqual(
+            values,
+            {"builder_many_fresh": "fresh", "builder_many_stale": "new", "builder_many_missing": "built"},
+        )
+        self.assertEqual(cache.get("builder_many_missing"), "built")
+
+    def test_waits_for_lock_holder(self) -> None:
+        """Without the lock a worker waits for the value stored by the lock holder"""
+        cache.add("builder_wait:lock", "locked")
+        loaded = iter([None, "stored"])
+
+        with patch.object(builder.time, "sleep"):
+            value = build_once("builder_wait", lambda: "built", lambda: next(loaded))
+
+        self.assertEqual(value, "stored")
+
+    def test_falls_back_to_building_after_waiting(self) -> None:
+        """If the lock holder never stores the value the worker builds it"""
+        cache.add("builder_slow:lock", "locked")
+
+        with patch.object(builder, "WAIT_TIMEOUT", 0), patch.object(builder.time, "sleep"):
+            value = build_once("builder_slow", lambda: "built", lambda: None)
+
+        self.assertEqual(value, "built")
+
+    def test_rebuild_reports_duration(self) -> None:
+        """Each rebuild sends its duration through the signal"""
+        received = []
+
+        def receiver(**kwargs: object) -> None:
+            received.append(kwargs)
+
+        cache_rebuild_signal.connect(receiver)
+        try:
+            get_or_build("builder_metric", lambda: 1, 60, name="metric")
+        finally:
+            cache_rebuild_signal.disconnect(receiver)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["name"], "metric")
+        self.assertEqual(received[0]["key"], "builder_metric")
+        self.assertGreaterEqual(received[0]["duration"], 0)
+        self.assertFalse(received[0]["stale"])
+
+    def test_slow_rebuild_is_recorded_in_profiler(self) -> None:
+        """Rebuilds slower than the threshold are stored in the profiler, the fast ones are not"""
+        get_or_build("builder_fast", lambda: 1, 60, name="fast")
+        with patch.object(builder.time, "perf_counter", side_effect=[0, builder.SLOW_REBUILD + 1]):
+            get_or_build("builder_profiled", lambda: 1, 60, name="profiled")
+
+        entry = LarpManagerProfiler.objects.get(domain="cache")
+        self.assertEqual(entry.view_func_name, "profiled")
+        self.assertEqual(entry.path, "builder_profiled")
+        self.assertEqual(entry.duration, builder.SLOW_REBUILD + 1)
@@ -0,0 +1,134 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the batched registration status of the calendar"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from larpmanager.cache.run import calendar_runs_cache_key
+from larpmanager.models.event import DevelopStatus, EventConfig, RegistrationStatus
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.users.registration import registration_status, set_runs_registration_status
+from larpmanager.views.user.event import get_anonymous_calendar_runs
+
+
+class TestCalendarStatus(BaseTestCase):
+    """Test the calendar status computed for all runs together"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.association = self.get_association()
+        self.member = self.get_member()
+        end = timezone.now().date() + timedelta(days=30)
+        self.event = self.create_event(slug="calendar")
+        first_run = self.event.runs.first()
+        first_run.end = end
+        first_run.development = DevelopStatus.SHOW
+        first_run.save()
+        self.runs = [
+            first_run,
+            self.create_run(event=self.event, number=2, end=end + timedelta(days=1), development=DevelopStatus.SHOW),
+            self.create_run(
+                event=self.event,
+                number=3,
+                end=end + timedelta(days=2),
+                development=DevelopStatus.SHOW,
+                registration_status=RegistrationStatus.PRE,
+            ),
+        ]
+        self.registration = self.create_registration(member=self.member, run=self.runs[0])
+
+    def _calendar_runs(self) -> list:
+        return [run for run in get_anonymous_calendar_runs(self.association.id) if run.event_id == self.event.id]
+
+    def _member_context(self) -> dict:
+        return {
+            "member": self.member,
+            "membership": self.member.membership,
+            "my_regs": {self.registration.run_id: self.registration},
+            "character_rels_dict": {},
+            "player_characters_dict": {},
+            "payment_invoices_dict": {},
+            "pre_registrations_dict": {},
+        }
+
+    def test_anonymous_runs_served_from_cache(self) -> None:
+        """The anonymous calendar is computed once, and recomputed after a run is saved"""
+        runs = self._calendar_runs()
+        assert [run.id for run in runs] == [run.id for run in self.runs]
+        assert all(run.status["text"] for run in runs)
+
+        with self.assertNumQueries(0):
+            cached_runs = self._calendar_runs()
+        assert [str(run.status["text"]) for run in cached_runs] == [str(run.status["text"]) for run in runs]
+
+        self.runs[1].save()
+        assert cache.get(calendar_runs_cache_key(self.association.id, get_language())) is None
+
+    def test_cached_status_expires_when_registrations_open(self) -> None:
+        """A run opening its registrations is shown as open right away, not after the cache timeout"""
+        now = timezone.now()
+        self.runs[1].registration_status = RegistrationStatus.FUTURE
+        self.runs[1].registration_open = now + timedelta(hours=1)
+        self.runs[1].save()
+
+        assert self._calendar_runs()[1].status["details"]
+
+        with patch("django.utils.timezone.now", return_value=now + timedelta(hours=2)):
+            runs = self._calendar_runs()
+            assert not runs[1].status["details"]
+            assert runs[1].status["open"] == registration_status({}, self.runs[1], None)["open"]
+
+    def test_config_change_clears_cached_runs(self) -> None:
+        """Saving an event config drops the cached calendar"""
+        self._calendar_runs()
+        EventConfig.objects.create(event=self.event, name="registration_secret", value="abc")
+        assert cache.get(calendar_runs_cache_key(self.association.id, get_language())) is None
+
+    def test_member_overlay_matches_status_per_run(self) -> None:
+        """The member status on top of the anonymous one is the same as computing each run"""
+        expected_context = self._member_context()
+        expected = [registration_status(expected_context, run, self.member) for run in self.runs]
+
+        runs = self._calendar_runs()
+        context = self._member_context()
+        set_runs_registration_status(context, runs, self.member, {run.id: run.status for run in runs})
+
+        for run, expected_status in zip(runs, expected, strict=True):
+            assert run.status["open"] == expected_status["open"]
+            assert str(run.status["text"]) == str(expected_status["text"])
+            assert run.status["registration"] == expected_status["registration"]
+        assert "registration_counts" not in context
+
+    def test_no_registration_lookup_per_run(self) -> None:
+        """Runs without a registration of the member do not query for one"""
+        runs = self._calendar_runs()
+        context = self._member_context()
+        context["my_regs"] = {}
+
+        # Only the pre-registration run depends on the member, with the data already in context
+        with self.assertNumQueries(0):
+            set_runs_registration_status(context, runs, self.member, {run.id: run.status for run in runs})
+        assert runs[0].status["registration"] is None
@@ -0,0 +1,124 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the single-pass rendering of character and trait references"""
+
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+from larpmanager.templatetags.show_tags import go_character, go_trait, replace_chars, show_char, show_trait
+from larpmanager.tests.unit.base import BaseTestCase
+
+SAMPLE_TEXTS = [
+    "<p>#12 meets @1 and ^3 near #123, while #05 and ##7 wait</p>",
+    "<p>#999 owes @2x a favour, ^40 and #41 are strangers &#39; #0</p>",
+    "@1@2^3#4 and 12#1 and ^ or # alone",
+]
+
+
+def _sequential_references(text: str, max_number: int, build: Callable[[str, int], str | None]) -> str:
+    """Replace references one number at a time in descending order, as the tags did before."""
+    for number in range(max_number, 0, -1):
+        for prefix in ("#", "@", "^"):
+            search = f"{prefix}{number}"
+            if search not in text:
+                continue
+            replacement = build(prefix, number)
+            if replacement is not None:
+                text = text.replace(search, replacement)
+    return text
+
+
+class TestCharacterReferences(BaseTestCase):
+    """Test that the single scan renders the same output as the replacement per number"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.run = self.get_run()
+
+    def _context(self, count: int = 40) -> dict:
+        chars = {
+            number: {
+                "name": f"Character {number}",
+                "uuid": str(uuid4()),
+                "title": "",
+                "teaser": f"Friend of #{number - 1}" if number > 1 else "",
+                "factions": [],
+            }
+            for number in range(1, count + 1)
+        }
+        # Characters without a name are shown as an empty reference
+        chars[3]["name"] = ""
+        return {"chars": chars, "max_ch_number": count, "factions": {}, "association_slug": "test", "slug": "test"}
+
+    def test_show_char_matches_sequential_replacement(self) -> None:
+        """Links, tooltips and partial numbers are the same as replacing each number in turn"""
+        for text in SAMPLE_TEXTS:
+            context = self._context()
+            expected = _sequential_references(
+                text + " ",
+                context["max_ch_number"],
+                lambda prefix, number, ctx=context: go_character(
+                    ctx, number, self.run, include_tooltip=True, simple=prefix == "^"
+                ),
+            )
+            assert show_char(context, text, self.run, include_tooltip=1) == expected
+
+    def test_replace_chars_matches_sequential_replacement(self) -> None:
+        """Names replace the references, except the first name of characters without a name"""
+        context = self._context()
+        assert replace_chars(context, "#12 @1 ^3 ^4 #123", limit=500) == (
+            "Character 12 Character 1 ^3 Character Character 123"
+        )
+
+    def test_show_trait_matches_sequential_replacement(self) -> None:
+        """Trait references are resolved to the assigned characters"""
+        context = self._context()
+        context["traits"] = {number: {"char": number + 1} for number in range(1, 20)}
+        context["max_trait"] = 19
+        text = "#5 and @15 with ^2 and #199"
+        expected = _sequential_references(
+            text,
+            context["max_trait"],
+            lambda prefix, number: go_trait(context, number, self.run, include_tooltip=True, simple=prefix == "^"),
+        )
+        assert show_trait(context, text, self.run, include_tooltip=True) == expected
+
+    def test_single_pass_is_faster(self) -> None:
+        """Micro-benchmark: a long sheet of a large event is rendered faster than one scan per number"""
+        context = self._context(count=300)
+        text = " ".join(f"<p>#{number} talks to @{number + 1} about ^{number + 2}</p>" for number in range(1, 280, 7))
+
+        def build(prefix: str, number: int) -> str | None:
+            return go_character(context, number, self.run, include_tooltip=True, simple=prefix == "^")
+
+        start = time.perf_counter()
+        for _ in range(5):
+            sequential = _sequential_references(text + " ", context["max_ch_number"], build)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(5):
+            single_pass = show_char(context, text, self.run, include_tooltip=1)
+        single_pass_time = time.perf_counter() - start
+
+        assert single_pass == sequential
+        assert single_pass_time < sequential_time
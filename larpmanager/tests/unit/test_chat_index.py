@@ -0,0 +1,98 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the BM25 chat retrieval index over guides and tutorials"""
+
+from larpmanager.models.larpmanager import LarpManagerGuide, LarpManagerTutorial
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.larpmanager.chat import _find_relevant_docs, _get_docs_context, get_chat_index
+
+
+class TestChatIndex(BaseTestCase):
+    """Test the chat retrieval index and its ranking"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        LarpManagerGuide.objects.create(
+            title="Casting preferences",
+            slug="casting",
+            text="<p>Players express casting preferences, then the casting algorithm assigns characters.</p>",
+            published=True,
+        )
+        LarpManagerGuide.objects.create(
+            title="Payments",
+            slug="payments",
+            text="<p>Collect payments for tickets with the payment methods of the organization.</p>",
+            published=True,
+        )
+        LarpManagerGuide.objects.create(
+            title="Casting draft", slug="draft", text="<p>Unpublished casting notes.</p>", published=False
+        )
+        LarpManagerTutorial.objects.create(
+            name="Tickets", slug="tickets", order=1, descr="<h2>Ticket tiers</h2><p>Configure ticket prices.</p>"
+        )
+
+    def test_ranks_by_relevance(self) -> None:
+        """Documents mentioning the question terms rank first, unpublished guides are skipped"""
+        ranked = _find_relevant_docs("How does the casting algorithm work?")
+
+        self.assertEqual([(doc_type, slug) for _score, doc_type, slug, _title in ranked], [("guide", "casting")])
+
+        ranked = _find_relevant_docs("ticket payments")
+        self.assertEqual({slug for _score, _doc_type, slug, _title in ranked}, {"payments", "tickets"})
+        self.assertGreater(ranked[0][0], 0)
+
+    def test_section_titles_weigh_like_titles(self) -> None:
+        """A tutorial section title ranks above a passing mention in a shorter guide"""
+        LarpManagerGuide.objects.create(title="Queue", slug="queue", text="<p>Waitlist.</p>", published=True)
+        LarpManagerTutorial.objects.create(
+            name="Registrations",
+            slug="registrations",
+            order=2,
+            descr="<h2>Waitlist</h2><p>Configure the waiting registrations, their order and the automatic promotion.</p>",
+        )
+
+        ranked = _find_relevant_docs("waitlist")
+
+        self.assertEqual(ranked[0][2], "registrations")
+
+    def test_index_is_rebuilt_when_docs_change(self) -> None:
+        """Saving a guide resets the index, which is reloaded with the new document"""
+        version = get_chat_index()["version"]
+        self.assertIs(get_chat_index(), get_chat_index())
+        self.assertEqual(_find_relevant_docs("refunds"), [])
+
+        LarpManagerGuide.objects.create(
+            title="Refunds", slug="refunds", text="<p>Refunds of the tokens.</p>", published=True
+        )
+
+        self.assertNotEqual(get_chat_index()["version"], version)
+        self.assertEqual(_find_relevant_docs("refunds")[0][2], "refunds")
+
+    def test_docs_context_is_loaded_in_one_query(self) -> None:
+        """The full text of the matched guides and tutorials is fetched with a single query"""
+        ranked = _find_relevant_docs("ticket payments")
+
+        with self.assertNumQueries(1):
+            blocks = _get_docs_context(ranked)
+
+        self.assertEqual(len(blocks), 2)
+        self.assertIn("Configure ticket prices.", "".join(blocks))
+        self.assertIn("# Payments\nCollect payments", "".join(blocks))
@@ -21,6 +21,10 @@
 """Tests for digest email generation functions"""
 
 from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from larpmanager.mail.digest import (
     digest_help_questions,
@@ -28,6 +32,7 @@ from larpmanager.mail.digest import (
     digest_refund_request,
     generate_association_summary_email,
     generate_summary_email,
+    send_daily_organizer_summaries,
 )
 from larpmanager.models.accounting import AccountingItemPayment, PaymentInvoice
 from larpmanager.models.member import NotificationQueue, NotificationType
@@ -464,3 +469,72 @@ class TestDigestFunctions(BaseTestCase):
 
         self.assertIn(self.association.name, email_content)
         self.assertIn("Go to organization dashboard", email_content)
+
+    def _queue_help_questions(self, count: int, member: object) -> None:
+        """Queue help question notifications for the member, or for the association main mail if None"""
+        for number in range(count):
+            question = HelpQuestion.objects.create(
+                member=self.member, association=self.association, text=f"Question {number}"
+            )
+            NotificationQueue.objects.create(
+                association=self.association,
+                member=member,
+                notification_type=NotificationType.HELP_QUESTION,
+                object_id=question.id,
+                sent=False,
+            )
+
+    def test_send_daily_organizer_summaries_groups_by_recipient(self) -> None:
+        """Each recipient gets one email per run or association, and every notification is marked sent"""
+        registration = self.get_registration()
+        for notification_type in (NotificationType.REGISTRATION_NEW, NotificationType.REGISTRATION_UPDATE):
+            NotificationQueue.objects.create(
+                run=self.run,
+                member=self.member,
+                notification_type=notification_type,
+                object_id=registration.id,
+                sent=False,
+            )
+        self._queue_help_questions(2, self.member)
+        self._queue_help_questions(1, None)
+
+        with patch("larpmanager.mail.digest.my_send_mail") as mock_send:
+            send_daily_organizer_summaries()
+
+        self.assertEqual(mock_send.call_count, 3)
+        self.assertEqual([call.args[2] for call in mock_send.call_args_list].count(self.member), 2)
+        self.assertFalse(NotificationQueue.objects.filter(sent=False).exists())
+
+    def test_send_daily_organizer_summaries_marks_each_digest_when_sent(self) -> None:
+        """A failing summary leaves its notifications queued, the ones delivered before are marked sent"""
+        NotificationQueue.objects.create(
+            run=self.run,
+            member=self.member,
+            notification_type=NotificationType.REGISTRATION_NEW,
+            object_id=self.get_registration().id,
+            sent=False,
+        )
+        self._queue_help_questions(2, self.member)
+
+        with (
+            patch("larpmanager.mail.digest.my_send_mail", side_effect=[None, OSError("smtp down")]),
+            self.assertRaises(OSError),
+        ):
+            send_daily_organizer_summaries()
+
+        # The run summary went out, the association one failed
+        self.assertTrue(NotificationQueue.objects.get(run=self.run).sent)
+        self.assertEqual(NotificationQueue.objects.filter(run__isnull=True, sent=False).count(), 2)
+
+    def test_send_daily_organizer_summaries_queries_do_not_grow_with_recipients(self) -> None:
+        """Only the update marking each digest as sent grows with the number of recipients"""
+        query_counts = []
+        for count in (1, 4):
+            for number in range(count):
+                user = self.create_user(username=f"digest{count}_{number}", email=f"digest{count}_{number}@example.com")
+                self._queue_help_questions(2, self.create_member(user=user))
+            with patch("larpmanager.mail.digest.my_send_mail"), CaptureQueriesContext(connection) as queries:
+                send_daily_organizer_summaries()
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[1] - query_counts[0], 3)
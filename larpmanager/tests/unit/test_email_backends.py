@@ -378,9 +378,9 @@ class TestFactoryHelpers(BaseTestCase):
         event = self.get_event()
         run = self.get_run()
 
-        with patch('larpmanager.mail.factory.get_event_config') as mock_get_config:
+        with patch('larpmanager.mail.factory.get_event_configs') as mock_get_config:
             # Mock config responses
-            def config_side_effect(event_id, key, **kwargs):
+            def config_side_effect(event_id, keys, **kwargs):
                 config_map = {
                     'mail_server_host_user': 'user@event.com',
                     'mail_server_host': 'smtp.event.com',
@@ -388,7 +388,7 @@ class TestFactoryHelpers(BaseTestCase):
                     'mail_server_host_password': 'password',
                     'mail_server_use_tls': True,
                 }
-                return config_map.get(key, kwargs.get('default_value', ''))
+                return {key: config_map.get(key, '') for key in keys}
 
             mock_get_config.side_effect = config_side_effect
 
@@ -406,8 +406,8 @@ class TestFactoryHelpers(BaseTestCase):
         event = self.get_event()
         run = self.get_run()
 
-        with patch('larpmanager.mail.factory.get_event_config') as mock_get_config:
-            mock_get_config.return_value = ""  # No host user configured
+        with patch('larpmanager.mail.factory.get_event_configs') as mock_get_config:
+            mock_get_config.return_value = {"mail_server_host_user": ""}  # No host user configured
 
             config = _get_event_smtp_config(run.id)
 
@@ -24,6 +24,7 @@ import base64
 import contextlib
 import datetime
 import json
+import time
 from http import HTTPStatus
 from unittest.mock import patch
 
@@ -37,9 +38,15 @@ from django.test import Client
 from django.urls import reverse
 from django.utils import timezone
 
+from larpmanager.mail import sns
+from larpmanager.management.commands.automate import Command
 from larpmanager.mail.sns import _canonical_string, handle_sns_payload, verify_sns_signature
 from larpmanager.mail.suppression import (
+    REPUTATION_LOOKBACK_HOURS,
     SOFT_BOUNCE_LIMIT,
+    apply_feedback_batch,
+    clean_email_reputation,
+    get_email_reputation,
     get_suppressed_emails,
     is_suppressed,
     suppress_email,
@@ -47,7 +54,15 @@ from larpmanager.mail.suppression import (
 )
 from larpmanager.models.larpmanager import LarpManagerNewsletter, NewsletterStatus
 from larpmanager.models.member import Membership, NewsletterChoices
-from larpmanager.models.miscellanea import EmailContent, EmailRecipient, EmailSuppression, SuppressionReason
+from larpmanager.models.miscellanea import (
+    EmailContent,
+    EmailFeedbackEvent,
+    EmailFeedbackKind,
+    EmailRecipient,
+    EmailReputationCounter,
+    EmailSuppression,
+    SuppressionReason,
+)
 from larpmanager.tests.unit.base import BaseTestCase
 from larpmanager.utils.larpmanager.tasks import partition_newsletter_recipients
 
@@ -298,6 +313,34 @@ class TestSnsSignature(BaseTestCase):
             assert not verify_sns_signature(payload)
             mock_fetch.assert_not_called()
 
+    def test_certificate_is_kept_in_process(self):
+        """The signing certificate is downloaded once and then reused by the process."""
+        response = patch("larpmanager.mail.sns.urllib.request.urlopen").start()
+        self.addCleanup(patch.stopall)
+        response.return_value.__enter__.return_value.read.return_value = self.pem
+        sns._loaded_certificate.clear()
+
+        first = sns._fetch_certificate(CERT_URL)
+        cache.clear()
+        second = sns._fetch_certificate(CERT_URL)
+
+        assert first is second
+        response.assert_called_once()
+
+    def test_certificate_in_process_expires(self):
+        """The certificate kept in process is downloaded again once its timeout has elapsed."""
+        response = patch("larpmanager.mail.sns.urllib.request.urlopen").start()
+        self.addCleanup(patch.stopall)
+        response.return_value.__enter__.return_value.read.return_value = self.pem
+        sns._loaded_certificate.clear()
+
+        sns._fetch_certificate(CERT_URL)
+        cache.clear()
+        with patch("larpmanager.mail.sns.time.monotonic", return_value=time.monotonic() + sns.CERT_CACHE_TIMEOUT):
+            sns._fetch_certificate(CERT_URL)
+
+        assert response.call_count == 2
+
 
 class TestSnsHandling(BaseTestCase):
     """Tests for the processing of verified SNS payloads."""
@@ -406,6 +449,108 @@ class TestSnsHandling(BaseTestCase):
             mock_open.assert_not_called()
 
 
+class TestFeedbackBatch(BaseTestCase):
+    """Tests for the batched application of the queued SES feedback events."""
+
+    def setUp(self):
+        """Clear caches between tests."""
+        cache.clear()
+
+    def test_burst_is_applied_in_one_batch(self):
+        """A burst of events is applied with a fixed number of queries, in queue order."""
+        suppress_email("full@example.com", SuppressionReason.BOUNCE_TRANSIENT)
+        is_suppressed("busy@example.com")
+        events = [
+            EmailFeedbackEvent(email="busy@example.com", kind=EmailFeedbackKind.BOUNCE, reason="t")
+            for _ in range(SOFT_BOUNCE_LIMIT)
+        ]
+        events.extend(
+            EmailFeedbackEvent(email=f"gone{number}@example.com", kind=EmailFeedbackKind.BOUNCE, reason="b")
+            for number in range(50)
+        )
+        events.append(EmailFeedbackEvent(email="spam@example.com", kind=EmailFeedbackKind.COMPLAINT, reason="c"))
+        events.append(EmailFeedbackEvent(email="full@example.com", kind=EmailFeedbackKind.DELIVERY))
+        EmailFeedbackEvent.objects.bulk_create(events)
+
+        with self.assertNumQueries(12):
+            assert apply_feedback_batch() == len(events)
+
+        assert apply_feedback_batch() == 0
+        assert is_suppressed("busy@example.com")
+        assert EmailSuppression.objects.get(email="busy@example.com").bounce_count == SOFT_BOUNCE_LIMIT
+        assert EmailSuppression.objects.filter(reason=SuppressionReason.BOUNCE_PERMANENT, active=True).count() == 50
+        assert EmailSuppression.objects.get(email="spam@example.com").reason == SuppressionReason.COMPLAINT
+        assert EmailSuppression.objects.get(email="full@example.com").bounce_count == 0
+
+    def test_row_created_concurrently_is_merged(self):
+        """An address suppressed while the batch runs keeps its block and only gets the new bounce added."""
+        EmailFeedbackEvent.objects.create(email="raced@example.com", kind=EmailFeedbackKind.BOUNCE, reason="t")
+        original_bulk_create = EmailSuppression.all_objects.bulk_create
+
+        def bulk_create_after_manual_entry(*args, **kwargs):
+            EmailSuppression.all_objects.create(
+                email="raced@example.com", reason=SuppressionReason.MANUAL, bounce_count=0, active=True
+            )
+            return original_bulk_create(*args, **kwargs)
+
+        with patch.object(EmailSuppression.all_objects, "bulk_create", side_effect=bulk_create_after_manual_entry):
+            assert apply_feedback_batch() == 1
+
+        obj = EmailSuppression.objects.get(email="raced@example.com")
+        assert obj.active
+        assert obj.reason == SuppressionReason.MANUAL
+        assert obj.bounce_count == 1
+
+    def test_reputation_counter_is_incremented(self):
+        """Bounces, complaints and deliveries are added to the hourly reputation counter."""
+        handle_sns_payload(bounce_payload("gone@example.com", message_id="bounce"))
+        payload = bounce_payload("ok@example.com", message_id="delivery")
+        payload["Message"] = json.dumps(
+            {"notificationType": "Delivery", "delivery": {"recipients": ["ok@example.com", "fine@example.com"]}}
+        )
+        handle_sns_payload(payload)
+
+        assert get_email_reputation() == {"deliveries": 2, "bounces": 1, "complaints": 0}
+        assert not EmailFeedbackEvent.objects.exists()
+
+    def test_clean_removes_counters_outside_the_lookback(self):
+        """Counters older than the reputation lookback are deleted, the recent ones are kept."""
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        EmailReputationCounter.objects.create(hour=hour, deliveries=3)
+        EmailReputationCounter.objects.create(
+            hour=hour - datetime.timedelta(hours=REPUTATION_LOOKBACK_HOURS - 1), bounces=1
+        )
+        EmailReputationCounter.objects.create(
+            hour=hour - datetime.timedelta(hours=REPUTATION_LOOKBACK_HOURS), bounces=5
+        )
+
+        clean_email_reputation()
+
+        assert EmailReputationCounter.objects.count() == 2
+        assert get_email_reputation() == {"deliveries": 3, "bounces": 1, "complaints": 0}
+
+    def test_reputation_alert_uses_ses_statistics(self):
+        """Without the Delivery topic the SES send statistics still provide the denominator of the rates."""
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        EmailReputationCounter.objects.create(hour=hour, bounces=8)
+        statistics = {"attempts": 150, "bounces": 6, "complaints": 0}
+
+        with (
+            patch("larpmanager.management.commands.automate.get_ses_send_statistics", return_value=statistics),
+            patch("larpmanager.management.commands.automate.notify_admins") as mock_notify,
+        ):
+            Command.check_email_reputation()
+        mock_notify.assert_called_once()
+        assert "Sent: 150 - bounces: 8" in mock_notify.call_args.args[1]
+
+        with (
+            patch("larpmanager.management.commands.automate.get_ses_send_statistics", return_value=None),
+            patch("larpmanager.management.commands.automate.notify_admins") as mock_notify,
+        ):
+            Command.check_email_reputation()
+        mock_notify.assert_not_called()
+
+
 class TestSuppressionOnSend(BaseTestCase):
     """Tests that suppressed addresses are never contacted."""
 
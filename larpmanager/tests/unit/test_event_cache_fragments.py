@@ -0,0 +1,156 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the fragmented event cache and the generation of the rendered gallery"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from larpmanager.cache.character import (
+    get_event_cache_all,
+    get_event_cache_all_key,
+    get_event_cache_char_key,
+    get_event_cache_faction,
+    get_event_cache_fragment_key,
+    get_event_cache_faction_key,
+    get_gallery_html_key,
+    init_event_cache_all,
+    reset_event_cache_all,
+    update_event_cache_all,
+)
+from larpmanager.cache.feature import get_event_features
+from larpmanager.templatetags.show_tags import show_char
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+@pytest.mark.django_db
+class TestEventCacheFragments(BaseTestCase):
+    """Test cases for storing the event data as index plus fragments"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = self.create_event(slug="fragcache")
+        self.run = self.event.runs.first()
+        self.alice = self.character(event=self.event, name="Alice")
+        self.bob = self.character(event=self.event, name="Bob")
+
+    def _context(self) -> dict:
+        return {"event": self.event, "run": self.run, "features": get_event_features(self.event.id)}
+
+    def test_fragments_assemble_complete_data(self) -> None:
+        """The data assembled from the fragments matches a fresh build"""
+        get_event_cache_all(self._context())
+
+        index = cache.get(get_event_cache_all_key(self.run))
+        assert index["char_numbers"] == [self.alice.number, self.bob.number]
+        assert "chars" not in index
+        assert cache.get(get_event_cache_char_key(self.run, self.bob.number))["name"] == "Bob"
+
+        context = self._context()
+        get_event_cache_all(context)
+        expected = init_event_cache_all(self._context())
+        assert context["chars"] == expected["chars"]
+        assert context["factions"] == expected["factions"]
+        assert context["char_mapping"] == expected["char_mapping"]
+
+    def test_missing_fragment_rebuilds(self) -> None:
+        """A missing fragment causes the data to be rebuilt instead of returning partial data"""
+        get_event_cache_all(self._context())
+        cache.delete(get_event_cache_char_key(self.run, self.alice.number))
+
+        context = self._context()
+        get_event_cache_all(context)
+        assert context["chars"][self.alice.number]["name"] == "Alice"
+        assert cache.get(get_event_cache_char_key(self.run, self.alice.number)) is not None
+
+    def test_update_writes_character_fragment(self) -> None:
+        """Updating a character rewrites its fragment and starts a new generation"""
+        get_event_cache_all(self._context())
+        gallery_key = get_gallery_html_key(self.run.id, "en")
+
+        self.alice.name = "Alicia"
+        update_event_cache_all(self.run, self.alice)
+
+        assert cache.get(get_event_cache_char_key(self.run, self.alice.number))["name"] == "Alicia"
+        assert get_gallery_html_key(self.run.id, "en") != gallery_key
+
+    def test_faction_loads_only_its_characters(self) -> None:
+        """The single faction lookup fetches only the characters listed in the faction"""
+        full_context = self._context()
+        get_event_cache_all(full_context)
+
+        # Without the faction feature all characters are in the default faction, which has no uuid
+        faction = full_context["factions"][0]
+        faction["uuid"] = "default"
+        faction["characters"] = [self.bob.number]
+        cache.set(get_event_cache_faction_key(self.run, 0), faction)
+
+        context = self._context()
+        found = get_event_cache_faction(context, "default")
+        assert found["number"] == 0
+        assert list(context["chars"]) == [self.bob.number]
+        assert get_event_cache_faction(self._context(), "missing") is None
+
+    def test_reset_changes_generation(self) -> None:
+        """Resetting the event data invalidates the rendered gallery"""
+        gallery_key = get_gallery_html_key(self.run.id, "en")
+        assert get_gallery_html_key(self.run.id, "en") == gallery_key
+
+        reset_event_cache_all(self.run)
+        assert get_gallery_html_key(self.run.id, "en") != gallery_key
+
+    def _sheet_context(self) -> dict:
+        context = self._context()
+        context["association_slug"] = self.event.association.slug
+        get_event_cache_all(context)
+        return context
+
+    def test_rendered_text_served_from_cache(self) -> None:
+        """A text rendered with the event data is cached and served without sanitizing it again"""
+        text = f"<p>#{self.alice.number} meets ^{self.bob.number}</p>"
+        rendered = show_char(self._sheet_context(), text, self.run, 1)
+        assert "Alice" in rendered
+
+        with patch("larpmanager.templatetags.show_tags._sanitize_html") as sanitize:
+            assert show_char(self._sheet_context(), text, self.run, 1) == rendered
+            sanitize.assert_not_called()
+
+        # Tooltips are part of the key, a different setting renders again
+        assert show_char(self._sheet_context(), text, self.run, 0) != rendered
+
+    def test_rendered_text_follows_event_data(self) -> None:
+        """Renaming a character starts a new generation, so the texts are rendered again"""
+        text = f"<p>#{self.alice.number}</p>"
+        assert "Alice" in show_char(self._sheet_context(), text, self.run, 0)
+
+        self.alice.name = "Alicia"
+        self.alice.save()
+
+        assert "Alicia" in show_char(self._sheet_context(), text, self.run, 0)
+
+    def test_rendered_text_not_cached_with_other_characters(self) -> None:
+        """Texts rendered with characters not taken from the event data are not cached"""
+        context = self._sheet_context()
+        assert get_event_cache_fragment_key(context, self.run, "text", include_tooltip=True)
+
+        context["chars"] = dict(context["chars"])
+        assert get_event_cache_fragment_key(context, self.run, "text", include_tooltip=True) is None
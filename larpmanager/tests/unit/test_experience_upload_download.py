@@ -20,11 +20,13 @@
 
 """Tests for experience CSV export/import, including the experience system column"""
 
+from types import SimpleNamespace
 from typing import Any
 from unittest import mock
 
 import pandas as pd
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 
 from larpmanager.cache.experience import clear_event_exp_systems_cache
 from larpmanager.models.experience import AbilityExp, CriterionExp, DeliveryExp, SystemExp
@@ -42,7 +44,7 @@ from larpmanager.utils.io.download import (
     export_criterions,
     export_deliveries,
 )
-from larpmanager.utils.io.restore import _FakeFile, _FakeForm, _preview_abilities, _preview_deliveries
+from larpmanager.utils.io.restore import _preview_abilities, _preview_deliveries
 from larpmanager.utils.io.upload import (
     _ability_load,
     _assign_requirements,
@@ -79,7 +81,9 @@ class TestExperienceUploadDownload(BaseTestCase):
     def _load_csv(self, typ: str, csv_text: str) -> list[str]:
         """Run a real CSV through the loader of the given upload type, as an upload would"""
         context = {**self.context, "typ": typ}
-        form = _FakeForm(first=_FakeFile(csv_text.encode()))
+        form = SimpleNamespace(
+            cleaned_data={"first": SimpleUploadedFile(f"{typ}.csv", csv_text.encode()), "second": None}
+        )
         loaders = {
             "exp_abilitie": abilities_load,
             "exp_criterion": criterions_load,
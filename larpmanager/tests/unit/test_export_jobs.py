@@ -0,0 +1,134 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for background export jobs"""
+
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from larpmanager.cache.feature import get_event_features
+from larpmanager.models.miscellanea import ExportJob, ExportJobStatus, ExportJobType
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.io.export import clean_export_jobs, get_export_fingerprint, start_export_job
+
+
+@pytest.mark.django_db(transaction=True)
+class TestExportJobs(BaseTestCase):
+    """Test cases for export job creation, reuse and cleanup"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.media_dir = tempfile.TemporaryDirectory()
+        self.media_override = override_settings(MEDIA_ROOT=self.media_dir.name)
+        self.media_override.enable()
+
+    def tearDown(self) -> None:
+        self.media_override.disable()
+        self.media_dir.cleanup()
+        super().tearDown()
+
+    def _context(self) -> dict:
+        run = self.create_event(slug="exportjob").runs.first()
+        return {
+            "event": run.event,
+            "run": run,
+            "features": get_event_features(run.event_id),
+            "member": self.get_member(),
+        }
+
+    def test_export_job_completes_with_artifact(self) -> None:
+        """A new job runs to completion and stores a downloadable artifact"""
+        context = self._context()
+        self.question(event=context["event"])
+
+        job = start_export_job(context, ExportJobType.REGISTRATION_FORM, {"applicable": "r"})
+
+        self.assertEqual(job.status, ExportJobStatus.DONE)
+        self.assertEqual(job.progress, 100)
+        self.assertTrue(job.is_ready())
+        self.assertTrue(Path(job.artifact).exists())
+        self.assertIsNotNone(job.expires)
+
+    def test_export_job_reused_on_unchanged_data(self) -> None:
+        """A second request on unchanged data returns the previous artifact"""
+        context = self._context()
+        self.question(event=context["event"])
+
+        first = start_export_job(context, ExportJobType.REGISTRATION_FORM, {"applicable": "r"})
+        second = start_export_job(context, ExportJobType.REGISTRATION_FORM, {"applicable": "r"})
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(ExportJob.objects.count(), 1)
+
+    def test_export_job_rebuilt_on_changed_data(self) -> None:
+        """Editing the exported data changes the fingerprint and builds a new artifact"""
+        context = self._context()
+        question = self.question(event=context["event"])
+        before = get_export_fingerprint(context, ExportJobType.REGISTRATION_FORM, {})
+        first = start_export_job(context, ExportJobType.REGISTRATION_FORM)
+
+        question.name = "Changed question"
+        question.save()
+        second = start_export_job(context, ExportJobType.REGISTRATION_FORM)
+
+        self.assertNotEqual(before, get_export_fingerprint(context, ExportJobType.REGISTRATION_FORM, {}))
+        self.assertNotEqual(first.pk, second.pk)
+
+    def test_member_edit_changes_backup_fingerprint(self) -> None:
+        """Editing a registered member changes the backup fingerprint, since the backup lists its data"""
+        context = self._context()
+        registration = self.create_registration(run=context["run"])
+        before = get_export_fingerprint(context, ExportJobType.BACKUP, {})
+
+        member = registration.member
+        member.name = "Renamed"
+        member.save()
+
+        self.assertNotEqual(before, get_export_fingerprint(context, ExportJobType.BACKUP, {}))
+
+    def test_export_job_attaches_to_job_in_progress(self) -> None:
+        """A request while the same export is running returns the running job"""
+        context = self._context()
+        running = ExportJob.objects.create(
+            run=context["run"], typ=ExportJobType.CHARACTER_FORM, status=ExportJobStatus.RUNNING
+        )
+
+        job = start_export_job(context, ExportJobType.CHARACTER_FORM)
+
+        self.assertEqual(job.pk, running.pk)
+
+    def test_clean_export_jobs_removes_expired_artifacts(self) -> None:
+        """Expired artifacts are deleted from storage and detached from their job"""
+        context = self._context()
+        job = start_export_job(context, ExportJobType.CHARACTER_FORM)
+        artifact = Path(job.artifact)
+        ExportJob.objects.filter(pk=job.pk).update(expires=timezone.now() - timedelta(days=1))
+
+        clean_export_jobs()
+
+        job.refresh_from_db()
+        self.assertFalse(artifact.exists())
+        self.assertEqual(job.artifact, "")
+        self.assertFalse(job.is_ready())
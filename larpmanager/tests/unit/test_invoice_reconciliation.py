@@ -0,0 +1,127 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the indexed bank statement reconciliation of pending invoices"""
+
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from larpmanager.accounting.invoice import InvoiceMatchIndex, invoice_verify, reconcile_invoices
+from larpmanager.cache.accounting import get_member_accounting_snapshot_cache_key
+from larpmanager.models.accounting import PaymentInvoice
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+def _invoice(pk: int, cod: str, causal: str, mc_gross: str = "50.00", **kwargs: object) -> PaymentInvoice:
+    return PaymentInvoice(pk=pk, cod=cod, causal=causal, mc_gross=Decimal(mc_gross), verified=False, **kwargs)
+
+
+class TestInvoiceMatchIndex(BaseTestCase):
+    """Test the hash index matching statement causals to invoices"""
+
+    def test_matches_codes_and_causal(self) -> None:
+        """Codes, transaction IDs, registration codes and causals are found regardless of formatting"""
+        by_code = _invoice(1, "abc123def456", "Membership fee")
+        by_txn = _invoice(2, "zzz999yyy888", "Donation", txn_id="TXN-000111")
+        by_reg = _invoice(3, "qqq777www666", "Event ticket")
+        by_reg.reg_cod = "reguuid12345"
+        by_causal = _invoice(4, "kkk555jjj444", "kkk555jjj444 - Registration Mario Rossi")
+        index = InvoiceMatchIndex([by_code, by_txn, by_reg, by_causal])
+
+        self.assertEqual(index.match("Bonifico ABC123-DEF456"), ({1}, set()))
+        self.assertEqual(index.match("ref txn 000111"), ({2}, set()))
+        self.assertEqual(index.match("REGUUID12345 ticket"), ({3}, set()))
+        # The causal is found even without its special code prefix
+        self.assertEqual(index.match("registration: mario rossi!"), (set(), {4}))
+        self.assertEqual(index.match("unrelated transfer"), (set(), set()))
+
+    def test_ambiguous_rows_are_reported(self) -> None:
+        """A row matching two invoices by causal is not applied; a code match wins over causal matches"""
+        first = _invoice(1, "aaa111bbb222", "Annual fee")
+        second = _invoice(2, "ccc333ddd444", "Annual fee")
+
+        result = reconcile_invoices([first, second], "50,00;Annual fee\n")
+        self.assertEqual(result.verified, [])
+        self.assertEqual(result.ambiguous, [("Annual fee", [first, second])])
+
+        result = reconcile_invoices([first, second], "50,00;Annual fee CCC333DDD444\n")
+        self.assertEqual(result.verified, [second])
+        self.assertEqual(result.ambiguous, [])
+
+    def test_underpaid_and_repeated_rows(self) -> None:
+        """Underpayments are skipped and an invoice is verified only once"""
+        invoice = _invoice(1, "aaa111bbb222", "Annual fee", mc_gross="50.00")
+
+        result = reconcile_invoices([invoice], "49,00;aaa111bbb222\n50,00;aaa111bbb222\n50,00;aaa111bbb222\n")
+        self.assertEqual(result.verified, [invoice])
+
+    def test_benchmark_10k_rows(self) -> None:
+        """Ten thousand statement rows against five hundred invoices reconcile in linear time"""
+        invoices = [
+            _invoice(pk, f"cod{pk:09d}", f"Registration fee participant {pk}", mc_gross="30.00") for pk in range(1, 501)
+        ]
+        rows = [f"30,00;Bonifico da cliente {row} causale COD{row % 2000:09d}" for row in range(10000)]
+
+        start = time.perf_counter()
+        result = reconcile_invoices(invoices, "\n".join(rows))
+        elapsed = time.perf_counter() - start
+
+        # Codes 1..500 each appear in several rows but are verified once; 0 and >500 match nothing
+        self.assertEqual(len(result.verified), 500)
+        self.assertEqual(result.ambiguous, [])
+        self.assertLess(elapsed, 5)
+
+
+class TestInvoiceVerify(BaseTestCase):
+    """Test applying the reconciliation to the database"""
+
+    def test_verified_invoices_are_updated_in_bulk(self) -> None:
+        """Matched invoices are flagged verified with a single update"""
+        matched = self.payment_invoice(cod="match000001", causal="First", mc_gross=Decimal("20.00"))
+        matched.save()
+        pending = PaymentInvoice.objects.create(
+            member=matched.member,
+            association=matched.association,
+            method=matched.method,
+            typ=matched.typ,
+            mc_gross=Decimal("100.00"),
+            causal="Second",
+            cod="other000002",
+        )
+
+        snapshot_key = get_member_accounting_snapshot_cache_key(matched.association_id, matched.member_id)
+        cache.set(snapshot_key, {"pending": True})
+
+        context = {"todo": PaymentInvoice.objects.filter(verified=False)}
+        csv_upload = SimpleUploadedFile("statement.csv", b"amount;causal\n20,00;MATCH000001 First\n")
+        with self.assertNumQueries(2):
+            # Load the invoices, then a single bulk update
+            counter = invoice_verify(context, csv_upload)
+
+        self.assertEqual(counter, 1)
+        matched.refresh_from_db()
+        pending.refresh_from_db()
+        self.assertTrue(matched.verified)
+        self.assertFalse(pending.verified)
+        # The bulk update skips the post_save, so the snapshot listing the pending payment is dropped explicitly
+        self.assertIsNone(cache.get(snapshot_key))
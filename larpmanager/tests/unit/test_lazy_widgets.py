@@ -0,0 +1,127 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the lazily loaded dashboard widgets and their invalidation"""
+
+import time
+from unittest.mock import patch
+
+from background_task.models import Task
+from django.core.cache import cache
+from django.test import override_settings
+
+from larpmanager.cache.widget import (
+    get_exe_widget_cache,
+    get_orga_widget_cache,
+    get_widget_cache_key,
+    peek_exe_widget_cache,
+    peek_orga_widget_cache,
+    recompute_widgets,
+)
+from larpmanager.models.writing import CharacterStatus
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestLazyWidgets(BaseTestCase):
+    """Test the widgets served from cache, or deferred to their own endpoint"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.association = self.get_association()
+        self.event = self.create_event(slug="widgets")
+        self.run = self.event.runs.first()
+
+    def test_peek_does_not_build(self) -> None:
+        self.assertIsNone(peek_orga_widget_cache(self.run.id, "logs"))
+        self.assertIsNone(cache.get(get_widget_cache_key("run", self.run.id, "logs")))
+
+        data = get_orga_widget_cache(self.run, "logs")
+
+        self.assertEqual(peek_orga_widget_cache(self.run.id, "logs"), data)
+
+    def test_peek_exe_widget(self) -> None:
+        self.assertIsNone(peek_exe_widget_cache(self.association.id, "accounting"))
+
+        data = get_exe_widget_cache(self.association.id, "accounting")
+
+        self.assertEqual(peek_exe_widget_cache(self.association.id, "accounting"), data)
+
+    def test_stale_widget_is_refreshed_in_background(self) -> None:
+        key = get_widget_cache_key("run", self.run.id, "logs")
+        get_orga_widget_cache(self.run, "logs")
+        cache.set(key, {"stale": True})
+        cache.set(f"{key}:soft", time.time() - 1)
+
+        with patch("larpmanager.cache.widget.refresh_widget_cache") as refresh:
+            data = peek_orga_widget_cache(self.run.id, "logs")
+
+        # The stale data is served, while the refresh is scheduled
+        self.assertEqual(data, {"stale": True})
+        refresh.assert_called_once_with("run", self.run.id, "logs")
+
+        # Background tasks run inline in tests: the refresh replaces the stale data
+        get_orga_widget_cache(self.run, "logs")
+        self.assertNotIn("stale", cache.get(key))
+
+
+class TestWidgetInvalidation(BaseTestCase):
+    """Test that saves invalidate only the widgets depending on the saved model"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.event = self.create_event(slug="invalidation")
+        self.run = self.event.runs.first()
+
+    def test_save_invalidates_only_dependent_widgets(self) -> None:
+        get_orga_widget_cache(self.run, "user_character")
+        logs = get_orga_widget_cache(self.run, "logs")
+
+        with patch("larpmanager.cache.widget.recompute_widgets") as recompute:
+            self.character(event=self.event, name="Proposed", status=CharacterStatus.PROPOSED)
+
+        recompute.assert_called_with("run", self.run.id)
+        self.assertIsNone(cache.get(get_widget_cache_key("run", self.run.id, "user_character")))
+        self.assertEqual(cache.get(get_widget_cache_key("run", self.run.id, "logs")), logs)
+
+    def test_invalidated_widget_is_recomputed(self) -> None:
+        self.assertEqual(get_orga_widget_cache(self.run, "user_character")["proposed"], 0)
+
+        # Background tasks run inline in tests: the recompute follows the save
+        self.character(event=self.event, name="Proposed", status=CharacterStatus.PROPOSED)
+
+        cached = cache.get(get_widget_cache_key("run", self.run.id, "user_character"))
+        self.assertEqual(cached["proposed"], 1)
+
+    def test_uncached_widgets_are_not_computed(self) -> None:
+        self.character(event=self.event, name="Proposed", status=CharacterStatus.PROPOSED)
+
+        self.assertIsNone(cache.get(get_widget_cache_key("run", self.run.id, "user_character")))
+
+    @override_settings(AUTO_BACKGROUND_TASKS=False)
+    def test_recompute_is_coalesced(self) -> None:
+        get_orga_widget_cache(self.run, "user_character")
+        get_orga_widget_cache(self.run, "progress")
+
+        for number in range(3):
+            self.character(event=self.event, name=f"Character {number}")
+
+        self.assertEqual(Task.objects.filter(task_name=recompute_widgets.task.name).count(), 1)
@@ -0,0 +1,208 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the incremental daily ledger rollup of accounting items"""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from larpmanager.accounting.ledger import (
+    compute_association_ledger,
+    rebuild_association_ledger,
+    verify_association_ledger,
+)
+from larpmanager.accounting.registration import cancel_run
+from larpmanager.management.commands.automate import Command
+from larpmanager.models.accounting import (
+    AccountingItemOther,
+    AccountingItemOutflow,
+    AccountingItemPayment,
+    AccountingLedgerRollup,
+    ExpenseChoices,
+    LedgerCategory,
+    OtherChoices,
+    PaymentChoices,
+)
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestLedgerRollup(BaseTestCase):
+    """Test the ledger rollup maintained by the accounting item signals"""
+
+    def _rollups(self, **filters: object) -> dict[tuple, tuple[Decimal, int]]:
+        return {
+            (rollup.run_id, rollup.day, rollup.category, rollup.kind): (rollup.total, rollup.num)
+            for rollup in AccountingLedgerRollup.objects.filter(association=self.get_association(), **filters)
+        }
+
+    def test_payment_is_rolled_up_under_registration_run(self) -> None:
+        """Payments are summed per day under the run of their registration"""
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+        registration = self.create_registration(member=member, run=run)
+
+        for value in ("30.00", "20.00"):
+            payment = AccountingItemPayment.objects.create(
+                member=member,
+                association=association,
+                registration=registration,
+                pay=PaymentChoices.MONEY,
+                value=Decimal(value),
+            )
+
+        key = (run.id, payment.created.date(), LedgerCategory.PAYMENT, PaymentChoices.MONEY)
+        self.assertEqual(self._rollups(category=LedgerCategory.PAYMENT), {key: (Decimal("50.00"), 2)})
+        self.assertEqual(verify_association_ledger(association.id), [])
+
+    def test_moving_and_deleting_items_updates_buckets(self) -> None:
+        """Changing the day or value of an item refreshes both buckets; soft delete removes it"""
+        association = self.get_association()
+        outflow = AccountingItemOutflow.objects.create(
+            association=association,
+            value=Decimal("40.00"),
+            exp=ExpenseChoices.LOCAT,
+            descr="Rent",
+            payment_date=date(2024, 3, 1),
+        )
+
+        outflow.payment_date = date(2024, 4, 1)
+        outflow.value = Decimal("45.00")
+        outflow.save()
+        self.assertEqual(
+            self._rollups(category=LedgerCategory.OUTFLOW),
+            {(None, date(2024, 4, 1), LedgerCategory.OUTFLOW, ExpenseChoices.LOCAT): (Decimal("45.00"), 1)},
+        )
+
+        outflow.delete()
+        self.assertEqual(self._rollups(category=LedgerCategory.OUTFLOW), {})
+
+    def test_refunds_are_split_from_other_items(self) -> None:
+        """Cancellation entries go to the refund category, the others keep their type"""
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+        for oth, cancellation in ((OtherChoices.TOKEN, False), (OtherChoices.REFUND, True)):
+            AccountingItemOther.objects.create(
+                member=member,
+                association=association,
+                run=run,
+                oth=oth,
+                cancellation=cancellation,
+                value=Decimal("5.00"),
+            )
+
+        categories = {(category, kind) for _run, _day, category, kind in self._rollups(run=run)}
+        self.assertEqual(
+            categories, {(LedgerCategory.OTHER, OtherChoices.TOKEN), (LedgerCategory.REFUND, OtherChoices.REFUND)}
+        )
+
+    def test_cancel_run_rolls_up_refund_credits(self) -> None:
+        """The refund credits bulk created when a run is cancelled are rolled up"""
+        run = self.get_run()
+        member = self.get_member()
+        association = self.get_association()
+        registration = self.create_registration(member=member, run=run)
+        AccountingItemPayment.objects.create(
+            member=member,
+            association=association,
+            registration=registration,
+            pay=PaymentChoices.MONEY,
+            value=Decimal("60.00"),
+        )
+
+        cancel_run(run)
+
+        credit = AccountingItemOther.objects.get(run=run, member=member, oth=OtherChoices.CREDIT)
+        key = (run.id, credit.created.date(), LedgerCategory.OTHER, OtherChoices.CREDIT)
+        self.assertEqual(self._rollups(category=LedgerCategory.OTHER), {key: (Decimal("60.00"), 1)})
+        self.assertEqual(
+            self._rollups(),
+            {
+                (run_id, day, category, kind): value
+                for (_association_id, run_id, day, category, kind), value in compute_association_ledger(
+                    association.id
+                ).items()
+            },
+        )
+
+    def test_verify_and_rebuild(self) -> None:
+        """Drift is reported by verify and fixed by the rebuild command"""
+        association = self.get_association()
+        AccountingItemOutflow.objects.create(
+            association=association,
+            value=Decimal("10.00"),
+            exp=ExpenseChoices.OTHER,
+            descr="Misc",
+            payment_date=date(2024, 1, 5),
+        )
+
+        # Bulk updates skip the signals and leave the rollup stale
+        AccountingItemOutflow.objects.filter(association=association).update(value=Decimal("12.00"))
+        self.assertEqual(len(verify_association_ledger(association.id)), 1)
+
+        out = StringIO()
+        call_command("rebuild_ledger", "--check", stdout=out)
+        self.assertIn("1 ledger rows differ", out.getvalue())
+        self.assertEqual(len(verify_association_ledger(association.id)), 1)
+
+        call_command("rebuild_ledger", stdout=StringIO())
+        self.assertEqual(verify_association_ledger(association.id), [])
+        self.assertEqual(rebuild_association_ledger(association.id), 1)
+
+    def test_bucket_is_locked_before_recompute(self) -> None:
+        """Saving an item takes the advisory lock of its bucket before reading the raw items"""
+        with CaptureQueriesContext(connection) as queries:
+            AccountingItemOutflow.objects.create(
+                association=self.get_association(),
+                value=Decimal("10.00"),
+                exp=ExpenseChoices.OTHER,
+                descr="Misc",
+                payment_date=date(2024, 1, 5),
+            )
+
+        statements = [query["sql"] for query in queries.captured_queries]
+        lock_index = next(index for index, sql in enumerate(statements) if "pg_advisory_xact_lock" in sql)
+        assert any("SUM" in sql for sql in statements[lock_index:])
+
+    def test_automate_repairs_drifted_ledger(self) -> None:
+        """The nightly automation verifies the rollup and rebuilds it on drift"""
+        association = self.get_association()
+        AccountingItemOutflow.objects.create(
+            association=association,
+            value=Decimal("10.00"),
+            exp=ExpenseChoices.OTHER,
+            descr="Misc",
+            payment_date=date(2024, 1, 5),
+        )
+        AccountingItemOutflow.objects.filter(association=association).update(value=Decimal("12.00"))
+
+        with patch("larpmanager.management.commands.automate.notify_admins") as notify:
+            Command.check_ledger(association)
+            Command.check_ledger(association)
+
+        self.assertEqual(verify_association_ledger(association.id), [])
+        notify.assert_called_once()
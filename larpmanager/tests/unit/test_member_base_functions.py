@@ -24,14 +24,29 @@ from decimal import Decimal
 from typing import Any
 from unittest.mock import patch
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
 from larpmanager.accounting.base import is_registration_provisional
-from larpmanager.accounting.member import _info_token_credit, _init_choices, _init_pending
+from larpmanager.accounting.member import _info_token_credit, _init_choices, _init_pending, info_accounting
+from larpmanager.accounting.registration import cancel_run
+from larpmanager.cache.accounting import (
+    get_member_accounting_history_cache_key,
+    get_member_accounting_snapshot_cache_key,
+)
 from larpmanager.models.accounting import (
     AccountingItemExpense,
     AccountingItemOther,
+    AccountingItemPayment,
     OtherChoices,
+    PaymentChoices,
+    PaymentStatus,
 )
+from larpmanager.models.event import DevelopStatus
 from larpmanager.models.form import RegistrationChoice
+from larpmanager.models.registration import Registration
 from larpmanager.tests.unit.base import BaseTestCase
 
 
@@ -154,6 +169,95 @@ class TestMemberAccountingFunctions(BaseTestCase):
         self.assertEqual(context["accounting_credits"], 1)
 
 
+class TestMemberAccountingSnapshot(BaseTestCase):
+    """Test the cached accounting snapshot behind the member accounting page"""
+
+    def _context(self, member: Any) -> dict:
+        return {"member": member, "association_id": self.get_association().id, "features": {}}
+
+    def test_snapshot_served_from_cache(self) -> None:
+        """A second page view does not query the registrations again"""
+        member = self.get_member()
+        registration = self.create_registration(member=member)
+
+        context = self._context(member)
+        info_accounting(context)
+        self.assertEqual(context["registration_list"], [registration])
+
+        context = self._context(member)
+        with CaptureQueriesContext(connection) as queries:
+            info_accounting(context)
+        self.assertFalse([query for query in queries if "larpmanager_registration" in query["sql"]])
+        self.assertEqual([item.id for item in context["registration_list"]], [registration.id])
+
+    def test_invoice_refreshes_pending_payments(self) -> None:
+        """Submitting a payment invoice moves the registration among the pending payments"""
+        member = self.get_member()
+        registration = self.create_registration(member=member)
+        info_accounting(self._context(member))
+
+        self.payment_invoice(member=member, status=PaymentStatus.SUBMITTED, idx=registration.id).save()
+
+        context = self._context(member)
+        info_accounting(context)
+        self.assertEqual([item.id for item in context["payments_pending"]], [registration.id])
+        self.assertTrue(context["registration_list"][0].currently_pending)
+
+    def test_completed_runs_are_kept_apart(self) -> None:
+        """Accounting changes leave the registrations of completed runs cached"""
+        member = self.get_member()
+        association = self.get_association()
+        run = self.get_run()
+        run.development = DevelopStatus.DONE
+        run.save()
+        registration = self.create_registration(member=member, run=run)
+        info_accounting(self._context(member))
+
+        history_key = get_member_accounting_history_cache_key(association.id, member.id)
+        self.assertEqual([item.id for item in cache.get(history_key)["registrations"]], [registration.id])
+
+        AccountingItemOther.objects.create(
+            member=member, association=association, oth=OtherChoices.TOKEN, value=Decimal("5.00"), descr="Token"
+        )
+        self.assertIsNone(cache.get(get_member_accounting_snapshot_cache_key(association.id, member.id)))
+        self.assertIsNotNone(cache.get(history_key))
+
+        # Saving the run drops the history as well
+        run.save()
+        self.assertIsNone(cache.get(history_key))
+
+    def test_registrations_listed_newest_first(self) -> None:
+        """Registrations of open and completed runs are listed together, newest first"""
+        member = self.get_member()
+        older = self.create_registration(member=member, run=self.get_run())
+        completed_run = self.create_event(name="Completed").runs.first()
+        completed_run.development = DevelopStatus.DONE
+        completed_run.save()
+        newer = self.create_registration(member=member, run=completed_run)
+
+        context = self._context(member)
+        info_accounting(context)
+        self.assertEqual([item.id for item in context["registration_list"]], [newer.id, older.id])
+
+
+    def test_cancel_run_refreshes_snapshot(self) -> None:
+        """The refunds written in bulk when a run is cancelled drop the snapshot"""
+        member = self.get_member()
+        association = self.get_association()
+        run = self.get_run()
+        registration = self.create_registration(member=member, run=run)
+        AccountingItemPayment.objects.create(
+            member=member, association=association, registration=registration, pay=PaymentChoices.MONEY, value=60
+        )
+        # Already cancelled registrations are only refunded, without being saved again
+        Registration.objects.filter(pk=registration.pk).update(cancellation_date=timezone.now())
+        info_accounting(self._context(member))
+
+        cancel_run(run)
+
+        self.assertIsNone(cache.get(get_member_accounting_snapshot_cache_key(association.id, member.id)))
+
+
 class TestBaseUtilityFunctions(BaseTestCase):
     """Test cases for base utility functions"""
 
@@ -0,0 +1,131 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the permission index precomputed with the event links"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from larpmanager.cache.links import cache_event_links
+from larpmanager.models.access import (
+    AssociationPermission,
+    AssociationRole,
+    EventPermission,
+    EventRole,
+    PermissionModule,
+)
+from larpmanager.models.base import Feature, FeatureModule
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.auth.permission import get_event_roles, has_association_permission, has_event_permission
+
+
+class TestPermissionIndex(BaseTestCase):
+    """Test the permission checks answered by the precomputed permission index"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.association = self.get_association()
+        self.member = self.create_member(user=self.create_user(username="index", email="index@example.com"))
+        self.event = self.create_event(slug="index")
+
+        module = FeatureModule.objects.create(name="Index module", order=100)
+        feature = Feature.objects.create(name="Index feature", order=100, module=module, placeholder=True)
+        permission_module = PermissionModule.objects.create(name="Index module", order=100)
+        granted, denied = (
+            AssociationPermission.objects.create(
+                name=slug, slug=slug, number=100 + number, descr=slug, feature=feature, module=permission_module
+            )
+            for number, slug in enumerate(["exe_index_granted", "exe_index_denied"])
+        )
+        self.granted, self.denied = granted.slug, denied.slug
+        self.association_role = AssociationRole.objects.create(association=self.association, name="Staff", number=10)
+        self.association_role.permissions.add(granted)
+        self.association_role.members.add(self.member)
+
+        event_permission = EventPermission.objects.create(
+            name="Index", slug="orga_index", number=100, descr="Index", feature=feature, module=permission_module
+        )
+        self.event_permission = event_permission.slug
+        self.event_role = EventRole.objects.create(event=self.event, name="Helper", number=10)
+        self.event_role.permissions.add(event_permission)
+        self.event_role.members.add(self.member)
+
+        self.request = RequestFactory().get("/")
+        self.request.user = self.member.user
+
+    def _load_context(self) -> dict:
+        context = {"member": self.member, "association_id": self.association.id}
+        cache_event_links(self.request, context)
+        return context
+
+    def test_index_is_precomputed_with_links(self) -> None:
+        context = self._load_context()
+
+        is_admin, permissions, role_names = context["association_permission_index"]
+        self.assertFalse(is_admin)
+        self.assertEqual(permissions, frozenset({self.granted}))
+        self.assertEqual(role_names, ["Staff"])
+        self.assertEqual(context["event_permission_index"]["index"][1], frozenset({self.event_permission}))
+
+    def test_checks_do_not_read_the_roles(self) -> None:
+        context = self._load_context()
+
+        with (
+            patch("larpmanager.cache.role.get_cache_association_role") as association_role,
+            patch("larpmanager.cache.role.get_cache_event_role") as event_role,
+        ):
+            self.assertTrue(has_association_permission(self.request, context, self.granted))
+            self.assertFalse(has_association_permission(self.request, context, self.denied))
+            self.assertTrue(has_event_permission(self.request, context, "index", self.event_permission))
+            self.assertFalse(has_event_permission(self.request, context, "index", self.granted))
+
+        association_role.assert_not_called()
+        event_role.assert_not_called()
+
+    def test_index_is_built_once_without_links(self) -> None:
+        context = self._load_context()
+        del context["event_permission_index"]
+
+        is_organizer, permissions, role_names = get_event_roles(self.request, context, "index")
+
+        self.assertFalse(is_organizer)
+        self.assertEqual(permissions, frozenset({self.event_permission}))
+        self.assertEqual(role_names, ["Helper"])
+        self.assertIn("event_permission_index", context)
+
+    def test_role_change_rebuilds_index(self) -> None:
+        self._load_context()
+
+        self.association_role.permissions.add(AssociationPermission.objects.get(slug=self.denied))
+        self.association_role.save()
+
+        context = self._load_context()
+        self.assertTrue(has_association_permission(self.request, context, self.denied))
+
+    def test_association_save_resets_roles(self) -> None:
+        self._load_context()
+
+        with patch("larpmanager.cache.links.remove_association_role_cache") as remove_role:
+            self.association.save()
+
+        remove_role.assert_any_call(self.association_role.id)
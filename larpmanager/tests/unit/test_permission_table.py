@@ -0,0 +1,105 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the permission table compiled once per process"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from larpmanager.cache import permission
+from larpmanager.cache.permission import (
+    PERMISSION_TABLE_CHECK_INTERVAL,
+    PERMISSION_TABLE_VERSION_KEY,
+    get_association_permission_feature,
+    get_cache_index_permission,
+    get_event_permission_feature,
+    get_permission_table,
+)
+from larpmanager.models.access import AssociationPermission, EventPermission, PermissionModule
+from larpmanager.models.base import Feature, FeatureModule
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestPermissionTable(BaseTestCase):
+    """Test the lookups answered by the per-process permission table"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        module = FeatureModule.objects.create(name="Table module", order=100)
+        self.feature = Feature.objects.create(name="Table feature", slug="table", order=100, module=module)
+        self.permission_module = PermissionModule.objects.create(name="Table module", order=100)
+        AssociationPermission.objects.create(
+            name="Table",
+            slug="exe_table",
+            number=100,
+            descr="Table",
+            feature=self.feature,
+            module=self.permission_module,
+        )
+        EventPermission.objects.create(
+            name="Table",
+            slug="orga_table",
+            number=100,
+            descr="Table",
+            feature=self.feature,
+            module=self.permission_module,
+        )
+
+    def test_lookups_do_not_touch_cache(self) -> None:
+        """Compiled lookups are answered from process memory"""
+        get_permission_table()
+        with patch.object(permission, "cache") as mock_cache:
+            self.assertEqual(get_association_permission_feature("exe_table")[0], "table")
+            self.assertEqual(get_event_permission_feature("orga_table")[0], "table")
+            self.assertIn("orga_table", [row["slug"] for row in get_cache_index_permission("event")])
+        mock_cache.get.assert_not_called()
+
+    def test_unknown_slugs(self) -> None:
+        """Unknown association slugs raise, unknown event slugs return empty values"""
+        with self.assertRaises(AssociationPermission.DoesNotExist):
+            get_association_permission_feature("exe_missing")
+        self.assertEqual(get_event_permission_feature("orga_missing"), ("", "", ""))
+
+    def test_save_reloads_table(self) -> None:
+        """Saving a permission bumps the shared version and recompiles the table"""
+        version = get_permission_table().version
+        EventPermission.objects.create(
+            name="New",
+            slug="orga_table_new",
+            number=101,
+            descr="New",
+            feature=self.feature,
+            module=self.permission_module,
+        )
+        self.assertNotEqual(get_permission_table().version, version)
+        self.assertEqual(get_event_permission_feature("orga_table_new")[0], "table")
+
+    def test_shared_version_change_is_picked_up(self) -> None:
+        """Another process bumping the version is noticed after the check interval"""
+        table = get_permission_table()
+        cache.set(PERMISSION_TABLE_VERSION_KEY, "other")
+        self.assertIs(get_permission_table(), table)
+
+        with patch.object(
+            permission.time, "monotonic", return_value=table.checked + PERMISSION_TABLE_CHECK_INTERVAL + 1
+        ):
+            self.assertEqual(get_permission_table().version, "other")
@@ -24,7 +24,11 @@ import uuid
 
 import pytest
 
-from larpmanager.cache.question import get_cached_registration_questions, skip_registration_question
+from larpmanager.cache.question import (
+    _get_registration_faction_ids,
+    get_cached_registration_questions,
+    skip_registration_question,
+)
 from larpmanager.forms.registration import RegistrationForm
 from larpmanager.models.form import QuestionStatus
 from larpmanager.models.writing import Faction
@@ -277,6 +281,22 @@ class TestRegistrationQuestionFactionFiltering(BaseTestCase):
         result = skip_registration_question(question, registration, features=["reg_que_faction"])
         self.assertFalse(result)
 
+    def test_deleted_faction_is_not_assigned(self) -> None:
+        """Test a soft deleted faction of the character does not count as assigned"""
+        from larpmanager.models.registration import RegistrationCharacterRel
+
+        event = self.get_event()
+        rebels = Faction.objects.create(name="Rebels", event=event)
+        empire = Faction.objects.create(name="Empire", event=event)
+        character = self.character(event=event)
+        character.factions_list.add(rebels, empire)
+        rebels.delete()
+
+        registration = self.create_registration(member=self.get_member(), run=self.get_run())
+        RegistrationCharacterRel.objects.create(registration=registration, character=character)
+
+        self.assertEqual(_get_registration_faction_ids(registration), frozenset({empire.id}))
+
     def test_question_shown_when_character_has_one_of_multiple_factions(self) -> None:
         """Test question is shown when character has one of multiple allowed factions"""
         from larpmanager.models.registration import RegistrationCharacterRel
@@ -363,6 +383,38 @@ class TestRegistrationQuestionFactionFiltering(BaseTestCase):
         result = skip_registration_question(question, registration, features=["reg_que_faction"])
         self.assertTrue(result)
 
+    def test_registration_factions_loaded_once(self) -> None:
+        """Test the registration factions are loaded once for all the questions of the form"""
+        from larpmanager.models.registration import RegistrationCharacterRel
+
+        event = self.get_event()
+        run = self.get_run()
+        member = self.get_member()
+
+        # Create factions, and a character with one of them
+        rebels = Faction.objects.create(name="Rebels", event=event)
+        empire = Faction.objects.create(name="Empire", event=event)
+        character = self.character(event=event)
+        character.factions_list.add(rebels)
+
+        # Create one question for each faction
+        self.question(event=event, name="Rebels question").factions.add(rebels)
+        self.question(event=event, name="Empire question").factions.add(empire)
+
+        # Create registration and assign character
+        registration = self.create_registration(member=member, run=run)
+        RegistrationCharacterRel.objects.create(registration=registration, character=character)
+
+        questions = [question for question in get_cached_registration_questions(event=event) if question["factions_map"]]
+
+        # Only the first evaluation queries the character factions
+        with self.assertNumQueries(1):
+            skipped = [
+                skip_registration_question(question, registration, features=["reg_que_faction"])
+                for question in questions
+            ]
+        self.assertEqual(sorted(skipped), [False, True])
+
 
 @pytest.mark.django_db_reset_sequences
 class TestRegistrationQuestionAllowedMembersFiltering(BaseTestCase):
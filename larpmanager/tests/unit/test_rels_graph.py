@@ -0,0 +1,111 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the relationship graph index of the event characters"""
+
+import pytest
+from django.core.cache import cache
+
+from larpmanager.cache.feature import get_event_features
+from larpmanager.cache.rels import (
+    get_character_graph_ids,
+    get_event_char_rels,
+    get_event_chars_rels,
+    get_event_rels_graph,
+    get_event_rels_graph_key,
+)
+from larpmanager.models.writing import Faction, Plot, PlotCharacterRel, Relationship
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+@pytest.mark.django_db
+class TestRelsGraph(BaseTestCase):
+    """Test cases for building and updating the relationship graph"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = self.create_event(slug="relsgraph")
+        self.alice = self.character(event=self.event, name="Alice")
+        self.bob = self.character(event=self.event, name="Bob")
+        self.carol = self.character(event=self.event, name="Carol")
+
+    def test_graph_inbound_relationships(self) -> None:
+        """Inbound lookups return the sources having the character as target"""
+        Relationship.objects.create(source=self.alice, target=self.carol, text="knows")
+        Relationship.objects.create(source=self.bob, target=self.carol, text="hates")
+
+        assert sorted(get_character_graph_ids(self.carol, "relationships", inbound=True)) == sorted(
+            [self.alice.id, self.bob.id]
+        )
+        assert get_character_graph_ids(self.alice, "relationships") == [self.carol.id]
+        assert get_character_graph_ids(self.alice, "relationships", inbound=True) == []
+
+    def test_relationship_change_drops_cached_graph(self) -> None:
+        """Saving and deleting relationships drops the cached graph, rebuilt on the next lookup"""
+        get_event_rels_graph(self.event.id)
+        relationship = Relationship.objects.create(source=self.alice, target=self.bob, text="loves")
+
+        assert cache.get(get_event_rels_graph_key(self.event.id)) is None
+        assert get_character_graph_ids(self.bob, "relationships", inbound=True) == [self.alice.id]
+        assert cache.get(get_event_rels_graph_key(self.event.id)) is not None
+
+        relationship.delete()
+        assert cache.get(get_event_rels_graph_key(self.event.id)) is None
+        assert get_character_graph_ids(self.bob, "relationships", inbound=True) == []
+
+    def test_m2m_deltas_update_cached_graph(self) -> None:
+        """Adding, removing and clearing faction members updates the cached graph"""
+        faction = Faction.objects.create(event=self.event, name="Guild", number=1)
+        get_event_rels_graph(self.event.id)
+
+        faction.characters.add(self.alice, self.bob)
+        assert sorted(get_character_graph_ids(self.alice, "factions")) == [faction.id]
+        assert sorted(get_event_rels_graph(self.event.id)["factions"]["in"][faction.id]) == sorted(
+            [self.alice.id, self.bob.id]
+        )
+
+        faction.characters.remove(self.alice)
+        assert get_character_graph_ids(self.alice, "factions") == []
+
+        faction.characters.clear()
+        assert get_character_graph_ids(self.bob, "factions") == []
+
+    def test_plot_character_rel_updates_graph(self) -> None:
+        """Plot-character relations are indexed in both directions"""
+        plot = Plot.objects.create(event=self.event, name="Heist", number=1)
+        get_event_rels_graph(self.event.id)
+
+        rel = PlotCharacterRel.objects.create(plot=plot, character=self.carol)
+        assert get_character_graph_ids(self.carol, "plots") == [plot.id]
+
+        rel.delete()
+        assert get_character_graph_ids(self.carol, "plots") == []
+
+    def test_bulk_rels_match_single_character(self) -> None:
+        """The bulk computation returns the same rels as the per-character one"""
+        Relationship.objects.create(source=self.alice, target=self.bob, text="knows")
+        faction = Faction.objects.create(event=self.event, name="Guild", number=1)
+        faction.characters.add(self.alice, self.carol)
+        features = get_event_features(self.event.id)
+
+        characters = [self.alice, self.bob, self.carol]
+        bulk = get_event_chars_rels(characters, features, self.event)
+        for character in characters:
+            assert bulk[character.id] == get_event_char_rels(character, features, self.event)
@@ -0,0 +1,171 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the reminder schedule read by the nightly automation"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from larpmanager.mail.schedule import advance_reminder_schedules, next_reminder_day
+from larpmanager.management.commands.automate import Command
+from larpmanager.models.association import AssociationConfig
+from larpmanager.models.event import DevelopStatus
+from larpmanager.models.registration import Registration, ReminderKind, ReminderSchedule
+from larpmanager.tests.unit.base import BaseTestCase
+
+
+class TestReminderSchedule(BaseTestCase):
+    """Test the scheduling of registration and deadline reminders"""
+
+    def test_next_reminder_day_matches_modulo_rule(self) -> None:
+        """The scheduled day is the first one whose distance from the anchor, modulo the interval, is 1"""
+        anchor = date(2025, 3, 10)
+        for interval in (2, 3, 5, 7):
+            for shift in range(-20, 20):
+                from_day = anchor + timedelta(days=shift)
+                due = next_reminder_day(anchor, interval, from_day)
+                expected = next(
+                    from_day + timedelta(days=offset)
+                    for offset in range(interval)
+                    if (anchor - from_day - timedelta(days=offset)).days % interval == 1
+                )
+                self.assertEqual(due, expected)
+
+        self.assertIsNone(next_reminder_day(anchor, 1, anchor))
+        self.assertIsNone(next_reminder_day(None, 5, anchor))
+
+    def test_registration_is_scheduled_on_creation(self) -> None:
+        """New registrations get a schedule with the association remind_days interval"""
+        registration = self.create_registration()
+
+        schedule = ReminderSchedule.objects.get(registration=registration, kind=ReminderKind.REGISTRATION)
+        self.assertEqual(schedule.interval, 5)
+        self.assertEqual(schedule.run_id, registration.run_id)
+        self.assertEqual(schedule.due, next_reminder_day(registration.created.date(), 5, timezone.now().date()))
+
+    def test_config_change_rebuilds_schedules(self) -> None:
+        """Changing remind_days or deadline_days reschedules the association reminders"""
+        registration = self.create_registration()
+        run = registration.run
+        run.start = timezone.now().date() + timedelta(days=30)
+        run.save()
+        self.assertFalse(ReminderSchedule.objects.filter(kind=ReminderKind.DEADLINE).exists())
+
+        association = self.get_association()
+        AssociationConfig.objects.create(association=association, name="remind_days", value="7")
+        AssociationConfig.objects.create(association=association, name="deadline_days", value="3")
+
+        schedule = ReminderSchedule.objects.get(registration=registration)
+        self.assertEqual(schedule.interval, 7)
+        deadline = ReminderSchedule.objects.get(run=run, kind=ReminderKind.DEADLINE)
+        self.assertEqual(deadline.interval, 3)
+        self.assertEqual(deadline.due, next_reminder_day(run.start, 3, timezone.now().date()))
+
+        # Disabling the interval drops the schedules
+        AssociationConfig.objects.filter(association=association, name="remind_days").update(value="0")
+        AssociationConfig.objects.get(association=association, name="remind_days").save()
+        self.assertFalse(ReminderSchedule.objects.filter(kind=ReminderKind.REGISTRATION).exists())
+
+    def test_advance_moves_due_and_missed_schedules(self) -> None:
+        """Schedules due today or missed are moved to their next day after today"""
+        registration = self.create_registration()
+        today = timezone.now().date()
+        schedule = ReminderSchedule.objects.get(registration=registration)
+        ReminderSchedule.objects.filter(pk=schedule.pk).update(due=today - timedelta(days=7))
+
+        self.assertEqual(advance_reminder_schedules(today), 1)
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.due, today + timedelta(days=3))
+        self.assertEqual(advance_reminder_schedules(today), 0)
+
+    def test_cancelled_registration_and_closed_run_drop_schedules(self) -> None:
+        """Cancelling a registration or closing its run deletes the schedules"""
+        registration = self.create_registration()
+        run = registration.run
+        run.start = timezone.now().date() + timedelta(days=30)
+        run.save()
+        AssociationConfig.objects.create(association=self.get_association(), name="deadline_days", value="3")
+        self.assertTrue(ReminderSchedule.objects.filter(run=run, kind=ReminderKind.DEADLINE).exists())
+
+        registration.cancellation_date = timezone.now()
+        registration.save()
+        self.assertFalse(ReminderSchedule.objects.filter(registration=registration).exists())
+
+        registration.cancellation_date = None
+        registration.save()
+        self.assertTrue(ReminderSchedule.objects.filter(registration=registration).exists())
+
+        run.development = DevelopStatus.DONE
+        run.save()
+        self.assertFalse(ReminderSchedule.objects.filter(run=run).exists())
+
+    def test_reopened_run_restores_registration_schedules(self) -> None:
+        """Reopening a completed run schedules again the reminders of its active registrations"""
+        registration = self.create_registration()
+        cancelled = self.create_registration(
+            member=self.create_member(user=self.create_user(username="cancelled", email="cancelled@example.com")),
+            run=registration.run,
+        )
+        Registration.objects.filter(pk=cancelled.pk).update(cancellation_date=timezone.now())
+        run = registration.run
+        run.development = DevelopStatus.DONE
+        run.save()
+        self.assertFalse(ReminderSchedule.objects.filter(run=run).exists())
+
+        run.development = DevelopStatus.SHOW
+        run.save()
+        schedule = ReminderSchedule.objects.get(run=run, kind=ReminderKind.REGISTRATION)
+        self.assertEqual(schedule.registration_id, registration.id)
+        self.assertEqual(schedule.due, next_reminder_day(registration.created.date(), 5, timezone.now().date()))
+
+        # Saving the open run again does not duplicate the schedules
+        run.save()
+        self.assertEqual(ReminderSchedule.objects.filter(run=run).count(), 1)
+
+    def test_advance_prunes_schedules_updated_in_bulk(self) -> None:
+        """Schedules of registrations cancelled through a bulk update are deleted, not moved"""
+        registration = self.create_registration()
+        today = timezone.now().date()
+        ReminderSchedule.objects.filter(registration=registration).update(due=today)
+        Registration.objects.filter(pk=registration.pk).update(cancellation_date=timezone.now())
+
+        self.assertEqual(advance_reminder_schedules(today), 0)
+        self.assertFalse(ReminderSchedule.objects.filter(registration=registration).exists())
+
+    @patch("larpmanager.management.commands.automate.check_holiday", return_value=False)
+    def test_check_remind_only_processes_due_registrations(self, _mock_holiday: object) -> None:
+        """The nightly reminder check only reads the registrations due today"""
+        today = timezone.now().date()
+        run = self.get_run()
+        run.start = today + timedelta(days=30)
+        run.end = run.start
+        run.save()
+        due_registration = self.create_registration(run=run)
+        other_member = self.create_member(user=self.create_user(username="other", email="other@example.com"))
+        self.create_registration(member=other_member, run=run)
+        ReminderSchedule.objects.filter(registration=due_registration).update(due=today)
+        ReminderSchedule.objects.exclude(registration=due_registration).update(due=today + timedelta(days=1))
+
+        with patch.object(Command, "remind_reg") as remind_reg:
+            Command().check_remind(self.get_association())
+
+        self.assertEqual([call.args[0] for call in remind_reg.call_args_list], [due_registration])
@@ -0,0 +1,140 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the restore plan built on preview and applied on confirm"""
+
+import io
+import tempfile
+import zipfile
+
+import pytest
+from django.test import override_settings
+
+from larpmanager.cache.feature import get_event_features
+from larpmanager.models.event import EventConfig
+from larpmanager.models.form import QuestionApplicable, WritingQuestion, WritingQuestionType
+from larpmanager.models.writing import Character, CharacterConfig
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.utils.io.restore import (
+    build_restore_plan,
+    execute_restore,
+    load_restore_temp,
+    preview_restore,
+    save_restore_temp,
+)
+
+
+def _zip(files: dict[str, str]) -> bytes:
+    """Build a backup ZIP from a mapping of file name to CSV content"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRestorePlan(BaseTestCase):
+    """Test cases for building, storing and executing restore plans"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.media_dir = tempfile.TemporaryDirectory()
+        self.media_override = override_settings(MEDIA_ROOT=self.media_dir.name)
+        self.media_override.enable()
+
+    def tearDown(self) -> None:
+        self.media_override.disable()
+        self.media_dir.cleanup()
+        super().tearDown()
+
+    def _context(self) -> dict:
+        run = self.create_event(slug="restoreplan").runs.first()
+        return {
+            "event": run.event,
+            "run": run,
+            "association_id": run.event.association_id,
+            "features": get_event_features(run.event_id),
+            "member": self.get_member(),
+        }
+
+    def test_build_restore_plan(self) -> None:
+        """Every non-empty CSV becomes a plan entry, with lowercase columns and None for empty cells"""
+        plan = build_restore_plan(
+            _zip(
+                {
+                    "configuration.csv": "Name,Value,Source\nfoo,,event\n",
+                    "empty.csv": "name\n",
+                    "notes.txt": "ignored",
+                }
+            )
+        )
+
+        self.assertEqual(list(plan), ["configuration"])
+        self.assertEqual(plan["configuration"]["columns"], ["name", "value", "source"])
+        self.assertEqual(plan["configuration"]["rows"], [["foo", None, "event"]])
+
+    def test_restore_temp_round_trip(self) -> None:
+        """The stored plan is returned once, and invalid keys are rejected"""
+        plan = build_restore_plan(_zip({"configuration.csv": "name,value\nfoo,bar\n"}))
+
+        key = save_restore_temp(plan)
+
+        self.assertEqual(load_restore_temp(key), plan)
+        self.assertIsNone(load_restore_temp(key))
+        self.assertIsNone(load_restore_temp("../../settings"))
+
+    def test_preview_and_execute_restore(self) -> None:
+        """The plan built on preview is applied on execution, matching the preview"""
+        context = self._context()
+        event = context["event"]
+        existing = self.character(event=event, name="Existing")
+        WritingQuestion.objects.get_or_create(
+            event=event,
+            applicable=QuestionApplicable.CHARACTER,
+            typ=WritingQuestionType.NAME,
+            defaults={"name": "Name"},
+        )
+        EventConfig.objects.create(event=event, name="restore_same", value="1")
+        plan = build_restore_plan(
+            _zip(
+                {
+                    "configuration.csv": "name,value,source\nrestore_same,1,event\nrestore_new,2,event\n",
+                    "character.csv": f"number,name\n{existing.number},Existing\n,Newcomer\n",
+                    "character_config.csv": f"character_number,name,value\n{existing.number},restore_cfg,abc\n",
+                    "unknown.csv": "a\n1\n",
+                }
+            )
+        )
+
+        sections, unknown = preview_restore(context, plan)
+        self.assertEqual(unknown, ["unknown.csv"])
+        configuration = next(section for section in sections if section["label"] == "Configuration")
+        self.assertEqual(configuration["creates"], ["event / restore_new"])
+        self.assertEqual(configuration["updates"], ["event / restore_same"])
+
+        logs = execute_restore(context, load_restore_temp(save_restore_temp(plan)))
+
+        self.assertFalse([log for log in logs if log.startswith("ERR")], logs)
+        self.assertEqual(EventConfig.objects.get(event=event, name="restore_new").value, "2")
+        self.assertIn("OK - Updated Existing", logs)
+        self.assertEqual(Character.objects.filter(event=event, name="Existing").count(), 1)
+        self.assertTrue(Character.objects.filter(event=event, name="Newcomer").exists())
+        self.assertEqual(CharacterConfig.objects.get(character=existing, name="restore_cfg").value, "abc")
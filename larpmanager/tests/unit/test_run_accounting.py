@@ -0,0 +1,177 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the set-based accounting recompute of a whole run"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from larpmanager.accounting.registration import (
+    get_date_surcharge,
+    recompute_run_accounting,
+    update_registration_accounting,
+)
+from larpmanager.cache.feature import cache_event_features_key
+from larpmanager.cache.registration import cache_registration_counts_key
+from larpmanager.cache.run import calendar_api_cache_key
+from larpmanager.models.accounting import (
+    AccountingItemDiscount,
+    AccountingItemPayment,
+    AccountingItemTransaction,
+    Discount,
+    DiscountType,
+    PaymentChoices,
+)
+from larpmanager.models.base import Feature
+from larpmanager.models.event import DevelopStatus
+from larpmanager.models.form import RegistrationChoice
+from larpmanager.models.member import Member, Membership, get_user_membership
+from larpmanager.models.registration import Registration, RegistrationSurcharge, RegistrationTicket
+from larpmanager.tests.unit.base import BaseTestCase
+
+ACCOUNTING_FIELDS = ["surcharge", "tot_iscr", "tot_payed", "quota", "deadline", "alert"]
+
+
+@pytest.mark.django_db
+class TestRunAccountingRecompute(BaseTestCase):
+    """Test cases comparing the run recompute with the per-registration path"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = self.create_event(slug="runacc")
+        self.run = self.event.runs.first()
+        self.run.start = date.today() + timedelta(days=90)
+        self.run.end = self.run.start
+        self.run.development = DevelopStatus.SHOW
+        self.run.save()
+        self.ticket = self.ticket(event=self.event, price=Decimal("100.00"))
+        self.association = self.event.association
+
+        self.registrations = []
+        for index in range(4):
+            member = self.create_member(user=self.create_user(username=f"runacc{index}", email=f"r{index}@test.com"))
+            self.registrations.append(
+                self.create_registration(member=member, run=self.run, ticket=self.ticket, quotas=index + 1)
+            )
+
+    def _expected(self) -> dict[int, dict]:
+        """Compute the accounting fields with the per-registration path, without saving them."""
+        expected = {}
+        for registration in Registration.objects.filter(run=self.run).select_related("run", "ticket", "member"):
+            # Saving a registration recomputes its surcharge before the accounting
+            registration.surcharge = get_date_surcharge(registration, self.event)
+            update_registration_accounting(registration)
+            expected[registration.id] = {field: getattr(registration, field) for field in ACCOUNTING_FIELDS}
+        return expected
+
+    def test_recompute_matches_per_registration_path(self) -> None:
+        """Options, discounts, payments and transactions give the same results as saving each registration"""
+        first, second, third, _fourth = self.registrations
+        question, option, _other = self.question_with_options(event=self.event)
+        RegistrationChoice.objects.create(registration=first, option=option, question=question)
+
+        discount = Discount.objects.create(
+            name="Early", value=Decimal("15.00"), max_redeem=10, typ=DiscountType.STANDARD, event=self.event, number=1
+        )
+        AccountingItemDiscount.objects.create(
+            member=second.member, run=self.run, disc=discount, value=Decimal("15.00"), association=self.association
+        )
+        AccountingItemPayment.objects.create(
+            member=third.member,
+            association=self.association,
+            registration=third,
+            pay=PaymentChoices.MONEY,
+            value=Decimal("40.00"),
+        )
+        AccountingItemTransaction.objects.create(
+            member=third.member,
+            association=self.association,
+            registration=third,
+            value=Decimal("2.00"),
+            user_burden=True,
+        )
+        RegistrationSurcharge.objects.create(event=self.event, date=date.today() - timedelta(days=1), amount=7)
+
+        # Change the ticket price without signals, as a bulk edit would
+        RegistrationTicket.objects.filter(pk=self.ticket.pk).update(price=Decimal("120.00"))
+        expected = self._expected()
+
+        updated = recompute_run_accounting(self.run)
+
+        assert updated == len(self.registrations)
+        for registration in Registration.objects.filter(run=self.run):
+            actual = {field: getattr(registration, field) for field in ACCOUNTING_FIELDS}
+            assert actual == expected[registration.id]
+        assert Registration.objects.get(pk=first.pk).tot_iscr == Decimal("177.00")
+
+    def test_recompute_query_count_does_not_grow_with_registrations(self) -> None:
+        """The number of queries is independent of the number of registrations, tokens and credits included"""
+        for slug in ("tokens", "credits"):
+            feature, _created = Feature.objects.get_or_create(slug=slug, defaults={"name": slug, "order": 1})
+            self.event.features.add(feature)
+        cache.delete(cache_event_features_key(self.event.id))
+
+        # A single member spends tokens: the others have no balance and stay unpaid
+        membership = get_user_membership(self.registrations[0].member, self.association.id)
+        Membership.objects.update(tokens=0, credit=0)
+        Membership.objects.filter(pk=membership.pk).update(tokens=Decimal("20.00"))
+        recompute_run_accounting(self.run)
+        assert Registration.objects.get(pk=self.registrations[0].pk).tot_payed == Decimal("20.00")
+
+        recompute_run_accounting(self.run)
+        with CaptureQueriesContext(connection) as small:
+            recompute_run_accounting(self.run)
+
+        members = [
+            self.create_member(user=self.create_user(username=f"runacc{index}", email=f"r{index}@test.com"))
+            for index in range(4, 12)
+        ]
+        Membership.objects.update(tokens=0, credit=0)
+        for member in members:
+            # Reload the member, whose cached membership still holds the fixture balances
+            self.create_registration(member=Member.objects.get(pk=member.pk), run=self.run, ticket=self.ticket)
+        recompute_run_accounting(self.run)
+
+        with CaptureQueriesContext(connection) as large:
+            recompute_run_accounting(self.run)
+        assert len(large.captured_queries) <= len(small.captured_queries) + 2
+
+    def test_recompute_clears_registration_caches(self) -> None:
+        """The caches reading the accounting fields are cleared, as saving each registration would"""
+        counts_key = cache_registration_counts_key(self.run.id)
+        calendar_key = calendar_api_cache_key(self.association.id)
+        cache.set(counts_key, {"count_reg": 0})
+        cache.set(calendar_key, [])
+
+        recompute_run_accounting(self.run)
+
+        assert cache.get(counts_key) is None
+        assert cache.get(calendar_key) is None
+
+    def test_cancelled_run_is_skipped(self) -> None:
+        """Cancelled runs keep their accounting untouched"""
+        self.run.development = DevelopStatus.CANC
+        self.run.save()
+        assert recompute_run_accounting(self.run) == 0
@@ -0,0 +1,101 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+
+"""Tests for the character search index served to the search page"""
+
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from larpmanager.cache.character import get_search_index, normalize_search_text, reset_event_cache_all
+from larpmanager.cache.feature import get_event_features
+from larpmanager.models.base import Feature
+from larpmanager.models.writing import Faction
+from larpmanager.tests.unit.base import BaseTestCase
+from larpmanager.views.user.event import search_index
+
+
+class TestSearchIndex(BaseTestCase):
+    """Test the search index built alongside the event data"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.event = self.create_event(slug="searchidx")
+        self.run = self.event.runs.first()
+        feature, _created = Feature.objects.get_or_create(slug="faction", defaults={"name": "Factions", "order": 100})
+        self.event.features.add(feature)
+        self.faction = Faction.objects.create(name="Rebel Alliance", event=self.event, number=1)
+        self.alice = self.character(event=self.event, name="Élodie", teaser="<p>A <b>smuggler</b></p>")
+        self.alice.factions_list.add(self.faction)
+        self.bob = self.character(event=self.event, name="Bob")
+
+    def _context(self) -> dict:
+        return {
+            "event": self.event,
+            "run": self.run,
+            "features": get_event_features(self.event.id),
+            "show_character": {"name": 1, "teaser": 1},
+        }
+
+    def test_normalize_search_text(self) -> None:
+        """Markup and accents are stripped, case and whitespace normalized"""
+        self.assertEqual(normalize_search_text("<p>Élodie  <b>MARCHAND</b></p>"), "elodie marchand")
+
+    def test_index_contents(self) -> None:
+        """The index holds the normalized names, teasers and faction names"""
+        index, _etag = get_search_index(self._context(), show_teaser=True)
+        self.assertIn("elodie", index[self.alice.number]["words"])
+        self.assertIn("smuggler", index[self.alice.number]["text"])
+        self.assertIn("rebel alliance", index[self.alice.number]["text"])
+        self.assertEqual(index[self.bob.number]["words"], ["bob"])
+
+        index, _etag = get_search_index(self._context(), show_teaser=False)
+        self.assertNotIn("smuggler", index[self.alice.number]["text"])
+
+    def test_index_follows_event_data(self) -> None:
+        """The index is cached, and rebuilt with a new ETag when the event data is reset"""
+        _index, etag = get_search_index(self._context(), show_teaser=True)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_search_index(self._context(), show_teaser=True)[1], etag)
+
+        self.bob.name = "Robert"
+        self.bob.save()
+        reset_event_cache_all(self.run)
+        index, new_etag = get_search_index(self._context(), show_teaser=True)
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(index[self.bob.number]["words"], ["robert"])
+
+    def test_endpoint_revalidates_with_etag(self) -> None:
+        """The endpoint serves the index with its ETag, and a 304 when the client holds it"""
+        request = RequestFactory().get("/")
+        with (
+            patch("larpmanager.views.user.event.get_event_context", return_value=self._context()),
+            patch("larpmanager.views.user.event.check_gallery_visibility", return_value=True),
+        ):
+            response = search_index(request, "searchidx")
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(str(self.alice.number), json.loads(response.content)["index"])
+
+            request = RequestFactory().get("/", HTTP_IF_NONE_MATCH=response["ETag"])
+            response = search_index(request, "searchidx")
+            self.assertEqual(response.status_code, 304)
@@ -22,9 +22,19 @@
 
 import pytest
 
+from larpmanager.models.form import (
+    BaseQuestionType,
+    QuestionApplicable,
+    WritingAnswer,
+    WritingChoice,
+    WritingOption,
+    WritingQuestion,
+    WritingQuestionType,
+)
+from larpmanager.models.miscellanea import Log
 from larpmanager.models.writing import Character
 from larpmanager.tests.unit.base import BaseTestCase
-from larpmanager.utils.io.upload import element_load
+from larpmanager.utils.io.upload import element_load, elements_load
 
 
 @pytest.mark.django_db(transaction=True)
@@ -173,3 +183,117 @@ class TestUploadFunctions(BaseTestCase):
         existing_character.refresh_from_db()
         self.assertEqual(existing_character.teaser, "New teaser")
         self.assertEqual(existing_character.event, parent_event)
+
+    def _bulk_context(self, event) -> dict:
+        """Build an upload context with a text and a choice question on characters"""
+        text_question = WritingQuestion.objects.create(
+            event=event, name="motto", applicable=QuestionApplicable.CHARACTER, typ=BaseQuestionType.TEXT
+        )
+        choice_question = WritingQuestion.objects.create(
+            event=event, name="side", applicable=QuestionApplicable.CHARACTER, typ=BaseQuestionType.SINGLE
+        )
+        light = WritingOption.objects.create(event=event, question=choice_question, name="Light")
+        WritingOption.objects.create(event=event, question=choice_question, name="Dark")
+        questions = {
+            "motto": {"id": text_question.id, "typ": BaseQuestionType.TEXT, "options": {}},
+            "side": {"id": choice_question.id, "typ": BaseQuestionType.SINGLE, "options": {"light": light.id}},
+        }
+        context = {
+            "association_id": self.get_association().id,
+            "event": event,
+            "typ": "character",
+            "field_name": "name",
+            "fields": {
+                "name": "name",
+                "teaser": "teaser",
+                "motto": BaseQuestionType.TEXT,
+                "side": BaseQuestionType.SINGLE,
+            },
+            "member": self.get_member(),
+        }
+        return context, questions, text_question, choice_question
+
+    def test_elements_load_multiple_rows(self) -> None:
+        """Test that a multi-row import creates elements, answers, choices and logs in bulk"""
+        event = self.create_event(name="Bulk Event", slug="bulkload")
+        context, questions, text_question, choice_question = self._bulk_context(event)
+        rows = [
+            {"name": "First", "teaser": "One", "motto": "Carpe diem", "side": "Light"},
+            {"name": "Second", "teaser": "Two", "motto": "Memento mori", "side": "Light"},
+            {"name": "first", "teaser": "Updated"},
+        ]
+
+        results = elements_load(context, rows, questions)
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all("OK" in result for result in results))
+        self.assertIn("Updated", results[2])
+
+        # Duplicate names in the same file update the element created by the earlier row
+        self.assertEqual(Character.objects.filter(event=event, name__iexact="first").count(), 1)
+        first = Character.objects.get(event=event, name="First")
+        self.assertEqual(first.teaser, "Updated")
+
+        self.assertEqual(WritingAnswer.objects.filter(question=text_question).count(), 2)
+        self.assertIn("Carpe diem", WritingAnswer.objects.get(question=text_question, element_id=first.id).text)
+        self.assertEqual(WritingChoice.objects.filter(question=choice_question).count(), 2)
+        # One log per element, even when several rows refer to it
+        self.assertEqual(Log.objects.filter(eid=first.id, cls="Character").count(), 1)
+
+    def test_elements_load_unknown_option(self) -> None:
+        """Test that an unknown option is reported while the rest of the row is imported"""
+        event = self.create_event(name="Option Event", slug="optionload")
+        context, questions, _text_question, choice_question = self._bulk_context(event)
+
+        results = elements_load(context, [{"name": "Lost", "side": "Grey"}], questions)
+
+        self.assertIn("couldn't find option grey", results[0])
+        self.assertTrue(Character.objects.filter(event=event, name="Lost").exists())
+        self.assertFalse(WritingChoice.objects.filter(question=choice_question).exists())
+
+    def test_elements_load_mirror_to_new_element(self) -> None:
+        """Test that a mirror can point to an element created by the same import, even one saved later"""
+        event = self.create_event(name="Mirror Event", slug="mirrorload")
+        context, questions, _text_question, _choice_question = self._bulk_context(event)
+        context["fields"]["mirror"] = WritingQuestionType.MIRROR
+        existing = self.character(event=event, name="Existing")
+        rows = [
+            {"name": "Reflection", "teaser": "Mirrored"},
+            {"name": "Original"},
+            {"name": "Second"},
+            {"name": "Reflection", "mirror": "Original"},
+            {"name": "Existing", "mirror": "Second"},
+        ]
+
+        results = elements_load(context, rows, questions)
+
+        self.assertTrue(all("OK" in result for result in results))
+        original = Character.objects.get(event=event, name="Original")
+        self.assertEqual(Character.objects.get(event=event, name="Reflection").mirror, original)
+        existing.refresh_from_db()
+        self.assertEqual(existing.mirror, Character.objects.get(event=event, name="Second"))
+
+    def test_elements_load_dry_run(self) -> None:
+        """Test that a dry run reports the same logs as a real import without writing"""
+        event = self.create_event(name="Dry Event", slug="dryload")
+        context, questions, text_question, _choice_question = self._bulk_context(event)
+        existing = self.character(event=event, name="Existing", teaser="Old")
+        rows = [
+            {"name": "Existing", "teaser": "New"},
+            {"name": "Fresh", "motto": "Hello", "side": "Light"},
+        ]
+        characters_before = Character.objects.filter(event=event).count()
+        logs_before = Log.objects.count()
+
+        dry_results = elements_load(context, rows, questions, dry_run=True)
+
+        self.assertEqual(Character.objects.filter(event=event).count(), characters_before)
+        self.assertEqual(Log.objects.count(), logs_before)
+        self.assertFalse(WritingAnswer.objects.filter(question=text_question).exists())
+        existing.refresh_from_db()
+        self.assertEqual(existing.teaser, "Old")
+
+        # The real import produces the same outcome for every row
+        self.assertEqual(elements_load(context, rows, questions), dry_results)
+        existing.refresh_from_db()
+        self.assertEqual(existing.teaser, "New")
@@ -173,6 +173,11 @@ urlpatterns = [
         views_ue.search,
         name="search",
     ),
+    path(
+        "<slug:event_slug>/search/index/",
+        views_ue.search_index,
+        name="search_index",
+    ),
     path(
         "<slug:event_slug>/limitations/",
         views_ue.limitations,
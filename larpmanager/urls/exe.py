@@ -757,6 +757,11 @@ urlpatterns = [
         views_eas.feature_description,
         name="feature_description",
     ),
+    path(
+        "manage/widget/<slug:widget_name>/",
+        views_mg.exe_manage_widget,
+        name="exe_manage_widget",
+    ),
     path(
         "manage/suggestions/<slug:perm>/",
         views_mg.exe_close_suggestion,
@@ -1675,6 +1675,16 @@ urlpatterns = [
         views_oe.orga_backup,
         name="orga_backup",
     ),
+    path(
+        "<slug:event_slug>/manage/export-job/<slug:job_uuid>/",
+        views_oe.orga_export_job,
+        name="orga_export_job",
+    ),
+    path(
+        "<slug:event_slug>/manage/export-job/<slug:job_uuid>/download/",
+        views_oe.orga_export_job_download,
+        name="orga_export_job_download",
+    ),
     path(
         "<slug:event_slug>/manage/restore/",
         views_oe.orga_restore,
@@ -1840,6 +1850,11 @@ urlpatterns = [
         views_ow.orga_export,
         name="orga_export",
     ),
+    path(
+        "<slug:event_slug>/manage/widget/<slug:widget_name>/",
+        views_mg.orga_manage_widget,
+        name="orga_manage_widget",
+    ),
     path(
         "<slug:event_slug>/manage/suggestions/<slug:perm>/",
         views_mg.orga_close_suggestion,
@@ -34,7 +34,7 @@ from larpmanager.cache.permission import (
     get_cache_index_permission,
     get_event_permission_feature,
 )
-from larpmanager.cache.role import get_cache_association_role, get_cache_event_role
+from larpmanager.cache.role import get_association_permission_index, get_event_permission_index
 from larpmanager.models.access import EventPermission
 from larpmanager.utils.auth.admin import get_allowed_managed, is_allowed_managed, is_lm_admin
 from larpmanager.utils.core.exceptions import UserPermissionError
@@ -56,9 +56,12 @@ def auto_assign_event_permission_number(event_permission: Any) -> None:
         event_permission.number = max_number + 10
 
 
-def get_association_roles(request: HttpRequest, context: dict) -> tuple[bool, dict[str, int], list[str]]:
+def get_association_roles(request: HttpRequest, context: dict) -> tuple[bool, frozenset[str], list[str]]:
     """Get association roles and permissions for the current user.
 
+    The roles are merged once in the permission index, precomputed with the
+    event links of the member, so each permission check is a set lookup.
+
     Args:
         request: Django HTTP request object containing user information
         context: Dict with context informations
@@ -66,35 +69,19 @@ def get_association_roles(request: HttpRequest, context: dict) -> tuple[bool, di
     Returns:
         tuple: A 3-tuple containing:
             - bool: True if user is admin (role 1) or superuser, False otherwise
-            - dict: Mapping of permission slugs to integer values (1 for granted)
+            - frozenset: Permission slugs granted
             - list: List of role names assigned to the user
 
     """
-    permissions = {}
-
     # Superusers have all permissions automatically
     if is_lm_admin(request):
-        return True, {}, ["superuser"]
-
-    # Get cached event context and role information
-    is_admin = False
-    role_names = []
-
-    # Process each association role assigned to the user
-    for role_number, role_data in context["association_role"].items():
-        # Role number 1 indicates admin privileges
-        if role_number == 1:
-            is_admin = True
-
-        # Extract role name and associated permission slugs
-        (role_name, permission_slugs) = get_cache_association_role(role_data)
-        role_names.append(role_name)
+        return True, frozenset(), ["superuser"]
 
-        # Grant all permissions associated with this role
-        for permission_slug in permission_slugs:
-            permissions[permission_slug] = 1
+    # Merge the roles once per request, if the event links did not precompute them
+    if "association_permission_index" not in context:
+        context["association_permission_index"] = get_association_permission_index(context["association_role"])
 
-    return is_admin, permissions, role_names
+    return context["association_permission_index"]
 
 
 def has_association_permission(request: HttpRequest, context: dict, permission: str | list[str]) -> bool:
@@ -188,9 +175,12 @@ def get_index_association_permissions(
     )
 
 
-def get_event_roles(request: HttpRequest, context: dict, slug: str) -> tuple[bool, dict[str, int], list[str]]:
+def get_event_roles(request: HttpRequest, context: dict, slug: str) -> tuple[bool, frozenset[str], list[str]]:
     """Get user's event roles and permissions for a specific event slug.
 
+    The roles are merged once in the permission index, precomputed with the
+    event links of the member, so each permission check is a set lookup.
+
     Args:
         request: Django HTTP request object with authenticated user
         context: Dict with context informations
@@ -199,42 +189,26 @@ def get_event_roles(request: HttpRequest, context: dict, slug: str) -> tuple[boo
     Returns:
         tuple: A tuple containing:
             - is_organizer (bool): True if user is an organizer for this event
-            - permissions_dict (dict[str, int]): Dictionary mapping permission slugs to values
+            - permission_slugs (frozenset[str]): Permission slugs granted for this event
             - role_names_list (list[str]): List of role names the user has for this event
 
     """
-    permission_slugs = {}
-
     # Extract base slug by splitting on hyphen and taking first part
     slug = slug.split("-", 1)[0]
 
     # Superusers have full access to all events
     if is_lm_admin(request):
-        return True, {}, ["superuser"]
+        return True, frozenset(), ["superuser"]
 
     # Get cached event context and check if user has roles for this event
     if slug not in context["event_role"]:
-        return False, {}, []
-
-    # Initialize tracking variables for user's roles in this event
-    is_organizer = False
-    role_names = []
-
-    # Process each role the user has for this event
-    for role_number, role_element in context["event_role"][slug].items():
-        # Role number 1 indicates organizer status
-        if role_number == 1:
-            is_organizer = True
-
-        # Extract role name and permission slugs from cached role data
-        (role_name, permission_slug_list) = get_cache_event_role(role_element)
-        role_names.append(role_name)
+        return False, frozenset(), []
 
-        # Add all permission slugs for this role to permissions dictionary
-        for permission_slug in permission_slug_list:
-            permission_slugs[permission_slug] = 1
+    # Merge the roles once per request, if the event links did not precompute them
+    if "event_permission_index" not in context:
+        context["event_permission_index"] = get_event_permission_index(context["event_role"])
 
-    return is_organizer, permission_slugs, role_names
+    return context["event_permission_index"][slug]
 
 
 def has_event_permission(
@@ -383,7 +357,7 @@ LITE_PERMISSIONS: frozenset[str] = frozenset(
 def get_index_permissions(  # noqa: C901, PLR0912
     context: dict,
     features: dict,
-    permissions: dict,
+    permissions: frozenset[str],
     permission_type: str,
     *,
     has_default: bool,
@@ -397,7 +371,7 @@ def get_index_permissions(  # noqa: C901, PLR0912
     Args:
         context: Context dictionary containing association information
         features: Dict of available feature slugs for the user
-        permissions: Dict of specific permission slugs the user has
+        permissions: Permission slugs the user has
         permission_type: Permission type to filter (e.g., 'association', 'event')
         has_default: Whether user has default permissions (bypasses specific checks)
 
@@ -77,6 +77,31 @@ def save_log(
     if operation_type is None:
         operation_type = LogOperationType.NEW if element_uuid is None else LogOperationType.UPDATE
 
+    _build_log(context, cls, element, operation_type, info).save()
+
+
+def save_logs(context: dict, cls: BaseModel, elements: list, *, operation_type: str, info: str | None = None) -> None:
+    """Create the log entries of several elements with a single insert.
+
+    Args:
+        context: Dict context
+        cls: Model class of the elements
+        elements: The elements being logged
+        operation_type: Type of operation (NEW/UPDATE/DELETE/BULK/UPLOAD)
+        info: Additional informations
+
+    """
+    logs = Log.objects.bulk_create([_build_log(context, cls, element, operation_type, info) for element in elements])
+
+    # Bulk inserts skip the post_save signal, so reset the widgets once for the whole batch
+    if logs:
+        from larpmanager.cache.widget import reset_widgets  # noqa: PLC0415  # circular import
+
+        reset_widgets(logs[0])
+
+
+def _build_log(context: dict, cls: BaseModel, element: Any, operation_type: str, info: str | None) -> Log:
+    """Build the (unsaved) log entry of an element."""
     # Extract element name
     element_name = ""
     if hasattr(element, "name") and element.name:
@@ -97,7 +122,7 @@ def save_log(
     if info:
         info = info[:500]
 
-    Log.objects.create(
+    return Log(
         member=context["member"],
         cls=cls.__name__,
         eid=element.id,
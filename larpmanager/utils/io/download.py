@@ -22,7 +22,7 @@ from __future__ import annotations
 import csv
 import io
 import zipfile
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from bs4 import BeautifulSoup
@@ -58,6 +58,9 @@ from larpmanager.utils.core.common import check_field
 from larpmanager.utils.edit.backend import _get_values_mapping
 from larpmanager.utils.security.csv_validation import SanitizingCsvWriter, sanitize_dataframe
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def _temp_csv_file(column_headers: Any, data_rows: Any) -> Any:
     """Create CSV content from keys and values."""
@@ -82,16 +85,21 @@ def zip_exports(context: Any, exports: Any, filename: Any) -> Any:
     """
     zip_buffer = io.BytesIO()
     with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for export_name, csv_headers, csv_rows in exports:
-            if not csv_headers or not csv_rows:
-                continue
-            zip_file.writestr(f"{export_name}.csv", _temp_csv_file(csv_headers, csv_rows))
+        write_exports(zip_file, exports)
     zip_buffer.seek(0)
     response = HttpResponse(zip_buffer.read(), content_type="application/zip")
     response["Content-Disposition"] = f"attachment; filename={context['run']!s} - {filename}.zip"
     return response
 
 
+def write_exports(zip_file: zipfile.ZipFile, exports: list[tuple[str, list, list]]) -> None:
+    """Write each non-empty (name, keys, values) export as a CSV entry of the ZIP file."""
+    for export_name, csv_headers, csv_rows in exports:
+        if not csv_headers or not csv_rows:
+            continue
+        zip_file.writestr(f"{export_name}.csv", _temp_csv_file(csv_headers, csv_rows))
+
+
 def download(context: Any, typ: Any, nm: Any) -> Any:
     """Generate downloadable ZIP export for model type."""
     exports = export_data(context, typ)
@@ -715,12 +723,6 @@ def get_writer(context: dict, nm: str) -> tuple[HttpResponse, csv.writer]:
     return response, writer
 
 
-def orga_registration_form_download(context: dict) -> HttpResponse:
-    """Download registration form data as a ZIP archive."""
-    applicable = context.get("registration_typ", RegistrationQuestionApplicable.REGISTRATION)
-    return zip_exports(context, export_registration_form(context, applicable), "Registration form")
-
-
 def export_registration_form(
     context: dict, applicable: str = RegistrationQuestionApplicable.REGISTRATION
 ) -> list[tuple[str, list, list]]:
@@ -821,11 +823,6 @@ def _extract_values(field_names: list, objects: list, field_mappings: dict) -> l
     return all_values
 
 
-def orga_character_form_download(context: dict) -> HttpResponse:
-    """Generate and download character forms as a zip archive."""
-    return zip_exports(context, export_character_form(context), "Character form")
-
-
 def export_character_form(context: dict) -> list[tuple[str, list, list]]:
     """Export character form questions and options to CSV format.
 
@@ -1482,47 +1479,65 @@ def prepare_backup(context: dict) -> HttpResponse:
     Returns:
         HttpResponse: ZIP file response containing all exported event data
 
-    Raises:
-        KeyError: If required context keys are missing
-        Exception: If export or ZIP creation fails
-
     """
-    export_files = []
+    return zip_exports(context, export_backup(context), "backup")
+
+
+def export_backup(context: dict, progress: Callable[[int], None] | None = None) -> list[tuple[str, list, list]]:
+    """Collect every export of the event backup.
+
+    Args:
+        context: Context dictionary with event, run and features
+        progress: Optional callback receiving the completion percentage after each step
 
-    # Export core event data
-    export_files.extend(export_event(context))
+    Returns:
+        List of (name, keys, values) export tuples
 
-    # Export registration-related data
-    export_files.extend(export_data(context, Registration))
-    export_files.extend(export_registration_form(context))
-    export_files.extend(export_tickets(context))
+    """
+    export_steps = get_backup_steps(context)
+    export_files = []
+    for step_index, export_step in enumerate(export_steps, start=1):
+        export_files.extend(export_step(context))
+        if progress:
+            progress(int(step_index * 100 / len(export_steps)))
+    return export_files
+
+
+def get_backup_steps(context: dict) -> list[Callable[[dict], list]]:
+    """Return the export functions making up the backup, based on enabled features."""
+    # Core event and registration-related data
+    export_steps = [
+        export_event,
+        lambda ctx: export_data(ctx, Registration),
+        export_registration_form,
+        export_tickets,
+    ]
 
-    # Export character data if feature is enabled
+    # Character data if feature is enabled
     if "character" in context["features"]:
-        export_files.extend(export_data(context, Character))
-        export_files.extend(export_character_form(context))
-        export_files.extend(export_character_configs(context))
+        export_steps.extend([lambda ctx: export_data(ctx, Character), export_character_form, export_character_configs])
 
-    # Export faction data if feature is enabled
+    # Faction data if feature is enabled
     if "faction" in context["features"]:
-        export_files.extend(export_data(context, Faction))
+        export_steps.append(lambda ctx: export_data(ctx, Faction))
 
-    # Export plot data if feature is enabled
+    # Plot data if feature is enabled
     if "plot" in context["features"]:
-        export_files.extend(export_data(context, Plot))
+        export_steps.append(lambda ctx: export_data(ctx, Plot))
 
-    # Export experience/abilities data if feature is enabled
+    # Experience/abilities data if feature is enabled
     if "experience" in context["features"]:
-        export_files.extend(export_abilities(context))
-        export_files.extend(export_deliveries(context))
-        # Exported regardless of the criterions config, so that backup and restore stay symmetric
-        export_files.extend(export_criterions(context))
+        # Criterions are exported regardless of their config, so that backup and restore stay symmetric
+        export_steps.extend([export_abilities, export_deliveries, export_criterions])
 
-    # Export quest builder data if feature is enabled
+    # Quest builder data if feature is enabled
     if "questbuilder" in context["features"]:
-        export_files.extend(export_data(context, QuestType))
-        export_files.extend(export_data(context, Quest))
-        export_files.extend(export_data(context, Trait))
+        export_steps.extend(
+            [
+                lambda ctx: export_data(ctx, QuestType),
+                lambda ctx: export_data(ctx, Quest),
+                lambda ctx: export_data(ctx, Trait),
+            ]
+        )
 
-    # Create and return ZIP file with all exports
-    return zip_exports(context, export_files, "backup")
+    return export_steps
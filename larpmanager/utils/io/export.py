@@ -0,0 +1,324 @@
+# LarpManager - https://larpmanager.com
+# Copyright (C) 2025 Scanagatta Mauro
+#
+# This file is part of LarpManager and is dual-licensed:
+#
+# 1. Under the terms of the GNU Affero General Public License (AGPL) version 3,
+#    as published by the Free Software Foundation. You may use, modify, and
+#    distribute this file under those terms.
+#
+# 2. Under a commercial license, allowing use in closed-source or proprietary
+#    environments without the obligations of the AGPL.
+#
+# If you have obtained this file under the AGPL, and you make it available over
+# a network, you must also make the complete source code available under the same license.
+#
+# For more information or to purchase a commercial license, contact:
+# commercial@larpmanager.com
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
+"""Background export jobs.
+
+Large exports are built by a background task instead of the web worker: the job
+row tracks status and progress, the artifact is written to the media storage and
+expires after a while, and the requester is notified when it is ready. The
+fingerprint of the event data is stored with the job, so an export requested
+again on unchanged data is served from the previous artifact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import zipfile
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings as conf_settings
+from django.db.models import Count, Max, Q
+from django.http import FileResponse, HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import activate, gettext_lazy as _
+
+from larpmanager.models.association import get_url, hdr
+from larpmanager.models.casting import Quest, QuestType, Trait
+from larpmanager.models.event import Event, EventConfig, Run, RunConfig
+from larpmanager.models.experience import AbilityExp, CriterionExp, DeliveryExp, ModifierExp, RuleExp
+from larpmanager.models.form import (
+    RegistrationAnswer,
+    RegistrationChoice,
+    RegistrationOption,
+    RegistrationQuestion,
+    RegistrationQuestionApplicable,
+    WritingAnswer,
+    WritingChoice,
+    WritingOption,
+    WritingQuestion,
+)
+from larpmanager.models.member import Member
+from larpmanager.models.miscellanea import ExportJob, ExportJobStatus, ExportJobType
+from larpmanager.models.registration import Registration, RegistrationCharacterRel, RegistrationTicket
+from larpmanager.models.writing import Character, CharacterConfig, Faction, Plot, PlotCharacterRel, Relationship
+from larpmanager.utils.core.base import get_event_context
+from larpmanager.utils.io.download import export_backup, export_character_form, export_registration_form, write_exports
+from larpmanager.utils.io.pdf import get_fake_request
+from larpmanager.utils.larpmanager.tasks import background_auto, my_send_mail
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Days an artifact stays downloadable
+EXPORT_JOB_EXPIRY_DAYS = 7
+
+# A job still pending or running after this long is considered lost, and a new one is started
+EXPORT_JOB_STALE_HOURS = 6
+
+# Permission required to start and download each kind of export
+EXPORT_JOB_PERMISSIONS = {
+    ExportJobType.BACKUP: "orga_event",
+    ExportJobType.REGISTRATION_FORM: "orga_registration_form",
+    ExportJobType.CHARACTER_FORM: "orga_character_form",
+}
+
+_FORM_SOURCES = {
+    ExportJobType.REGISTRATION_FORM: [(RegistrationQuestion, "event_id"), (RegistrationOption, "event_id")],
+    ExportJobType.CHARACTER_FORM: [(WritingQuestion, "event_id"), (WritingOption, "event_id")],
+}
+
+_WRITING_SOURCES = [
+    (Event, "id"),
+    (EventConfig, "event_id"),
+    (Run, "event_id"),
+    (RunConfig, "run__event_id"),
+    (Character, "event_id"),
+    (CharacterConfig, "character__event_id"),
+    (Faction, "event_id"),
+    (Plot, "event_id"),
+    (PlotCharacterRel, "plot__event_id"),
+    (Relationship, "source__event_id"),
+    (WritingQuestion, "event_id"),
+    (WritingOption, "event_id"),
+    (WritingAnswer, "question__event_id"),
+    (WritingChoice, "question__event_id"),
+    (Registration, "run__event_id"),
+    (RegistrationCharacterRel, "registration__run__event_id"),
+    # Registrations and characters are exported with the name and data of their member
+    (Member, "registrations__run__event_id"),
+    (Member, "characters_player__event_id"),
+]
+
+# Models whose rows end up in each export, with the lookup reaching their event
+EXPORT_JOB_SOURCES = {
+    **_FORM_SOURCES,
+    ExportJobType.BACKUP: [
+        *_WRITING_SOURCES,
+        (RegistrationTicket, "event_id"),
+        (RegistrationQuestion, "event_id"),
+        (RegistrationOption, "event_id"),
+        (RegistrationAnswer, "registration__run__event_id"),
+        (RegistrationChoice, "registration__run__event_id"),
+        (AbilityExp, "event_id"),
+        (DeliveryExp, "event_id"),
+        (CriterionExp, "event_id"),
+        (RuleExp, "event_id"),
+        (ModifierExp, "event_id"),
+        (QuestType, "event_id"),
+        (Quest, "event_id"),
+        (Trait, "event_id"),
+    ],
+}
+
+
+def get_export_fingerprint(context: dict, typ: str, params: dict) -> str:
+    """Compute a digest of the event data an export is built from.
+
+    For every source model, the last update time and the row count are read,
+    soft deleted rows included: an edit or a soft delete moves the former, a hard
+    delete the latter. Parent events are included, since campaign events inherit
+    their elements.
+
+    Args:
+        context: Context dictionary with event and features
+        typ: Export job type
+        params: Export parameters
+
+    Returns:
+        Hex digest identifying the current state of the exported data
+
+    """
+    event = context["event"]
+    event_ids = [event.id]
+    if event.parent_id:
+        event_ids.append(event.parent_id)
+
+    digest = hashlib.sha256()
+    digest.update(f"{typ}|{sorted(params.items())}|{sorted(context['features'])}".encode())
+    for model_class, event_lookup in EXPORT_JOB_SOURCES[typ]:
+        stats = model_class.all_objects.filter(**{f"{event_lookup}__in": event_ids}).aggregate(
+            last=Max("updated"),
+            total=Count("id"),
+        )
+        digest.update(f"|{model_class.__name__}:{stats['last']}:{stats['total']}".encode())
+    return digest.hexdigest()
+
+
+def get_export_artifact_path(job: ExportJob) -> Path:
+    """Return the filesystem path of the ZIP artifact of a job."""
+    return Path(conf_settings.MEDIA_ROOT) / "exports" / job.run.media_token / f"{job.uuid}.zip"
+
+
+def start_export_job(context: dict, typ: str, params: dict | None = None) -> ExportJob:
+    """Return the job serving an export request, starting a new one only if needed.
+
+    A completed job built on the same data is reused as is, and a job already in
+    progress for the same export is returned instead of queueing a duplicate.
+
+    Args:
+        context: Context dictionary with event, run, features and member
+        typ: Export job type
+        params: Export parameters, for example the registration form type
+
+    Returns:
+        ExportJob whose artifact is, or will be, the requested export
+
+    """
+    params = params or {}
+    fingerprint = get_export_fingerprint(context, typ, params)
+    jobs = ExportJob.objects.filter(run=context["run"], typ=typ, params=params)
+
+    # Reuse the artifact of the last export, if the data did not change since then
+    last_done = jobs.filter(status=ExportJobStatus.DONE, fingerprint=fingerprint).order_by("-created").first()
+    if last_done and last_done.is_ready():
+        return last_done
+
+    # Attach to an export already in progress
+    stale_limit = timezone.now() - timedelta(hours=EXPORT_JOB_STALE_HOURS)
+    in_progress = (
+        jobs.filter(status__in=[ExportJobStatus.PENDING, ExportJobStatus.RUNNING], created__gte=stale_limit)
+        .order_by("-created")
+        .first()
+    )
+    if in_progress:
+        return in_progress
+
+    job = ExportJob.objects.create(
+        run=context["run"],
+        member=context.get("member"),
+        typ=typ,
+        params=params,
+        fingerprint=fingerprint,
+    )
+    run_export_job(job.id)
+
+    # Reload, so that an export completed in the foreground is seen as such
+    job.refresh_from_db()
+    return job
+
+
+@background_auto(queue="export")
+def run_export_job(job_id: int) -> None:
+    """Build the artifact of an export job, tracking its progress.
+
+    Args:
+        job_id: Primary key of the ExportJob to run
+
+    Side Effects:
+        Writes the ZIP artifact to the media storage, updates the job status and
+        notifies the requester once done
+
+    """
+    job = ExportJob.objects.select_related("run__event__association", "member").filter(pk=job_id).first()
+    if not job or job.status != ExportJobStatus.PENDING:
+        return
+
+    ExportJob.objects.filter(pk=job.pk).update(status=ExportJobStatus.RUNNING, progress=0)
+
+    def progress(percentage: int) -> None:
+        ExportJob.objects.filter(pk=job.pk).update(progress=min(percentage, 99))
+
+    artifact_path = get_export_artifact_path(job)
+    artifact_path.parent.mkdir(mode=0o770, parents=True, exist_ok=True)
+    temp_path = artifact_path.with_suffix(".tmp")
+    try:
+        request = get_fake_request(job.run.event.association.slug)
+        context = get_event_context(request, job.run.get_slug(), check_visibility=False)
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            _write_export(job, context, zip_file, progress)
+        temp_path.rename(artifact_path)
+    except Exception as error:
+        logger.exception("Export job %s failed", job.uuid)
+        temp_path.unlink(missing_ok=True)
+        ExportJob.objects.filter(pk=job.pk).update(status=ExportJobStatus.FAILED, error=str(error))
+        return
+
+    ExportJob.objects.filter(pk=job.pk).update(
+        status=ExportJobStatus.DONE,
+        progress=100,
+        artifact=str(artifact_path),
+        expires=timezone.now() + timedelta(days=EXPORT_JOB_EXPIRY_DAYS),
+    )
+
+    if job.member:
+        send_export_ready_email(job, job.member)
+
+
+def _write_export(
+    job: ExportJob,
+    context: dict,
+    zip_file: zipfile.ZipFile,
+    progress: Callable[[int], None],
+) -> None:
+    """Write the content of the export requested by the job into the ZIP file."""
+    if job.typ == ExportJobType.BACKUP:
+        write_exports(zip_file, export_backup(context, progress))
+    elif job.typ == ExportJobType.REGISTRATION_FORM:
+        applicable = job.params.get("applicable", RegistrationQuestionApplicable.REGISTRATION)
+        write_exports(zip_file, export_registration_form(context, applicable))
+    elif job.typ == ExportJobType.CHARACTER_FORM:
+        write_exports(zip_file, export_character_form(context))
+
+
+def send_export_ready_email(job: ExportJob, member: Member) -> None:
+    """Notify the requester that the export artifact can be downloaded."""
+    activate(member.language)
+    run = job.run
+    subject = hdr(run.event) + _("Export ready: %(type)s for %(event)s") % {
+        "type": job.get_typ_display(),
+        "event": run,
+    }
+    url = get_url(reverse("orga_export_job", kwargs={"event_slug": run.get_slug(), "job_uuid": job.uuid}), run.event)
+    body = _("The export you requested is ready, <a href='%(url)s'>download it here</a>.") % {"url": url}
+    body += "<br /><br />" + _("The file will be available for %(days)s days.") % {"days": EXPORT_JOB_EXPIRY_DAYS}
+    my_send_mail(subject, body, member, run)
+
+
+def serve_export_job(job: ExportJob) -> FileResponse:
+    """Return the artifact of a completed job as a file download."""
+    return FileResponse(
+        Path(job.artifact).open("rb"),
+        content_type="application/zip",
+        as_attachment=True,
+        filename=f"{job.run!s} - {job.get_typ_display()}.zip",
+    )
+
+
+def export_job_response(job: ExportJob, event_slug: str) -> HttpResponse:
+    """Serve the export if already available, otherwise show its progress page."""
+    if job.is_ready():
+        return serve_export_job(job)
+    return redirect("orga_export_job", event_slug=event_slug, job_uuid=job.uuid)
+
+
+def clean_export_jobs() -> None:
+    """Delete the artifacts of expired export jobs from the media storage."""
+    expired_jobs = ExportJob.objects.filter(expires__lt=timezone.now()).exclude(
+        Q(artifact="") | Q(artifact__isnull=True)
+    )
+    for job in expired_jobs:
+        Path(job.artifact).unlink(missing_ok=True)
+    expired_jobs.update(artifact="")
@@ -46,7 +46,7 @@ from xhtml2pdf import pisa
 from larpmanager.cache.association import get_cache_association
 from larpmanager.cache.association_text import get_association_text
 from larpmanager.cache.character import get_event_cache_all
-from larpmanager.cache.config import get_association_config, get_event_config
+from larpmanager.cache.config import get_association_config, get_event_configs
 from larpmanager.cache.media import (
     get_character_media_filepath,
     get_handout_media_filepath,
@@ -102,11 +102,8 @@ def fix_filename(filename: Any) -> Any:
 
 def has_pdf_customization(event_id: int) -> bool:
     """Return True if event has any custom PDF styling configured."""
-    for key in ["page_css", "header_content", "footer_content"]:
-        value = get_event_config(event_id, key)
-        if value and str(value).strip():
-            return True
-    return False
+    values = get_event_configs(event_id, ["page_css", "header_content", "footer_content"])
+    return any(value and str(value).strip() for value in values.values())
 
 
 # reprint if file not exists, older than 1 day, or debug
@@ -244,13 +241,14 @@ def add_pdf_instructions(context: dict) -> None:
 
     """
     # Extract PDF configuration from event settings
-    for instruction_key in ["page_css", "header_content", "footer_content"]:
-        context[instruction_key] = get_event_config(
+    context.update(
+        get_event_configs(
             context["event"].id,
-            instruction_key,
+            ["page_css", "header_content", "footer_content"],
             context=context,
             bypass_cache=True,
         )
+    )
 
     # Build replacement codes dictionary with event and character data
     replacement_codes = {
@@ -19,7 +19,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 from __future__ import annotations
 
+import gzip
 import io
+import json
 import logging
 import uuid
 import zipfile
@@ -31,6 +33,7 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
 
+from larpmanager.cache.config import reset_character_configs
 from larpmanager.models.base import Feature
 from larpmanager.models.casting import QuestType
 from larpmanager.models.event import EventConfig, RunConfig
@@ -45,6 +48,7 @@ from larpmanager.models.form import (
 from larpmanager.models.registration import Registration, RegistrationTicket
 from larpmanager.models.writing import Character, CharacterConfig, Plot, PlotCharacterRel, Relationship
 from larpmanager.utils.io.upload import (
+    ParsedCsv,
     _get_row_number,
     abilities_load,
     criterions_load,
@@ -54,77 +58,110 @@ from larpmanager.utils.io.upload import (
     tickets_load,
     writing_load,
 )
+from larpmanager.utils.security import sanitize_dataframe
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Helpers: fake file/form objects to reuse existing upload functions
+# Helpers: fake form objects to reuse existing upload functions
 # ---------------------------------------------------------------------------
 
 
-class _FakeFile:
-    """Wrap raw bytes to mimic a Django UploadedFile for existing load functions."""
-
-    def __init__(self, data: bytes) -> None:
-        self._buf = io.BytesIO(data)
-        self.size = len(data)
-
-    def seek(self, n: int) -> int:
-        return self._buf.seek(n)
-
-    def read(self) -> bytes:
-        return self._buf.read()
+def _as_upload(data: pd.DataFrame | None) -> ParsedCsv | None:
+    """Wrap already parsed rows so the load functions skip the CSV parsing."""
+    return ParsedCsv(data) if isinstance(data, pd.DataFrame) else data
 
 
 class _FakeForm:
     """Mimic a validated Django Form with cleaned_data for existing load functions."""
 
-    def __init__(self, first: _FakeFile | None = None, second: _FakeFile | None = None) -> None:
-        self.cleaned_data: dict[str, _FakeFile | None] = {"first": first, "second": second}
+    def __init__(self, first: pd.DataFrame | None = None, second: pd.DataFrame | None = None) -> None:
+        self.cleaned_data: dict[str, ParsedCsv | None] = {
+            "first": _as_upload(first),
+            "second": _as_upload(second),
+        }
 
 
 # ---------------------------------------------------------------------------
-# Temp storage: save/load the uploaded ZIP between preview and confirm steps
+# Restore plan: the CSV files of the backup, parsed once on preview.
+# Stored as {stem: {"columns": [...], "rows": [[...], ...]}}, with None for empty cells
 # ---------------------------------------------------------------------------
 
 _TMP_DIR_NAME = "tmp_restore"
 
 
-def save_restore_temp(zip_bytes: bytes) -> str:
-    """Save ZIP bytes to a temp file, return the unique key."""
+def _restore_temp_path(key: str) -> Path | None:
+    """Return the path of the temp plan for the key, None if the key is not valid."""
+    try:
+        key = str(uuid.UUID(key))
+    except (TypeError, ValueError):
+        return None
+    return Path(settings.MEDIA_ROOT) / _TMP_DIR_NAME / f"{key}.json.gz"
+
+
+def save_restore_temp(plan: dict[str, dict]) -> str:
+    """Save the restore plan to a compressed temp file, return the unique key."""
     key = str(uuid.uuid4())
-    path = Path(settings.MEDIA_ROOT) / _TMP_DIR_NAME / f"{key}.zip"
+    path = _restore_temp_path(key)
     path.parent.mkdir(mode=0o770, parents=True, exist_ok=True)
-    path.write_bytes(zip_bytes)
+    path.write_bytes(gzip.compress(json.dumps(plan, separators=(",", ":")).encode("utf-8")))
     return key
 
 
-def load_restore_temp(key: str) -> bytes | None:
-    """Load and delete the temp ZIP file; returns None if expired/missing."""
-    path = Path(settings.MEDIA_ROOT) / _TMP_DIR_NAME / f"{key}.zip"
-    if not path.exists():
+def load_restore_temp(key: str) -> dict[str, dict] | None:
+    """Load and delete the temp restore plan; returns None if expired/missing."""
+    path = _restore_temp_path(key)
+    if path is None or not path.exists():
         return None
     data = path.read_bytes()
     path.unlink(missing_ok=True)
-    return data
-
+    return json.loads(gzip.decompress(data))
 
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
 
-
-def _read_df(zip_file: zipfile.ZipFile, filename: str) -> pd.DataFrame | None:
-    """Read a CSV from the open ZipFile, return DataFrame or None."""
+def _read_plan_file(zip_file: zipfile.ZipFile, filename: str) -> dict | None:
+    """Read a CSV from the open ZipFile into a plan entry, None if unreadable or empty."""
     try:
         raw = zip_file.read(filename)
-        df = pd.read_csv(io.BytesIO(raw), dtype=str).fillna("")
-        df.columns = [c.lower().strip() for c in df.columns]
+        df = pd.read_csv(io.BytesIO(raw), dtype=str)
     except Exception:
         logger.exception("Failed to read %s from ZIP", filename)
         return None
-    else:
-        return df
+    if df.empty:
+        return None
+
+    # Sanitize once here, the loaders receive the rows already parsed
+    df = sanitize_dataframe(df)
+    df = df.astype(object).where(df.notna(), None)
+    return {"columns": [str(c).lower().strip() for c in df.columns], "rows": df.to_numpy().tolist()}
+
+
+def build_restore_plan(zip_bytes: bytes) -> dict[str, dict]:
+    """Open ZIP and return the restore plan, with an entry for every non-empty .csv file found."""
+    plan: dict[str, dict] = {}
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
+        for info in z.infolist():
+            if not info.filename.lower().endswith(".csv"):
+                continue
+            stem = Path(info.filename).stem.lower()
+            entry = _read_plan_file(z, info.filename)
+            if entry is not None:
+                plan[stem] = entry
+    return plan
+
+
+def _frame(plan: dict[str, dict], stem: str, *, keep_missing: bool = False) -> pd.DataFrame | None:
+    """Build the DataFrame of a plan entry, None if the backup has no such file.
+
+    Empty cells become empty strings, or NaN with keep_missing, as the upload
+    loaders expect from a parsed CSV.
+    """
+    entry = plan.get(stem)
+    if entry is None:
+        return None
+    df = pd.DataFrame(entry["rows"], columns=entry["columns"], dtype=object)
+    if keep_missing:
+        return df.where(df.notna(), float("nan"))
+    return df.fillna("")
 
 
 def _section(label: str, creates: list, updates: list, skips: list) -> dict:
@@ -139,13 +176,6 @@ def _cell(row: pd.Series, column: str) -> str:
     return str(value).strip()
 
 
-def _fake_csv(df: pd.DataFrame) -> _FakeFile:
-    """Serialize a DataFrame back to CSV bytes wrapped in _FakeFile."""
-    buf = io.StringIO()
-    df.to_csv(buf, index=False)
-    return _FakeFile(buf.getvalue().encode("utf-8"))
-
-
 # ---------------------------------------------------------------------------
 # Preview functions: read-only, return section dicts
 # ---------------------------------------------------------------------------
@@ -428,7 +458,7 @@ def _preview_relationships(context: dict, df: pd.DataFrame) -> dict:
 
 
 # ---------------------------------------------------------------------------
-# Execute functions: delegate to existing upload functions via FakeFile/FakeForm
+# Execute functions: apply the plan, through the upload functions where they exist
 # ---------------------------------------------------------------------------
 
 
@@ -438,6 +468,10 @@ def _exec_configuration(context: dict, df: pd.DataFrame) -> list[str]:
     if "source" not in df.columns:
         df["source"] = "event"
 
+    # Load the current configs once; each save resets the config caches, so unchanged values are not saved
+    event_configs = {cfg.name: cfg for cfg in EventConfig.objects.filter(event=event, deleted__isnull=True)}
+    run_configs = {cfg.name: cfg for cfg in RunConfig.objects.filter(run=run, deleted__isnull=True)}
+
     logs: list[str] = []
     for _idx, row in df.iterrows():
         source = str(row.get("source", "event")).strip()
@@ -446,23 +480,25 @@ def _exec_configuration(context: dict, df: pd.DataFrame) -> list[str]:
         if not name:
             continue
         if source == "event":
-            try:
-                cfg = EventConfig.objects.get(event=event, name=name, deleted__isnull=True)
+            cfg = event_configs.get(name)
+            if cfg is None:
+                event_configs[name] = EventConfig.objects.create(event=event, name=name, value=value)
+                logs.append(f"OK - Created event config: {name}")
+                continue
+            if cfg.value != value:
                 cfg.value = value
                 cfg.save()
-                logs.append(f"OK - Updated event config: {name}")
-            except EventConfig.DoesNotExist:
-                EventConfig.objects.create(event=event, name=name, value=value)
-                logs.append(f"OK - Created event config: {name}")
+            logs.append(f"OK - Updated event config: {name}")
         elif source == "run":
-            try:
-                cfg = RunConfig.objects.get(run=run, name=name, deleted__isnull=True)
+            cfg = run_configs.get(name)
+            if cfg is None:
+                run_configs[name] = RunConfig.objects.create(run=run, name=name, value=value)
+                logs.append(f"OK - Created run config: {name}")
+                continue
+            if cfg.value != value:
                 cfg.value = value
                 cfg.save()
-                logs.append(f"OK - Updated run config: {name}")
-            except RunConfig.DoesNotExist:
-                RunConfig.objects.create(run=run, name=name, value=value)
-                logs.append(f"OK - Created run config: {name}")
+            logs.append(f"OK - Updated run config: {name}")
         else:
             logs.append(f"SKIP - {source} config (read-only): {name}")
     return logs
@@ -474,6 +510,8 @@ def _exec_features(context: dict, df: pd.DataFrame) -> list[str]:
         df["source"] = "event"
 
     existing = set(event.features.values_list("slug", flat=True))
+    known = {feature.slug: feature for feature in Feature.objects.all()}
+    to_add: dict[str, Feature] = {}
     logs: list[str] = []
     for _idx, row in df.iterrows():
         source = str(row.get("source", "event")).strip()
@@ -483,23 +521,32 @@ def _exec_features(context: dict, df: pd.DataFrame) -> list[str]:
         slug = str(row.get("slug", "")).strip()
         if not slug:
             continue
-        if slug in existing:
+        if slug in existing or slug in to_add:
             logs.append(f"SKIP - feature already present: {slug}")
             continue
-        try:
-            feature = Feature.objects.get(slug=slug)
-            event.features.add(feature)
+        if slug in known:
+            to_add[slug] = known[slug]
             logs.append(f"OK - Added feature: {slug}")
-        except Feature.DoesNotExist:
+        else:
             logs.append(f"ERR - Feature not found in system: {slug}")
+
+    # Single m2m update, so the features caches are reset once
+    if to_add:
+        event.features.add(*to_add.values())
     return logs
 
 
 def _exec_character_config(context: dict, df: pd.DataFrame) -> list[str]:
     event_id = context["event"].get_class_parent(Character)
     char_map = {c.number: c for c in Character.objects.filter(event_id=event_id, deleted__isnull=True)}
+    existing = {
+        (cfg.character_id, cfg.name): cfg
+        for cfg in CharacterConfig.objects.filter(character__event_id=event_id, deleted__isnull=True)
+    }
 
     logs: list[str] = []
+    to_create: dict[tuple[int, str], CharacterConfig] = {}
+    to_update: dict[int, CharacterConfig] = {}
     for _idx, row in df.iterrows():
         try:
             num = int(str(row.get("character_number", "")).strip())
@@ -512,14 +559,22 @@ def _exec_character_config(context: dict, df: pd.DataFrame) -> list[str]:
         if char is None:
             logs.append(f"ERR - character #{num} not found")
             continue
-        try:
-            cfg = CharacterConfig.objects.get(character=char, name=name, deleted__isnull=True)
-            cfg.value = value
-            cfg.save()
-            logs.append(f"OK - Updated character #{num} config: {name}")
-        except CharacterConfig.DoesNotExist:
-            CharacterConfig.objects.create(character=char, name=name, value=value)
+        cfg = existing.get((char.id, name)) or to_create.get((char.id, name))
+        if cfg is None:
+            to_create[(char.id, name)] = CharacterConfig(character=char, name=name, value=value)
             logs.append(f"OK - Created character #{num} config: {name}")
+            continue
+        if cfg.value != value:
+            cfg.value = value
+            if cfg.pk:
+                to_update[cfg.pk] = cfg
+        logs.append(f"OK - Updated character #{num} config: {name}")
+
+    # Bulk writes skip the save signal: reset the configs cache of the characters touched
+    CharacterConfig.objects.bulk_create(to_create.values())
+    CharacterConfig.objects.bulk_update(to_update.values(), ["value"])
+    for character_id in {cfg.character_id for cfg in [*to_create.values(), *to_update.values()]}:
+        reset_character_configs(character_id)
     return logs
 
 
@@ -552,11 +607,9 @@ def _exec_questtype(context: dict, df: pd.DataFrame) -> list[str]:
 
 
 def _exec_writing(context: dict, df_main: pd.DataFrame, typ: str, df_second: pd.DataFrame | None = None) -> list[str]:
-    """Delegate to writing_load via FakeFile/FakeForm."""
+    """Delegate to writing_load via FakeForm."""
     ctx = {**context, "typ": typ}
-    first_file = _fake_csv(df_main)
-    second_file = _fake_csv(df_second) if df_second is not None else None
-    return writing_load(ctx, _FakeForm(first=first_file, second=second_file))
+    return writing_load(ctx, _FakeForm(first=df_main, second=df_second))
 
 
 def _exec_registration_form(
@@ -564,77 +617,55 @@ def _exec_registration_form(
 ) -> list[str]:
     typ = "registration_form" if is_registration else "character_form"
     ctx = {**context, "typ": typ}
-    q_file = _fake_csv(df_q)
-    o_file = _fake_csv(df_o) if df_o is not None else None
-    return form_load(ctx, _FakeForm(first=q_file, second=o_file), is_registration=is_registration)
+    return form_load(ctx, _FakeForm(first=df_q, second=df_o), is_registration=is_registration)
 
 
 def _exec_tickets(context: dict, df: pd.DataFrame) -> list[str]:
     ctx = {**context, "typ": "registration_ticket"}
-    return tickets_load(ctx, _FakeForm(first=_fake_csv(df)))
+    return tickets_load(ctx, _FakeForm(first=df))
 
 
 def _exec_abilities(context: dict, df: pd.DataFrame) -> list[str]:
     ctx = {**context, "typ": "exp_abilitie"}
-    return abilities_load(ctx, _FakeForm(first=_fake_csv(df)))
+    return abilities_load(ctx, _FakeForm(first=df))
 
 
 def _exec_criterions(context: dict, df: pd.DataFrame) -> list[str]:
     ctx = {**context, "typ": "exp_criterion"}
-    return criterions_load(ctx, _FakeForm(first=_fake_csv(df)))
+    return criterions_load(ctx, _FakeForm(first=df))
 
 
 def _exec_deliveries(context: dict, df: pd.DataFrame) -> list[str]:
     ctx = {**context, "typ": "exp_deliverie"}
-    return deliveries_load(ctx, _FakeForm(first=_fake_csv(df)))
+    return deliveries_load(ctx, _FakeForm(first=df))
 
 
 def _exec_registration(context: dict, df: pd.DataFrame) -> list[str]:
     ctx = {**context, "typ": "registration"}
-    return registrations_load(ctx, _FakeForm(first=_fake_csv(df)))
+    return registrations_load(ctx, _FakeForm(first=df))
 
 
-# ---------------------------------------------------------------------------
-# ZIP parsing: build filename -> DataFrame mapping
-# ---------------------------------------------------------------------------
-
 _WRITING_TYPES = {"character", "faction", "plot", "quest", "trait", "prologue"}
 
 
-def _parse_zip(zip_bytes: bytes) -> dict[str, pd.DataFrame]:
-    """Open ZIP and return {stem: DataFrame} for every .csv file found."""
-    dfs: dict[str, pd.DataFrame] = {}
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
-        for info in z.infolist():
-            if not info.filename.lower().endswith(".csv"):
-                continue
-            stem = Path(info.filename).stem.lower()
-            df = _read_df(z, info.filename)
-            if df is not None and not df.empty:
-                dfs[stem] = df
-    return dfs
-
-
 # ---------------------------------------------------------------------------
 # Preview helpers to keep preview_restore under complexity limit
 # ---------------------------------------------------------------------------
 
 
-def _preview_writing_types(
-    context: dict, dfs: dict[str, pd.DataFrame], sections: list[dict], handled: set[str]
-) -> None:
+def _preview_writing_types(context: dict, plan: dict[str, dict], sections: list[dict], handled: set[str]) -> None:
     for typ in _WRITING_TYPES:
-        if typ not in dfs:
+        if typ not in plan:
             continue
-        sec = _preview_writing(context, dfs[typ], typ)
-        if typ == "character" and "relationships" in dfs:
-            rels = _preview_relationships(context, dfs["relationships"])
+        sec = _preview_writing(context, _frame(plan, typ), typ)
+        if typ == "character" and "relationships" in plan:
+            rels = _preview_relationships(context, _frame(plan, "relationships"))
             sec["creates"] += rels["creates"]
             sec["updates"] += rels["updates"]
             sec["skips"] += rels["skips"]
             handled.add("relationships")
-        if typ == "plot" and "plot_rels" in dfs:
-            pr = _preview_plot_rels(context, dfs["plot_rels"])
+        if typ == "plot" and "plot_rels" in plan:
+            pr = _preview_plot_rels(context, _frame(plan, "plot_rels"))
             sec["creates"] += pr["creates"]
             sec["updates"] += pr["updates"]
             sec["skips"] += pr["skips"]
@@ -643,16 +674,16 @@ def _preview_writing_types(
         handled.add(typ)
 
 
-def _preview_form_sections(
-    context: dict, dfs: dict[str, pd.DataFrame], sections: list[dict], handled: set[str]
-) -> None:
-    if "registration_questions" in dfs:
-        sec = _preview_registration_form(context, dfs["registration_questions"], dfs.get("registration_options"))
+def _preview_form_sections(context: dict, plan: dict[str, dict], sections: list[dict], handled: set[str]) -> None:
+    if "registration_questions" in plan:
+        sec = _preview_registration_form(
+            context, _frame(plan, "registration_questions"), _frame(plan, "registration_options")
+        )
         sections.append(sec)
         handled.add("registration_questions")
         handled.add("registration_options")
-    if "writing_questions" in dfs:
-        sec = _preview_character_form(context, dfs["writing_questions"], dfs.get("writing_options"))
+    if "writing_questions" in plan:
+        sec = _preview_character_form(context, _frame(plan, "writing_questions"), _frame(plan, "writing_options"))
         sections.append(sec)
         handled.add("writing_questions")
         handled.add("writing_options")
@@ -662,54 +693,47 @@ def _preview_form_sections(
 # Public API: preview_restore and execute_restore
 # ---------------------------------------------------------------------------
 
+# Files previewed with a single-file function, in order
+_PREVIEW_FILES = {
+    "configuration": _preview_configuration,
+    "features": _preview_features,
+    "tickets": _preview_tickets,
+}
 
-def preview_restore(context: dict, zip_bytes: bytes) -> tuple[list[dict], list[str]]:
-    """Parse ZIP and return (sections, unknown_files) without modifying the DB."""
-    dfs = _parse_zip(zip_bytes)
+
+def preview_restore(context: dict, plan: dict[str, dict]) -> tuple[list[dict], list[str]]:
+    """Return (sections, unknown_files) of the restore plan without modifying the DB."""
     sections: list[dict] = []
     handled: set[str] = set()
 
-    if "configuration" in dfs:
-        sections.append(_preview_configuration(context, dfs["configuration"]))
-        handled.add("configuration")
-
-    if "features" in dfs:
-        sections.append(_preview_features(context, dfs["features"]))
-        handled.add("features")
+    for stem, preview in _PREVIEW_FILES.items():
+        if stem in plan:
+            sections.append(preview(context, _frame(plan, stem)))
+            handled.add(stem)
 
-    if "tickets" in dfs:
-        sections.append(_preview_tickets(context, dfs["tickets"]))
-        handled.add("tickets")
+    _preview_form_sections(context, plan, sections, handled)
 
-    _preview_form_sections(context, dfs, sections, handled)
-
-    if "character_config" in dfs:
-        sections.append(_preview_character_config(context, dfs["character_config"]))
+    if "character_config" in plan:
+        sections.append(_preview_character_config(context, _frame(plan, "character_config")))
         handled.add("character_config")
 
-    if "registration" in dfs:
-        sections.append(_preview_registration(context, dfs["registration"]))
+    if "registration" in plan:
+        sections.append(_preview_registration(context, _frame(plan, "registration")))
         handled.add("registration")
 
-    _preview_writing_types(context, dfs, sections, handled)
-
-    if "questtype" in dfs:
-        sections.append(_preview_questtype(context, dfs["questtype"]))
-        handled.add("questtype")
+    _preview_writing_types(context, plan, sections, handled)
 
-    if "abilities" in dfs:
-        sections.append(_preview_abilities(context, dfs["abilities"]))
-        handled.add("abilities")
+    for stem, preview in {
+        "questtype": _preview_questtype,
+        "abilities": _preview_abilities,
+        "criterions": _preview_criterions,
+        "deliveries": _preview_deliveries,
+    }.items():
+        if stem in plan:
+            sections.append(preview(context, _frame(plan, stem)))
+            handled.add(stem)
 
-    if "criterions" in dfs:
-        sections.append(_preview_criterions(context, dfs["criterions"]))
-        handled.add("criterions")
-
-    if "deliveries" in dfs:
-        sections.append(_preview_deliveries(context, dfs["deliveries"]))
-        handled.add("deliveries")
-
-    unknown = [f"{stem}.csv" for stem in dfs if stem not in handled]
+    unknown = [f"{stem}.csv" for stem in plan if stem not in handled]
     return sections, unknown
 
 
@@ -721,28 +745,35 @@ def _safe_run(logs: list[str], label: str, fn: Any, *args: Any) -> None:
         logs.append(f"ERR - {label}: {exc}")
 
 
-def _exec_writing_types(context: dict, dfs: dict[str, pd.DataFrame], logs: list[str]) -> None:
+def _exec_writing_types(context: dict, plan: dict[str, dict], logs: list[str]) -> None:
     for typ in _WRITING_TYPES:
-        if typ not in dfs:
+        if typ not in plan:
             continue
-        second = dfs.get("relationships") if typ == "character" else dfs.get("plot_rels") if typ == "plot" else None
-        _safe_run(logs, typ, _exec_writing, context, dfs[typ], typ, second)
+        second = "relationships" if typ == "character" else "plot_rels" if typ == "plot" else None
+        second_df = _frame(plan, second, keep_missing=True) if second else None
+        _safe_run(logs, typ, _exec_writing, context, _frame(plan, typ, keep_missing=True), typ, second_df)
 
 
-def _exec_form_sections(context: dict, dfs: dict[str, pd.DataFrame], logs: list[str]) -> None:
-    if "registration_questions" in dfs:
+def _exec_form_sections(context: dict, plan: dict[str, dict], logs: list[str]) -> None:
+    if "registration_questions" in plan:
         try:
             result = _exec_registration_form(
-                context, dfs["registration_questions"], dfs.get("registration_options"), is_registration=True
+                context,
+                _frame(plan, "registration_questions", keep_missing=True),
+                _frame(plan, "registration_options", keep_missing=True),
+                is_registration=True,
             )
             logs.extend(result)
         except Exception as exc:
             logger.exception("Restore error in registration_form")
             logs.append(f"ERR - registration_form: {exc}")
-    if "writing_questions" in dfs:
+    if "writing_questions" in plan:
         try:
             result = _exec_registration_form(
-                context, dfs["writing_questions"], dfs.get("writing_options"), is_registration=False
+                context,
+                _frame(plan, "writing_questions", keep_missing=True),
+                _frame(plan, "writing_options", keep_missing=True),
+                is_registration=False,
             )
             logs.extend(result)
         except Exception as exc:
@@ -750,34 +781,37 @@ def _exec_form_sections(context: dict, dfs: dict[str, pd.DataFrame], logs: list[
             logs.append(f"ERR - character_form: {exc}")
 
 
-def execute_restore(context: dict, zip_bytes: bytes) -> list[str]:
-    """Execute the full restore from the ZIP, return all log messages."""
-    dfs = _parse_zip(zip_bytes)
+def execute_restore(context: dict, plan: dict[str, dict]) -> list[str]:
+    """Execute the full restore from the plan built on preview, return all log messages.
+
+    The DataFrame of each file is built only when its section is applied.
+    """
     logs: list[str] = []
 
-    if "configuration" in dfs:
-        _safe_run(logs, "configuration", _exec_configuration, context, dfs["configuration"])
-    if "features" in dfs:
-        _safe_run(logs, "features", _exec_features, context, dfs["features"])
-    if "tickets" in dfs:
-        _safe_run(logs, "tickets", _exec_tickets, context, dfs["tickets"])
-
-    _exec_form_sections(context, dfs, logs)
-
-    if "character_config" in dfs:
-        _safe_run(logs, "character_config", _exec_character_config, context, dfs["character_config"])
-    if "registration" in dfs:
-        _safe_run(logs, "registration", _exec_registration, context, dfs["registration"])
-
-    _exec_writing_types(context, dfs, logs)
-
-    if "questtype" in dfs:
-        _safe_run(logs, "questtype", _exec_questtype, context, dfs["questtype"])
-    if "abilities" in dfs:
-        _safe_run(logs, "abilities", _exec_abilities, context, dfs["abilities"])
-    if "criterions" in dfs:
-        _safe_run(logs, "criterions", _exec_criterions, context, dfs["criterions"])
-    if "deliveries" in dfs:
-        _safe_run(logs, "deliveries", _exec_deliveries, context, dfs["deliveries"])
+    if "configuration" in plan:
+        _safe_run(logs, "configuration", _exec_configuration, context, _frame(plan, "configuration"))
+    if "features" in plan:
+        _safe_run(logs, "features", _exec_features, context, _frame(plan, "features"))
+    if "tickets" in plan:
+        _safe_run(logs, "tickets", _exec_tickets, context, _frame(plan, "tickets", keep_missing=True))
+
+    _exec_form_sections(context, plan, logs)
+
+    if "character_config" in plan:
+        _safe_run(logs, "character_config", _exec_character_config, context, _frame(plan, "character_config"))
+    if "registration" in plan:
+        _safe_run(logs, "registration", _exec_registration, context, _frame(plan, "registration", keep_missing=True))
+
+    _exec_writing_types(context, plan, logs)
+
+    if "questtype" in plan:
+        _safe_run(logs, "questtype", _exec_questtype, context, _frame(plan, "questtype"))
+    for stem, execute in {
+        "abilities": _exec_abilities,
+        "criterions": _exec_criterions,
+        "deliveries": _exec_deliveries,
+    }.items():
+        if stem in plan:
+            _safe_run(logs, stem, execute, context, _frame(plan, stem, keep_missing=True))
 
     return logs
@@ -24,6 +24,7 @@ import logging
 import os
 import re
 import shutil
+from collections import defaultdict
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -33,11 +34,13 @@ from django.conf import settings as conf_settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 from PIL import Image
 
 from larpmanager.cache.experience import clear_event_exp_systems_cache, get_event_exp_systems
 from larpmanager.cache.question import get_cached_registration_questions, get_cached_writing_questions
+from larpmanager.cache.text_fields import update_cache_text_fields
 from larpmanager.models.base import Feature
 from larpmanager.models.casting import Quest, QuestType
 from larpmanager.models.event import EventConfig
@@ -83,7 +86,7 @@ from larpmanager.models.writing import (
     PlotCharacterRel,
     Relationship,
 )
-from larpmanager.utils.edit.backend import save_log
+from larpmanager.utils.edit.backend import save_log, save_logs
 from larpmanager.utils.io.download import _get_column_names
 from larpmanager.utils.security import (
     FileSecurityError,
@@ -91,6 +94,7 @@ from larpmanager.utils.security import (
     sanitize_dataframe,
     validate_file_size,
 )
+from larpmanager.utils.services.character import update_character_referenced_chars_background
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -206,6 +210,11 @@ def _text_to_html_paragraphs(value: str) -> str:
     return "".join(line if _HTML_TAG_RE.search(line) else f"<p>{line}</p>" for line in lines)
 
 
+def supports_dry_run(upload_type: str) -> bool:
+    """Check if the upload type can be validated without saving (writing elements only)."""
+    return not upload_type.startswith(("registration", "matchmaker", "character_form", "exp_"))
+
+
 def go_upload(context: dict, upload_form_data: Any) -> Any:
     """Route uploaded files to appropriate processing functions.
 
@@ -243,6 +252,18 @@ def go_upload(context: dict, upload_form_data: Any) -> Any:
     return writing_load(context, upload_form_data)
 
 
+class ParsedCsv:
+    """CSV content already parsed and sanitized, accepted by the loaders in place of an uploaded file.
+
+    Used when the rows come from a source read beforehand (e.g. a restore plan),
+    to avoid serializing them back to CSV only to parse them again.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame) -> None:
+        """Wrap the parsed rows, with the CSV header as columns."""
+        self.dataframe = dataframe
+
+
 def _read_uploaded_csv(uploaded_file: Any) -> pd.DataFrame | None:
     """Read CSV file with multiple encoding fallbacks.
 
@@ -360,8 +381,8 @@ def _get_file(context: dict, file: Any, column_id: int | None = None) -> tuple[p
     # Convert all allowed column names to lowercase for comparison
     allowed_column_names = [column_name.lower() for column_name in allowed_column_names]
 
-    # Read and parse the uploaded CSV file
-    input_dataframe = _read_uploaded_csv(file)
+    # Read and parse the uploaded CSV file, unless already parsed
+    input_dataframe = file.dataframe.copy() if isinstance(file, ParsedCsv) else _read_uploaded_csv(file)
     if input_dataframe is None:
         return None, ["ERR - Could not parse the uploaded file. Please check the file format and encoding"]
 
@@ -379,7 +400,11 @@ def _get_file(context: dict, file: Any, column_id: int | None = None) -> tuple[p
 
 
 def registrations_load(context: dict, uploaded_file_form: Form) -> list[str]:
-    """Load registration data from uploaded CSV file."""
+    """Load registration data from uploaded CSV file.
+
+    Users and memberships of all the rows are resolved with two queries, and the
+    rows are imported in a single transaction.
+    """
     (input_dataframe, processing_logs) = _get_file(context, uploaded_file_form.cleaned_data["first"], 0)
 
     registration_questions = get_cached_registration_questions(context["event"])
@@ -388,12 +413,48 @@ def registrations_load(context: dict, uploaded_file_form: Form) -> list[str]:
     if input_dataframe is not None:
         if len(input_dataframe) > MAX_CSV_ROWS:
             return [f"ERR - File too large: {len(input_dataframe)} rows exceeds limit of {MAX_CSV_ROWS}"]
-        for registration_row in input_dataframe.to_dict(orient="records"):
-            processing_logs.append(_reg_load(context, registration_row, questions_mapping))
+        registration_rows = input_dataframe.to_dict(orient="records")
+        import_lookups = _get_registrations_import_lookups(context, registration_rows)
+        with transaction.atomic():
+            for registration_row in registration_rows:
+                processing_logs.append(_reg_load(context, registration_row, questions_mapping, import_lookups))
     return processing_logs
 
 
-def _reg_load(context: dict, csv_row: dict, registration_questions: dict) -> str:
+def _get_registrations_import_lookups(context: dict, registration_rows: list[dict]) -> dict[str, dict]:
+    """Resolve the users and memberships of the emails of a registrations import.
+
+    Args:
+        context: Context dictionary containing the event
+        registration_rows: CSV rows, with the participant email
+
+    Returns:
+        Dict with the users by lowercase email and the memberships by member id
+
+    """
+    emails = {
+        str(registration_row["email"]).strip().lower()
+        for registration_row in registration_rows
+        if not _is_missing(registration_row.get("email"))
+    }
+
+    users_by_email = {}
+    for user in (
+        User.objects.annotate(email_lower=Lower("email")).filter(email_lower__in=emails).select_related("member")
+    ):
+        users_by_email.setdefault(user.email_lower, user)
+
+    memberships_by_member = {
+        membership.member_id: membership
+        for membership in Membership.objects.filter(
+            association_id=context["event"].association_id,
+            member_id__in=[user.member.id for user in users_by_email.values()],
+        )
+    }
+    return {"users": users_by_email, "memberships": memberships_by_member}
+
+
+def _reg_load(context: dict, csv_row: dict, registration_questions: dict, import_lookups: dict[str, dict]) -> str:
     """Load registration data from CSV row for bulk import.
 
     Creates or updates registrations with field validation, membership checks,
@@ -403,30 +464,28 @@ def _reg_load(context: dict, csv_row: dict, registration_questions: dict) -> str
         context: Context dictionary containing event and run information
         csv_row: Dictionary representing a CSV row with registration data
         registration_questions: List of registration questions for the event
+        import_lookups: Users and memberships resolved by _get_registrations_import_lookups
 
     Returns:
         str: Status message indicating success/failure and details
 
-    Raises:
-        ObjectDoesNotExist: When user email or membership is not found
-
     """
     # Validate required email column exists
     if "email" not in csv_row:
         return "ERR - There is no email column"
 
     # Find user by email (case-insensitive)
-    try:
-        user = User.objects.get(email__iexact=csv_row["email"].strip())
-    except ObjectDoesNotExist:
+    user = None
+    if not _is_missing(csv_row["email"]):
+        user = import_lookups["users"].get(str(csv_row["email"]).strip().lower())
+    if not user:
         return "ERR - Email not found"
 
     member = user.member
 
     # Check if user has valid membership for this association
-    try:
-        membership = Membership.objects.get(member=member, association_id=context["event"].association_id)
-    except ObjectDoesNotExist:
+    membership = import_lookups["memberships"].get(member.id)
+    if not membership:
         return "ERR - Sharing data not found"
 
     # Verify user has approved data sharing
@@ -441,10 +500,14 @@ def _reg_load(context: dict, csv_row: dict, registration_questions: dict) -> str
     )
 
     error_logs = []
+    planned_answers = _new_planned_answers()
 
     # Process each field in the CSV row
     for field_name, field_value in csv_row.items():
-        _registration_field_load(context, registration, field_name, field_value, registration_questions, error_logs)
+        _registration_field_load(
+            context, registration, field_name, field_value, registration_questions, planned_answers, error_logs
+        )
+    _save_planned_answers([(registration, planned_answers)], is_registration=True)
 
     # Save registration and log the action
     registration.save()
@@ -467,6 +530,7 @@ def _registration_field_load(
     field_name: str,
     field_value: str,
     registration_questions: dict[str, Any],
+    planned_answers: dict[str, dict],
     error_logs: list[str],
 ) -> None:
     """Load individual registration field from CSV data.
@@ -477,6 +541,7 @@ def _registration_field_load(
         field_name: Field name from CSV
         field_value: Field value from CSV
         registration_questions: Dictionary of registration questions
+        planned_answers: Planned answers of the registration, written after all its fields
         error_logs: List to append error messages to
 
     """
@@ -502,14 +567,7 @@ def _registration_field_load(
     elif field_type == "additional_tickets":
         registration.additionals = _to_int(field_value)
     else:
-        _assign_choice_answer(
-            registration,
-            field_name,
-            field_value,
-            registration_questions,
-            error_logs,
-            is_registration=True,
-        )
+        _plan_answer(planned_answers, field_name, field_value, registration_questions, error_logs)
 
 
 def _assign_elem(
@@ -710,6 +768,8 @@ def writing_load(context: dict, form: Form) -> list[str]:
 
     Processes uploaded files containing writing elements and their relationships.
     Handles both character and plot types with their respective relationship data.
+    In dry run mode every row is validated and logged as in a real import, but
+    nothing is written.
 
     Args:
         context: Context dictionary containing event, writing_typ, and typ keys
@@ -724,6 +784,8 @@ def writing_load(context: dict, form: Form) -> list[str]:
 
     """
     logs = []
+    dry_run = bool(form.cleaned_data.get("dry_run"))
+    planned_names = set()
 
     # Process main writing data file
     uploaded_file = form.cleaned_data.get("first", None)
@@ -735,28 +797,39 @@ def writing_load(context: dict, form: Form) -> list[str]:
         questions_dict = _get_questions(writing_questions)
 
         # Activate features based on uploaded columns
-        if input_dataframe is not None:
+        if input_dataframe is not None and not dry_run:
             _activate_features_from_columns(context, input_dataframe.columns.tolist(), writing_questions)
 
-        # Process each row of writing data
+        # Process all the rows of writing data
         if input_dataframe is not None:
             if len(input_dataframe) > MAX_CSV_ROWS:
                 return [f"ERR - File too large: {len(input_dataframe)} rows exceeds limit of {MAX_CSV_ROWS}"]
-            for row in input_dataframe.to_dict(orient="records"):
-                logs.append(element_load(context, row, questions_dict))
+            import_plan = _get_elements_import_plan(context)
+            logs.extend(
+                elements_load(
+                    context,
+                    input_dataframe.to_dict(orient="records"),
+                    questions_dict,
+                    dry_run=dry_run,
+                    import_plan=import_plan,
+                )
+            )
+            planned_names = set(import_plan["elements"])
 
     # Process character relationships if type is character
     if context["typ"] == "character":
-        _writing_load_relationships(context, form, logs)
+        _writing_load_relationships(context, form, logs, dry_run=dry_run, planned_names=planned_names)
 
     # Process plot relationships if type is plot
     if context["typ"] == "plot":
-        _writing_load_plot_rels(context, form, logs)
+        _writing_load_plot_rels(context, form, logs, dry_run=dry_run, planned_names=planned_names)
 
     return logs
 
 
-def _writing_load_relationships(context: dict, form: Form, logs: list[str]) -> None:
+def _writing_load_relationships(
+    context: dict, form: Form, logs: list[str], *, dry_run: bool = False, planned_names: set[str] | None = None
+) -> None:
     """Load character relationships from uploaded file.
 
     Processes an uploaded CSV/Excel file containing character relationship data,
@@ -767,6 +840,8 @@ def _writing_load_relationships(context: dict, form: Form, logs: list[str]) -> N
         context: View context dictionary containing event and other request data
         form: Form object with cleaned_data containing the uploaded file
         logs: List to append processing status messages to
+        dry_run: If True, validate the rows without writing them
+        planned_names: Lowercase names of the characters of the main file, known in dry run
 
     Side Effects:
         - Creates or updates CharacterRel objects in the database
@@ -781,15 +856,19 @@ def _writing_load_relationships(context: dict, form: Form, logs: list[str]) -> N
             element["name"].lower(): element["id"]
             for element in context["event"].get_elements(Character).values("id", "name")
         }
+        if dry_run:
+            character_name_to_id = dict.fromkeys(planned_names or (), None) | character_name_to_id
 
         # Process each relationship row
         if input_dataframe is not None:
             for row in input_dataframe.to_dict(orient="records"):
-                new_logs.append(_relationships_load(row, character_name_to_id))
+                new_logs.append(_relationships_load(row, character_name_to_id, dry_run=dry_run))
         logs.extend(new_logs)
 
 
-def _writing_load_plot_rels(context: dict, form: Form, logs: list[str]) -> None:
+def _writing_load_plot_rels(
+    context: dict, form: Form, logs: list[str], *, dry_run: bool = False, planned_names: set[str] | None = None
+) -> None:
     """Load plot-character relationships from uploaded file.
 
     Processes an uploaded CSV/Excel file containing plot-character relationship data,
@@ -800,6 +879,8 @@ def _writing_load_plot_rels(context: dict, form: Form, logs: list[str]) -> None:
         context: View context dictionary containing event and other request data
         form: Form object with cleaned_data containing the uploaded file
         logs: List to append processing status messages to
+        dry_run: If True, validate the rows without writing them
+        planned_names: Lowercase names of the plots of the main file, known in dry run
 
     Side Effects:
         - Creates or updates PlotCharacterRel objects in the database
@@ -818,15 +899,17 @@ def _writing_load_plot_rels(context: dict, form: Form, logs: list[str]) -> None:
             element["name"].lower(): element["id"]
             for element in context["event"].get_elements(Plot).values("id", "name")
         }
+        if dry_run:
+            plot_name_to_id = dict.fromkeys(planned_names or (), None) | plot_name_to_id
 
         # Process each plot relationship row
         if input_dataframe is not None:
             for row in input_dataframe.to_dict(orient="records"):
-                new_logs.append(_plot_rels_load(row, character_name_to_id, plot_name_to_id))
+                new_logs.append(_plot_rels_load(row, character_name_to_id, plot_name_to_id, dry_run=dry_run))
         logs.extend(new_logs)
 
 
-def _plot_rels_load(row: dict, chars: dict[str, int], plots: dict[str, int]) -> str:
+def _plot_rels_load(row: dict, chars: dict[str, int], plots: dict[str, int], *, dry_run: bool = False) -> str:
     """Load plot-character relationships from row data.
 
     Creates or updates PlotCharacterRel objects based on the provided row data,
@@ -836,6 +919,7 @@ def _plot_rels_load(row: dict, chars: dict[str, int], plots: dict[str, int]) ->
         row: Dictionary containing character, plot, and text data
         chars: Mapping of character names (lowercase) to character IDs
         plots: Mapping of plot names (lowercase) to plot IDs
+        dry_run: If True, only validate the row
 
     Returns:
         Status message indicating success or failure with details
@@ -853,16 +937,19 @@ def _plot_rels_load(row: dict, chars: dict[str, int], plots: dict[str, int]) ->
         return f"ERR - target not found {plot_name}"
     plot_id = plots[plot_name]
 
-    # Create or retrieve existing plot-character relationship
-    plot_character_relationship, _ = PlotCharacterRel.objects.get_or_create(character_id=character_id, plot_id=plot_id)
+    if not dry_run:
+        # Create or retrieve existing plot-character relationship
+        plot_character_relationship, _ = PlotCharacterRel.objects.get_or_create(
+            character_id=character_id, plot_id=plot_id
+        )
 
-    # Update relationship text and save to database
-    plot_character_relationship.text = _text_to_html_paragraphs(row.get("text") or "")
-    plot_character_relationship.save()
+        # Update relationship text and save to database
+        plot_character_relationship.text = _text_to_html_paragraphs(row.get("text") or "")
+        plot_character_relationship.save()
     return f"OK - Plot role {character_name} {plot_name}"
 
 
-def _relationships_load(row: dict, chars: dict) -> str:
+def _relationships_load(row: dict, chars: dict, *, dry_run: bool = False) -> str:
     """Load relationships from CSV row data.
 
     Creates or updates a Relationship object based on source and target character
@@ -872,6 +959,7 @@ def _relationships_load(row: dict, chars: dict) -> str:
     Args:
         row: Dictionary containing relationship data with 'source', 'target', and 'text' keys
         chars: Dictionary mapping lowercase character names to character IDs
+        dry_run: If True, only validate the row
 
     Returns:
         Status message indicating success or error with details
@@ -889,10 +977,13 @@ def _relationships_load(row: dict, chars: dict) -> str:
         return f"ERR - target not found {target_character_name}"
     target_character_id = chars[target_character_name]
 
-    # Create or retrieve relationship and update text
-    relationship, _ = Relationship.objects.get_or_create(source_id=source_character_id, target_id=target_character_id)
-    relationship.text = _text_to_html_paragraphs(row.get("text") or "")
-    relationship.save()
+    if not dry_run:
+        # Create or retrieve relationship and update text
+        relationship, _ = Relationship.objects.get_or_create(
+            source_id=source_character_id, target_id=target_character_id
+        )
+        relationship.text = _text_to_html_paragraphs(row.get("text") or "")
+        relationship.save()
     return f"OK - Relationship {source_character_name} {target_character_name}"
 
 
@@ -912,41 +1003,31 @@ def _get_questions(questions_queryset: QuerySet) -> dict:
     return questions_by_name
 
 
-def _assign_text_answer(
-    target_element: Registration | Character,
-    question: dict[str, Any],
-    field_value: str,
-    *,
-    is_registration: bool,
-) -> None:
-    """Create or update a text/paragraph/editor answer, converting plain text to HTML paragraphs."""
-    if is_registration:
-        answer, _ = RegistrationAnswer.objects.get_or_create(
-            registration_id=target_element.id, question_id=question["id"]
-        )
-    else:
-        answer, _ = WritingAnswer.objects.get_or_create(element_id=target_element.id, question_id=question["id"])
+def _new_planned_answers() -> dict[str, dict]:
+    """Return an empty set of planned answers: text by question id, option ids by question id."""
+    return {"texts": {}, "choices": {}}
 
-    if question["typ"] in [BaseQuestionType.PARAGRAPH, BaseQuestionType.EDITOR]:
-        answer.text = _text_to_html_paragraphs(field_value)
-    else:
-        answer.text = field_value
-    answer.save()
 
-
-def _assign_choice_answer(
-    target_element: Registration | Character,
+def _plan_answer(
+    planned_answers: dict[str, dict],
     field_name: str,
     field_value: str,
     available_questions: dict[str, Any],
     error_logs: list[str],
-    *,
-    is_registration: bool = False,
 ) -> None:
-    """Assign choice answers to form elements during bulk import.
+    """Resolve the answer of a form question from a CSV value, without writing it.
+
+    Text questions store the value (converted to HTML paragraphs for paragraph
+    and editor questions); choice questions store the ids of the matched options,
+    which replace the current choices when saved.
+
+    Args:
+        planned_answers: Planned answers of the element, updated in place
+        field_name: Column name, matched against the question names
+        field_value: Raw CSV value
+        available_questions: Question metadata by lowercase name, see _get_questions
+        error_logs: List to append error messages to
 
-    Processes choice field assignments with validation, option matching,
-    and proper relationship creation for registration or character forms.
     """
     field_name = field_name.lower()
     if field_name not in available_questions:
@@ -956,111 +1037,331 @@ def _assign_choice_answer(
 
     # check if answer
     if question["typ"] in [BaseQuestionType.TEXT, BaseQuestionType.PARAGRAPH, BaseQuestionType.EDITOR]:
-        _assign_text_answer(target_element, question, field_value, is_registration=is_registration)
+        if question["typ"] in [BaseQuestionType.PARAGRAPH, BaseQuestionType.EDITOR]:
+            field_value = _text_to_html_paragraphs(field_value)
+        planned_answers["texts"][question["id"]] = field_value
+        return
 
     # check if choice
-    else:
-        option_values = field_value.split(",")
-        if len(option_values) > MAX_COMMA_VALUES:
-            error_logs.append(
-                f"Problem with question {field_name}: too many options ({len(option_values)}, max {MAX_COMMA_VALUES})"
-            )
-            return
+    option_values = field_value.split(",")
+    if len(option_values) > MAX_COMMA_VALUES:
+        error_logs.append(
+            f"Problem with question {field_name}: too many options ({len(option_values)}, max {MAX_COMMA_VALUES})"
+        )
+        return
 
-        if is_registration:
-            RegistrationChoice.objects.filter(registration_id=target_element.id, question_id=question["id"]).delete()
-        else:
-            WritingChoice.objects.filter(element_id=target_element.id, question_id=question["id"]).delete()
+    option_ids = []
+    for original_input_option in option_values:
+        normalized_input_option = original_input_option.lower().strip()
+        option_id = question["options"].get(normalized_input_option)
+        if not option_id:
+            error_logs.append(f"Problem with question {field_name}: couldn't find option {normalized_input_option}")
+            continue
+        option_ids.append(option_id)
+    planned_answers["choices"][question["id"]] = option_ids
 
-        for original_input_option in option_values:
-            normalized_input_option = original_input_option.lower().strip()
-            option_id = question["options"].get(normalized_input_option)
-            if not option_id:
-                error_logs.append(f"Problem with question {field_name}: couldn't find option {normalized_input_option}")
-                continue
 
-            if is_registration:
-                RegistrationChoice.objects.create(
-                    registration_id=target_element.id,
-                    question_id=question["id"],
-                    option_id=option_id,
-                )
+def _save_planned_answers(elements_answers: list[tuple[Any, dict[str, dict]]], *, is_registration: bool) -> None:
+    """Write the planned answers of several elements with bulk queries.
+
+    Existing text answers are updated and missing ones created; the choices of
+    every planned choice question replace the current ones.
+
+    Args:
+        elements_answers: Pairs of saved element (Registration or writing element) and its planned answers
+        is_registration: Whether the elements are registrations or writing elements
+
+    """
+    if is_registration:
+        answer_class, choice_class, owner_field = RegistrationAnswer, RegistrationChoice, "registration_id"
+    else:
+        answer_class, choice_class, owner_field = WritingAnswer, WritingChoice, "element_id"
+
+    texts = {
+        (element.id, question_id): text
+        for element, planned_answers in elements_answers
+        for question_id, text in planned_answers["texts"].items()
+    }
+    if texts:
+        existing_answers = {
+            (getattr(answer, owner_field), answer.question_id): answer
+            for answer in answer_class.objects.filter(
+                **{f"{owner_field}__in": {owner_id for owner_id, _question_id in texts}},
+                question_id__in={question_id for _owner_id, question_id in texts},
+            )
+        }
+        now = timezone.now()
+        answers_to_update = []
+        answers_to_create = []
+        for (owner_id, question_id), text in texts.items():
+            answer = existing_answers.get((owner_id, question_id))
+            if answer:
+                answer.text = text
+                answer.updated = now
+                answers_to_update.append(answer)
             else:
-                WritingChoice.objects.create(
-                    element_id=target_element.id,
-                    question_id=question["id"],
-                    option_id=option_id,
+                answers_to_create.append(
+                    answer_class(**{owner_field: owner_id, "question_id": question_id, "text": text})
                 )
+        answer_class.objects.bulk_update(answers_to_update, ["text", "updated"])
+        answer_class.objects.bulk_create(answers_to_create)
 
+    choices = {
+        (element.id, question_id): option_ids
+        for element, planned_answers in elements_answers
+        for question_id, option_ids in planned_answers["choices"].items()
+    }
+    if choices:
+        # Remove the current choices of the planned questions, one query per question
+        owners_by_question = defaultdict(set)
+        for owner_id, question_id in choices:
+            owners_by_question[question_id].add(owner_id)
+        for question_id, owner_ids in owners_by_question.items():
+            choice_class.objects.filter(question_id=question_id, **{f"{owner_field}__in": owner_ids}).delete()
+
+        choice_class.objects.bulk_create(
+            [
+                choice_class(**{owner_field: owner_id, "question_id": question_id, "option_id": option_id})
+                for (owner_id, question_id), option_ids in choices.items()
+                for option_id in option_ids
+            ]
+        )
 
-def element_load(context: dict, csv_row: dict, element_questions: dict) -> str:
-    """Load generic element data from CSV row for bulk import.
 
-    Processes element creation or updates with field validation,
-    question processing, and proper logging for various element types.
+def _get_elements_import_plan(context: dict) -> dict[str, Any]:
+    """Prepare the in-memory maps used to resolve the rows of a writing elements import.
+
+    Args:
+        context: Context dictionary with event and typ
+
+    Returns:
+        Dict with the element model, the event the elements belong to, the
+        elements by lowercase name (new elements are added while planning), and
+        the lookups of the referenced objects, filled on first use
+
+    """
+    question_applicable_type = QuestionApplicable.get_applicable(context["typ"])
+    writing_model_class = QuestionApplicable.get_applicable_inverse(question_applicable_type)
+
+    # Get the target event - use parent if in campaign and element is inheritable
+    target_event = context["event"].get_class_parent(writing_model_class)
+
+    # Index the existing elements by name, the oldest one winning on duplicates
+    elements = {}
+    for element in writing_model_class.objects.filter(event=target_event).order_by("pk"):
+        elements.setdefault(element.name.lower(), element)
+
+    return {"model": writing_model_class, "event": target_event, "elements": elements, "lookups": {}}
+
+
+def _get_import_lookup(context: dict, import_plan: dict[str, Any], lookup_name: str) -> dict[str, Any]:
+    """Return the map by lowercase name of the objects a column refers to, loading it once per import."""
+    lookups = import_plan["lookups"]
+    if lookup_name not in lookups:
+        if lookup_name == "mirror" and import_plan["model"] is Character:
+            # Mirrors can point to characters created by the previous rows
+            lookups[lookup_name] = import_plan["elements"]
+        else:
+            lookup_querysets = {
+                "quest_type": lambda: context["event"].get_elements(QuestType),
+                "quest": lambda: context["event"].get_elements(Quest),
+                "mirror": lambda: context["event"].get_elements(Character),
+                "faction": lambda: Faction.objects.filter(event=context["event"]),
+            }
+            lookups[lookup_name] = {}
+            for instance in lookup_querysets[lookup_name]().order_by("pk"):
+                lookups[lookup_name].setdefault(instance.name.lower(), instance)
+    return lookups[lookup_name]
+
+
+def element_load(context: dict, csv_row: dict, element_questions: dict) -> str:
+    """Load a single writing element from a CSV row.
 
     Args:
         context: Context dictionary with field_name, typ, event, and fields
         csv_row: CSV row data as dictionary with field names and values
-        element_questions: List of questions for element processing
+        element_questions: Questions of the element type, see _get_questions
 
     Returns:
         Status message string indicating success/failure and operation details
 
+    """
+    return elements_load(context, [csv_row], element_questions)[0]
+
+
+def elements_load(
+    context: dict,
+    csv_rows: list[dict],
+    element_questions: dict,
+    *,
+    dry_run: bool = False,
+    import_plan: dict[str, Any] | None = None,
+) -> list[str]:
+    """Import writing elements from CSV rows in two phases.
+
+    First every row is resolved against in-memory maps of the existing elements,
+    questions, options and referenced objects, collecting the changes and the
+    row log. Then, unless in dry run, the changes are applied in one transaction:
+    each element is saved once, and answers, choices and logs are written in bulk.
+
+    Args:
+        context: Context dictionary with field_name, typ, event, fields and member
+        csv_rows: CSV rows as dictionaries with field names and values
+        element_questions: Questions of the element type, see _get_questions
+        dry_run: If True, return the logs without writing anything
+        import_plan: Maps prepared by _get_elements_import_plan, built if missing
+
+    Returns:
+        One status message per row
+
+    """
+    if import_plan is None:
+        import_plan = _get_elements_import_plan(context)
+
+    # Normalize field names to lowercase for consistent processing
+    context["fields"] = {key.lower(): content for key, content in context["fields"].items()}
+
+    planned_rows = [_plan_element_row(context, import_plan, csv_row, element_questions) for csv_row in csv_rows]
+
+    if not dry_run:
+        with transaction.atomic():
+            _apply_elements_import(context, import_plan, planned_rows)
+
+    return [planned_row["log"] for planned_row in planned_rows]
+
+
+def _plan_element_row(context: dict, import_plan: dict[str, Any], csv_row: dict, element_questions: dict) -> dict:
+    """Resolve a CSV row into the changes to apply to its element.
+
+    Args:
+        context: Context dictionary with field_name and fields
+        import_plan: Maps prepared by _get_elements_import_plan
+        csv_row: CSV row data as dictionary with field names and values
+        element_questions: Questions of the element type, see _get_questions
+
+    Returns:
+        Dict with the status message of the row and, for valid rows, the element
+        (with its fields already set), the planned answers and the factions
+
     """
     # Validate that the required field name exists in the CSV row
     primary_field_name = context["field_name"].lower()
     if primary_field_name not in csv_row:
-        return "ERR - There is no name in fields"
+        return {"log": "ERR - There is no name in fields"}
 
-    # Extract element name and determine the appropriate model class
+    # Extract element name
     element_name = csv_row[primary_field_name]
 
     # Handle NaN or empty element names (e.g. blank rows in CSV)
     if pd.isna(element_name) or not str(element_name).strip():
-        return "ERR - empty name"
+        return {"log": "ERR - empty name"}
 
     # Remove initial "#number " pattern from name
     element_name = _strip_number_prefix(str(element_name))
-    question_applicable_type = QuestionApplicable.get_applicable(context["typ"])
-    writing_model_class = QuestionApplicable.get_applicable_inverse(question_applicable_type)
-
-    # Get the target event - use parent if in campaign and element is inheritable
-    target_event = context["event"].get_class_parent(writing_model_class)
-
-    # Try to find existing element or create new one
-    element = writing_model_class.objects.filter(event=target_event, name__iexact=element_name).first()
-    if element:
-        is_newly_created = False
-    else:
-        element = writing_model_class.objects.create(event=target_event, name=element_name)
-        is_newly_created = True
 
-    # Initialize logging for field processing errors
-    error_logs = []
+    # Find the existing element, or one created by a previous row, or plan a new one
+    element = import_plan["elements"].get(element_name.lower())
+    is_newly_created = element is None
+    if is_newly_created:
+        element = import_plan["model"](event=import_plan["event"], name=element_name)
+        import_plan["elements"][element_name.lower()] = element
 
-    # Normalize field names to lowercase for consistent processing
-    context["fields"] = {key.lower(): content for key, content in context["fields"].items()}
+    planned_row = {"element": element, "answers": _new_planned_answers(), "factions": []}
 
     # Process each field in the CSV row and update element
+    error_logs = []
     for field_name, field_value in csv_row.items():
-        _writing_load_field(context, element, field_name, field_value, element_questions, error_logs)
-
-    # Save the element and log the operation
-    element.save()
-    save_log(context, writing_model_class, element, operation_type=LogOperationType.UPLOAD)
+        _writing_load_field(context, import_plan, planned_row, field_name, field_value, element_questions, error_logs)
 
     # Return appropriate status message based on processing results
     if error_logs:
-        return "KO - " + ",".join(error_logs)
+        planned_row["log"] = "KO - " + ",".join(error_logs)
+    elif is_newly_created:
+        planned_row["log"] = f"OK - Created {element_name}"
+    else:
+        planned_row["log"] = f"OK - Updated {element_name}"
+    return planned_row
 
-    if is_newly_created:
-        return f"OK - Created {element_name}"
-    return f"OK - Updated {element_name}"
+
+def _apply_elements_import(context: dict, import_plan: dict[str, Any], planned_rows: list[dict]) -> None:
+    """Write the changes resolved by _plan_element_row.
+
+    New elements are saved first, so that answers, factions and mirrors can refer
+    to them; existing elements are saved after their answers, so that their save signals
+    see the new values. Signals skipped by the bulk writes are run once per
+    element afterwards.
+
+    Args:
+        context: Context dictionary with run/association and member, for the logs
+        import_plan: Maps prepared by _get_elements_import_plan
+        planned_rows: Rows resolved by _plan_element_row
+
+    """
+    valid_rows = [planned_row for planned_row in planned_rows if "element" in planned_row]
+
+    # Every element is saved once, even when several rows refer to it
+    elements = list({id(planned_row["element"]): planned_row["element"] for planned_row in valid_rows}.values())
+    new_elements = [element for element in elements if element.pk is None]
+    for element in new_elements:
+        element.save()
+
+    new_element_ids = {element.id for element in new_elements}
+    _assign_planned_mirrors(valid_rows, new_element_ids)
+
+    _save_planned_answers(
+        [(planned_row["element"], planned_row["answers"]) for planned_row in valid_rows], is_registration=False
+    )
+
+    # Add the characters to their factions, one m2m update per faction
+    faction_characters = {}
+    for planned_row in valid_rows:
+        for faction in planned_row["factions"]:
+            faction_characters.setdefault(faction.pk, (faction, []))[1].append(planned_row["element"])
+    for faction, characters in faction_characters.values():
+        faction.characters.add(*characters)
+
+    for element in elements:
+        if element.id not in new_element_ids:
+            element.save()
+
+    # The answers of new elements were written after their save: refresh what their signals computed
+    answered_ids = {
+        planned_row["element"].id
+        for planned_row in valid_rows
+        if planned_row["answers"]["texts"] or planned_row["answers"]["choices"]
+    }
+    for element in new_elements:
+        if element.id in answered_ids:
+            update_cache_text_fields(element)
+            if import_plan["model"] is Character:
+                update_character_referenced_chars_background(element.id)
+
+    save_logs(context, import_plan["model"], elements, operation_type=LogOperationType.UPLOAD)
+
+
+def _assign_planned_mirrors(valid_rows: list[dict], new_element_ids: set[int]) -> None:
+    """Set the mirrors to the new elements, which can be referenced only once saved.
+
+    The existing elements get the mirror before their own save, the new ones,
+    already saved, store it with a save of the mirror alone.
+    """
+    for planned_row in valid_rows:
+        if "mirror" not in planned_row:
+            continue
+        element = planned_row["element"]
+        element.mirror = planned_row["mirror"]
+        if element.id in new_element_ids:
+            element.save(update_fields=["mirror"])
 
 
 def _writing_load_field(
-    context: dict, element: BaseModel, field: str, value: str, questions: dict, logs: list[str]
+    context: dict,
+    import_plan: dict[str, Any],
+    planned_row: dict,
+    field: str,
+    value: str,
+    questions: dict,
+    logs: list[str],
 ) -> None:
     """Load writing field data during upload processing.
 
@@ -1070,7 +1371,8 @@ def _writing_load_field(
 
     Args:
         context: Context dictionary containing event and field information
-        element: Writing element instance to update with field data
+        import_plan: Maps prepared by _get_elements_import_plan
+        planned_row: Planned changes of the row, with the element to update
         field: Name of the field being processed
         value: Value from upload data for this field
         questions: Dictionary mapping field names to question instances
@@ -1081,9 +1383,11 @@ def _writing_load_field(
     if pd.isna(value):
         return
 
+    element = planned_row["element"]
+
     # Handle quest type field with case-insensitive lookup
     if field == "typ":
-        quest_type = context["event"].get_elements(QuestType).filter(name__iexact=value).first()
+        quest_type = _get_import_lookup(context, import_plan, "quest_type").get(str(value).lower())
         if quest_type:
             element.typ = quest_type
         else:
@@ -1092,7 +1396,7 @@ def _writing_load_field(
 
     # Handle quest field with case-insensitive lookup
     if field == "quest":
-        quest = context["event"].get_elements(Quest).filter(name__iexact=value).first()
+        quest = _get_import_lookup(context, import_plan, "quest").get(str(value).lower())
         if quest:
             element.quest = quest
         else:
@@ -1120,7 +1424,7 @@ def _writing_load_field(
         return
 
     # Delegate to question loading for all other field types
-    _writing_question_load(context, element, field, field_type, logs, questions, html_formatted_value)
+    _writing_question_load(context, import_plan, planned_row, field, field_type, logs, questions, html_formatted_value)
 
 
 def _set_character_status(element: Character, value: str, logs: list[str]) -> None:
@@ -1133,18 +1437,23 @@ def _set_character_status(element: Character, value: str, logs: list[str]) -> No
     logs.append(f"ERR - status not found: {value}")
 
 
-def _set_assigned_member(element: Character, email: str, logs: list[str]) -> None:
-    """Set assigned staff member from email address."""
-    try:
-        member = Member.objects.get(user__email__iexact=email.strip())
-        element.assigned = member
-    except Member.DoesNotExist:
+def _set_assigned_member(import_plan: dict[str, Any], element: Character, email: str, logs: list[str]) -> None:
+    """Set assigned staff member from email address, querying each address once per import."""
+    assigned_members = import_plan["lookups"].setdefault("assigned", {})
+    email = email.strip().lower()
+    if email not in assigned_members:
+        assigned_members[email] = Member.objects.filter(user__email__iexact=email).first()
+
+    if assigned_members[email]:
+        element.assigned = assigned_members[email]
+    else:
         logs.append(f"ERR - assigned member not found: {email}")
 
 
 def _writing_question_load(
     context: dict,
-    writing_element: Character | Plot | Faction,
+    import_plan: dict[str, Any],
+    planned_row: dict,
     question_field: str,
     question_type: WritingQuestionType,
     processing_logs: list[str],
@@ -1155,7 +1464,8 @@ def _writing_question_load(
 
     Args:
         context: Context dictionary
-        writing_element: Target writing element to update
+        import_plan: Maps prepared by _get_elements_import_plan
+        planned_row: Planned changes of the row, with the element to update
         question_field: Field identifier
         question_type: WritingQuestionType enum value
         processing_logs: List to collect processing logs
@@ -1163,14 +1473,15 @@ def _writing_question_load(
         field_value: Value to assign to the field
 
     """
+    writing_element = planned_row["element"]
     if question_type == WritingQuestionType.MIRROR:
-        _get_mirror_instance(context, writing_element, field_value, processing_logs)
+        _get_mirror_instance(context, import_plan, planned_row, field_value, processing_logs)
     elif question_type == WritingQuestionType.HIDE:
         writing_element.hide = field_value.lower() == "true"
     elif question_type == WritingQuestionType.LOCKED:
         writing_element.locked = field_value.lower() == "true"
     elif question_type == WritingQuestionType.FACTIONS:
-        _assign_faction(context, writing_element, field_value, processing_logs)
+        _assign_faction(context, import_plan, planned_row, field_value, processing_logs)
     elif question_type == WritingQuestionType.TEASER:
         writing_element.teaser = field_value
     elif question_type == WritingQuestionType.SHEET:
@@ -1180,32 +1491,40 @@ def _writing_question_load(
     elif question_type == "character_status":
         _set_character_status(writing_element, field_value, processing_logs)
     elif question_type == "character_assigned":
-        _set_assigned_member(writing_element, field_value, processing_logs)
+        _set_assigned_member(import_plan, writing_element, field_value, processing_logs)
     # TODO: implement
     else:
-        _assign_choice_answer(writing_element, question_field, field_value, questions_dict, processing_logs)
+        _plan_answer(planned_row["answers"], question_field, field_value, questions_dict, processing_logs)
 
 
 def _get_mirror_instance(
     context: dict,
-    character_element: Character,
+    import_plan: dict[str, Any],
+    planned_row: dict,
     mirror_character_name: str,
     error_logs: list[str],
 ) -> None:
-    """Fetch and assign mirror character instance from event."""
-    mirror_character = context["event"].get_elements(Character).filter(name__iexact=mirror_character_name).first()
-    if mirror_character:
-        character_element.mirror = mirror_character
-    else:
+    """Assign the mirror character, looked up by name among the characters of the event.
+
+    A character created by this import has no pk yet, and assigning it would make the
+    save of the element fail: it is planned instead, and assigned once it is saved.
+    """
+    mirror_character = _get_import_lookup(context, import_plan, "mirror").get(mirror_character_name.lower())
+    if not mirror_character:
         error_logs.append(f"ERR - mirror not found: {mirror_character_name}")
+    elif mirror_character.pk:
+        planned_row["element"].mirror = mirror_character
+    else:
+        planned_row["mirror"] = mirror_character
 
 
-def _assign_faction(context: dict, element: Character, value: str, logs: list[str]) -> None:
-    """Assign character to factions by comma-separated faction names.
+def _assign_faction(context: dict, import_plan: dict[str, Any], planned_row: dict, value: str, logs: list[str]) -> None:
+    """Plan the assignment of a character to factions by comma-separated faction names.
 
     Args:
         context: Dictionary containing event and other context data
-        element: Character instance to assign to factions
+        import_plan: Maps prepared by _get_elements_import_plan
+        planned_row: Planned changes of the row, collecting the factions
         value: Comma-separated string of faction names
         logs: List to append error messages to
 
@@ -1215,13 +1534,13 @@ def _assign_faction(context: dict, element: Character, value: str, logs: list[st
         logs.append(f"ERR - Too many factions: {len(faction_names)} exceeds limit of {MAX_COMMA_VALUES}")
         return
 
-    element.save()
     # Process each faction name in the comma-separated list
+    factions_by_name = _get_import_lookup(context, import_plan, "faction")
     for faction_name in faction_names:
         # Find faction by case-insensitive name match for the event
-        faction = Faction.objects.filter(name__iexact=faction_name.strip(), event=context["event"]).first()
+        faction = factions_by_name.get(faction_name.strip().lower())
         if faction:
-            faction.characters.add(element)
+            planned_row["factions"].append(faction)
         else:
             # Log faction not found errors
             logs.append(f"Faction not found: {faction_name}")
@@ -18,15 +18,24 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 
 import hashlib
+import heapq
 import logging
+import math
 import re
+from uuid import uuid4
 
 import anthropic
 from django.conf import settings as conf_settings
 from django.core.cache import cache
+from django.db.models import Value
 from django.utils.translation import gettext as _
 
-from larpmanager.cache.wwyltd import get_content_preview, get_guides_cache, get_tutorials_cache
+from larpmanager.cache.wwyltd import (
+    get_chat_index_cache_key,
+    get_chat_index_version_key,
+    get_content_preview,
+    get_tutorials_cache,
+)
 from larpmanager.models.larpmanager import LarpManagerGuide, LarpManagerTutorial
 
 logger = logging.getLogger(__name__)
@@ -67,18 +76,119 @@ _WORD_PATTERN = re.compile(r"[a-z0-9]+")
 _MIN_TOKEN_LENGTH = 2
 
 
-def _tokenize(text: str) -> set[str]:
+# BM25 parameters: term frequency saturation and document length normalization
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+# Chat index loaded by this process, reused until its version changes in the shared cache
+_loaded_chat_index: dict[str, dict] = {}
+
+
+def _terms(text: str) -> list[str]:
     """Extract lowercase content words from text, dropping stopwords and short tokens."""
-    return {
+    return [
         word for word in _WORD_PATTERN.findall(text.lower()) if word not in _STOPWORDS and len(word) > _MIN_TOKEN_LENGTH
-    }
+    ]
+
+
+def _tokenize(text: str) -> set[str]:
+    """Extract the distinct content words of text."""
+    return set(_terms(text))
+
+
+def _get_chat_documents() -> list[tuple[str, str, str, str, str]]:
+    """Load the documents searched by the chat, as (doc_type, slug, title, headings, plain text) tuples.
 
+    The headings of a tutorial are the titles of its sections, read from the tutorials cache.
+    """
+    documents = [
+        ("guide", slug, title, "", get_content_preview(text, len(text or "")))
+        for slug, title, text in LarpManagerGuide.objects.filter(published=True)
+        .order_by("number")
+        .values_list("slug", "title", "text")
+    ]
+
+    section_titles: dict[str, list[str]] = {}
+    for tutorial in get_tutorials_cache():
+        section_titles.setdefault(tutorial["slug"], []).append(tutorial["section_title"])
+    documents.extend(
+        ("tutorial", slug, name, " ".join(section_titles.get(slug, [])), get_content_preview(descr, len(descr or "")))
+        for slug, name, descr in LarpManagerTutorial.objects.order_by("order").values_list("slug", "name", "descr")
+    )
+    return documents
 
-def _find_relevant_docs(question: str) -> list[tuple[int, str, str, str]]:
-    """Rank cached guides/tutorials by keyword overlap with the question.
 
-    Reuses the existing wwyltd guides/tutorials cache (already built and refreshed via
-    signals) instead of a separate index, so retrieval costs no extra API calls or storage.
+def build_chat_index() -> dict:
+    """Build the inverted index of guides and tutorials with precomputed BM25 weights.
+
+    Each term maps to a posting list of (document, weight) pairs, so that a
+    question is scored by summing the weights of its terms' postings. Titles and
+    section titles are counted twice, being the most descriptive part of a document.
+
+    Returns:
+        Dict with the index version, the (doc_type, slug, title) documents and
+        the posting lists by term
+
+    """
+    documents = []
+    term_counts = []
+    for doc_type, slug, title, headings, text in _get_chat_documents():
+        documents.append((doc_type, slug, title))
+        counts: dict[str, int] = {}
+        for term in _terms(f"{title} {title} {headings} {headings} {text}"):
+            counts[term] = counts.get(term, 0) + 1
+        term_counts.append(counts)
+
+    lengths = [sum(counts.values()) for counts in term_counts]
+    average_length = (sum(lengths) / len(lengths)) if lengths else 0
+    frequencies: dict[str, list[tuple[int, int]]] = {}
+    for doc_id, counts in enumerate(term_counts):
+        for term, frequency in counts.items():
+            frequencies.setdefault(term, []).append((doc_id, frequency))
+
+    postings = {}
+    for term, doc_frequencies in frequencies.items():
+        idf = math.log(1 + (len(documents) - len(doc_frequencies) + 0.5) / (len(doc_frequencies) + 0.5))
+        postings[term] = [
+            (
+                doc_id,
+                idf
+                * frequency
+                * (_BM25_K1 + 1)
+                / (frequency + _BM25_K1 * (1 - _BM25_B + _BM25_B * lengths[doc_id] / average_length)),
+            )
+            for doc_id, frequency in doc_frequencies
+        ]
+
+    return {"version": uuid4().hex, "documents": documents, "postings": postings}
+
+
+def get_chat_index() -> dict:
+    """Get the chat index, loading it from the shared cache only when its version changed.
+
+    The index is rebuilt after the guides and tutorials cache signals reset it;
+    every process keeps its loaded copy until then.
+    """
+    version = cache.get(get_chat_index_version_key())
+    loaded_index = _loaded_chat_index.get("index")
+    if loaded_index is not None and loaded_index["version"] == version:
+        return loaded_index
+
+    chat_index = cache.get(get_chat_index_cache_key())
+    if chat_index is None or chat_index["version"] != version:
+        chat_index = build_chat_index()
+        cache.set(get_chat_index_cache_key(), chat_index, timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+        cache.set(get_chat_index_version_key(), chat_index["version"], timeout=conf_settings.CACHE_TIMEOUT_1_DAY)
+
+    _loaded_chat_index["index"] = chat_index
+    return chat_index
+
+
+def _find_relevant_docs(question: str) -> list[tuple[float, str, str, str]]:
+    """Rank guides/tutorials by BM25 relevance to the question.
+
+    Only the posting lists of the question terms are visited, so the cost does
+    not grow with the number of documents that do not match.
 
     Returns:
         List of (score, doc_type, slug, title) tuples, highest score first.
@@ -88,45 +198,51 @@ def _find_relevant_docs(question: str) -> list[tuple[int, str, str, str]]:
     if not question_tokens:
         return []
 
-    scores: dict[tuple[str, str], list] = {}
-
-    for guide in get_guides_cache():
-        overlap = len(question_tokens & _tokenize(f"{guide['title']} {guide['content_preview']}"))
-        if overlap:
-            key = ("guide", guide["slug"])
-            entry = scores.setdefault(key, [0, guide["title"]])
-            entry[0] += overlap
+    chat_index = get_chat_index()
+    scores: dict[int, float] = {}
+    for term in question_tokens:
+        for doc_id, weight in chat_index["postings"].get(term, ()):
+            scores[doc_id] = scores.get(doc_id, 0) + weight
 
-    for tutorial in get_tutorials_cache():
-        text = f"{tutorial['title']} {tutorial['section_title']} {tutorial['content_preview']}"
-        overlap = len(question_tokens & _tokenize(text))
-        if overlap:
-            key = ("tutorial", tutorial["slug"])
-            entry = scores.setdefault(key, [0, tutorial["title"]])
-            entry[0] += overlap
-
-    ranked = sorted(
-        ((score, doc_type, slug, title) for (doc_type, slug), (score, title) in scores.items()),
-        key=lambda item: item[0],
-        reverse=True,
-    )
-    return ranked[:CHAT_MAX_CONTEXT_DOCS]
+    ranked = heapq.nlargest(CHAT_MAX_CONTEXT_DOCS, scores.items(), key=lambda item: item[1])
+    return [(score, *chat_index["documents"][doc_id]) for doc_id, score in ranked]
 
 
-def _get_doc_context(doc_type: str, slug: str, title: str) -> str:
-    """Fetch and clean full document text from the database for a matched doc.
+def _get_docs_context(relevant_docs: list[tuple[float, str, str, str]]) -> list[str]:
+    """Fetch and clean the full text of the matched docs with a single query.
 
     Only called for the handful of top-ranked matches, so it stays a cheap targeted
     query instead of loading full guide/tutorial text into the shared cache.
     """
-    if doc_type == "guide":
-        guide = LarpManagerGuide.objects.filter(slug=slug, published=True).first()
-        raw_text = guide.text if guide else ""
-    else:
-        tutorial = LarpManagerTutorial.objects.filter(slug=slug).first()
-        raw_text = tutorial.descr if tutorial else ""
+    slugs_by_type: dict[str, list[str]] = {}
+    for _score, doc_type, slug, _title in relevant_docs:
+        slugs_by_type.setdefault(doc_type, []).append(slug)
+
+    querysets = []
+    if "guide" in slugs_by_type:
+        querysets.append(
+            LarpManagerGuide.objects.filter(slug__in=slugs_by_type["guide"], published=True)
+            .annotate(doc_type=Value("guide"))
+            .values_list("slug", "text", "doc_type")
+        )
+    if "tutorial" in slugs_by_type:
+        querysets.append(
+            LarpManagerTutorial.objects.filter(slug__in=slugs_by_type["tutorial"])
+            .annotate(doc_type=Value("tutorial"))
+            .values_list("slug", "descr", "doc_type")
+        )
+
+    # Clear the default ordering, not allowed in the parts of a union
+    querysets = [queryset.order_by() for queryset in querysets]
+    texts = {}
+    if querysets:
+        union = querysets[0].union(*querysets[1:], all=True)
+        texts = {(doc_type, slug): raw_text for slug, raw_text, doc_type in union}
 
-    return f"# {title}\n{get_content_preview(raw_text, CHAT_MAX_DOC_LENGTH)}"
+    return [
+        f"# {title}\n{get_content_preview(texts.get((doc_type, slug)) or '', CHAT_MAX_DOC_LENGTH)}"
+        for _score, doc_type, slug, title in relevant_docs
+    ]
 
 
 def _call_anthropic(question: str, context_blocks: list[str]) -> str:
@@ -159,7 +275,7 @@ def _call_anthropic(question: str, context_blocks: list[str]) -> str:
 def get_chat_answer(question: str) -> str:
     """Answer a user question grounded in LarpManager guides/tutorials, cheaply.
 
-    Retrieval is free keyword matching over the already-cached guides/tutorials summaries.
+    Retrieval is free BM25 ranking over the cached index of guides/tutorials.
     The Anthropic call (the only paid step) only fires for the handful of top matches, and
     identical questions are served from cache afterwards without calling the API again.
     """
@@ -180,7 +296,7 @@ def get_chat_answer(question: str) -> str:
             )
         )
     else:
-        context_blocks = [_get_doc_context(doc_type, slug, title) for _score, doc_type, slug, title in relevant_docs]
+        context_blocks = _get_docs_context(relevant_docs)
         answer = _call_anthropic(question, context_blocks)
 
     cache.set(cache_key, answer, timeout=CHAT_ANSWER_CACHE_TIMEOUT)
@@ -18,12 +18,19 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later OR Proprietary
 
+import logging
 from urllib.parse import urlparse
 
 from django.dispatch import receiver
 
+from larpmanager.cache.builder import SLOW_REBUILD
 from larpmanager.models.larpmanager import LarpManagerProfiler
-from larpmanager.utils.profiler.signals import profiler_response_signal
+from larpmanager.utils.profiler.signals import cache_rebuild_signal, profiler_response_signal
+
+logger = logging.getLogger(__name__)
+
+# Domain under which the cache rebuilds are stored, apart from the requests
+CACHE_REBUILD_DOMAIN = "cache"
 
 
 @receiver(profiler_response_signal)
@@ -72,3 +79,39 @@ def handle_profiler_response(
         view_func_name=view_func_name,
         duration=duration,
     )
+
+
+@receiver(cache_rebuild_signal)
+def handle_cache_rebuild(
+    sender: object,  # noqa: ARG001
+    name: str,
+    key: str,
+    duration: float,
+    stale: bool,  # noqa: FBT001
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Record the slow cache rebuilds in the profiler, next to the slow requests.
+
+    Args:
+        sender: The signal sender object that triggered this handler
+        name: Name of the rebuilt cache, used as the profiled function
+        key: Cache key that was rebuilt
+        duration: Time spent in the builder, in seconds
+        stale: Whether a stale value was being served during the rebuild
+        **kwargs: Additional keyword arguments passed by the signal
+
+    """
+    if duration < SLOW_REBUILD:
+        return
+
+    try:
+        LarpManagerProfiler.objects.create(
+            domain=CACHE_REBUILD_DOMAIN,
+            path=key[:500],
+            query="stale" if stale else "",
+            method="REBUILD",
+            view_func_name=name[:100],
+            duration=duration,
+        )
+    except Exception as err:  # noqa: BLE001 - Profiler must never disrupt the cache rebuild
+        logger.warning("Cache rebuild profiler fail: %s", err)
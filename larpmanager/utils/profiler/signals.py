@@ -21,3 +21,6 @@
 from django.dispatch import Signal
 
 profiler_response_signal = Signal()
+
+# Sent after a cache value is rebuilt, with the name, key, duration (seconds) and whether it was stale
+cache_rebuild_signal = Signal()
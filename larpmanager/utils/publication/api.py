@@ -27,7 +27,7 @@ from django.http import HttpRequest, JsonResponse
 from django.utils import timezone
 from django.views.decorators.http import require_GET
 
-from larpmanager.cache.config import get_element_config
+from larpmanager.cache.config import get_element_config, prefetch_configs
 from larpmanager.forms.event import PromotionMood, PromotionSetting
 from larpmanager.models.association import Association
 from larpmanager.models.base import PublisherApiKey
@@ -176,6 +176,7 @@ def published_events(request: HttpRequest) -> JsonResponse:  # noqa: C901, PLR09
         runs = (
             Run.objects.filter(event__association__in=publisher_associations, start__gte=now)
             .select_related("event", "event__association", "event__association__skin")
+            .prefetch_related(prefetch_configs("event__configs"))
             .order_by("start")
         )
 
@@ -35,7 +35,9 @@ from django.db import transaction
 from django.db.models import Count, Min, Q
 from django.utils import timezone
 
+from larpmanager.accounting.ledger import rebuild_association_ledger
 from larpmanager.cache.association import clear_association_cache
+from larpmanager.mail.schedule import rebuild_association_reminders
 from larpmanager.models.accounting import (
     AccountingItemDiscount,
     AccountingItemExpense,
@@ -153,6 +155,9 @@ def clone_association(demo_type: Any, new_slug: str, skin_id: int) -> Associatio
         _clone_accounting(clone_context)
         _fix_deferred_self_references(clone_context)
         _apply_deferred_m2m(clone_context)
+        # Signals are suppressed during the clone: build the ledger rollup and reminder schedules in one pass
+        rebuild_association_ledger(new_association.id)
+        rebuild_association_reminders(new_association.id)
 
     clear_association_cache(new_slug)
     return new_association
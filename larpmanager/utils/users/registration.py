@@ -36,7 +36,11 @@ from larpmanager.cache.basic import get_run_association_id, get_run_event_id
 from larpmanager.cache.config import get_association_config, get_event_config
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.question import get_cached_registration_questions, skip_registration_question
-from larpmanager.cache.registration import clear_registration_counts_cache, get_registration_counts
+from larpmanager.cache.registration import (
+    clear_registration_counts_cache,
+    get_registration_counts,
+    get_registration_counts_many,
+)
 from larpmanager.cache.run import get_event_run_ids
 from larpmanager.models.accounting import AccountingItemMembership, PaymentInvoice, PaymentStatus, PaymentType
 from larpmanager.models.casting import Casting
@@ -598,6 +602,7 @@ def registration_status(context: dict, run: Run, member: Member) -> dict:
         member: Member object attempting registration
         context: Dict context dictionary, optionally containing cached data for efficiency:
             - my_regs: Pre-filtered user registrations
+            - my_regs_complete: Whether my_regs holds all the user registrations of the run
             - features_map: Cached features mapping
             - registration_counts: Pre-calculated registration counts dictionary
             - character_rels_dict: Dictionary mapping registration IDs to lists of RegistrationCharacterRel objects
@@ -625,7 +630,9 @@ def registration_status(context: dict, run: Run, member: Member) -> dict:
     # Find user's registration if not already provided
     cached_registrations = context.get("my_regs")
     if cached_registrations is not None:
-        registration = cached_registrations.get(run.id) or (registration_find(run, member) if member else None)
+        registration = cached_registrations.get(run.id)
+        if not registration and member and not context.get("my_regs_complete"):
+            registration = registration_find(run, member)
         context["registration"] = registration
     elif "registration" in context:
         registration = context["registration"]
@@ -656,6 +663,54 @@ def registration_status(context: dict, run: Run, member: Member) -> dict:
     return _check_run_status(context, run, member, run_status, register_url)
 
 
+def set_runs_registration_status(
+    context: dict,
+    runs: list[Run],
+    member: Member | None,
+    anonymous_status: dict[int, dict] | None = None,
+) -> None:
+    """Compute the registration status of several runs, setting it as their status attribute.
+
+    The features and registration counts of all the runs are fetched together,
+    and context["my_regs"] is taken as the complete set of the member
+    registrations, so that no query is made per run.
+
+    Args:
+        context: Context dictionary, with the member data precomputed as for registration_status
+        runs: Runs to compute the status of
+        member: Member viewing the runs, None for anonymous visitors
+        anonymous_status: Status shown to anonymous visitors by run id, reused for the
+            runs whose status does not depend on the member
+
+    """
+    my_regs = context.get("my_regs") or {}
+    revoked = member is not None and context["membership"].status in [MembershipStatus.REWOKED]
+
+    # Without a registration or a pre-registration to show, the member sees the anonymous status
+    pending_runs = []
+    for run in runs:
+        if (
+            anonymous_status is not None
+            and run.id in anonymous_status
+            and not revoked
+            and run.id not in my_regs
+            and run.registration_status != RegistrationStatus.PRE
+        ):
+            run.status = anonymous_status[run.id]
+        else:
+            pending_runs.append(run)
+
+    registration_counts = get_registration_counts_many([run for run in pending_runs if run.event.max_pg])
+
+    context.setdefault("features_map", {})
+    context["my_regs_complete"] = True
+    for run in pending_runs:
+        context["registration_counts"] = registration_counts.get(run.id, {})
+        run.status = registration_status(context, run, member)
+    context.pop("registration_counts", None)
+    del context["my_regs_complete"]
+
+
 def _check_run_status(context: dict, run: Run, member: Member, run_status: dict, register_url: str) -> dict:
     """Fill run status dict based on run registrations status field."""
     # Check registration status field
@@ -1216,6 +1216,15 @@ def exe_verification(request: HttpRequest) -> HttpResponse:
             # Process uploaded verification file and count verified payments
             counter = invoice_verify(context, request.FILES["first"])
             messages.success(request, _("Verified payments!") + " " + str(counter))
+            # Rows matching more than one invoice are left to manual verification
+            for payment_causal, candidates in context["ambiguous"]:
+                messages.warning(
+                    request,
+                    _("Ambiguous payment, verify it manually")
+                    + f": {payment_causal} ("
+                    + ", ".join(invoice.cod for invoice in candidates)
+                    + ")",
+                )
             return redirect("exe_verification")
 
     else:
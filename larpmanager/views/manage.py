@@ -49,7 +49,12 @@ from larpmanager.cache.config import (
 )
 from larpmanager.cache.feature import get_association_features, get_event_features
 from larpmanager.cache.registration import get_registration_counts
-from larpmanager.cache.widget import get_exe_widget_cache, get_orga_widget_cache
+from larpmanager.cache.widget import (
+    get_exe_widget_cache,
+    get_orga_widget_cache,
+    peek_exe_widget_cache,
+    peek_orga_widget_cache,
+)
 from larpmanager.cache.wwyltd import (
     get_exe_configs_cache,
     get_features_cache,
@@ -257,23 +262,63 @@ def _exe_manage(request: HttpRequest) -> HttpResponse:
     return render(request, "larpmanager/manage/exe.html", context)
 
 
-def _exe_widgets(request: HttpRequest, context: dict, features: dict) -> None:
-    """Loads widget data into context for executive dashboard."""
+# Template rendering each dashboard widget, by widget name
+EXE_WIDGET_TEMPLATES = {
+    "accounting": "exe_accounting",
+    "deadlines": "exe_deadlines",
+    "logs": "exe_logs",
+}
+
+ORGA_WIDGET_TEMPLATES = {
+    "accounting": "orga_accounting",
+    "deadlines": "orga_deadline",
+    "casting": "orga_casting",
+    "logs": "orga_logs",
+    "user_character": "orga_user_character",
+    "progress": "orga_progress",
+    "milestones": "orga_milestones",
+}
+
+
+def _exe_widgets_available(request: HttpRequest, context: dict, features: dict) -> list[str]:
+    """Return the executive dashboard widgets the user can see."""
     permissions = [
         ("exe_accounting", "accounting", False),
         ("exe_deadlines", "deadlines", True),
         ("exe_log", "logs", True),
     ]
 
-    widgets_available = [
+    return [
         widget
         for perm, widget, require_feature in permissions
         if has_association_permission(request, context, perm) and (not require_feature or widget in features)
     ]
 
-    context["widgets"] = {
-        widget: get_exe_widget_cache(context["association_id"], widget) for widget in widgets_available
-    }
+
+def _exe_widgets(request: HttpRequest, context: dict, features: dict) -> None:
+    """Loads cached widget data into context, leaving the others to be loaded lazily."""
+    context["widgets"] = {}
+    context["lazy_widgets"] = {}
+    for widget in _exe_widgets_available(request, context, features):
+        widget_data = peek_exe_widget_cache(context["association_id"], widget)
+        if widget_data is None:
+            context["lazy_widgets"][widget] = reverse("exe_manage_widget", args=[widget])
+        else:
+            context["widgets"][widget] = widget_data
+
+
+@login_required
+def exe_manage_widget(request: HttpRequest, widget_name: str) -> HttpResponse:
+    """Render a single executive dashboard widget, requested by the dashboard once loaded."""
+    context = get_context(request)
+    get_index_association_permissions(request, context, context["association_id"])
+
+    features = get_association_features(context["association_id"])
+    if widget_name not in _exe_widgets_available(request, context, features):
+        raise Http404
+
+    context["widgets"] = {widget_name: get_exe_widget_cache(context["association_id"], widget_name)}
+    return render(request, f"larpmanager/manage/widgets/{EXE_WIDGET_TEMPLATES[widget_name]}.html", context)
 
 
 def _exe_suggestions(context: dict) -> None:
@@ -555,8 +600,8 @@ def _orga_manage(request: HttpRequest, event_slug: str) -> HttpResponse:
     return render(request, "larpmanager/manage/orga.html", context)
 
 
-def _orga_widgets(request: HttpRequest, context: dict, features: dict):
-    """Loads widget data into context."""
+def _orga_widgets_available(request: HttpRequest, context: dict, features: dict) -> list[str]:
+    """Return the event dashboard widgets the user can see."""
     permissions = [
         ("orga_accounting", "accounting", False),
         ("orga_deadlines", "deadlines", True),
@@ -583,7 +628,34 @@ def _orga_widgets(request: HttpRequest, context: dict, features: dict):
     if "milestones" in features and has_event_permission(request, context, event_slug, "orga_milestones"):
         widgets_available.append("milestones")
 
-    context["widgets"] = {widget: get_orga_widget_cache(context["run"], widget) for widget in widgets_available}
+    return widgets_available
+
+
+def _orga_widgets(request: HttpRequest, context: dict, features: dict) -> None:
+    """Loads cached widget data into context, leaving the others to be loaded lazily."""
+    run = context["run"]
+    context["widgets"] = {}
+    context["lazy_widgets"] = {}
+    for widget in _orga_widgets_available(request, context, features):
+        widget_data = peek_orga_widget_cache(run.id, widget)
+        if widget_data is None:
+            context["lazy_widgets"][widget] = reverse("orga_manage_widget", args=[run.get_slug(), widget])
+        else:
+            context["widgets"][widget] = widget_data
+
+
+@login_required
+def orga_manage_widget(request: HttpRequest, event_slug: str, widget_name: str) -> HttpResponse:
+    """Render a single event dashboard widget, requested by the dashboard once loaded."""
+    context = get_event_context(request, event_slug)
+    get_index_event_permissions(request, context, event_slug)
+
+    features = get_event_features(context["event"].id)
+    if widget_name not in _orga_widgets_available(request, context, features):
+        raise Http404
+
+    context["widgets"] = {widget_name: get_orga_widget_cache(context["run"], widget_name)}
+    return render(request, f"larpmanager/manage/widgets/{ORGA_WIDGET_TEMPLATES[widget_name]}.html", context)
 
 
 def _orga_actions_priorities(request: HttpRequest, context: dict, features: dict) -> None:  # noqa: C901 - Complex priority determination logic
@@ -52,6 +52,7 @@ from larpmanager.models.form import (
     WritingQuestionType,
 )
 from larpmanager.models.member import Member
+from larpmanager.models.miscellanea import ExportJobType
 from larpmanager.models.utils import strip_tags
 from larpmanager.models.writing import (
     Character,
@@ -83,7 +84,7 @@ from larpmanager.utils.edit.orga import (
     orga_versions,
     orga_view,
 )
-from larpmanager.utils.io.download import orga_character_form_download
+from larpmanager.utils.io.export import export_job_response, start_export_job
 from larpmanager.utils.services.character import get_chars_relations
 from larpmanager.utils.services.writing import writing_list
 
@@ -499,7 +500,8 @@ def orga_writing_form(request: HttpRequest, event_slug: str, writing_type: str)
 
     # Handle POST request for downloading character form data
     if request.method == "POST" and request.POST.get("download") == "1":
-        return orga_character_form_download(context)
+        job = start_export_job(context, ExportJobType.CHARACTER_FORM)
+        return export_job_response(job, event_slug)
 
     # Configure context for template rendering with upload/download settings
     context["upload"] = "character_form"
@@ -50,6 +50,7 @@ from larpmanager.mail.base import send_role_invite_email
 from larpmanager.models.access import AssociationPermission, AssociationRole, EventPermission, EventRole, RoleInvite
 from larpmanager.models.base import Feature
 from larpmanager.models.event import Event, EventButton, EventText, Run
+from larpmanager.models.miscellanea import ExportJob, ExportJobStatus, ExportJobType
 from larpmanager.utils.auth.permission import get_event_roles, get_index_event_permissions
 from larpmanager.utils.core.base import check_event_context
 from larpmanager.utils.core.common import clear_messages, get_feature, is_rate_limited
@@ -57,10 +58,22 @@ from larpmanager.utils.core.copy import copy, get_copy_sections, read_copy_picks
 from larpmanager.utils.core.exceptions import RedirectError, UserPermissionError
 from larpmanager.utils.edit.backend import backend_edit, save_log
 from larpmanager.utils.edit.orga import OrgaAction, orga_delete, orga_edit, orga_new
-from larpmanager.utils.io.download import _get_column_names, prepare_backup, zip_exports
-from larpmanager.utils.io.restore import execute_restore, load_restore_temp, preview_restore, save_restore_temp
+from larpmanager.utils.io.download import _get_column_names, zip_exports
+from larpmanager.utils.io.export import (
+    EXPORT_JOB_PERMISSIONS,
+    export_job_response,
+    serve_export_job,
+    start_export_job,
+)
+from larpmanager.utils.io.restore import (
+    build_restore_plan,
+    execute_restore,
+    load_restore_temp,
+    preview_restore,
+    save_restore_temp,
+)
 from larpmanager.utils.io.template import build_upload_template
-from larpmanager.utils.io.upload import go_upload
+from larpmanager.utils.io.upload import go_upload, supports_dry_run
 from larpmanager.utils.services.event import reset_all_run
 from larpmanager.utils.users.deadlines import check_run_deadlines
 
@@ -626,7 +639,40 @@ def orga_backup(request: HttpRequest, event_slug: str) -> HttpResponse:
     if is_rate_limited(f"orga_backup_{context['event'].id}"):
         messages.error(request, _("Please wait before retrying."))
         return redirect("manage", event_slug=event_slug)
-    return prepare_backup(context)
+    job = start_export_job(context, ExportJobType.BACKUP)
+    return export_job_response(job, event_slug)
+
+
+def _get_export_job(request: HttpRequest, event_slug: str, job_uuid: str) -> tuple[dict, ExportJob]:
+    """Load an export job of the run, checking the permission required by its type."""
+    job = get_object_or_404(ExportJob, uuid=job_uuid)
+    context = check_event_context(request, event_slug, EXPORT_JOB_PERMISSIONS[job.typ])
+    if job.run_id != context["run"].id:
+        msg = "export job not found"
+        raise Http404(msg)
+    if job.typ == ExportJobType.BACKUP:
+        _check_organizer(request, context, event_slug)
+    return context, job
+
+
+@login_required
+def orga_export_job(request: HttpRequest, event_slug: str, job_uuid: str) -> HttpResponse:
+    """Show the progress of an export job; auto-refreshes until the artifact is ready."""
+    context, job = _get_export_job(request, event_slug, job_uuid)
+    context["job"] = job
+    context["job_ready"] = job.is_ready()
+    context["job_running"] = job.status in (ExportJobStatus.PENDING, ExportJobStatus.RUNNING)
+    return render(request, "larpmanager/orga/export_job.html", context)
+
+
+@login_required
+def orga_export_job_download(request: HttpRequest, event_slug: str, job_uuid: str) -> HttpResponse:
+    """Download the artifact of a completed export job."""
+    _context, job = _get_export_job(request, event_slug, job_uuid)
+    if not job.is_ready():
+        messages.warning(request, _("Export not available"))
+        return redirect("orga_export_job", event_slug=event_slug, job_uuid=job.uuid)
+    return serve_export_job(job)
 
 
 @login_required
@@ -641,12 +687,12 @@ def orga_restore(request: HttpRequest, event_slug: str) -> HttpResponse:
                 messages.error(request, _("Please wait before retrying."))
                 return render(request, "larpmanager/orga/restore.html", context)
             temp_key = request.POST.get("temp_key", "")
-            zip_bytes = load_restore_temp(temp_key)
-            if zip_bytes is None:
+            plan = load_restore_temp(temp_key)
+            if plan is None:
                 messages.error(request, _("Session expired, please upload the file again."))
                 return render(request, "larpmanager/orga/restore.html", context)
             try:
-                context["logs"] = execute_restore(context, zip_bytes)
+                context["logs"] = execute_restore(context, plan)
                 messages.success(request, _("Completed!"))
                 return render(request, "larpmanager/orga/uploads.html", context)
             except Exception as exc:
@@ -657,8 +703,9 @@ def orga_restore(request: HttpRequest, event_slug: str) -> HttpResponse:
         elif "zip_file" in request.FILES:
             zip_bytes = request.FILES["zip_file"].read()
             try:
-                sections, unknown_files = preview_restore(context, zip_bytes)
-                temp_key = save_restore_temp(zip_bytes)
+                plan = build_restore_plan(zip_bytes)
+                sections, unknown_files = preview_restore(context, plan)
+                temp_key = save_restore_temp(plan)
                 context["sections"] = sections
                 context["unknown_files"] = unknown_files
                 context["temp_key"] = temp_key
@@ -697,6 +744,7 @@ def orga_upload(request: HttpRequest, event_slug: str, upload_type: str) -> Http
     context = check_event_context(request, event_slug, f"orga_{permission_type}")
     context["typ"] = upload_type.rstrip("s")
     context["name"] = context["typ"]
+    context["dry_run_allowed"] = supports_dry_run(context["typ"])
 
     # Get column names for the upload template
     _get_column_names(context)
@@ -716,9 +764,13 @@ def orga_upload(request: HttpRequest, event_slug: str, upload_type: str) -> Http
                 # Process the uploaded file and get processing logs
                 context["logs"] = go_upload(context, form)
                 context["redr"] = redr
+                context["dry_run"] = context["dry_run_allowed"] and form.cleaned_data.get("dry_run")
 
                 # Show success message and render results page
-                messages.success(request, _("Elements uploaded!"))
+                if context["dry_run"]:
+                    messages.info(request, _("Dry run completed, nothing has been saved"))
+                else:
+                    messages.success(request, _("Elements uploaded!"))
                 return render(request, "larpmanager/orga/uploads.html", context)
 
             except Exception as exp:
@@ -35,6 +35,7 @@ from larpmanager.cache.registration import clear_registration_tickets_cache, get
 from larpmanager.cache.writing import clear_relationship_tags_cache
 from larpmanager.forms.registration import OrgaRegistrationTicketForm
 from larpmanager.models.form import REGISTRATION_APPLICABLE_TO_TYPE, RegistrationOption, RegistrationQuestion
+from larpmanager.models.miscellanea import ExportJobType
 from larpmanager.models.registration import (
     RegistrationInstallment,
     RegistrationQuota,
@@ -60,7 +61,8 @@ from larpmanager.utils.edit.orga import (
     orga_edit,
     orga_new,
 )
-from larpmanager.utils.io.download import orga_registration_form_download, orga_tickets_download
+from larpmanager.utils.io.download import orga_tickets_download
+from larpmanager.utils.io.export import export_job_response, start_export_job
 
 
 @login_required
@@ -189,7 +191,10 @@ def orga_registration_form(request: HttpRequest, event_slug: str, registration_t
 
     # Handle download request for registration form data
     if request.method == "POST" and request.POST.get("download") == "1":
-        return orga_registration_form_download(context)
+        job = start_export_job(
+            context, ExportJobType.REGISTRATION_FORM, {"applicable": str(context["registration_typ"])}
+        )
+        return export_job_response(job, event_slug)
 
     # Configure context for template rendering
     context["upload"] = f"{context['typ']}_form"
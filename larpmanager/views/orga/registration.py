@@ -42,7 +42,7 @@ from slugify import slugify
 from larpmanager.accounting.base import is_registration_provisional
 from larpmanager.accounting.registration import (
     cancel_reg,
-    check_registration_background,
+    check_run_accounting_background,
     get_accounting_refund,
     get_registration_payments,
 )
@@ -1038,11 +1038,8 @@ def orga_registrations_reload(request: HttpRequest, event_slug: str) -> HttpResp
     # Check user permissions for the event
     context = check_event_context(request, event_slug, "orga_registrations")
 
-    # Collect all active (non-pending) registration IDs for the current run
-    registration_ids = [str(registration.id) for registration in get_active_registrations(context["run"])]
-
-    # Trigger background registration checks
-    check_registration_background(registration_ids)
+    # Trigger the background accounting recompute of the whole run
+    check_run_accounting_background(context["run"].id)
     return redirect("orga_registrations", event_slug=context["run"].get_slug())
 
 
@@ -25,23 +25,40 @@ from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Count, QuerySet
 from django.http import Http404, HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
 from django.utils import timezone
-from django.utils.translation import gettext_lazy as _
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.translation import get_language, gettext_lazy as _
 
 from larpmanager.accounting.base import is_registration_provisional
 from larpmanager.cache.association_text import get_association_text
-from larpmanager.cache.character import get_event_cache_all
+from larpmanager.cache.builder import get_or_build, jittered_timeout, rebuild
+from larpmanager.cache.character import (
+    GALLERY_HTML_TIMEOUT,
+    get_event_cache_all,
+    get_event_cache_faction,
+    get_gallery_html_key,
+    get_search_index,
+)
 from larpmanager.cache.config import get_event_config
 from larpmanager.cache.event_text import get_event_text
 from larpmanager.cache.feature import get_event_features
 from larpmanager.cache.fields import visible_writing_fields
 from larpmanager.cache.question import get_writing_field_names
-from larpmanager.cache.registration import get_registration_counts, get_registration_tickets
+from larpmanager.cache.registration import (
+    REGISTRATION_COUNTS_STALE_TIMEOUT,
+    REGISTRATION_COUNTS_TIMEOUT,
+    get_registration_counts,
+    get_registration_tickets,
+)
+from larpmanager.cache.run import calendar_api_cache_key, calendar_runs_cache_key
 from larpmanager.cache.writing import get_writing_element_fields, get_writing_element_fields_batch
 from larpmanager.forms.registration import MatchmakerForm
 from larpmanager.models.accounting import AccountingItemDiscount, PaymentInvoice, PaymentType
@@ -52,6 +69,7 @@ from larpmanager.models.event import (
     Event,
     EventTextType,
     PreRegistration,
+    RegistrationStatus,
     Run,
 )
 from larpmanager.models.form import (
@@ -75,7 +93,7 @@ from larpmanager.utils.auth.admin import is_lm_admin
 from larpmanager.utils.core.base import get_context, get_event, get_event_context
 from larpmanager.utils.core.common import get_coming_runs, get_element, with_geo_configs, with_geo_configs_registrations
 from larpmanager.utils.core.exceptions import HiddenError
-from larpmanager.utils.users.registration import registration_status
+from larpmanager.utils.users.registration import registration_status, set_runs_registration_status
 
 
 def calendar(request: HttpRequest, context: dict, lang: str) -> HttpResponse:
@@ -100,15 +118,15 @@ def calendar(request: HttpRequest, context: dict, lang: str) -> HttpResponse:
             - my_reg: User's registration status for each run (if authenticated)
 
     Note:
-        Authenticated users see runs they're registered for even if in START development status.
-        Anonymous users cannot see START status runs at all.
+        Runs in START development status are not listed. The runs and their status for
+        anonymous visitors are cached, authenticated users get their own status on top.
 
     """
     # Extract association ID from request context
     association_id = context["association_id"]
 
-    # Get upcoming runs with optimized queries using select_related and prefetch_related
-    runs = with_geo_configs(get_coming_runs(association_id))
+    # Upcoming runs with the status shown to anonymous visitors, shared by every request
+    runs = get_anonymous_calendar_runs(association_id)
 
     # Initialize context with default user context
     context = get_context(request)
@@ -146,25 +164,19 @@ def calendar(request: HttpRequest, context: dict, lang: str) -> HttpResponse:
 
         # Create lookup dictionary for O(1) access to user registrations
         context["my_regs"] = {registration.run_id: registration for registration in user_registrations}
-        user_registered_run_ids = list(context["my_regs"].keys())
-
-        # Filter runs: authenticated users can see START development runs they're registered for
-        runs = runs.exclude(Q(development=DevelopStatus.START) & ~Q(id__in=user_registered_run_ids))
 
         # Precompute character rels, payment invoices, and pre-registrations objects
         context["character_rels_dict"] = get_character_rels_dict(context["my_regs"], member)
         context["player_characters_dict"] = get_player_characters_dict(association_id, member)
         context["payment_invoices_dict"] = get_payment_invoices_dict(context["my_regs"], member)
         context["pre_registrations_dict"] = get_pre_registrations_dict(association_id, member)
-    else:
-        # Anonymous users cannot see runs in START development status
-        runs = runs.exclude(development=DevelopStatus.START)
 
-    # Process each run to determine registration status and categorize
-    for run in runs:
-        # Calculate registration status (open, closed, full, etc.)
-        run.status = registration_status(context, run, context["member"])
+        # Overlay the member status on the anonymous one, computing only the runs where it differs
+        anonymous_status = {run.id: run.status for run in runs}
+        set_runs_registration_status(context, runs, member, anonymous_status)
 
+    # Categorize runs by registration status (open, closed, full, etc.)
+    for run in runs:
         # Categorize runs based on registration availability
         if run.status["open"]:
             context["open"].append(run)  # Available for registration
@@ -180,6 +192,50 @@ def calendar(request: HttpRequest, context: dict, lang: str) -> HttpResponse:
     return render(request, "larpmanager/general/calendar.html", context)
 
 
+def get_anonymous_calendar_runs(association_id: int) -> list[Run]:
+    """Get the upcoming runs of an association, with the registration status shown to anonymous visitors.
+
+    The runs are cached per association and language, for as long as the
+    registration counts they are computed from, and never past the moment the
+    registrations of one of them open: the status shown depends on it.
+
+    Args:
+        association_id: Association to list the runs of
+
+    Returns:
+        The upcoming runs, with their status attribute set
+
+    """
+
+    def build() -> dict:
+        # Anonymous users cannot see runs in START development status
+        runs = list(with_geo_configs(get_coming_runs(association_id)))
+        set_runs_registration_status({}, runs, None)
+
+        # The status of the runs not open yet changes as soon as their registrations open
+        now = timezone.now()
+        openings = [
+            run.registration_open
+            for run in runs
+            if run.registration_status == RegistrationStatus.FUTURE
+            and run.registration_open
+            and run.registration_open > now
+        ]
+        return {"runs": runs, "valid_until": min(openings, default=None)}
+
+    cache_key = calendar_runs_cache_key(association_id, get_language())
+    cache_options = {
+        "timeout": REGISTRATION_COUNTS_TIMEOUT,
+        "stale_timeout": REGISTRATION_COUNTS_STALE_TIMEOUT,
+        "name": "calendar_runs",
+    }
+    cached = get_or_build(cache_key, build, **cache_options)
+    if cached["valid_until"] and timezone.now() >= cached["valid_until"]:
+        # Another worker may be rebuilding it already: compute it without storing it
+        cached = rebuild(cache_key, build, **cache_options) or build()
+    return cached["runs"]
+
+
 def get_member_registrations(member: Any, association_id: int | None = None) -> QuerySet:
     """Get registrations for a member, optionally scoped to a single association."""
     qs = Registration.objects.filter(member=member, cancellation_date__isnull=True).select_related("ticket")
@@ -380,18 +436,26 @@ def api_json(request: HttpRequest, lang: str = "it") -> object:
     if lang:
         request.LANGUAGE_CODE = lang
 
-    # Initialize result list and tracking set
-    res = []
-    runs = get_coming_runs(aid)
-    already = []
-
-    # Process each run and avoid duplicate events
-    for run in runs:
-        # Only add event if not already processed
-        if run.event_id not in already:
-            res.append(run.event.show())
-        already.append(run.event_id)
-
+    def build() -> list[dict]:
+        # Initialize result list and tracking set
+        res = []
+        already = []
+
+        # Process each run and avoid duplicate events
+        for run in get_coming_runs(aid):
+            # Only add event if not already processed
+            if run.event_id not in already:
+                res.append(run.event.show())
+            already.append(run.event_id)
+        return res
+
+    res = get_or_build(
+        calendar_api_cache_key(aid),
+        build,
+        timeout=REGISTRATION_COUNTS_TIMEOUT,
+        stale_timeout=REGISTRATION_COUNTS_STALE_TIMEOUT,
+        name="calendar_api",
+    )
     return JsonResponse({"res": res})
 
 
@@ -645,6 +709,14 @@ def gallery(request: HttpRequest, event_slug: str) -> HttpResponse:
     if "character" not in context["features"]:
         return redirect("event", event_slug=context["run"].get_slug())
 
+    # Anonymous visitors all see the same gallery: serve its content from the rendered cache
+    html_cache_key = None
+    if not request.user.is_authenticated:
+        html_cache_key = get_gallery_html_key(context["run"].id, get_language())
+        context["gallery_html"] = cache.get(html_cache_key)
+        if context["gallery_html"] is not None:
+            return render(request, "larpmanager/event/gallery.html", context)
+
     # Initialize registration list for unassigned members
     context["registration_list"] = []
 
@@ -690,6 +762,10 @@ def gallery(request: HttpRequest, event_slug: str) -> HttpResponse:
             ):
                 context["registration_list"].append(registration.member)
 
+    if html_cache_key:
+        context["gallery_html"] = render_to_string("larpmanager/event/gallery_content.html", context, request)
+        cache.set(html_cache_key, context["gallery_html"], timeout=jittered_timeout(GALLERY_HTML_TIMEOUT))
+
     return render(request, "larpmanager/event/gallery.html", context)
 
 
@@ -962,6 +1038,36 @@ def search(request: HttpRequest, event_slug: str) -> HttpResponse:
     return render(request, "larpmanager/event/search.html", context)
 
 
+def search_index(request: HttpRequest, event_slug: str) -> HttpResponse:
+    """Serve the character search index of the event as JSON, revalidated through its ETag.
+
+    Args:
+        request: Django HTTP request object
+        event_slug: Event slug string used to identify the specific event
+
+    Returns:
+        HttpResponse: JSON object mapping character numbers to their normalized text and
+        words, or a 304 response if the client already holds the current index
+
+    """
+    context = get_event_context(request, event_slug, include_status=True)
+
+    # Serve an empty index where the search page shows no characters
+    if not check_gallery_visibility(request, context) or not context["show_character"]:
+        return JsonResponse({"index": {}})
+
+    index, etag = get_search_index(context, show_teaser="teaser" in context["show_character"])
+
+    # Let the browser reuse its copy while the index is unchanged
+    quoted_etag = quote_etag(etag)
+    response = get_conditional_response(request, etag=quoted_etag)
+    if response is None:
+        response = JsonResponse({"index": index})
+    response["ETag"] = quoted_etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 def get_fact(factions_queryset: QuerySet[Faction]) -> list[dict[str, Any]]:
     """Filter queryset to return only factions with characters.
 
@@ -1040,13 +1146,8 @@ def faction(request: HttpRequest, event_slug: str, faction_uuid: str) -> HttpRes
     context = get_event_context(request, event_slug, include_status=True)
     check_visibility(context, "faction", _("Factions"))
 
-    get_event_cache_all(context)
-
-    faction = None
-    for faction_data in context["factions"].values():
-        if faction_uuid == faction_data.get("uuid"):
-            faction = faction_data
-            break
+    # Load only the fragments of the event data needed by this faction
+    faction = get_event_cache_faction(context, faction_uuid)
 
     if not faction or faction["typ"] == FactionType.SECRET:
         msg = "Faction does not exist"
@@ -61,7 +61,7 @@ from PIL import Image, UnidentifiedImageError
 
 from larpmanager.accounting.member import info_accounting
 from larpmanager.cache.association_text import get_association_text
-from larpmanager.cache.config import get_association_config, save_single_config
+from larpmanager.cache.config import get_association_config, get_many_element_configs, save_single_config
 from larpmanager.forms.member import (
     AvatarForm,
     LanguageForm,
@@ -91,7 +91,6 @@ from larpmanager.models.miscellanea import (
 )
 from larpmanager.models.registration import Registration, RegistrationCharacterRel
 from larpmanager.models.utils import generate_id
-from larpmanager.models.writing import CharacterConfig
 from larpmanager.utils.core.base import get_context
 from larpmanager.utils.core.common import get_badge, get_channel, get_contact, welcome_user
 from larpmanager.utils.core.exceptions import check_association_feature
@@ -1260,15 +1259,8 @@ def _configs_character_rels(character_rels: list[RegistrationCharacterRel]) -> N
     if not char_ids:
         return
 
-    # Batch query for CharacterConfig
-    configs_mapping = {}
-    configs_query = CharacterConfig.objects.filter(character_id__in=char_ids).values_list(
-        "character_id", "name", "value"
-    )
-    for character_id, name, value in configs_query:
-        if character_id not in configs_mapping:
-            configs_mapping[character_id] = {}
-        configs_mapping[character_id][name] = value
+    # Batch load the character configs in one round trip
+    configs_mapping = get_many_element_configs(char_ids, "character")
 
     for rel in character_rels:
         rel.character.configs_dict = configs_mapping.get(rel.character_id, {})
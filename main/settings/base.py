@@ -438,6 +438,7 @@ CLEAN_DB = [
     "delete from larpmanager_casting where deleted < CURRENT_DATE - INTERVAL '6 months';",
     "delete from larpmanager_relationship where deleted < CURRENT_DATE - INTERVAL '6 months';",
     "delete from larpmanager_larpmanagerprofiler where created < CURRENT_DATE - INTERVAL '6 months';",
+    "delete from larpmanager_exportjob where created < CURRENT_DATE - INTERVAL '1 month';",
 
     # recipients first: the foreign key is not cascading at database level
     "delete from larpmanager_emailrecipient where email_content_id in ( select id from larpmanager_emailcontent where created < CURRENT_DATE - INTERVAL '12 months');",